@@ -55,6 +55,57 @@ else:
 #  This module provides the base Arch component class, that
 #  is shared by all of the Arch BIM objects
 
+def projectFace(face,horizontal=False):
+    """Project a face on the XY plane.
+
+    The wires of the face are discretized into polygons, so faces with any
+    number of edges, curved or not, are projected the same way. Inner wires
+    become holes of the projected face.
+
+    Parameters
+    ----------
+    face: <Part.Face>
+        The face to project. Vertical faces cannot be projected.
+    horizontal: bool, optional
+        If True, the face is already horizontal and is only moved to Z=0.
+
+    Returns
+    -------
+    <Part.Face>
+        The projected face, at Z=0.
+    """
+
+    import Part
+    if horizontal:
+        face = face.copy()
+        face.translate(FreeCAD.Vector(0,0,-face.BoundBox.ZMin))
+        return face
+    deflection = max(face.BoundBox.DiagonalLength*0.001,0.01)
+    wires = []
+    for wire in [face.OuterWire]+[w for w in face.Wires if not w.isSame(face.OuterWire)]:
+        pts = []
+        for i,edge in enumerate(wire.OrderedEdges):
+            if isinstance(edge.Curve,(Part.Line,Part.LineSegment)):
+                epts = [v.Point for v in edge.Vertexes]
+            else:
+                epts = edge.discretize(Deflection=deflection)
+            if i == 1:
+                # the first edge may run backwards too
+                dend = min(epts[0].sub(pts[-1]).Length,epts[-1].sub(pts[-1]).Length)
+                dstart = min(epts[0].sub(pts[0]).Length,epts[-1].sub(pts[0]).Length)
+                if dstart < dend:
+                    pts.reverse()
+            if pts:
+                if epts[-1].sub(pts[-1]).Length < epts[0].sub(pts[-1]).Length:
+                    epts.reverse()
+                epts = epts[1:]
+            pts.extend(epts)
+        pts = [FreeCAD.Vector(p.x,p.y,0) for p in pts]
+        if pts[0].sub(pts[-1]).Length > 1e-7:
+            pts.append(pts[0])
+        wires.append(Part.makePolygon(pts))
+    return Part.makeFace(wires,"Part::FaceMakerBullseye")
+
 def addToComponent(compobject,addobject,mod=None):
     """Add an object to a component's properties.
 
@@ -991,13 +1042,6 @@ class Component(ArchIFC.IfcProduct):
             return
 
         import Part
-        import TechDraw
-        fmax = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Arch").GetInt("MaxComputeAreas",20)
-        if len(obj.Shape.Faces) > fmax:
-            obj.VerticalArea = 0
-            obj.HorizontalArea = 0
-            obj.PerimeterLength = 0
-            return
 
         a = 0
         fset = []
@@ -1014,41 +1058,45 @@ class Component(ArchIFC.IfcProduct):
                 if (ang > 1.57) and (ang < 1.571):
                     a += f.Area
                 if ang < 1.5707:
-                    fset.append(f)
+                    fset.append((f,ang))
+
+        flatarea = None
+        pset = []
+        for f,ang in fset:
+            try:
+                pset.append(projectFace(f,ang < 0.00001))
+            except Part.OCCError:
+                # error in computing the areas. Better set them to zero than show a wrong value
+                print("Debug: Error computing areas for ",obj.Label,": unable to project face: ",str([v.Point for v in f.Vertexes])," (face normal:",f.normalAt(0,0),")")
+                flatarea = Part.Shape()
+                break
+        else:
+            if pset:
+                # fuse all the projected faces in a single boolean operation
+                if len(pset) > 1:
+                    flatarea = pset[0].multiFuse(pset[1:])
+                else:
+                    flatarea = pset[0]
+                flatarea = flatarea.removeSplitter()
 
         if a and hasattr(obj,"VerticalArea"):
             if obj.VerticalArea.Value != a:
                 obj.VerticalArea = a
-        if fset and hasattr(obj,"HorizontalArea"):
-            pset = []
-            for f in fset:
-                if f.normalAt(0,0).getAngle(FreeCAD.Vector(0,0,1)) < 0.00001:
-                    # already horizontal
-                    pset.append(f)
-                else:
-                    try:
-                        pf = Part.Face(Part.Wire(TechDraw.project(f,FreeCAD.Vector(0,0,1))[0].Edges))
-                    except Part.OCCError:
-                        # error in computing the areas. Better set them to zero than show a wrong value
-                        if obj.HorizontalArea.Value != 0:
-                            print("Debug: Error computing areas for ",obj.Label,": unable to project face: ",str([v.Point for v in f.Vertexes])," (face normal:",f.normalAt(0,0),")")
-                            obj.HorizontalArea = 0
-                        if hasattr(obj,"PerimeterLength"):
-                            if obj.PerimeterLength.Value != 0:
-                                obj.PerimeterLength = 0
-                    else:
-                        pset.append(pf)
-
-            if pset:
-                self.flatarea = pset.pop()
-                for f in pset:
-                    self.flatarea = self.flatarea.fuse(f)
-                self.flatarea = self.flatarea.removeSplitter()
-                if obj.HorizontalArea.Value != self.flatarea.Area:
-                    obj.HorizontalArea = self.flatarea.Area
-                if hasattr(obj,"PerimeterLength") and (len(self.flatarea.Faces) == 1):
-                    if obj.PerimeterLength.Value != self.flatarea.Faces[0].OuterWire.Length:
-                        obj.PerimeterLength = self.flatarea.Faces[0].OuterWire.Length
+        if (flatarea is not None) and hasattr(obj,"HorizontalArea"):
+            if flatarea.isNull():
+                # the projection failed
+                if obj.HorizontalArea.Value != 0:
+                    obj.HorizontalArea = 0
+                if hasattr(obj,"PerimeterLength"):
+                    if obj.PerimeterLength.Value != 0:
+                        obj.PerimeterLength = 0
+                return
+            self.flatarea = flatarea
+            if obj.HorizontalArea.Value != flatarea.Area:
+                obj.HorizontalArea = flatarea.Area
+            if hasattr(obj,"PerimeterLength") and (len(flatarea.Faces) == 1):
+                if obj.PerimeterLength.Value != flatarea.Faces[0].OuterWire.Length:
+                    obj.PerimeterLength = flatarea.Faces[0].OuterWire.Length
 
     def isStandardCase(self,obj):
         """Determine if the component is a standard case of its IFC type.
@@ -37,6 +37,105 @@ TOLERANCE = 0.0001 # smaller than this, two points are considered equal
 DISCRETIZE = 4 # the number of segments in which arcs must be subdivided
 ROTATIONS = [0,90,180,270] # the possible rotations to try
 
+
+def getPolygonKey(pol):
+
+    """getPolygonKey(pol): returns a hashable description of the outline of a
+       polygon given as a list of (x,y) tuples, its vertices relative to the
+       first one, rounded to TOLERANCE. Translated copies of a polygon have the
+       same key."""
+
+    digits = int(round(-math.log10(TOLERANCE)))
+    x0,y0 = pol[0]
+    return tuple((round(x-x0,digits),round(y-y0,digits)) for x,y in pol)
+
+
+def isInsidePolygon(point,pol):
+
+    """isInsidePolygon(point,pol): returns True if a (x,y) point is strictly
+       inside a polygon given as a list of (x,y) tuples. Points closer to the
+       boundary than TOLERANCE are not inside."""
+
+    x,y = point
+    inside = False
+    j = len(pol)-1
+    for i in range(len(pol)):
+        x1,y1 = pol[j]
+        x2,y2 = pol[i]
+        # distance to the edge
+        dx = x2-x1
+        dy = y2-y1
+        l = dx*dx+dy*dy
+        t = 0
+        if l:
+            t = max(0,min(1,((x-x1)*dx+(y-y1)*dy)/l))
+        if math.hypot(x1+t*dx-x,y1+t*dy-y) <= TOLERANCE:
+            return False
+        # ray casting
+        if (y1 > y) != (y2 > y):
+            if x < x1+(y-y1)*dx/dy:
+                inside = not inside
+        j = i
+    return inside
+
+
+def segmentsCross(p1,p2,p3,p4):
+
+    """segmentsCross(p1,p2,p3,p4): returns True if the segments p1-p2 and p3-p4
+       cross each other away from their end points."""
+
+    def side(a,b,c):
+        # signed distance of c to the line ab
+        l = math.hypot(b[0]-a[0],b[1]-a[1])
+        if not l:
+            return 0
+        return ((b[0]-a[0])*(c[1]-a[1])-(b[1]-a[1])*(c[0]-a[0]))/l
+
+    d1 = side(p3,p4,p1)
+    d2 = side(p3,p4,p2)
+    if not (((d1 > TOLERANCE) and (d2 < -TOLERANCE)) or ((d1 < -TOLERANCE) and (d2 > TOLERANCE))):
+        return False
+    d3 = side(p1,p2,p3)
+    d4 = side(p1,p2,p4)
+    return ((d3 > TOLERANCE) and (d4 < -TOLERANCE)) or ((d3 < -TOLERANCE) and (d4 > TOLERANCE))
+
+
+def polygonsOverlap(pol1,pol2):
+
+    """polygonsOverlap(pol1,pol2): returns True if two polygons given as lists
+       of (x,y) tuples overlap. Polygons that only touch don't overlap."""
+
+    # bounding boxes
+    if (min(p[0] for p in pol1) >= max(p[0] for p in pol2)-TOLERANCE) \
+    or (min(p[0] for p in pol2) >= max(p[0] for p in pol1)-TOLERANCE) \
+    or (min(p[1] for p in pol1) >= max(p[1] for p in pol2)-TOLERANCE) \
+    or (min(p[1] for p in pol2) >= max(p[1] for p in pol1)-TOLERANCE):
+        return False
+
+    # vertices inside the other polygon
+    for p in pol1:
+        if isInsidePolygon(p,pol2):
+            return True
+    for p in pol2:
+        if isInsidePolygon(p,pol1):
+            return True
+
+    # crossing edges, even if all vertices are outside
+    for i in range(len(pol1)):
+        a = pol1[i-1]
+        b = pol1[i]
+        for j in range(len(pol2)):
+            if segmentsCross(a,b,pol2[j-1],pol2[j]):
+                return True
+
+    # coincident polygons: test the centers
+    for pa,pb in [(pol1,pol2),(pol2,pol1)]:
+        c = (sum(p[0] for p in pa)/len(pa),sum(p[1] for p in pa)/len(pa))
+        if isInsidePolygon(c,pa) and isInsidePolygon(c,pb):
+            return True
+    return False
+
+
 class Nester:
 
 
@@ -214,8 +313,24 @@ class Nester:
         faces = nfaces
 
         # container for sheets with a first, empty sheet
+        # each placed piece is stored as [hashcode,face,rotation,polygon],
+        # polygon being its outline as a list of (x,y) tuples in the container plane
         sheets = [[]]
 
+        # 2D coordinate system of the container plane
+        wp = WorkingPlane.plane()
+        wp.alignToPointAndAxis(self.container.CenterOfMass,normal)
+        self.u = wp.u
+        self.v = wp.v
+        self.origin = FreeCAD.Vector(wp.axis).multiply(self.container.Vertexes[0].Point.dot(wp.axis))
+
+        # no-fit polygons only depend on the outlines of the two pieces, not on
+        # their positions, so they are computed once and translated for each
+        # placement, and identical pieces share them
+        # contains (outline key,placed outline key):[polygon,reference point] items
+        self.nfpcache = {}
+        self.nfphits = 0 # number of no-fit polygons taken from the cache
+
         print("Everything OK (",datetime.now()-starttime,")")
 
         # main loop
@@ -234,7 +349,7 @@ class Nester:
 
             # this stores the available solutions for each rotation of a piece
             # contains [sheetnumber,face,xlength] lists,
-            # face being [hascode,transformed face] and xlength
+            # face being [hascode,transformed face,rotation,polygon] and xlength
             # the X size of all boundboxes of placed pieces
             available = []
 
@@ -259,6 +374,8 @@ class Nester:
                     rotface.rotate(rotface.CenterOfMass,normal,rotation)
                 bof = rotface.BoundBox
                 rotverts = self.order(rotface)
+                rotpol = self.toPolygon(rotverts)
+                rotkey = getPolygonKey(rotpol)
                 #for i,v in enumerate(rotverts):
                 #    Draft.makeText([str(i)],point=v)
                 basepoint = rotverts[0] # leftmost point of the rotated face
@@ -277,7 +394,7 @@ class Nester:
                 v3 = v2.add(FreeCAD.Vector(boc.XLength-bof.XLength,0,0))
                 v4 = v3.add(FreeCAD.Vector(0,-(boc.YLength-bof.YLength),0))
                 binpol = Part.Face(Part.makePolygon([v1,v2,v3,v4,v1]))
-                initials.append([binpol,[hashcode,rotface],basepoint])
+                initials.append([binpol,[hashcode,rotface,rotation,rotpol],basepoint])
 
                 # check for available space on each existing sheet
 
@@ -286,200 +403,28 @@ class Nester:
                     # current sheet. That is, a polygon in which basepoint
                     # cannot be, if we want our face to not overlap with the
                     # placed face.
-                    # To do this, we "circulate" the face around the placed face
 
                     if not self.update():
                         return
 
                     nofitpol = []
                     for placed in sheet:
-                        pts = []
-                        for placedvert in self.order(placed[1],right=True):
-                            fpts = []
-                            for i,rotvert in enumerate(rotverts):
-                                if not self.update():
-                                    return
-
-                                facecopy = rotface.copy()
-                                facecopy.translate(placedvert.sub(rotvert))
-
-                                # test if all the points of the face are outside the
-                                # placed face (except the base point, which is coincident)
-
-                                outside = True
-                                faceverts = self.order(facecopy)
-                                for vert in faceverts:
-                                    if (vert.sub(placedvert)).Length > TOLERANCE:
-                                        if placed[1].isInside(vert,TOLERANCE,True):
-                                            outside = False
-                                            break
-
-                                # also need to test for edge intersection, because even
-                                # if all vertices are outside, the pieces could still
-                                # overlap
-
-                                if outside:
-                                    for e1 in facecopy.OuterWire.Edges:
-                                        for e2 in placed[1].OuterWire.Edges:
-                                            if not self.update():
-                                                return
-
-                                            if True:
-                                                # Draft code (SLOW)
-                                                p = DraftGeomUtils.findIntersection(e1,e2)
-                                                if p:
-                                                    p = p[0]
-                                                    p1 = e1.Vertexes[0].Point
-                                                    p2 = e1.Vertexes[1].Point
-                                                    p3 = e2.Vertexes[0].Point
-                                                    p4 = e2.Vertexes[1].Point
-                                                    if (p.sub(p1).Length > TOLERANCE) and (p.sub(p2).Length > TOLERANCE) \
-                                                    and (p.sub(p3).Length > TOLERANCE) and (p.sub(p4).Length > TOLERANCE):
-                                                        outside = False
-                                                        break
-                                            else:
-                                                # alt code: using distToShape (EVEN SLOWER!)
-                                                p = e1.distToShape(e2)
-                                                if p:
-                                                    if p[0] < TOLERANCE:
-                                                        # allow vertex-to-vertex intersection
-                                                        if (p[2][0][0] != "Vertex") or (p[2][0][3] != "Vertex"):
-                                                            outside = False
-                                                            break
-
-
-                                if outside:
-                                    fpts.append([faceverts[0],i])
-                                    #Draft.makeText([str(i)],point=faceverts[0])
-
-                            # reorder available solutions around a same point if needed
-                            # ensure they are in the correct order
-
-                            idxs = [p[1] for p in fpts]
-                            if (0 in idxs) and (len(faceverts)-1 in idxs):
-                                slicepoint = len(fpts)
-                                last = len(faceverts)
-                                for p in reversed(fpts):
-                                    if p[1] == last-1:
-                                        slicepoint -= 1
-                                        last -= 1
-                                    else:
-                                        break
-                                fpts = fpts[slicepoint:]+fpts[:slicepoint]
-                                #print(fpts)
-                            pts.extend(fpts)
-
-                        # create the polygon
-
-                        if len(pts) < 3:
-                            print("Error calculating a no-fit polygon. Aborting")
-                            return
-                        pts = [p[0] for p in pts]
-                        pol = Part.Face(Part.makePolygon(pts+[pts[0]]))
-
-                        if not pol.isValid():
-
-                            # fix overlapping edges
-
-                            overlap = True
-                            while overlap:
-                                overlap = False
-                                for i in range(len(pol.OuterWire.Edges)-1):
-                                    if not self.update():
-                                        return
-
-                                    v1 = DraftGeomUtils.vec(pol.OuterWire.OrderedEdges[i])
-                                    v2 = DraftGeomUtils.vec(pol.OuterWire.OrderedEdges[i+1])
-                                    if abs(v1.getAngle(v2)-math.pi) <= TOLERANCE:
-                                        overlap = True
-                                        ne = Part.LineSegment(pol.OuterWire.OrderedEdges[i].Vertexes[0].Point,
-                                                              pol.OuterWire.OrderedEdges[i+1].Vertexes[-1].Point).toShape()
-                                        pol = Part.Face(Part.Wire(pol.OuterWire.OrderedEdges[:i]+[ne]+pol.OuterWire.OrderedEdges[i+2:]))
-                                        break
-
-                        if not pol.isValid():
-
-                            # trying basic OCC fix
-
-                            pol.fix(0,0,0)
-                            if pol.isValid():
-                                if pol.ShapeType == "Face":
-                                    pol = Part.Face(pol.OuterWire) # discard possible inner holes
-                                elif pol.Faces:
-                                    # several faces after the fix, keep the biggest one
-                                    a = 0
-                                    ff = None
-                                    for f in pol.Faces:
-                                        if f.Area > a:
-                                            a = f.Area
-                                            ff = f
-                                    if ff:
-                                        pol = ff
-                                else:
-                                    print("Unable to fix invalid no-fit polygon. Aborting")
-                                    Part.show(pol)
-                                    return
-
-                        if not pol.isValid():
-
-                            # none of the fixes worked. Epic fail.
-
-                            print("Invalid no-fit polygon. Aborting")
-                            Part.show(pol.OuterWire)
-                            for p in sheet:
-                                Part.show(p[1])
-                            Part.show(facecopy)
-                            #for i,p in enumerate(faceverts):
-                            #    Draft.makeText([str(i)],point=p)
-                            return
-
-                        if pol.isValid():
-                            nofitpol.append(pol)
-                            #Part.show(pol)
-
-                    # Union all the no-fit pols into one
-
-                    if len(nofitpol) == 1:
-                        nofitpol = nofitpol[0]
-                    elif len(nofitpol) > 1:
-                        b = nofitpol.pop()
-                        for n in nofitpol:
-                            if not self.update():
+                        key = (rotkey,getPolygonKey(placed[3]))
+                        if not key in self.nfpcache:
+                            pol = self.getNoFitPolygon(rotpol,placed[3])
+                            if not pol:
                                 return
-                            b = b.fuse(n)
-                        nofitpol = b
-
-                        # remove internal edges (discard edges shared by 2 faces)
-
-                        lut = {}
-                        for f in fitpol.Faces:
-                            for e in f.Edges:
-                                h = e.hashCode()
-                                if h in lut:
-                                    lut[h].append(e)
-                                else:
-                                    lut[h] = [e]
-                        edges = [e[0] for e in lut.values() if len(e) == 1]
-                        try:
-                            pol = Part.Face(Part.Wire(edges))
-                        except Exception:
-                            # above method can fail sometimes. Try a slower method
-                            w = DraftGeomUtils.findWires(edges)
-                            if len(w) == 1:
-                                if w[0].isClosed():
-                                    try:
-                                        pol = Part.Face(w[0])
-                                    except Exception:
-                                        print("Error merging polygons. Aborting")
-                                        try:
-                                            Part.show(Part.Wire(edges))
-                                        except Exception:
-                                            for e in edges:
-                                                Part.show(e)
-                                        return
-
-                    # subtract the no-fit polygon from the container's fit polygon
-                    # we then have the zone where the face can be placed
+                            self.nfpcache[key] = [pol,placed[3][0]]
+                        else:
+                            self.nfphits += 1
+                        pol,ref = self.nfpcache[key]
+                        pol = pol.copy()
+                        pol.translate(self.toVector(placed[3][0],ref))
+                        nofitpol.append(pol)
+
+                    # subtract the union of the no-fit polygons from the
+                    # container's fit polygon, in a single boolean operation.
+                    # We then have the zone where the face can be placed
 
                     if nofitpol:
                         fitpol = binpol.cut(nofitpol)
@@ -498,33 +443,18 @@ class Nester:
                             if not self.update():
                                 return
 
-                            trface = rotface.copy()
-                            trface.translate(p.sub(basepoint))
+                            delta = p.sub(basepoint)
+                            dx = delta.dot(self.u)
+                            dy = delta.dot(self.v)
+                            trpol = [(x+dx,y+dy) for x,y in rotpol]
                             ok = True
                             for placed in sheet:
-                                if ok:
-                                    for vert in trface.Vertexes:
-                                        if placed[1].isInside(vert.Point,TOLERANCE,False):
-                                            ok = False
-                                            break
-                                if ok:
-                                    for e1 in trface.OuterWire.Edges:
-                                        for e2 in placed[1].OuterWire.Edges:
-                                            p = DraftGeomUtils.findIntersection(e1,e2)
-                                            if p:
-                                                p = p[0]
-                                                p1 = e1.Vertexes[0].Point
-                                                p2 = e1.Vertexes[1].Point
-                                                p3 = e2.Vertexes[0].Point
-                                                p4 = e2.Vertexes[1].Point
-                                                if (p.sub(p1).Length > TOLERANCE) and (p.sub(p2).Length > TOLERANCE) \
-                                                and (p.sub(p3).Length > TOLERANCE) and (p.sub(p4).Length > TOLERANCE):
-                                                    ok = False
-                                                    break
-                                if not ok:
+                                if polygonsOverlap(trpol,placed[3]):
+                                    ok = False
                                     break
                             if ok:
-                                rotface = trface
+                                trface = rotface.copy()
+                                trface.translate(delta)
                                 break
                         else:
                             print("Couldn't determine location on sheet. Aborting")
@@ -532,10 +462,10 @@ class Nester:
 
                         # check the X space occupied by this solution
 
-                        bb = rotface.BoundBox
+                        bb = trface.BoundBox
                         for placed in sheet:
                             bb.add(placed[1].BoundBox)
-                        available.append([sheetnumber,[hashcode,rotface],bb.XMax,fitpol])
+                        available.append([sheetnumber,[hashcode,trface,rotation,trpol],bb.XMax,fitpol])
 
             if unfit:
                 print("One face doesn't fit in the container. Aborting")
@@ -557,21 +487,140 @@ class Nester:
                 print("Creating new sheet, adding piece to sheet",len(sheets))
                 # order initial positions by smallest X size
                 initials = sorted(initials,key=lambda sol: sol[1][1].BoundBox.XLength)
-                hashcode = initials[0][1][0]
-                face = initials[0][1][1]
+                hashcode,face,rotation,pol = initials[0][1]
                 # order binpol vertexes by X coord
                 verts = sorted([v.Point for v in initials[0][0].Vertexes],key=lambda v: v.x)
-                face.translate(verts[0].sub(initials[0][2]))
-                sheet.append([hashcode,face])
+                delta = verts[0].sub(initials[0][2])
+                face.translate(delta)
+                dx = delta.dot(self.u)
+                dy = delta.dot(self.v)
+                pol = [(x+dx,y+dy) for x,y in pol]
+                sheet.append([hashcode,face,rotation,pol])
                 sheets.append(sheet)
 
             facenumber += 1
 
         print("Run time:",datetime.now()-starttime)
+        print("No-fit polygons:",len(self.nfpcache),"computed,",self.nfphits,"reused")
         self.results.append(sheets)
         return sheets
 
 
+    def toPolygon(self,verts):
+
+        """toPolygon(verts): returns a list of (x,y) tuples from a list of
+        vectors, in the coordinate system of the container plane"""
+
+        return [(v.dot(self.u),v.dot(self.v)) for v in verts]
+
+    def toVector(self,point,ref=(0,0)):
+
+        """toVector(point,[ref]): returns the vector going from the 2D point
+        ref to the 2D point, in the container plane"""
+
+        return self.u*(point[0]-ref[0]) + self.v*(point[1]-ref[1])
+
+    def getNoFitPolygon(self,movpol,placedpol):
+
+        """getNoFitPolygon(movpol,placedpol): returns a face inside which the first
+        vertex of the moving polygon cannot be without overlapping the placed polygon,
+        or None if it cannot be computed. The polygons are lists of (x,y) tuples.
+        The no-fit polygon is the part of the Minkowski sum of the placed polygon and
+        the mirrored moving polygon where both touch: we "circulate" the moving
+        polygon around the placed one, keeping the vertex-to-vertex contact positions
+        where they don't overlap"""
+
+        bx,by = movpol[0]
+        pts = []
+        for px,py in placedpol:
+            if not self.update():
+                return None
+            fpts = []
+            for i,(rx,ry) in enumerate(movpol):
+                dx = px-rx
+                dy = py-ry
+                movedpol = [(x+dx,y+dy) for x,y in movpol]
+                if not polygonsOverlap(movedpol,placedpol):
+                    fpts.append([(bx+dx,by+dy),i])
+
+            # reorder available solutions around a same point if needed
+            # ensure they are in the correct order
+
+            idxs = [p[1] for p in fpts]
+            if (0 in idxs) and (len(movpol)-1 in idxs):
+                slicepoint = len(fpts)
+                last = len(movpol)
+                for p in reversed(fpts):
+                    if p[1] == last-1:
+                        slicepoint -= 1
+                        last -= 1
+                    else:
+                        break
+                fpts = fpts[slicepoint:]+fpts[:slicepoint]
+                #print(fpts)
+            pts.extend(fpts)
+
+        # create the polygon
+
+        if len(pts) < 3:
+            print("Error calculating a no-fit polygon. Aborting")
+            return None
+        pts = [self.origin.add(self.toVector(p[0])) for p in pts]
+        pol = Part.Face(Part.makePolygon(pts+[pts[0]]))
+
+        if not pol.isValid():
+
+            # fix overlapping edges
+
+            overlap = True
+            while overlap:
+                overlap = False
+                for i in range(len(pol.OuterWire.Edges)-1):
+                    if not self.update():
+                        return None
+
+                    v1 = DraftGeomUtils.vec(pol.OuterWire.OrderedEdges[i])
+                    v2 = DraftGeomUtils.vec(pol.OuterWire.OrderedEdges[i+1])
+                    if abs(v1.getAngle(v2)-math.pi) <= TOLERANCE:
+                        overlap = True
+                        ne = Part.LineSegment(pol.OuterWire.OrderedEdges[i].Vertexes[0].Point,
+                                              pol.OuterWire.OrderedEdges[i+1].Vertexes[-1].Point).toShape()
+                        pol = Part.Face(Part.Wire(pol.OuterWire.OrderedEdges[:i]+[ne]+pol.OuterWire.OrderedEdges[i+2:]))
+                        break
+
+        if not pol.isValid():
+
+            # trying basic OCC fix
+
+            pol.fix(0,0,0)
+            if pol.isValid():
+                if pol.ShapeType == "Face":
+                    pol = Part.Face(pol.OuterWire) # discard possible inner holes
+                elif pol.Faces:
+                    # several faces after the fix, keep the biggest one
+                    a = 0
+                    ff = None
+                    for f in pol.Faces:
+                        if f.Area > a:
+                            a = f.Area
+                            ff = f
+                    if ff:
+                        pol = ff
+                else:
+                    print("Unable to fix invalid no-fit polygon. Aborting")
+                    Part.show(pol)
+                    return None
+
+        if not pol.isValid():
+
+            # none of the fixes worked. Epic fail.
+
+            print("Invalid no-fit polygon. Aborting")
+            Part.show(pol.OuterWire)
+            return None
+
+        return pol
+
     def order(self,face,right=False):
 
         """order(face,[right]): returns a list of vertices
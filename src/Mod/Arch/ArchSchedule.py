@@ -20,6 +20,9 @@
 #*                                                                         *
 #***************************************************************************
 
+import functools
+import operator
+
 import FreeCAD
 if FreeCAD.GuiUp:
     import FreeCADGui
@@ -82,10 +85,27 @@ class _ArchScheduleDocObserver:
     def __init__(self, doc, schedule):
         self.doc = doc
         self.schedule = schedule
+        self.changed = set() # names of the objects changed since the last execute
+        self.created = False # True if objects were added since the last execute
+
+    def slotCreatedObject(self, obj):
+        if obj.Document == self.doc:
+            self.created = True
+            self.changed.add(obj.Name)
+
+    def slotDeletedObject(self, obj):
+        if obj.Document == self.doc:
+            self.changed.add(obj.Name)
+
+    def slotChangedObject(self, obj, prop):
+        if obj.Document == self.doc:
+            self.changed.add(obj.Name)
 
     def slotRecomputedDocument(self, doc):
         if doc != self.doc:
             return
+        if not (self.changed or self.created):
+            return
         try:
             self.schedule.Proxy.execute(self.schedule)
         except:
@@ -180,19 +200,23 @@ class _ArchSchedule:
         if prop == "CreateSpreadsheet":
             if obj.CreateSpreadsheet:
                 self.getSpreadSheet(obj, force=True)
+                self.data = None # write the new spreadsheet on the next execute
             else:
                 sp = self.getSpreadSheet(obj)
                 if sp is not None:
                     FreeCAD.ActiveDocument.removeObject(sp.Name)
                     self.spreadsheet = None
         elif prop == "AutoUpdate":
+            # the cached rows are only valid while an observer reports the changes
             if obj.AutoUpdate:
                 if getattr(self, "docObserver", None) is None:
                     self.docObserver = _ArchScheduleDocObserver(FreeCAD.ActiveDocument, obj)
                     FreeCAD.addDocumentObserver(self.docObserver)
+                    self.rowCache = None
             elif getattr(self, "docObserver", None) is not None:
                 FreeCAD.removeDocumentObserver(self.docObserver)
                 self.docObserver = None
+                self.rowCache = None
 
     def setSpreadsheetData(self,obj,force=False):
 
@@ -237,169 +261,244 @@ class _ArchSchedule:
             if len(obj.Description) != len(p):
                 return
 
-        self.data = {} # store all results in self.data, so it lives even without spreadsheet
+        # rows are cached together with the names of the objects they depend on,
+        # and only re-evaluated when the doc observer reports one of them changed
+
+        observer = getattr(self, "docObserver", None)
+        cache = getattr(self, "rowCache", None)
+        if (observer is None) or (cache is None):
+            cache = {}
+        else:
+            # objects linked by the changed ones may now be included in them
+            changed = set(observer.changed)
+            for name in observer.changed:
+                o = observer.doc.getObject(name)
+                if o is not None:
+                    changed.update([l.Name for l in o.OutList])
+            for key in list(cache.keys()):
+                deps, oncreate, lines = cache[key]
+                if (oncreate and observer.created) or not deps.isdisjoint(changed):
+                    del cache[key]
+        if observer is not None:
+            observer.changed = set()
+            observer.created = False
+        self.rowCache = {}
+
+        dv = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Units").GetInt("Decimals",2)
+        groups = {} # objects string: (candidate objects, deps, oncreate)
+        props = {} # object name: {uppercase property name: property name}
+        data = {} # store all results in data, so it lives even without spreadsheet
         li = 1 # row index - starts at 2 to leave 2 blank rows for the title
 
         for i in range(len(obj.Description)):
-            li += 1
-            if not obj.Description[i]:
-                # blank line
-                continue
-            # write description
-            self.data["A"+str(li)] = obj.Description[i]
+            key = (obj.Description[i], obj.Value[i], obj.Unit[i], obj.Objects[i], obj.Filter[i], obj.DetailedResults, dv)
+            if key in cache:
+                row = cache[key]
+            elif key in self.rowCache:
+                row = self.rowCache[key]
+            else:
+                row = self.getRow(obj, i, dv, groups, props)
+            self.rowCache[key] = row
+            for line in row[2]:
+                li += 1
+                for col, v in line.items():
+                    data[col+str(li)] = v
+
+        if (data != getattr(self, "data", None)) or (observer is None):
+            self.data = data
+            self.setSpreadsheetData(obj)
+
+    def getRowObjects(self, objs, groups):
+
+        """Returns the objects of a schedule row, the names of the objects it
+        depends on and whether it must be re-evaluated when objects are added"""
+
+        if objs in groups:
+            return groups[objs]
+        import Draft,Arch
+        key = objs
+        oncreate = True
+        if objs:
+            names = objs.split(";")
+            objs = [FreeCAD.ActiveDocument.getObject(o) for o in names]
+            objs = [o for o in objs if o is not None]
+            # a missing object may still be created later
+            oncreate = len(objs) != len(names)
+        else:
+            objs = FreeCAD.ActiveDocument.Objects
+        if len(objs) == 1:
+            # remove object itself if the object is a group
+            if objs[0].isDerivedFrom("App::DocumentObjectGroup"):
+                objs = objs[0].Group
+        # groups are dependencies too, as their contents may change
+        deps = set([o.Name for o in objs])
+        deps.update([o.Name for o in Draft.get_group_contents(objs,addgroups=True)])
+        objs = Draft.get_group_contents(objs)
+        # the objects including others decide which ones are pruned
+        deps.update([p.Name for o in objs for p in o.InList])
+        objs = Arch.pruneIncluded(objs,strict=True)
+        # Remove all schedules and spreadsheets:
+        objs = [o for o in objs if Draft.get_type(o) not in ["Schedule", "Spreadsheet::Sheet"]]
+        deps.difference_update([o.Name for o in FreeCAD.ActiveDocument.Objects if Draft.get_type(o) in ["Schedule", "Spreadsheet::Sheet"]])
+        groups[key] = (objs, deps, oncreate)
+        return groups[key]
+
+    def getRow(self, obj, i, dv, groups, props):
+
+        """Evaluates a row of the schedule. Returns a (deps, oncreate, lines) tuple,
+        where lines is a list of {column: value} dicts, one per spreadsheet line"""
+
+        lines = [{}]
+        deps = set()
+        oncreate = False
+        if not obj.Description[i]:
+            # blank line
+            return (deps, oncreate, lines)
+        # write description
+        lines[-1]["A"] = obj.Description[i]
+        if verbose:
+            l= "OPERATION: "+obj.Description[i]
+            print("")
+            print (l)
+            print (len(l)*"=")
+
+        # build set of valid objects
+
+        val = obj.Value[i]
+        if not val:
+            return (deps, oncreate, lines)
+        objs, deps, oncreate = self.getRowObjects(obj.Objects[i], groups)
+        if obj.Filter[i]:
+            # apply filters
+            filters = []
+            for f in obj.Filter[i].split(";"):
+                args = [a.strip() for a in f.strip().split(":")]
+                if args[0][0] == "!":
+                    inv = True
+                    prop = args[0][1:].upper()
+                else:
+                    inv = False
+                    prop = args[0].upper()
+                fval = args[1].upper()
+                if prop == "TYPE":
+                    prop = "IFCTYPE"
+                filters.append((inv, prop, fval))
+            nobjs = []
+            for o in objs:
+                if not o.Name in props:
+                    props[o.Name] = {}
+                    for p in o.PropertiesList:
+                        props[o.Name].setdefault(p.upper(), p)
+                oprops = props[o.Name]
+                ok = True
+                for inv, prop, fval in filters:
+                    if inv:
+                        if prop in oprops:
+                            if fval in getattr(o,oprops[prop]).upper():
+                                ok = False
+                                break
+                    else:
+                        if not (prop in oprops):
+                            ok = False
+                            break
+                        elif not (fval in getattr(o,oprops[prop]).upper()):
+                            ok = False
+                            break
+                if ok:
+                    nobjs.append(o)
+            objs = nobjs
+
+        # perform operation: count or retrieve property
+
+        if val.upper() == "COUNT":
+            val = len(objs)
             if verbose:
-                l= "OPERATION: "+obj.Description[i]
-                print("")
-                print (l)
-                print (len(l)*"=")
-
-            # build set of valid objects
-
-            objs = obj.Objects[i]
-            val = obj.Value[i]
-            if val:
-                import Draft,Arch
-                if objs:
-                    objs = objs.split(";")
-                    objs = [FreeCAD.ActiveDocument.getObject(o) for o in objs]
-                    objs = [o for o in objs if o is not None]
+                print (val, ",".join([o.Label for o in objs]))
+            lines[-1]["B"] = str(val)
+            if obj.DetailedResults:
+                # additional blank line...
+                lines.append({"A": " "})
+        else:
+            vals = val.split(".")
+            if vals[0][0].islower():
+                # old-style: first member is not a property
+                vals = vals[1:]
+            values = []
+
+            # get unit
+            tp = None
+            unit = None
+            q = None
+            if obj.Unit[i]:
+                unit = obj.Unit[i]
+                unit = unit.replace("2","^2")
+                unit = unit.replace("3","^3")
+                unit = unit.replace("²","^2")
+                unit = unit.replace("³","^3")
+                if "2" in unit:
+                    tp = FreeCAD.Units.Area
+                elif "3" in unit:
+                    tp = FreeCAD.Units.Volume
+                elif "deg" in unit:
+                    tp = FreeCAD.Units.Angle
                 else:
-                    objs = FreeCAD.ActiveDocument.Objects
-                if len(objs) == 1:
-                    # remove object itself if the object is a group
-                    if objs[0].isDerivedFrom("App::DocumentObjectGroup"):
-                        objs = objs[0].Group
-                objs = Draft.get_group_contents(objs)
-                objs = Arch.pruneIncluded(objs,strict=True)
-                # Remove all schedules and spreadsheets:
-                objs = [o for o in objs if Draft.get_type(o) not in ["Schedule", "Spreadsheet::Sheet"]]
-                if obj.Filter[i]:
-                    # apply filters
-                    nobjs = []
-                    for o in objs:
-                        props = [p.upper() for p in o.PropertiesList]
-                        ok = True
-                        for f in obj.Filter[i].split(";"):
-                            args = [a.strip() for a in f.strip().split(":")]
-                            if args[0][0] == "!":
-                                inv = True
-                                prop = args[0][1:].upper()
-                            else:
-                                inv = False
-                                prop = args[0].upper()
-                            fval = args[1].upper()
-                            if prop == "TYPE":
-                                prop = "IFCTYPE"
-                            if inv:
-                                if prop in props:
-                                    csprop = o.PropertiesList[props.index(prop)]
-                                    if fval in getattr(o,csprop).upper():
-                                        ok = False
-                            else:
-                                if not (prop in props):
-                                    ok = False
-                                else:
-                                    csprop = o.PropertiesList[props.index(prop)]
-                                    if not (fval in getattr(o,csprop).upper()):
-                                        ok = False
-                        if ok:
-                            nobjs.append(o)
-                    objs = nobjs
-
-                # perform operation: count or retrieve property
-
-                if val.upper() == "COUNT":
-                    val = len(objs)
-                    if verbose:
-                        print (val, ",".join([o.Label for o in objs]))
-                    self.data["B"+str(li)] = str(val)
-                    if obj.DetailedResults:
-                        # additional blank line...
-                        li += 1
-                        self.data["A"+str(li)] = " "
+                    tp = FreeCAD.Units.Length
+
+            # format value
+            fs = "{:."+str(dv)+"f}" # format string
+            for o in objs:
+                if verbose:
+                    l = o.Name+" ("+o.Label+"):"
+                    print (l+(40-len(l))*" ",end="")
+                try:
+                    d = o
+                    for v in vals:
+                        d = getattr(d,v)
+                    if hasattr(d,"Value"):
+                        d = d.Value
+                except Exception:
+                    FreeCAD.Console.PrintWarning(translate("Arch","Unable to retrieve value from object")+": "+o.Name+"."+".".join(vals)+"\n")
                 else:
-                    vals = val.split(".")
-                    if vals[0][0].islower():
-                        # old-style: first member is not a property
-                        vals = vals[1:]
-                    sumval = 0
-
-                    # get unit
-                    tp = None
-                    unit = None
-                    q = None
-                    if obj.Unit[i]:
-                        unit = obj.Unit[i]
-                        unit = unit.replace("2","^2")
-                        unit = unit.replace("3","^3")
-                        unit = unit.replace("²","^2")
-                        unit = unit.replace("³","^3")
-                        if "2" in unit:
-                            tp = FreeCAD.Units.Area
-                        elif "3" in unit:
-                            tp = FreeCAD.Units.Volume
-                        elif "deg" in unit:
-                            tp = FreeCAD.Units.Angle
-                        else:
-                            tp = FreeCAD.Units.Length
-
-                    # format value
-                    dv = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Units").GetInt("Decimals",2)
-                    fs = "{:."+str(dv)+"f}" # format string
-                    for o in objs:
-                        if verbose:
-                            l = o.Name+" ("+o.Label+"):"
-                            print (l+(40-len(l))*" ",end="")
-                        try:
-                            d = o
-                            for v in vals:
-                                d = getattr(d,v)
-                            if hasattr(d,"Value"):
-                                d = d.Value
-                        except Exception:
-                            FreeCAD.Console.PrintWarning(translate("Arch","Unable to retrieve value from object")+": "+o.Name+"."+".".join(vals)+"\n")
+                    if verbose:
+                        if tp and unit:
+                            v = fs.format(FreeCAD.Units.Quantity(d,tp).getValueAs(unit).Value)
+                            print(v,unit)
                         else:
-                            if verbose:
-                                if tp and unit:
-                                    v = fs.format(FreeCAD.Units.Quantity(d,tp).getValueAs(unit).Value)
-                                    print(v,unit)
-                                else:
-                                    print(fs.format(d))
-                            if obj.DetailedResults:
-                                li += 1
-                                self.data["A"+str(li)] = o.Name+" ("+o.Label+")"
-                                if tp and unit:
-                                    q = FreeCAD.Units.Quantity(d,tp)
-                                    self.data["B"+str(li)] = str(q.getValueAs(unit).Value)
-                                    self.data["C"+str(li)] = unit
-                                else:
-                                    self.data["B"+str(li)] = str(d)
-
-                            if not sumval:
-                                sumval = d
-                            else:
-                                sumval += d
-                    val = sumval
-                    if tp:
-                        q = FreeCAD.Units.Quantity(val,tp)
-
-                    # write data
+                            print(fs.format(d))
                     if obj.DetailedResults:
-                        li += 1
-                        self.data["A"+str(li)] = "TOTAL"
-                    if q and unit:
-                        self.data["B"+str(li)] = str(q.getValueAs(unit).Value)
-                        self.data["C"+str(li)] = unit
-                    else:
-                        self.data["B"+str(li)] = str(val)
-                    if verbose:
+                        line = {"A": o.Name+" ("+o.Label+")"}
                         if tp and unit:
-                            v = fs.format(FreeCAD.Units.Quantity(val,tp).getValueAs(unit).Value)
-                            print("TOTAL:"+34*" "+v+" "+unit)
+                            q = FreeCAD.Units.Quantity(d,tp)
+                            line["B"] = str(q.getValueAs(unit).Value)
+                            line["C"] = unit
                         else:
-                            v = fs.format(val)
-                            print("TOTAL:"+34*" "+v)
-        self.setSpreadsheetData(obj)
+                            line["B"] = str(d)
+                        lines.append(line)
+                    values.append(d)
+
+            if values:
+                val = functools.reduce(operator.add,values)
+            else:
+                val = 0
+            if tp:
+                q = FreeCAD.Units.Quantity(val,tp)
+
+            # write data
+            if obj.DetailedResults:
+                lines.append({"A": "TOTAL"})
+            if q and unit:
+                lines[-1]["B"] = str(q.getValueAs(unit).Value)
+                lines[-1]["C"] = unit
+            else:
+                lines[-1]["B"] = str(val)
+            if verbose:
+                if tp and unit:
+                    v = fs.format(FreeCAD.Units.Quantity(val,tp).getValueAs(unit).Value)
+                    print("TOTAL:"+34*" "+v+" "+unit)
+                else:
+                    v = fs.format(val)
+                    print("TOTAL:"+34*" "+v)
+        return (deps, oncreate, lines)
 
     def __getstate__(self):
 
@@ -20,6 +20,7 @@
 #***************************************************************************
 
 import FreeCAD
+import collections
 import math
 import Draft
 import ArchCommands
@@ -55,6 +56,19 @@ else:
 
 ISRENDERING = False # flag to prevent concurrent runs of the coin renderer
 
+# cut results of single solids, used by getCutShapes, emptied when a document is closed
+# { (shape hash, normal, offset, showHidden) : (shape, cut shapes, section faces, hidden shapes) }
+CUTCACHE = collections.OrderedDict()
+CUTCACHESIZE = 2000
+cutCacheObserver = None
+
+class _CutCacheDocObserver:
+
+    "doc observer emptying the cut cache when a document is closed"
+
+    def slotDeletedDocument(self, doc):
+        CUTCACHE.clear()
+
 def makeSectionPlane(objectslist=None,name="Section"):
 
     """makeSectionPlane([objectslist]) : Creates a Section plane objects including the
@@ -119,6 +133,8 @@ def getCutShapes(objs,cutplane,onlySolids,clip,joinArch,showHidden,groupSshapesB
     obtained from performing a series of booleans against the given cut plane
     """
 
+    global cutCacheObserver
+
     import Part,DraftGeomUtils
     shapes = []
     hshapes = []
@@ -171,6 +187,15 @@ def getCutShapes(objs,cutplane,onlySolids,clip,joinArch,showHidden,groupSshapesB
                     objectShapes.append((o,[o.Shape]))
 
     cutface,cutvolume,invcutvolume = ArchCommands.getCutVolume(cutplane,shapes,clip)
+    plane = None
+    if cutvolume and not clip:
+        # without clipping, the cut volume is the half space on the side
+        # of the cut face it is extruded to, so solids can be classified
+        # against this plane using their bounding box
+        pos = cutface.CenterOfMass
+        nor = cutvolume.CenterOfMass.sub(pos)
+        if nor.Length > 1e-7:
+            plane = (pos,nor.normalize())
     shapes = []
     for o, shapeList in objectShapes:
         tmpSshapes = []
@@ -179,20 +204,60 @@ def getCutShapes(objs,cutplane,onlySolids,clip,joinArch,showHidden,groupSshapesB
                 if cutvolume:
                     if sub.Volume < 0:
                         sub = sub.reversed() # Use reversed as sub is immutable.
+                    side = getPlaneSide(sub,plane) if plane else 0
+                    if side < 0:
+                        # entirely on the visible side, nothing is cut
+                        shapes.append(sub)
+                        continue
+                    elif side > 0:
+                        # entirely on the cut side, only hidden
+                        if showHidden:
+                            hshapes.append(sub)
+                        continue
+                    key = None
+                    if plane:
+                        # the plane is given by its normal and offset, its position
+                        # depends on the bounding box of all the cut objects
+                        prec = Draft.precision()
+                        key = (sub.hashCode(),
+                               tuple(round(v,prec) for v in plane[1]),
+                               round(plane[1].dot(plane[0]),prec),
+                               showHidden)
+                        cached = CUTCACHE.get(key)
+                        # hash codes are not unique, check that it is the same shape
+                        if cached and cached[0].isSame(sub):
+                            CUTCACHE.move_to_end(key)
+                            shapes.extend(cached[1])
+                            tmpSshapes.extend(cached[2])
+                            hshapes.extend(cached[3])
+                            continue
+                    cshapes = []
+                    csshapes = []
+                    chshapes = []
                     c = sub.cut(cutvolume)
                     s = sub.section(cutface)
                     try:
                         wires = DraftGeomUtils.findWires(s.Edges)
                         for w in wires:
                             f = Part.Face(w)
-                            tmpSshapes.append(f)
+                            csshapes.append(f)
                     except Part.OCCError:
                         #print "ArchView: unable to get a face"
-                        tmpSshapes.append(s)
-                    shapes.extend(c.SubShapes if c.ShapeType == "Compound" else [c])
+                        csshapes.append(s)
+                    cshapes.extend(c.SubShapes if c.ShapeType == "Compound" else [c])
                     if showHidden:
                         c = sub.cut(invcutvolume)
-                        hshapes.extend(c.SubShapes if c.ShapeType == "Compound" else [c])
+                        chshapes.extend(c.SubShapes if c.ShapeType == "Compound" else [c])
+                    if key:
+                        if cutCacheObserver is None:
+                            cutCacheObserver = _CutCacheDocObserver()
+                            FreeCAD.addDocumentObserver(cutCacheObserver)
+                        CUTCACHE[key] = (sub,cshapes,csshapes,chshapes)
+                        if len(CUTCACHE) > CUTCACHESIZE:
+                            CUTCACHE.popitem(last=False)
+                    shapes.extend(cshapes)
+                    tmpSshapes.extend(csshapes)
+                    hshapes.extend(chshapes)
                 else:
                     shapes.append(sub)
 
@@ -208,6 +273,34 @@ def getCutShapes(objs,cutplane,onlySolids,clip,joinArch,showHidden,groupSshapesB
         return shapes,hshapes,sshapes,cutface,cutvolume,invcutvolume
 
 
+def getPlaneSide(shape,plane):
+
+    """getPlaneSide(shape,plane): returns -1 if the bounding box of the shape lies
+    entirely behind the plane, given as a (point,normal) tuple, 1 if it lies
+    entirely in front of it, and 0 if the plane crosses it"""
+
+    bb = shape.BoundBox
+    if not bb.isValid():
+        return 0
+    pos,nor = plane
+    # the box corners nearest and farthest along the normal
+    low = high = -pos.dot(nor)
+    for n,vmin,vmax in ((nor.x,bb.XMin,bb.XMax),
+                        (nor.y,bb.YMin,bb.YMax),
+                        (nor.z,bb.ZMin,bb.ZMax)):
+        if n >= 0:
+            low += n*vmin
+            high += n*vmax
+        else:
+            low += n*vmax
+            high += n*vmin
+    if high < 0:
+        return -1
+    if low > 0:
+        return 1
+    return 0
+
+
 def getFillForObject(o, defaultFill, source):
 
     """returns a color tuple from an object's material"""
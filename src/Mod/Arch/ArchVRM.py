@@ -21,6 +21,7 @@
 
 "The FreeCAD Arch Vector Rendering Module"
 
+import heapq
 import math
 
 import FreeCAD
@@ -38,8 +39,6 @@ import Part
 #  It is used by the "Solid" mode of Arch views in TechDraw and Drawing,
 #  and is called from ArchSectionPlane code.
 
-MAXLOOP = 10 # the max number of loop before abort
-
 # WARNING: in this module, faces are lists whose first item is the actual OCC face, the
 # other items being additional information such as color, etc.
 
@@ -321,6 +320,9 @@ class Renderer:
         for v in face1[0].Vertexes:
             if self.isInside(v,face2):
                 return True
+        for v in face2[0].Vertexes:
+            if self.isInside(v,face1):
+                return True
 
         # even so, faces can still overlap if their edges cross each other
         for e1 in face1[0].Edges:
@@ -414,14 +416,9 @@ class Renderer:
             return 2
         if DEBUG: print("failed, cannot say if face 2 is in front or behind")
 
-        # test 5: see if faces projections don't overlap, vertexwise
-        if DEBUG: print("doing test 5")
-        if not self.zOverlaps(face1,face2):
-            return 0
-        elif not self.zOverlaps(face2,face1):
-            return 0
-        if DEBUG: print("failed, faces are overlapping")
-
+        # test 5 would check if the faces projections overlap, using zOverlaps(),
+        # but two overlapping faces that passed the tests above cannot be
+        # ordered either, so the result is 0 in all cases
         if DEBUG: print("Houston, all tests passed, and still no results")
         return 0
 
@@ -477,6 +474,107 @@ class Renderer:
         else:
             return None
 
+    def overlappingPairs(self,boxes):
+        "returns the pairs of indices of the given boundboxes that overlap in X and Y"
+        if not boxes:
+            return []
+        # uniform grid of the XY plane, with cells about the size of an average box
+        xmin = min(b.XMin for b in boxes)
+        ymin = min(b.YMin for b in boxes)
+        size = sum(max(b.XLength,b.YLength) for b in boxes)/len(boxes)
+        if size <= 0:
+            size = 1.0
+        cells = {}
+        for i,b in enumerate(boxes):
+            for cx in range(int((b.XMin-xmin)/size),int((b.XMax-xmin)/size)+1):
+                for cy in range(int((b.YMin-ymin)/size),int((b.YMax-ymin)/size)+1):
+                    cells.setdefault((cx,cy),[]).append(i)
+        pairs = set()
+        for cell in cells.values():
+            for n,i in enumerate(cell):
+                b1 = boxes[i]
+                for j in cell[n+1:]:
+                    b2 = boxes[j]
+                    if (b1.XMax < b2.XMin) or (b1.XMin > b2.XMax) \
+                            or (b1.YMax < b2.YMin) or (b1.YMin > b2.YMax):
+                        continue
+                    pairs.add((i,j))
+        return sorted(pairs)
+
+    def findCycle(self,after,done):
+        "returns the indices of faces forming a cycle of the graph of the faces not done yet"
+        # strongly connected components with an iterative Tarjan algorithm
+        index = {}
+        low = {}
+        stack = []
+        onstack = set()
+        comp = {}
+        comps = []
+        for root in range(len(after)):
+            if done[root] or (root in index):
+                continue
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            onstack.add(root)
+            work = [(root,0)]
+            while work:
+                v,n = work[-1]
+                if n < len(after[v]):
+                    work[-1] = (v,n+1)
+                    w = after[v][n]
+                    if done[w]:
+                        continue
+                    if not w in index:
+                        index[w] = low[w] = len(index)
+                        stack.append(w)
+                        onstack.add(w)
+                        work.append((w,0))
+                    elif w in onstack:
+                        low[v] = min(low[v],index[w])
+                else:
+                    work.pop()
+                    if work:
+                        u = work[-1][0]
+                        low[u] = min(low[u],low[v])
+                    if low[v] == index[v]:
+                        c = []
+                        while True:
+                            w = stack.pop()
+                            onstack.discard(w)
+                            comp[w] = len(comps)
+                            c.append(w)
+                            if w == v:
+                                break
+                        comps.append(c)
+        # a component no other one points to. As every face left has a face
+        # before it, this component has more than one face
+        source = [True] * len(comps)
+        for v,c in comp.items():
+            for w in after[v]:
+                if (not done[w]) and (comp[w] != c):
+                    source[comp[w]] = False
+        for c in range(len(comps)):
+            if source[c] and (len(comps[c]) > 1):
+                return comps[c]
+        return [v for v in range(len(after)) if not done[v]]
+
+    def splitFace(self,face,other):
+        "splits a face with the plane of another face, returns the list of parts or None"
+        import Part
+        f = face[0]
+        norm = other[0].normalAt(0,0)
+        pos = other[0].Vertexes[0].Point
+        size = f.BoundBox.DiagonalLength + f.BoundBox.Center.sub(pos).Length + 1
+        try:
+            plane = Part.Plane(pos,norm).toShape(-size,size,-size,size)
+            halfspace = plane.extrude(FreeCAD.Vector(norm).multiply(2*size))
+            parts = f.common(halfspace).Faces + f.cut(halfspace).Faces
+        except Part.OCCError:
+            return None
+        if len(parts) < 2:
+            return None
+        return [[p]+face[1:] for p in parts]
+
     def sort(self):
         "projects a shape on the WP"
         if DEBUG: print("\n\n======> Starting sort\n\n")
@@ -490,66 +588,90 @@ class Renderer:
         if not self.oriented:
             self.reorient()
             if DEBUG: print("Done reorientation")
-        faces = self.faces[:]
-        if DEBUG: print("sorting ",len(self.faces)," faces")
-        sfaces = []
-        loopcount = 0
-        notfoundstack = 0
-        while faces:
-            if DEBUG: print("loop ", loopcount)
-            f1 = faces[0]
-            if sfaces and (notfoundstack < len(faces)):
-                if DEBUG: print("using ordered stack, notfound = ",notfoundstack)
-                p = self.findPosition(f1,sfaces)
-                if p is None:
-                    # no position found, we move the face to the end of the pile
-                    faces.remove(f1)
-                    faces.append(f1)
-                    notfoundstack += 1
-                else:
-                    # position found, we insert it
-                    faces.remove(f1)
-                    sfaces.insert(p,f1)
-                    notfoundstack = 0
-            else:
-                # either there is no stack, or no more face can be compared
-                # find a root, 2 faces that can be compared
-                if DEBUG: print("using unordered stack, notfound = ",notfoundstack)
-                for f2 in faces[1:]:
-                    if DEBUG: print("comparing face",str(self.faces.index(f1))," with face",str(self.faces.index(f2)))
-                    r = self.compare(f1,f2)
-                    print("comparison result:",r)
-                    if r == 1:
-                        faces.remove(f2)
-                        sfaces.append(f2)
-                        faces.remove(f1)
-                        sfaces.append(f1)
-                        notfoundstack = 0
-                        break
-                    elif r == 2:
-                        faces.remove(f1)
-                        sfaces.append(f1)
-                        faces.remove(f2)
-                        sfaces.append(f2)
-                        notfoundstack = 0
+
+        # undefined faces cannot be sorted
+        faces = [f for f in self.faces if f]
+        if DEBUG: print("sorting ",len(faces)," faces")
+
+        # faces of a cycle are split and the sort is started again,
+        # at most once per face to sort
+        splits = 0
+        cycles = 0
+        sfaces = None
+        while sfaces is None:
+            boxes = [f[0].BoundBox for f in faces]
+
+            # only faces overlapping on the view can hide each other. Build the
+            # graph of the "is behind" relations between them, farther faces first
+            after = [[] for f in faces]
+            indegree = [0] * len(faces)
+            for i,j in self.overlappingPairs(boxes):
+                r = self.compare(faces[i],faces[j])
+                if r == 1:
+                    after[j].append(i)
+                    indegree[i] += 1
+                elif r == 2:
+                    after[i].append(j)
+                    indegree[j] += 1
+            if DEBUG: print("found ",sum(indegree)," relations")
+
+            # topological sort of the graph. Faces without constraints are taken
+            # from the farthest to the closest
+            heap = [(boxes[i].ZMin,i) for i in range(len(faces)) if indegree[i] == 0]
+            heapq.heapify(heap)
+            done = [False] * len(faces)
+            checked = set() # relations whose faces were checked to overlap
+            order = []
+            while len(order) < len(faces):
+                if not heap:
+                    # the relations left form cycles. The relations between faces
+                    # that do not overlap on the view are dropped first, then a face
+                    # of a cycle is split with the plane of a face it is related to.
+                    # If no face can be split, the farthest face of the cycle is
+                    # drawn first, which is not always right
+                    cycle = self.findCycle(after,done)
+                    incycle = set(cycle)
+                    for i in cycle:
+                        for j in after[i][:]:
+                            if (j in incycle) and not ((i,j) in checked):
+                                checked.add((i,j))
+                                if not self.zOverlaps(faces[i],faces[j]):
+                                    after[i].remove(j)
+                                    indegree[j] -= 1
+                                    if indegree[j] == 0:
+                                        heapq.heappush(heap,(boxes[j].ZMin,j))
+                    if heap:
+                        continue
+                    parts = None
+                    if splits < len(self.faces):
+                        for i in sorted(cycle,key=lambda i: (boxes[i].ZMin,i)):
+                            for j in cycle:
+                                if (j in after[i]) or (i in after[j]):
+                                    parts = self.splitFace(faces[i],faces[j])
+                                    if parts:
+                                        break
+                            if parts:
+                                break
+                    if parts:
+                        faces = faces[:i] + parts + faces[i+1:]
+                        splits += 1
                         break
-                    elif r == 31:
-                        if f1 in faces:
-                            faces.remove(f1)
-                    elif r == 32:
-                        if f2 in faces:
-                            faces.remove(f2)
-                else:
-                    # nothing found, move the face to the end of the pile
-                    if f1 in faces:
-                        faces.remove(f1)
-                        faces.append(f1)
-            loopcount += 1
-            if loopcount == MAXLOOP * len(self.faces):
-                if DEBUG: print("Too many loops, aborting.")
-                break
-
-        if DEBUG: print("done Z sorting. ", len(sfaces), " faces retained, ", len(self.faces)-len(sfaces), " faces lost.")
+                    i = min(cycle,key=lambda i: (boxes[i].ZMin,i))
+                    heap.append((boxes[i].ZMin,i))
+                    cycles += 1
+                z,i = heapq.heappop(heap)
+                if done[i]:
+                    continue
+                done[i] = True
+                order.append(faces[i])
+                for j in after[i]:
+                    indegree[j] -= 1
+                    if (indegree[j] == 0) and not done[j]:
+                        heapq.heappush(heap,(boxes[j].ZMin,j))
+            else:
+                sfaces = order
+
+        if DEBUG: print("done Z sorting. ", len(sfaces), " faces retained, ", splits, " faces split, ", cycles, " cycles broken.")
         self.faces = sfaces
         self.sorted = True
         if DEBUG: print("\n\n======> Finished sort\n\n")
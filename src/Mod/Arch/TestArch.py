@@ -23,6 +23,7 @@
 
 # Unit test for the Arch module
 
+import math
 import os
 import unittest
 
@@ -440,6 +441,21 @@ class ArchTest(unittest.TestCase):
         s = Arch.makeStructure(length=2,width=3,height=5)
         self.failUnless(s,"Arch Structure failed")
 
+    def testStructureAreas(self):
+        App.Console.PrintLog ('Checking Arch Structure areas...\n')
+        # a prism with more faces than the former MaxComputeAreas limit
+        n = 30
+        pts = [App.Vector(1000*math.cos(2*math.pi*i/n),1000*math.sin(2*math.pi*i/n),0) for i in range(n)]
+        b = App.ActiveDocument.addObject('Part::Feature','Base')
+        b.Shape = Part.Face(Part.makePolygon(pts+[pts[0]]))
+        s = Arch.makeStructure(b,height=500)
+        App.ActiveDocument.recompute()
+        area = 0.5*n*1000*1000*math.sin(2*math.pi/n)
+        perimeter = n*pts[0].sub(pts[1]).Length
+        self.assertAlmostEqual(s.HorizontalArea.Value,area,3,"Arch Structure horizontal area failed")
+        self.assertAlmostEqual(s.PerimeterLength.Value,perimeter,3,"Arch Structure perimeter failed")
+        self.assertAlmostEqual(s.VerticalArea.Value,perimeter*500,3,"Arch Structure vertical area failed")
+
     def testRebar(self):
         App.Console.PrintLog ('Checking Arch Rebar...\n')
         s = Arch.makeStructure(length=2,width=3,height=5)
@@ -615,6 +631,65 @@ class ArchTest(unittest.TestCase):
         s = Arch.makeSectionPlane([])
         self.failUnless(s,"Arch Section failed")
 
+    def testSectionCutShapes(self):
+        App.Console.PrintLog ('Checking Arch Section cut shapes...\n')
+        import ArchSectionPlane
+        objs = []
+        for z in (0,4,10):
+            b = App.ActiveDocument.addObject('Part::Feature','Box')
+            b.Shape = Part.makeBox(10,10,2,App.Vector(0,0,z))
+            objs.append(b)
+        cutplane = Part.makePlane(100,100,App.Vector(-50,-50,5))
+        # the second run uses the cached cut results
+        for i in range(2):
+            shapes,hshapes,sshapes,cutface,cutvolume,invcutvolume = \
+                ArchSectionPlane.getCutShapes(objs,cutplane,True,False,False,True)
+            self.assertEqual(len(shapes),2,"Arch Section cut shapes failed")
+            self.assertEqual(len(hshapes),2,"Arch Section hidden shapes failed")
+            self.assertEqual(len(sshapes),1,"Arch Section section faces failed")
+            volume = sum(sh.Volume for sh in shapes+hshapes)
+            self.assertAlmostEqual(volume,600,3,"Arch Section cut volume failed")
+        # another object and a larger cut plane move the cut face, but not its plane
+        ncached = len(ArchSectionPlane.CUTCACHE)
+        b = App.ActiveDocument.addObject('Part::Feature','Box')
+        b.Shape = Part.makeBox(10,10,2,App.Vector(30,30,0))
+        cutplane = Part.makePlane(200,200,App.Vector(-20,-30,5))
+        shapes,hshapes,sshapes,cutface,cutvolume,invcutvolume = \
+            ArchSectionPlane.getCutShapes(objs+[b],cutplane,True,False,False,True)
+        self.assertEqual(len(sshapes),1,"Arch Section section faces failed")
+        self.assertEqual(len(ArchSectionPlane.CUTCACHE),ncached,"Arch Section cut cache failed")
+
+    def testVRMCycle(self):
+        App.Console.PrintLog ('Checking Arch VRM sorting of cyclic faces...\n')
+        import ArchVRM
+        # three strips along the sides of a triangle, each one tilted so it is
+        # in front of the next one, so none of them can be drawn first
+        pts = [App.Vector(0,0,0),App.Vector(10,0,0),App.Vector(5,5*math.sqrt(3),0)]
+        center = (pts[0]+pts[1]+pts[2]).multiply(1.0/3)
+        c,s = math.cos(2*math.pi/3),math.sin(2*math.pi/3)
+        d = (pts[2]-pts[1]).normalize()
+        m = App.Vector(d.y,-d.x,0).multiply(0.3)
+        grad = App.Vector(1.5*m.x-s*m.y,s*m.x+1.5*m.y,0).multiply(1.0/3)
+        faces = []
+        for k in range(3):
+            a,b = pts[k],pts[(k+1)%3]
+            d = (b-a).normalize()
+            inward = App.Vector(-d.y,d.x,0).multiply(2)
+            verts = [App.Vector(p.x,p.y,5+grad.dot(p-center)) for p in (a,b,b+inward,a+inward)]
+            faces.append(Part.Face(Part.makePolygon(verts+verts[:1])))
+            grad = App.Vector(c*grad.x-s*grad.y,s*grad.x+c*grad.y,0)
+        r = ArchVRM.Renderer()
+        r.addFaces(faces)
+        r.sort()
+        self.assertTrue(len(r.faces) > 3,"Arch VRM cycle split failed")
+        area = sum(f[0].Area for f in r.faces)
+        self.assertAlmostEqual(area,sum(f.Area for f in faces),3,"Arch VRM cycle area failed")
+        # no face is drawn after a face in front of it
+        for i in range(len(r.faces)):
+            for j in range(i+1,len(r.faces)):
+                if r.zOverlaps(r.faces[i],r.faces[j]):
+                    self.assertNotEqual(r.compare(r.faces[i],r.faces[j]),1,"Arch VRM cycle sort failed")
+
     def testSpace(self):
         App.Console.PrintLog ('Checking Arch Space...\n')
         sb = Part.makeBox(1,1,1)
@@ -717,6 +792,95 @@ class ArchTest(unittest.TestCase):
         App.ActiveDocument.recompute()
         self.assertTrue(len(bp.Shape.Faces) == 16, "'{}' failed".format(operation))
 
+    def testSchedule(self):
+        App.Console.PrintLog ('Checking Arch Schedule...\n')
+        import ArchSchedule
+        s1 = Arch.makeStructure(length=1000,width=200,height=3000)
+        s2 = Arch.makeStructure(length=2000,width=200,height=3000)
+        g = App.ActiveDocument.addObject("App::DocumentObjectGroup","Group")
+        g.addObject(s1)
+        sc = App.ActiveDocument.addObject("App::FeaturePython","Schedule")
+        ArchSchedule._ArchSchedule(sc)
+        sc.Description = ["Length 1","Length 2","Count group","Count later"]
+        sc.Value = ["Length","Length","Count","Count"]
+        sc.Unit = ["","","",""]
+        sc.Objects = [s1.Name,s2.Name,g.Name,"Later"]
+        sc.Filter = ["","","",""]
+        App.ActiveDocument.recompute()
+        sc.Proxy.execute(sc)
+        rows = lambda: [sc.Proxy.data["B"+str(i)] for i in range(2,6)]
+        self.assertEqual(rows(),["1000.0","2000.0","1","0"],"Arch Schedule failed")
+        # edit an object
+        s1.Length = 1500
+        App.ActiveDocument.recompute()
+        self.assertEqual(rows(),["1500.0","2000.0","1","0"],"Arch Schedule edit failed")
+        # edits made without observer are not hidden by the cached rows
+        sc.AutoUpdate = False
+        s2.Length = 2500
+        sc.Proxy.execute(sc)
+        self.assertEqual(rows(),["1500.0","2500.0","1","0"],"Arch Schedule without AutoUpdate failed")
+        s1.Length = 1700
+        sc.AutoUpdate = True
+        sc.Proxy.execute(sc)
+        self.assertEqual(rows(),["1700.0","2500.0","1","0"],"Arch Schedule AutoUpdate toggle failed")
+        # add objects
+        g.addObject(Arch.makeStructure(length=500,width=200,height=3000))
+        App.ActiveDocument.addObject("App::FeaturePython","Later")
+        App.ActiveDocument.recompute()
+        self.assertEqual(rows(),["1700.0","2500.0","2","1"],"Arch Schedule added objects failed")
+
+    def testNestingPolygons(self):
+        App.Console.PrintLog ('Checking Arch Nesting polygon functions...\n')
+        import ArchNesting
+        square = [(0,0),(10,0),(10,10),(0,10)]
+        def moved(pol,dx,dy):
+            return [(x+dx,y+dy) for x,y in pol]
+        # keys of translated copies
+        self.assertEqual(ArchNesting.getPolygonKey(moved(square,3.5,-2)),ArchNesting.getPolygonKey(square),"Arch Nesting polygon key failed")
+        self.assertEqual(ArchNesting.getPolygonKey(moved(square,1e-6,0)),ArchNesting.getPolygonKey(square),"Arch Nesting polygon key failed")
+        self.assertNotEqual(ArchNesting.getPolygonKey([(0,0),(10,0),(10,20),(0,20)]),ArchNesting.getPolygonKey(square),"Arch Nesting polygon key failed")
+        # points inside, on the boundary and outside
+        self.assertTrue(ArchNesting.isInsidePolygon((5,5),square),"Arch Nesting inside point failed")
+        self.assertFalse(ArchNesting.isInsidePolygon((10,5),square),"Arch Nesting edge point failed")
+        self.assertFalse(ArchNesting.isInsidePolygon((0,0),square),"Arch Nesting vertex point failed")
+        self.assertFalse(ArchNesting.isInsidePolygon((15,5),square),"Arch Nesting outside point failed")
+        # crossing, touching, collinear and parallel segments
+        self.assertTrue(ArchNesting.segmentsCross((0,0),(10,10),(0,10),(10,0)),"Arch Nesting crossing segments failed")
+        self.assertFalse(ArchNesting.segmentsCross((0,0),(10,0),(5,0),(5,10)),"Arch Nesting touching segments failed")
+        self.assertFalse(ArchNesting.segmentsCross((0,0),(10,0),(5,0),(15,0)),"Arch Nesting collinear segments failed")
+        self.assertFalse(ArchNesting.segmentsCross((0,0),(10,0),(0,1),(10,1)),"Arch Nesting parallel segments failed")
+        # overlapping, touching, coincident and crossing polygons
+        self.assertTrue(ArchNesting.polygonsOverlap(square,moved(square,5,5)),"Arch Nesting overlapping polygons failed")
+        self.assertFalse(ArchNesting.polygonsOverlap(square,moved(square,10,0)),"Arch Nesting touching polygons failed")
+        self.assertFalse(ArchNesting.polygonsOverlap(square,moved(square,10,10)),"Arch Nesting corner polygons failed")
+        self.assertFalse(ArchNesting.polygonsOverlap(square,moved(square,20,0)),"Arch Nesting distant polygons failed")
+        self.assertTrue(ArchNesting.polygonsOverlap(square,list(square)),"Arch Nesting coincident polygons failed")
+        self.assertTrue(ArchNesting.polygonsOverlap(square,[(2,2),(8,2),(8,8),(2,8)]),"Arch Nesting inner polygon failed")
+        horizontal = [(-5,3),(15,3),(15,7),(-5,7)]
+        vertical = [(3,-5),(7,-5),(7,15),(3,15)]
+        self.assertTrue(ArchNesting.polygonsOverlap(horizontal,vertical),"Arch Nesting crossing polygons failed")
+
+    def testNesting(self):
+        App.Console.PrintLog ('Checking Arch Nesting...\n')
+        import time
+        import ArchNesting
+        container = Part.Face(Part.makePolygon([App.Vector(0,0,0),App.Vector(1000,0,0),App.Vector(1000,600,0),App.Vector(0,600,0),App.Vector(0,0,0)]))
+        panels = []
+        for i in range(24):
+            panels.append(Part.Face(Part.makePolygon([App.Vector(0,0,0),App.Vector(200,0,0),App.Vector(200,100,0),App.Vector(0,100,0),App.Vector(0,0,0)])))
+        n = ArchNesting.Nester(container,panels)
+        starttime = time.time()
+        sheets = n.run()
+        App.Console.PrintLog("Nested 24 panels in "+str(time.time()-starttime)+" s, "+str(len(n.nfpcache))+" no-fit polygons computed, "+str(n.nfphits)+" reused\n")
+        self.assertTrue(sheets,"Arch Nesting failed")
+        self.assertEqual(sum(len(sheet) for sheet in sheets),24,"Arch Nesting failed")
+        for sheet in sheets:
+            for i in range(len(sheet)):
+                for j in range(i+1,len(sheet)):
+                    self.assertFalse(ArchNesting.polygonsOverlap(sheet[i][3],sheet[j][3]),"Arch Nesting overlap failed")
+        # identical panels share their no-fit polygons
+        self.assertTrue(n.nfphits > 10*len(n.nfpcache),"Arch Nesting no-fit polygon cache failed")
+
     def tearDown(self):
         App.closeDocument("ArchTest")
         pass
@@ -255,7 +255,7 @@ def export(exportList, filename, colors=None, preferences=None):
 
     # create IFC file
 
-    global ifcfile, surfstyles, clones, sharedobjects, profiledefs, shapedefs, uids
+    global ifcfile, surfstyles, clones, clonebases, sharedobjects, profiledefs, shapedefs, uids
     ifcfile = ifcopenshell.open(templatefile)
     ifcfile = exportIFCHelper.writeUnits(ifcfile,preferences["IFC_UNIT"])
     history = ifcfile.by_type("IfcOwnerHistory")[0]
@@ -312,6 +312,7 @@ def export(exportList, filename, colors=None, preferences=None):
     subproducts = {} # { Name: IfcEntity, ... } for storing additions/subtractions and other types of subcomponents of a product
     surfstyles = {} # { (r,g,b): IfcEntity, ... }
     clones = {} # { Basename:[Clonename1,Clonename2,...] }
+    clonebases = {} # { Clonename:Basename }, the inverse of clones
     sharedobjects = {} # { BaseName: IfcRepresentationMap }
     count = 1
     groups = {} # { Host: [Child,Child,...] }
@@ -327,6 +328,7 @@ def export(exportList, filename, colors=None, preferences=None):
             b = Draft.getCloneBase(o,strict=True)
             if b:
                 clones.setdefault(b.Name,[]).append(o.Name)
+                clonebases[o.Name] = b.Name
 
     #print("clones table: ",clones)
     #print(objectslist)
@@ -1983,27 +1985,31 @@ def getRepresentation(
         if forceclone:
             if obj.Name not in clones:
                 clones[obj.Name] = []
-        for k,v in clones.items():
-            if (obj.Name == k) or (obj.Name in v):
-                if k in sharedobjects:
-                    # base shape already exists
-                    repmap = sharedobjects[k]
-                    pla = obj.getGlobalPlacement()
-                    pos = FreeCAD.Vector(pla.Base)
-                    if isinstance(forceclone,FreeCAD.Vector):
-                        pos += forceclone
-                    axis1 = ifcbin.createIfcDirection(tuple(pla.Rotation.multVec(FreeCAD.Vector(1,0,0))))
-                    axis2 = ifcbin.createIfcDirection(tuple(pla.Rotation.multVec(FreeCAD.Vector(0,1,0))))
-                    axis3 = ifcbin.createIfcDirection(tuple(pla.Rotation.multVec(FreeCAD.Vector(0,0,1))))
-                    origin = ifcbin.createIfcCartesianPoint(tuple(pos.multiply(preferences['SCALE_FACTOR'])))
-                    transf = ifcbin.createIfcCartesianTransformationOperator3D(axis1,axis2,origin,1.0,axis3)
-                    mapitem = ifcfile.createIfcMappedItem(repmap,transf)
-                    shapes = [mapitem]
-                    solidType = "MappedRepresentation"
-                    shapetype = "clone"
-                else:
-                    # base shape not yet created
-                    tostore = k
+        # find the base of this object in the clones table
+        if obj.Name in clones:
+            k = obj.Name
+        else:
+            k = clonebases.get(obj.Name)
+        if k:
+            if k in sharedobjects:
+                # base shape already exists
+                repmap = sharedobjects[k]
+                pla = obj.getGlobalPlacement()
+                pos = FreeCAD.Vector(pla.Base)
+                if isinstance(forceclone,FreeCAD.Vector):
+                    pos += forceclone
+                axis1 = ifcbin.createIfcDirection(tuple(pla.Rotation.multVec(FreeCAD.Vector(1,0,0))))
+                axis2 = ifcbin.createIfcDirection(tuple(pla.Rotation.multVec(FreeCAD.Vector(0,1,0))))
+                axis3 = ifcbin.createIfcDirection(tuple(pla.Rotation.multVec(FreeCAD.Vector(0,0,1))))
+                origin = ifcbin.createIfcCartesianPoint(tuple(pos.multiply(preferences['SCALE_FACTOR'])))
+                transf = ifcbin.createIfcCartesianTransformationOperator3D(axis1,axis2,origin,1.0,axis3)
+                mapitem = ifcfile.createIfcMappedItem(repmap,transf)
+                shapes = [mapitem]
+                solidType = "MappedRepresentation"
+                shapetype = "clone"
+            else:
+                # base shape not yet created
+                tostore = k
 
     # unhandled case: object is duplicated because of Axis
     if obj.isDerivedFrom("Part::Feature") and (len(obj.Shape.Solids) > 1) and hasattr(obj,"Axis") and obj.Axis:
@@ -2222,6 +2228,9 @@ def getRepresentation(
                                             pass
                                         except Base.FreeCADError:
                                             pass
+                                if curves:
+                                    # one curved edge is enough, no need to look further
+                                    break
                             if curves:
                                 joinfacets = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Arch").GetBool("ifcJoinCoplanarFacets",False)
                                 usedae = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Arch").GetBool("ifcUseDaeOptions",False)
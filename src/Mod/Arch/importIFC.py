@@ -40,7 +40,6 @@ import Arch
 import DraftVecUtils
 import ArchIFCSchema
 import importIFCHelper
-import importIFCmulticore
 
 from draftutils.messages import _msg, _err
 
@@ -170,6 +169,86 @@ def open(filename, skip=[], only=[], root=None):
     return doc
 
 
+def isSkipped(product, archobj, skip, preferences, ifcfile):
+    """Return True if the given product must not be imported.
+
+    Parameters
+    ----------
+    product: IfcProduct
+        The product to check.
+
+    archobj: bool
+        False if the product is a structural object.
+
+    skip: list
+        The ids and types of the products to skip.
+
+    preferences: dict
+        The import preferences, see `importIFCHelper.getPreferences`.
+
+    ifcfile: ifcopenshell.file
+        The IFC file of the product.
+    """
+    ptype = product.is_a()
+    if preferences['MERGE_MODE_ARCH'] == 4 and archobj:
+        return True
+    if preferences['MERGE_MODE_STRUCT'] == 3 and not archobj:
+        return True
+    if product.id() in skip:  # user given id skip list
+        return True
+    if ptype in skip:  # user given type skip list
+        return True
+    if ptype in preferences['SKIP']:  # preferences-set type skip list
+        return True
+    if preferences['REPLACE_PROJECT']:  # options-enabled project/site/building skip
+        if ptype in ['IfcProject','IfcSite']:
+            return True
+        elif ptype in ['IfcBuilding']:
+            # let multiple buildings through...
+            return len(ifcfile.by_type("IfcBuilding")) == 1
+        elif ptype in ['IfcBuildingStorey']:
+            # let multiple storeys through...
+            return len(ifcfile.by_type("IfcBuildingStorey")) == 1
+    return False
+
+
+def getProductShapes(ifcfile, products, geomproducts, settings, cores):
+    """Yield the products to import with the shapes of a multi-core iterator.
+
+    The products which are not in `geomproducts` come first, with no
+    shape. Then the shapes of `geomproducts` are computed in batches by
+    `importIFCHelper.buildRelGeometry`; the breps of a batch are imported
+    and the products of the batch yielded before the next batch is
+    computed, so the breps of the whole file are never held at once.
+    Products the iterator gave no shape come last, with no shape.
+
+    Yields
+    ------
+    tuple
+        `(product, shape)`, shape is a `Part.Shape` or None.
+    """
+    geomids = set(p.id() for p in geomproducts)
+    for product in products:
+        if product.id() not in geomids:
+            yield product, None
+    # the iterator computes no curves, only used by structural products
+    if hasattr(settings, "INCLUDE_CURVES"):
+        settings.set(settings.INCLUDE_CURVES, False)
+    for breps in importIFCHelper.buildRelGeometry(ifcfile, settings, cores, geomproducts):
+        shapes = []
+        for pid, brep in breps.items():
+            shape = Part.Shape()
+            shape.importBrepFromString(brep, False)
+            shape.scale(1000.0)  # IfcOpenShell always outputs in meters
+            shapes.append((ifcfile[pid], shape))
+            geomids.discard(pid)
+        for product, shape in shapes:
+            yield product, shape
+    for product in geomproducts:
+        if product.id() in geomids:
+            yield product, None
+
+
 def insert(srcfile, docname, skip=[], only=[], root=None, preferences=None):
     """Import the contents of an IFC file in the current active document.
 
@@ -221,7 +300,7 @@ def insert(srcfile, docname, skip=[], only=[], root=None, preferences=None):
             return BimIfcImport.insert(srcfile, docname, preferences)
         except:
             pass
-        return importIFCmulticore.insert(srcfile, docname, preferences)
+        # otherwise the shapes are computed below by a multi-core iterator
 
     try:
         doc = FreeCAD.getDocument(docname)
@@ -294,6 +373,7 @@ def insert(srcfile, docname, skip=[], only=[], root=None, preferences=None):
     shapes = {}  # { id:shaoe } only used for merge mode
     structshapes = {}  # { id:shaoe } only used for merge mode
     sharedobjects = {}  # { representationmapid:object }
+    sharedshapes = {}  # { representationmapid:(shape,placement) }
 
     # a list of imported objects whose parametric relationships
     # need processing after all objects have been created
@@ -313,7 +393,11 @@ def insert(srcfile, docname, skip=[], only=[], root=None, preferences=None):
     subtractions = importIFCHelper.buildRelSubtractions(ifcfile)
     mattable = importIFCHelper.buildRelMattable(ifcfile)
     colors = importIFCHelper.buildRelProductColors(ifcfile, prodrepr)
+    properties = importIFCHelper.buildRelPropertySets(ifcfile)
+    replayers = importIFCHelper.buildRelLayers(ifcfile)
     colordict = {}  # { objname:color tuple } for non-GUI use
+    # the shapes of products with openings cannot be shared
+    hosts = set(subtraction[1] for subtraction in subtractions)
     if preferences['DEBUG']:
         _msg("done.")
 
@@ -327,6 +411,31 @@ def insert(srcfile, docname, skip=[], only=[], root=None, preferences=None):
                 only.extend(additions[currentid])
         products = [ifcfile[currentid] for currentid in ids]
 
+    # read once the preferences used for every product
+    freecadprops = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Arch").GetBool("IfcImportFreeCADProperties",False)
+
+    # compute the shapes in batches using several threads if required,
+    # only for the products which are not skipped and need no curves,
+    # the products without a shape here are computed one by one below
+    if preferences['MULTICORE']:
+        if preferences['DEBUG']:
+            _msg("Computing shapes on {} cores...".format(preferences['MULTICORE']))
+        geomproducts = []
+        for product in products:
+            if product.is_a() in structuralifcobjects:
+                continue
+            if isSkipped(product, True, skip, preferences, ifcfile):
+                continue
+            psets = properties.get(product.id(), {})
+            if psets and freecadprops:
+                if any(ifcfile[pset].Name == "FreeCADPropertySet" for pset in psets):
+                    continue
+            geomproducts.append(product)
+        productshapes = getProductShapes(ifcfile, products, geomproducts,
+                                         settings, preferences['MULTICORE'])
+    else:
+        productshapes = ((product, None) for product in products)
+
     # start the actual import, set FreeCAD UI
     count = 0
     from FreeCAD import Base
@@ -352,7 +461,7 @@ def insert(srcfile, docname, skip=[], only=[], root=None, preferences=None):
 
     # handle IFC products
 
-    for product in products:
+    for product, itershape in productshapes:
 
         count += 1
         pid = product.id()
@@ -362,25 +471,22 @@ def insert(srcfile, docname, skip=[], only=[], root=None, preferences=None):
         if preferences['DEBUG']: print(count,"/",len(products),"object #"+str(pid),":",ptype,end="")
 
         # build list of related property sets
-        psets = importIFCHelper.getIfcPropertySets(ifcfile, pid)
+        psets = properties.get(pid, {})
 
         # add layer names to layers
         if hasattr(product, "Representation") and hasattr(product.Representation, "Representations"):
             if len(product.Representation.Representations) > 0:
-                lays = product.Representation.Representations[0].LayerAssignments
-                if len(lays) > 0:
-                    layer_name = lays[0].Name
-                    if layer_name not in list(layers.keys()):
-                        layers[layer_name] = [pid]
-                    else:
-                        layers[layer_name].append(pid)
+                rid = product.Representation.Representations[0].id()
+                if rid in replayers:
+                    layer_name = replayers[rid]
+                    layers.setdefault(layer_name, []).append(pid)
                     if preferences['DEBUG']: print(" layer ", layer_name, " found", ptype,end="")
                 else:
                     if preferences['DEBUG']: print(" no layer found", ptype,end="")
 
         # checking for full FreeCAD parametric definition, overriding everything else
-        if psets and FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Arch").GetBool("IfcImportFreeCADProperties",False):
-            if "FreeCADPropertySet" in [ifcfile[pset].Name for pset in psets.keys()]:
+        if psets and freecadprops:
+            if any(ifcfile[pset].Name == "FreeCADPropertySet" for pset in psets):
                 if preferences['DEBUG']: print(" restoring from parametric definition...",end="")
                 obj,parametrics = importIFCHelper.createFromProperties(psets,ifcfile,parametrics)
                 if obj:
@@ -410,35 +516,9 @@ def insert(srcfile, docname, skip=[], only=[], root=None, preferences=None):
             if preferences['DEBUG']: print(" (struct)",end="")
         else:
             if preferences['DEBUG']: print(" (arch)",end="")
-        if preferences['MERGE_MODE_ARCH'] == 4 and archobj:
+        if isSkipped(product, archobj, skip, preferences, ifcfile):
             if preferences['DEBUG']: print(" skipped.")
             continue
-        if preferences['MERGE_MODE_STRUCT'] == 3 and not archobj:
-            if preferences['DEBUG']: print(" skipped.")
-            continue
-        if pid in skip:  # user given id skip list
-            if preferences['DEBUG']: print(" skipped.")
-            continue
-        if ptype in skip:  # user given type skip list
-            if preferences['DEBUG']: print(" skipped.")
-            continue
-        if ptype in preferences['SKIP']:  # preferences-set type skip list
-            if preferences['DEBUG']: print(" skipped.")
-            continue
-        if preferences['REPLACE_PROJECT']:  # options-enabled project/site/building skip
-            if ptype in ['IfcProject','IfcSite']:
-                if preferences['DEBUG']: print(" skipped.")
-                continue
-            elif ptype in ['IfcBuilding']:
-                if len(ifcfile.by_type("IfcBuilding")) == 1:
-                    # let multiple buildings through...
-                    if preferences['DEBUG']: print(" skipped.")
-                    continue
-            elif ptype in ['IfcBuildingStorey']:
-                if len(ifcfile.by_type("IfcBuildingStorey")) == 1:
-                    # let multiple storeys through...
-                    if preferences['DEBUG']: print(" skipped.")
-                    continue
 
         # check if this object is sharing its shape (mapped representation)
         clone = None
@@ -459,20 +539,40 @@ def insert(srcfile, docname, skip=[], only=[], root=None, preferences=None):
                             sharedobjects[originalid] = None
                             store = originalid  # flag this object to be stored later
 
+        # products using the same representation map share the geometry
+        # of the first one, only moved to their own placement
+        mapped = None
+        sharedshape = None
+        if prepr and (pid not in hosts):
+            try:
+                mapped = importIFCHelper.getMappedPlacement(product,ifcscale)
+            except Exception:
+                mapped = None
+        if mapped and (mapped[0] in sharedshapes):
+            firstshape,firstplacement = sharedshapes[mapped[0]]
+            delta = mapped[1].multiply(firstplacement.inverse())
+            sharedshape = firstshape.transformed(delta.toMatrix())
+
         # set additional setting for structural entities
         if hasattr(settings,"INCLUDE_CURVES"):
             if structobj:
                 settings.set(settings.INCLUDE_CURVES,True)
             else:
                 settings.set(settings.INCLUDE_CURVES,False)
-        try:
-            cr = geom.create_shape(settings, product)
-            brep = cr.geometry.brep_data
-        except Exception:
-            pass  # IfcOpenShell will yield an error if a given product has no shape, but we don't care, we're brave enough
+        if (sharedshape is None) and (itershape is None):
+            try:
+                cr = geom.create_shape(settings, product)
+                brep = cr.geometry.brep_data
+            except Exception:
+                pass  # IfcOpenShell will yield an error if a given product has no shape, but we don't care, we're brave enough
 
         # from now on we have a brep string
-        if brep:
+        if sharedshape is not None:
+            if preferences['DEBUG']: print(" shared ",end="")
+            shape = sharedshape
+        elif itershape is not None:
+            shape = itershape
+        elif brep:
             if preferences['DEBUG']: print(" "+str(int(len(brep)/1000))+"k ",end="")
 
             # create a Part shape
@@ -480,11 +580,15 @@ def insert(srcfile, docname, skip=[], only=[], root=None, preferences=None):
             shape.importBrepFromString(brep,False)
             shape.scale(1000.0)  # IfcOpenShell always outputs in meters, we convert to mm, the freecad internal unit
 
+        if shape is not None:
             if shape.isNull() and (not preferences['ALLOW_INVALID']):
                 if preferences['DEBUG']: print("null shape ",end="")
-            elif not shape.isValid() and (not preferences['ALLOW_INVALID']):
+            elif (sharedshape is None) and not shape.isValid() and (not preferences['ALLOW_INVALID']):
                 if preferences['DEBUG']: print("invalid shape ",end="")
             else:
+                if mapped and (sharedshape is None):
+                    # first valid instance of this representation map
+                    sharedshapes[mapped[0]] = (shape,mapped[1])
 
                 # add to the global boundbox if applicable
                 if preferences['FITVIEW_ONIMPORT'] and FreeCAD.GuiUp:
@@ -996,7 +1100,7 @@ def insert(srcfile, docname, skip=[], only=[], root=None, preferences=None):
 
     # processing remaining (normal) groups
 
-    swallowed = []
+    swallowed = set()
     remaining = {}
     for host,children in groups.items():
         if ifcfile[host].is_a("IfcGroup"):
@@ -1011,7 +1115,7 @@ def insert(srcfile, docname, skip=[], only=[], root=None, preferences=None):
             for child in children:
                 if child in objects.keys():
                     grp.addObject(objects[child])
-                    swallowed.append(child)
+                    swallowed.add(child)
                 else:
                     remaining[child] = grp
 
@@ -1111,6 +1215,12 @@ def insert(srcfile, docname, skip=[], only=[], root=None, preferences=None):
     prodcount = count
     count = 0
 
+    # { child:[host,...] }, to find the containers of annotations
+    hosts_of = {}
+    for host,children in additions.items():
+        for child in children:
+            hosts_of.setdefault(child, []).append(host)
+
     for annotation in annotations:
 
         anno = None
@@ -1134,8 +1244,8 @@ def insert(srcfile, docname, skip=[], only=[], root=None, preferences=None):
             if aid in remaining.keys():
                 remaining[aid].addObject(anno)
             else:
-                for host,children in additions.items():
-                    if (aid in children) and (host in objects.keys()):
+                for host in hosts_of.get(aid, []):
+                    if host in objects:
                         Arch.addComponents(anno,objects[host])
 
         if preferences['DEBUG']: print("")  # add newline for 2D objects debug prints
@@ -1149,7 +1259,10 @@ def insert(srcfile, docname, skip=[], only=[], root=None, preferences=None):
     # print("colors:",colors)
     # print("mattable:",mattable)
     # print("materials:",materials)
-    added_mats = []
+    added_mats = {}  # { (description, color):material object }
+    matobjects = {}  # { matid:[objid, ...] }, inverse of mattable
+    for o,m in mattable.items():
+        matobjects.setdefault(m, []).append(o)
     for material in materials:
         # print(material.id())
 
@@ -1175,76 +1288,55 @@ def insert(srcfile, docname, skip=[], only=[], root=None, preferences=None):
         if material.id() in colors and colors[material.id()] is not None:
             mat_color = str(colors[material.id()])
         else:
-            for o,m in mattable.items():
-                if m == material.id():
-                    if o in colors and colors[o] is not None:
-                        mat_color = str(colors[o])
+            for o in matobjects.get(material.id(), []):
+                if o in colors and colors[o] is not None:
+                    mat_color = str(colors[o])
         if mat_color is not None:
             mdict["DiffuseColor"] = mat_color
         else:
             if preferences['DEBUG']: print("/n  no color for material: {}, ".format(str(material.id)),end="")
 
         # merge materials with same name and color if setting in prefs is True
-        add_material = True
-        if preferences["MERGE_MATERIALS"]:
-            for added_mat in added_mats:
-                if (
-                    "Description" in added_mat.Material  # Description has been set thus it is in mdict
-                    and added_mat.Material["Description"] == mdict["Description"]
-                ):
-                    if (
-                        (
-                            "DiffuseColor" in added_mat.Material
-                            and "DiffuseColor" in mdict
-                            and added_mat.Material["DiffuseColor"] == mdict["DiffuseColor"]
-                        )  # color in added mat with the same matname and new mat is the same
-                        or
-                        (
-                            "DiffuseColor" not in added_mat.Material
-                            and "DiffuseColor" not in mdict
-                        )  # there is no color in added mat with the same matname and new mat
-                        # on model imported from ArchiCAD color was not found for all IFC material objects,
-                        # thus DiffuseColor was not set for created materials, workaround to merge these too
-                    ):
-                        matobj = added_mat
-                        add_material = False
-                        break
-
-        # add a new material object
-        if add_material is True:
+        # on model imported from ArchiCAD color was not found for all IFC material objects,
+        # thus DiffuseColor was not set for created materials, these are merged too
+        matkey = (mdict["Description"], mdict.get("DiffuseColor"))
+        if preferences["MERGE_MATERIALS"] and matkey in added_mats:
+            matobj = added_mats[matkey]
+        else:
+            # add a new material object
             matobj = Arch.makeMaterial(name=name)
             matobj.Material = mdict
-            added_mats.append(matobj)
+            added_mats.setdefault(matkey, matobj)
         # fill material attribute of the objects
-        for o,m in mattable.items():
-            if m == material.id():
-                if o in objects:
-                    if hasattr(objects[o],"Material"):
-                        objects[o].Material = matobj
-                        if FreeCAD.GuiUp:
-                            # the reason behind ...
-                            # there are files around in which the material color is different from the shape color
-                            # all viewers use the shape color whereas in FreeCAD the shape color will be
-                            # overwritten by the material color (if there is a material with a color).
-                            # In such a case FreeCAD shows a different color than all common ifc viewers
-                            # https://forum.freecadweb.org/viewtopic.php?f=39&t=38440
-                            col = objects[o].ViewObject.ShapeColor[:3]
-                            dig = 5
-                            ma_color = sh_color = round(col[0], dig), round(col[1], dig), round(col[2], dig)
-                            if "DiffuseColor" in objects[o].Material.Material:
-                                string_color = objects[o].Material.Material["DiffuseColor"]
-                                col = tuple([float(f) for f in string_color.strip("()").split(",")])
-                                ma_color = round(col[0], dig), round(col[1], dig), round(col[2], dig)
-                            if ma_color != sh_color:
-                                print("\nobject color != material color for object: ", o)
-                                print("    material color is used (most software uses shape color)")
-                                print("    obj: ", o, "label: ", objects[o].Label, " col: ", sh_color)
-                                print("    mat: ", m, "label: ", matobj.Label, " col: ", ma_color)
-                                # print("    ", ifcfile[o])
-                                # print("    ", ifcfile[m])
-                                # print("    colors:")
-                                # print("    ", o, ": ", colors[o])
-                                # print("    ", m, ": ", colors[m])
+        m = material.id()
+        for o in matobjects.get(m, []):
+            if o in objects:
+                if hasattr(objects[o],"Material"):
+                    objects[o].Material = matobj
+                    if FreeCAD.GuiUp:
+                        # the reason behind ...
+                        # there are files around in which the material color is different from the shape color
+                        # all viewers use the shape color whereas in FreeCAD the shape color will be
+                        # overwritten by the material color (if there is a material with a color).
+                        # In such a case FreeCAD shows a different color than all common ifc viewers
+                        # https://forum.freecadweb.org/viewtopic.php?f=39&t=38440
+                        col = objects[o].ViewObject.ShapeColor[:3]
+                        dig = 5
+                        ma_color = sh_color = round(col[0], dig), round(col[1], dig), round(col[2], dig)
+                        if "DiffuseColor" in objects[o].Material.Material:
+                            string_color = objects[o].Material.Material["DiffuseColor"]
+                            col = tuple([float(f) for f in string_color.strip("()").split(",")])
+                            ma_color = round(col[0], dig), round(col[1], dig), round(col[2], dig)
+                        if ma_color != sh_color:
+                            print("\nobject color != material color for object: ", o)
+                            print("    material color is used (most software uses shape color)")
+                            print("    obj: ", o, "label: ", objects[o].Label, " col: ", sh_color)
+                            print("    mat: ", m, "label: ", matobj.Label, " col: ", ma_color)
+                            # print("    ", ifcfile[o])
+                            # print("    ", ifcfile[m])
+                            # print("    colors:")
+                            # print("    ", o, ": ", colors[o])
+                            # print("    ", m, ": ", colors[m])
     if preferences['DEBUG'] and materials: print("done")
 
     # Grouping everything if required
@@ -240,6 +240,66 @@ def buildRelProductRepresentation(ifcfile):
     return prodrepr
 
 
+def buildRelGeometry(ifcfile, settings, cores, products, batchsize=256):
+    """Yield the product/brep relation table in batches.
+
+    The shapes of the given products are computed by the IfcOpenShell
+    geometry iterator, using the given number of threads, instead of
+    one `create_shape` call per product. The iterator is consumed
+    lazily, so only the breps of one batch are kept at a time.
+
+    Parameters
+    ----------
+    ifcfile: ifcopenshell.file
+        The IFC file.
+
+    settings: ifcopenshell.geom.settings
+        The geometry settings, they must use brep data.
+
+    cores: int
+        The number of threads of the iterator.
+
+    products: list of IfcProduct
+        The products whose shapes are computed.
+
+    batchsize: int, optional
+        The number of breps in a batch.
+
+    Yields
+    ------
+    dict
+        A dictionary of `{product id: brep string}` of at most
+        `batchsize` products. Products whose geometry could not be
+        computed are in none of them.
+    """
+    from ifcopenshell import geom
+
+    if not products:
+        return
+    ids = set(p.id() for p in products)
+    try:
+        # only iterate over the given products if this version can filter
+        iterator = geom.iterator(settings, ifcfile, cores, include=products)
+    except TypeError:
+        iterator = geom.iterator(settings, ifcfile, cores)
+    except Exception:
+        return
+    if not iterator.initialize():
+        return
+    breps = {}  # { id:brep }
+    while True:
+        item = iterator.get()
+        if item.id in ids:
+            breps[item.id] = item.geometry.brep_data
+            if len(breps) >= batchsize:
+                yield breps
+                breps = {}
+        if not iterator.next():
+            break
+    if breps:
+        yield breps
+
+
 def buildRelAdditions(ifcfile):
     """Build the additions relation table."""
     additions = {}  # { host:[child,...], ... }
@@ -381,6 +441,7 @@ def buildRelProductColors(ifcfile, prodrepr):
         _msg("Product-color table")
 
     colors = dict()
+    styles = dict()  # { styled item id: color }, to read each style once
     i = 0
 
     for p in prodrepr.keys():
@@ -415,7 +476,10 @@ def buildRelProductColors(ifcfile, prodrepr):
             # for this product, write `None` if something goes wrong
             # or if the ifc file has errors and thus no valid color
             # is returned
-            colors[p] = getColorFromStyledItem(styled_item)
+            sid = styled_item.id()
+            if sid not in styles:
+                styles[sid] = getColorFromStyledItem(styled_item)
+            colors[p] = styles[sid]
 
         i += 1
     return colors
@@ -619,6 +683,50 @@ def buildRelProperties(ifcfile):
     return properties
 
 
+def buildRelPropertySets(ifcfile):
+    """Build the property sets relation table.
+
+    It gives the same result as calling `getIfcPropertySets`
+    for every object, but the file is only traversed once,
+    and the property lists of a property set shared by several
+    objects are only built once.
+
+    Returns
+    -------
+    dict
+        A dictionary with `{objid: {psetid: [propid, ...], ...}, ...}`
+        values.
+    """
+    psets = {}  # { objid : { psetid : [propertyid, ... ], ... }, ... }
+    props = {}  # { psetid : [propertyid, ... ] }
+    for rel in ifcfile.by_type("IfcRelDefinesByProperties"):
+        pset = rel.RelatingPropertyDefinition
+        if not pset.is_a("IfcPropertySet"):
+            continue
+        psetid = pset.id()
+        if psetid not in props:
+            props[psetid] = [prop.id() for prop in pset.HasProperties]
+        for obj in rel.RelatedObjects:
+            psets.setdefault(obj.id(), {})[psetid] = props[psetid]
+    return psets
+
+
+def buildRelLayers(ifcfile):
+    """Build the representation/layer relation table.
+
+    Returns
+    -------
+    dict
+        A dictionary with `{representationid: layer_name, ...}` values,
+        using the first layer an item is assigned to.
+    """
+    layers = {}  # { representationid : layer_name }
+    for layer in ifcfile.by_type("IfcPresentationLayerAssignment"):
+        for item in layer.AssignedItems:
+            layers.setdefault(item.id(), layer.Name)
+    return layers
+
+
 def getIfcPropertySets(ifcfile, pid):
     """Returns a dictionary of {pset_id:[prop_id, prop_id...]} for an IFC object"""
 
@@ -756,6 +864,72 @@ def getPlacement(entity,scaling=1000):
     return pl
 
 
+def getMappedPlacement(product,scaling=1000):
+    """returns the mapping source id and the placement of the mapped body of a product
+
+    If the body representation of the product is a single IfcMappedItem,
+    this returns a tuple (representation map id, placement), where the
+    placement takes the geometry of the representation map to its position
+    in the world. All the products using the same representation map have
+    the same shape, moved by their placements. Otherwise, or if the mapping
+    is not a rigid transformation, this returns None."""
+
+    try:
+        representations = product.Representation.Representations
+        objpl = product.ObjectPlacement
+    except AttributeError:
+        return None
+    items = None
+    for r in representations:
+        if r.RepresentationIdentifier and r.RepresentationIdentifier.upper() == "BODY":
+            items = r.Items
+            break
+    if (not items) or (len(items) != 1) or (not items[0].is_a("IfcMappedItem")):
+        return None
+    item = items[0]
+    target = item.MappingTarget
+    origin = item.MappingSource.MappingOrigin
+    if target.is_a("IfcCartesianTransformationOperator3DnonUniform"):
+        return None
+    if not target.is_a("IfcCartesianTransformationOperator3D"):
+        return None
+    if (target.Scale is not None) and abs(target.Scale - 1.0) > 1e-9:
+        return None
+    if not origin.is_a("IfcAxis2Placement3D"):
+        return None
+    if (not objpl) or (not objpl.is_a("IfcLocalPlacement")):
+        return None
+
+    # placement of the mapping target, built as an orthonormal frame
+    x = getVector(target.Axis1) or FreeCAD.Vector(1,0,0)
+    if target.Axis3:
+        z = getVector(target.Axis3)
+    elif target.Axis2:
+        z = x.cross(getVector(target.Axis2))
+    else:
+        z = FreeCAD.Vector(0,0,1)
+    if (x.Length < 1e-9) or (z.Length < 1e-9):
+        return None
+    z.normalize()
+    x = x.sub(FreeCAD.Vector(z).multiply(x.dot(z)))
+    if x.Length < 1e-9:
+        return None
+    x.normalize()
+    y = z.cross(x)
+    m = FreeCAD.Matrix(x.x,y.x,z.x,0,
+                       x.y,y.y,z.y,0,
+                       x.z,y.z,z.z,0,
+                       0,0,0,1)
+    targetpl = FreeCAD.Placement(m)
+    targetpl.Base = getVector(target.LocalOrigin).multiply(scaling)
+
+    objectpl = getPlacement(objpl,scaling)
+    originpl = getPlacement(origin,scaling)
+    if (not objectpl) or (not originpl):
+        return None
+    return item.MappingSource.id(), objectpl.multiply(targetpl).multiply(originpl.inverse())
+
+
 def getVector(entity,scaling=1000):
     """returns a vector from the given entity"""
 
@@ -20,6 +20,7 @@
 #***************************************************************************
 
 import os
+import array
 import codecs
 import ntpath
 # import numpy as np
@@ -63,6 +64,18 @@ def findVert(aVertex,aList):
                     return i
     return None
 
+def vertKey(point):
+    "returns a hashable key of a point, rounded like in findVert"
+    return (round(point.x,p),round(point.y,p),round(point.z,p))
+
+def buildVertIndex(aList):
+    "returns a dictionary giving the index of each vertex of aList by its rounded coordinates"
+    index = {}
+    for i,v in enumerate(aList):
+        # keep the first index, as findVert does
+        index.setdefault(vertKey(v.Point),i)
+    return index
+
 def getIndices(obj,shape,offsetv,offsetvn):
     "returns a list with 2 lists: vertices and face indexes, offset with the given amount"
     vlist = []
@@ -101,14 +114,18 @@ def getIndices(obj,shape,offsetv,offsetvn):
         mesh = shape
         curves = shape.Topology
     if mesh:
-        for v in mesh.Topology[0]:
+        # the topology is rebuilt every time it is accessed
+        topology = mesh.Topology
+        for v in topology[0]:
             vlist.append(" "+str(round(v[0],p))+" "+str(round(v[1],p))+" "+str(round(v[2],p)))
 
         for vn in mesh.Facets:
-            vnlist.append(" "+str(vn.Normal[0]) + " " + str(vn.Normal[1]) + " " + str(vn.Normal[2]))
+            n = vn.Normal
+            vnlist.append(" "+str(n[0]) + " " + str(n[1]) + " " + str(n[2]))
 
-        for i, vn in enumerate(mesh.Topology[1]):
-            flist.append(" "+str(vn[0]+offsetv)+"//"+str(i+offsetvn)+" "+str(vn[1]+offsetv)+"//"+str(i+offsetvn)+" "+str(vn[2]+offsetv)+"//"+str(i+offsetvn)+" ")
+        for i, vn in enumerate(topology[1]):
+            ni = "//"+str(i+offsetvn)+" "
+            flist.append(" "+str(vn[0]+offsetv)+ni+str(vn[1]+offsetv)+ni+str(vn[2]+offsetv)+ni)
     else:
         if curves:
             for v in curves[0]:
@@ -119,37 +136,48 @@ def getIndices(obj,shape,offsetv,offsetvn):
                     fi += " " + str(vi + offsetv)
                 flist.append(fi)
         else:
-            for v in shape.Vertexes:
+            vertexes = shape.Vertexes
+            for v in vertexes:
                 vlist.append(" "+str(round(v.X,p))+" "+str(round(v.Y,p))+" "+str(round(v.Z,p)))
+            # index of the vertices by rounded coordinates, instead of
+            # searching the whole list for every vertex with findVert
+            vindex = buildVertIndex(vertexes)
             if not shape.Faces:
                 for e in shape.Edges:
                     if DraftGeomUtils.geomType(e) == "Line":
-                        ei = " " + str(findVert(e.Vertexes[0],shape.Vertexes) + offsetv)
-                        ei += " " + str(findVert(e.Vertexes[-1],shape.Vertexes) + offsetv)
+                        ei = " " + str(vindex[vertKey(e.Vertexes[0].Point)] + offsetv)
+                        ei += " " + str(vindex[vertKey(e.Vertexes[-1].Point)] + offsetv)
                         elist.append(ei)
             for f in shape.Faces:
                 if len(f.Wires) > 1:
                     # if we have holes, we triangulate
                     tris = f.tessellate(1)
+                    tinds = []
+                    for pt in tris[0]:
+                        ind = vindex.get(vertKey(pt))
+                        if ind is None:
+                            return None,None,None,None
+                        tinds.append(str(ind + offsetv))
                     for fdata in tris[1]:
-                        fi = ""
-                        for vi in fdata:
-                            vdata = Part.Vertex(tris[0][vi])
-                            fi += " " + str(findVert(vdata,shape.Vertexes) + offsetv)
-                        flist.append(fi)
+                        flist.append("".join(" " + tinds[vi] for vi in fdata))
                 else:
-                    fi = ""
+                    fi = []
                     for e in f.OuterWire.OrderedEdges:
                         #print(e.Vertexes[0].Point,e.Vertexes[1].Point)
-                        v = e.Vertexes[0]
-                        ind = findVert(v,shape.Vertexes)
+                        ind = vindex.get(vertKey(e.Vertexes[0].Point))
                         if ind is None:
-                            return None,None,None
-                        fi += " " + str(ind + offsetv)
-                    flist.append(fi)
+                            return None,None,None,None
+                        fi.append(" " + str(ind + offsetv))
+                    flist.append("".join(fi))
     return vlist,vnlist,elist,flist
 
 
+def writeLines(outfile,prefix,data):
+    "writes all the elements of data as lines starting with the given prefix"
+    if data:
+        outfile.write(prefix + ("\n" + prefix).join(data) + "\n")
+
+
 def export(exportList,filename,colors=None):
 
     """export(exportList,filename,colors=None):
@@ -240,15 +268,11 @@ def export(exportList,filename,colors=None):
                                 outfile.write("usemtl color_" + mn + "\n")
                                 materials.append(("color_" + mn,obj.ViewObject.ShapeColor,obj.ViewObject.Transparency))
 
-                    # write geometry
-                    for v in vlist:
-                        outfile.write("v" + v + "\n")
-                    for vn in vnlist:
-                        outfile.write("vn" + vn + "\n")
-                    for e in elist:
-                        outfile.write("l" + e + "\n")
-                    for f in flist:
-                        outfile.write("f" + f + "\n")
+                    # write geometry, one write call per kind of element
+                    writeLines(outfile,"v",vlist)
+                    writeLines(outfile,"vn",vnlist)
+                    writeLines(outfile,"l",elist)
+                    writeLines(outfile,"f",flist)
     outfile.close()
     FreeCAD.Console.PrintMessage(translate("Arch","Successfully written") + " " + filename + "\n")
     if materials:
@@ -298,88 +322,110 @@ def insert(filename,docname):
         doc = FreeCAD.newDocument(docname)
     FreeCAD.ActiveDocument = doc
 
+    # the file is read line by line in a single pass, and the data is stored
+    # in typed arrays, which take much less memory than lists of numbers
+    verts = array.array("d") # x,y,z coordinates of all the vertices of the file
+    facets = array.array("l") # vertex indices of the triangles of the current object
+    polygons = [] # vertex indices of the faces of the current object with more than 3 vertices
+    activeobject = None
+    activeobjectExists = False
+    material = None
+    colortable = {}
     with pythonopen(filename,"r") as infile:
-        verts = []
-        facets = []
-        activeobject = None
-        material = None
-        colortable = {}
-        content_array = []
         for line in infile:
-            content_array.append(line)
-    activeobjectExists = False
-    for line in content_array:
-        line = line.strip()
-        if line[:2] == "o ":
-            activeobjectExists = True
+            line = line.strip()
+            if line[:2] == "v ":
+                verts.extend([float(i) for i in line[2:].split()[:3]])
+            elif line[:2] == "f ":
+                fa = []
+                for i in line[2:].split():
+                    i = int(i.split("/")[0])
+                    # negative indices are relative to the last vertex
+                    fa.append(i-1 if i > 0 else len(verts)//3 + i)
+                if len(fa) == 3:
+                    facets.extend(fa)
+                elif len(fa) > 3:
+                    polygons.append(fa)
+            elif line[:2] == "o ":
+                # faces found before the first object are not imported
+                if activeobject:
+                    makeMesh(doc,activeobject,verts,facets,material,colortable,polygons)
+                activeobjectExists = True
+                material = None
+                facets = array.array("l")
+                polygons = []
+                activeobject = line[2:]
+            elif line[:7] == "usemtl ":
+                material = line[7:]
+            elif line[:7] == "mtllib ":
+                colortable.update(readMaterials(os.path.join(os.path.dirname(filename),line[7:])))
     if not activeobjectExists:
+        # no object in the file, all faces belong to one mesh
         activeobject = meshName
-    for line in content_array:
-        line = line.strip()
-        if line[:7] == "mtllib ":
-            matlib = os.path.join(os.path.dirname(filename),line[7:])
-            if os.path.exists(matlib):
-                with pythonopen(matlib,"r") as matfile:
-                    mname = None
-                    color = None
-                    trans = None
-                    for mline in matfile:
-                        mline = mline.strip()
-                        if mline[:7] == "newmtl ":
-                            if mname and color:
-                                colortable[mname] = [color,trans]
-                            color = None
-                            trans = None
-                            mname = mline[7:]
-                        elif mline[:3] == "Kd ":
-                            color = tuple([float(i) for i in mline[3:].split()])
-                        elif mline[:2] == "d ":
-                            trans = int((1-float(mline[2:]))*100)
-                    if mname and color:
-                        colortable[mname] = [color,trans]
-        elif line[:2] == "o ":
-            if activeobject:
-                makeMesh(doc,activeobject,verts,facets,material,colortable)
-            material = None
-            facets = []
-            activeobject = line[2:]
-        elif line[:2] == "v ":
-            verts.append([float(i) for i in line[2:].split()])
-        elif line[:2] == "f ":
-            fa = []
-            for i in line[2:].split():
-                if "/" in i:
-                    i = i.split("/")[0]
-                fa.append(int(i))
-            facets.append(fa)
-        elif line[:7] == "usemtl ":
-            material = line[7:]
     if activeobject:
-        makeMesh(doc,activeobject,verts,facets,material,colortable)
+        makeMesh(doc,activeobject,verts,facets,material,colortable,polygons)
     FreeCAD.Console.PrintMessage(translate("Arch","Successfully imported") + ' ' + filename + "\n")
     return doc
 
-def makeMesh(doc,activeobject,verts,facets,material,colortable):
-    mfacets = []
-    if facets:
-        for facet in facets:
-            if len(facet) > 3:
-                vecs = [FreeCAD.Vector(*verts[i-1]) for i in facet]
-                vecs.append(vecs[0])
-                pol = Part.makePolygon(vecs)
-                try:
-                    face = Part.Face(pol)
-                except Part.OCCError:
-                    print("Skipping non-planar polygon:",vecs)
-                else:
-                    tris = face.tessellate(1)
-                    for tri in tris[1]:
-                        mfacets.append([tris[0][i] for i in tri])
-            else:
-                mfacets.append([verts[i-1] for i in facet])
-    if mfacets:
+def readMaterials(matlib):
+    "returns a {name:[color,transparency]} dictionary of the materials of a .mtl file"
+    colortable = {}
+    if os.path.exists(matlib):
+        with pythonopen(matlib,"r") as matfile:
+            mname = None
+            color = None
+            trans = None
+            for mline in matfile:
+                mline = mline.strip()
+                if mline[:7] == "newmtl ":
+                    if mname and color:
+                        colortable[mname] = [color,trans]
+                    color = None
+                    trans = None
+                    mname = mline[7:]
+                elif mline[:3] == "Kd ":
+                    color = tuple([float(i) for i in mline[3:].split()])
+                elif mline[:2] == "d ":
+                    trans = int((1-float(mline[2:]))*100)
+            if mname and color:
+                colortable[mname] = [color,trans]
+    return colortable
+
+def makeMesh(doc,activeobject,verts,facets,material,colortable,polygons=[]):
+    """makes a mesh object from the given vertex coordinates array, triangle
+    vertex indices array and list of polygons vertex indices"""
+    # only the vertices used by this object are passed to the mesh
+    used = {}
+    points = []
+    def getPoint(i):
+        j = used.get(i)
+        if j is None:
+            j = used[i] = len(points)
+            points.append(FreeCAD.Vector(verts[3*i],verts[3*i+1],verts[3*i+2]))
+        return j
+    tris = [(getPoint(facets[k]),getPoint(facets[k+1]),getPoint(facets[k+2]))
+            for k in range(0,len(facets),3)]
+    ptris = []
+    for facet in polygons:
+        vecs = [FreeCAD.Vector(verts[3*i],verts[3*i+1],verts[3*i+2]) for i in facet]
+        vecs.append(vecs[0])
+        pol = Part.makePolygon(vecs)
+        try:
+            face = Part.Face(pol)
+        except Part.OCCError:
+            print("Skipping non-planar polygon:",vecs)
+        else:
+            ftris = face.tessellate(1)
+            for tri in ftris[1]:
+                ptris.append([ftris[0][i] for i in tri])
+    if tris or ptris:
+        mesh = Mesh.Mesh()
+        if tris:
+            mesh.addFacets((points,tris))
+        if ptris:
+            mesh.addFacets(ptris)
         mobj = doc.addObject("Mesh::Feature",activeobject)
-        mobj.Mesh = Mesh.Mesh(mfacets)
+        mobj.Mesh = mesh
         if material and FreeCAD.GuiUp:
             if material in colortable:
                 mobj.ViewObject.ShapeColor = colortable[material][0]
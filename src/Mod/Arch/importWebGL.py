@@ -44,6 +44,9 @@ import Part
 import OfflineRenderingUtils
 import json
 import textwrap
+import array
+import base64
+import sys
 
 if FreeCAD.GuiUp:
     import FreeCADGui
@@ -64,6 +67,8 @@ if open.__module__ in ['__builtin__','io']: pythonopen = open
 disableCompression = False # Compress object data before sending to JS
 base = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ1234567890!#$%&()*+-:;/=>?@[]^_,.{|}~`' # safe str chars for js in all cases
 baseFloat = ',.-0123456789'
+useBinary = False # Default of the WebGLBinary preference: send object data to JS as base64 typed arrays, sharing identical meshes
+uint32 = 'I' if array.array('I').itemsize == 4 else 'L'
 
 def getHTMLTemplate():
     return textwrap.dedent("""\
@@ -151,7 +156,43 @@ def getHTMLTemplate():
                 dLight2.position.set(-5, 2, 3);
                 scene.add(dLight2);
 
-                if (data.compressed) {
+                if (data.binary) {
+                    function arrayDecode(input, type) {
+                        const bytes = Uint8Array.from(atob(input), c => c.charCodeAt(0));
+                        return new type(bytes.buffer);
+                    }
+
+                    function transform(input, matrix) {
+                        if (!matrix) {
+                            return input;
+                        }
+                        const m = new THREE.Matrix4().set(...matrix);
+                        const v = new THREE.Vector3();
+                        const output = new Float32Array(input.length);
+                        for (let i = 0; i < input.length; i += 3) {
+                            v.set(input[i], input[i + 1], input[i + 2]).applyMatrix4(m);
+                            output[i] = v.x;
+                            output[i + 1] = v.y;
+                            output[i + 2] = v.z;
+                        }
+                        return output;
+                    }
+
+                    // Decode the shared meshes and place them for each object
+                    const meshes = data.meshes.map(m => ({
+                        verts: arrayDecode(m.verts, Float32Array),
+                        facets: arrayDecode(m.facets, Uint32Array),
+                        wires: m.wires.map(w => arrayDecode(w, Float32Array)),
+                        facesToFacets: m.facesToFacets.map(x => arrayDecode(x, Uint32Array))
+                    }));
+                    for (const obj of data.objects) {
+                        const mesh = meshes[obj.mesh];
+                        obj.verts = transform(mesh.verts, obj.matrix);
+                        obj.facets = mesh.facets;
+                        obj.wires = mesh.wires.map(w => transform(w, obj.matrix));
+                        obj.facesToFacets = mesh.facesToFacets;
+                    }
+                } else if (data.compressed) {
                     const base = data.base;
                     const baseFloat = data.baseFloat;
 
@@ -653,12 +694,17 @@ def getHTMLTemplate():
     </html>
     """)
 
-def export( exportList, filename, colors = None, camera = None ):
-    """Exports objects to an html file"""
+def export( exportList, filename, colors = None, camera = None, binary = None ):
+    """Exports objects to an html file. If binary is True, object data is written
+    as base64 typed arrays and identical meshes are written once. It defaults to
+    the WebGLBinary preference"""
 
-    global disableCompression, base, baseFloat
+    if binary is None:
+        binary = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Arch").GetBool("WebGLBinary",useBinary)
 
-    data = { 'camera':{}, 'file':{}, 'objects':[] }
+    data = { 'camera':{}, 'file':{}, 'objects':[], 'meshes':[] }
+    meshIndex = {} # mesh contents: index in data['meshes']
+    shapeCache = {} # (hashCode, deviation): [(shape, index in data['meshes']), ...]
 
     if not FreeCADGui and not camera:
         camera = OfflineRenderingUtils.getCamera(FreeCAD.ActiveDocument.FileName)
@@ -741,118 +787,35 @@ def export( exportList, filename, colors = None, camera = None ):
                     for fc in obj.ViewObject.DiffuseColor:
                         objdata['faceColors'].append( Draft.getrgb(fc, testbw = False) )
 
-            # get verts and facets for ENTIRE object
-            shapeData = objShape.tessellate( deviation )
-            mesh = Mesh.Mesh(shapeData)
-
-            if len(objShape.Faces) > 1:
-                # Map each Facet created by tessellate() to a Face so that it can be colored correctly using faceColors
-                # This is done by matching the results of a tessellate() on EACH FACE to the overall tessellate stored in shapeData
-                # if there is any error in matching these two then we display the whole object as one face and forgo the face colors
-                for f in objShape.Faces:
-                    faceData = f.tessellate( deviation )
-                    found = True
-                    for fv in range( len(faceData[0]) ): # face verts. List of type Vector()
-                        found = False
-                        for sv in range( len(shapeData[0]) ): #shape verts
-                            if faceData[0][fv] == shapeData[0][sv]: # do not use isEqual() here
-                                faceData[0][fv] = sv # replace with the index of shapeData[0]
-                                found = True
-                                break
-                        if not found: break
-                    if not found:
-                        FreeCAD.Console.PrintMessage("Facet to Face Mismatch.\n")
-                        objdata['facesToFacets'] = []
-                        break
-
-                    # map each of the face facets to the shape facets and make a list of shape facet indices that belong to this face
-                    facetList = []
-                    for ff in faceData[1]: # face facets
-                        found = False
-                        for sf in range( len(shapeData[1]) ): #shape facets
-                            if faceData[0][ff[0]] in shapeData[1][sf] and faceData[0][ff[1]] in shapeData[1][sf] and faceData[0][ff[2]] in shapeData[1][sf]:
-                                facetList.append(sf)
-                                found = True
-                                break
-                        if not found: break
-                    if not found:
-                        FreeCAD.Console.PrintMessage("Facet List Mismatch.\n")
-                        objdata['facesToFacets'] = []
+            if binary:
+                # tessellate in local coordinates so that links and clones of the
+                # same shape share a single mesh, positioned by a matrix in JS
+                matrix = objShape.Placement.toMatrix()
+                objShape = objShape.copy(False)
+                objShape.Placement = FreeCAD.Placement()
+                if not matrix.isUnity(): objdata['matrix'] = list(matrix.A)
+                key = (objShape.hashCode(), deviation)
+                for cached, index in shapeCache.get(key, []):
+                    if cached.isSame(objShape):
+                        objdata['mesh'] = index
                         break
-
-                    objdata['facesToFacets'].append( baseEncode(facetList) )
-
-            wires = [] # Add wires
-            for f in objShape.Faces:
-                for w in f.Wires:
-                    wo = Part.Wire(Part.__sortEdges__(w.Edges))
-                    wire = []
-                    for v in wo.discretize(QuasiDeflection = 0.005):
-                        wire.append( '{:.5f}'.format(v.x) ) # use strings to avoid 0.00001 written as 1e-05
-                        wire.append( '{:.5f}'.format(v.y) )
-                        wire.append( '{:.5f}'.format(v.z) )
-                    wires.append( wire )
-
-            if not disableCompression:
-                for w in range( len(wires) ):
-                    for wv in range( len(wires[w]) ):
-                        found = False
-                        for f in range( len(objdata['floats']) ):
-                            if objdata['floats'][f] == wires[w][wv]:
-                                wires[w][wv] = f
-                                found = True
-                                break
-                        if not found:
-                            objdata['floats'].append( wires[w][wv] )
-                            wires[w][wv] = len(objdata['floats'])-1
-                    wires[w] = baseEncode(wires[w])
-            objdata['wires'] = wires
-
-        vIndex = {}
-        verts = []
-        for p in range( len(mesh.Points) ):
-            vIndex[ mesh.Points[p].Index ] = p
-            verts.append( '{:.5f}'.format(mesh.Points[p].Vector.x) )
-            verts.append( '{:.5f}'.format(mesh.Points[p].Vector.y) )
-            verts.append( '{:.5f}'.format(mesh.Points[p].Vector.z) )
-
-        # create floats list to compress verts and wires being written into the JS
-        if not disableCompression:
-            for v in range( len(verts) ):
-                found = False
-                for f in range( len(objdata['floats']) ):
-                    if objdata['floats'][f] == verts[v]:
-                        verts[v] = f
-                        found = True
-                        break
-                if not found:
-                    objdata['floats'].append( verts[v] )
-                    verts[v] = len(objdata['floats'])-1
-        objdata['verts'] = baseEncode(verts)
-
-        facets = []
-        for f in mesh.Facets:
-            for i in f.PointIndices:
-                facets.append( vIndex[i] )
-        objdata['facets'] = baseEncode(facets)
-
-        # compress floats
-        if not disableCompression:
-            # use ratio of 7x base13 to 4x base90 because 13^7 ~ 90^4
-            fullstr = json.dumps(objdata['floats'], separators=(',', ':'))
-            fullstr = fullstr.replace('[', '').replace(']', '').replace('"', '')
-            floatStr = ''
-            baseFloatCt = len(baseFloat)
-            baseCt = len(base)
-            for fs in range( 0, len(fullstr), 7 ): # chunks of 7 chars, skip the first one
-                str7 = fullstr[fs:(fs+7)]
-                quotient = 0
-                for s in range( len(str7) ):
-                    quotient += baseFloat.find(str7[s]) * pow(baseFloatCt, (6-s))
-                for v in range(4):
-                    floatStr += base[ quotient % baseCt ]
-                    quotient = int(quotient / baseCt)
-            objdata['floats'] = floatStr
+                else:
+                    verts, facets, facesToFacets, wires = getShapeData(objShape, deviation)
+                    objdata['mesh'] = addBinaryMesh(data, meshIndex, verts, facets, facesToFacets, wires)
+                    shapeCache.setdefault(key, []).append((objShape, objdata['mesh']))
+            else:
+                verts, facets, facesToFacets, wires = getShapeData(objShape, deviation)
+                encodeText(objdata, verts, facets, facesToFacets, wires)
+        else:
+            verts, facets = getMeshData(mesh)
+            if binary:
+                objdata['mesh'] = addBinaryMesh(data, meshIndex, verts, facets, [], [])
+            else:
+                encodeText(objdata, verts, facets, [], [])
+
+        if binary:
+            for k in ['verts', 'facets', 'wires', 'facesToFacets', 'floats']:
+                del objdata[k]
 
         data['objects'].append( objdata )
 
@@ -864,6 +827,7 @@ def export( exportList, filename, colors = None, camera = None ):
 
     # Remove data compression in JS
     data['compressed'] = not disableCompression
+    data['binary'] = binary
     data['base'] = base
     data['baseFloat'] = baseFloat
 
@@ -874,24 +838,140 @@ def export( exportList, filename, colors = None, camera = None ):
     outfile.close()
     FreeCAD.Console.PrintMessage( translate("Arch", "Successfully written") + ' ' + filename + "\n" )
 
+def getShapeData( shape, deviation ):
+    """Returns the verts, facets, facets of each face and wires of a shape"""
+
+    # get verts and facets for ENTIRE object
+    shapeData = shape.tessellate( deviation )
+    mesh = Mesh.Mesh(shapeData)
+
+    facesToFacets = []
+    if len(shape.Faces) > 1:
+        # Map each Facet created by tessellate() to a Face so that it can be colored correctly using faceColors
+        # This is done by matching the results of a tessellate() on EACH FACE to the overall tessellate stored in shapeData
+        # if there is any error in matching these two then we display the whole object as one face and forgo the face colors
+        vIndex = {}
+        for sv, v in enumerate(shapeData[0]):
+            vIndex.setdefault( (v.x, v.y, v.z), sv ) # do not use isEqual() here
+        fIndex = {}
+        for sf, f in enumerate(shapeData[1]):
+            fIndex.setdefault( frozenset(f), sf )
+        for f in shape.Faces:
+            faceData = f.tessellate( deviation )
+            faceVerts = [vIndex.get( (v.x, v.y, v.z) ) for v in faceData[0]] # indices of shapeData[0]
+            if None in faceVerts:
+                FreeCAD.Console.PrintMessage("Facet to Face Mismatch.\n")
+                facesToFacets = []
+                break
+
+            # map each of the face facets to the shape facets and make a list of shape facet indices that belong to this face
+            facetList = [fIndex.get( frozenset([faceVerts[i] for i in ff]) ) for ff in faceData[1]]
+            if None in facetList:
+                FreeCAD.Console.PrintMessage("Facet List Mismatch.\n")
+                facesToFacets = []
+                break
+            facesToFacets.append( facetList )
+
+    wires = []
+    for f in shape.Faces:
+        for w in f.Wires:
+            wo = Part.Wire(Part.__sortEdges__(w.Edges))
+            wire = []
+            for v in wo.discretize(QuasiDeflection = 0.005):
+                wire.extend( (v.x, v.y, v.z) )
+            wires.append( wire )
+
+    verts, facets = getMeshData(mesh)
+    return verts, facets, facesToFacets, wires
+
+def getMeshData( mesh ):
+    """Returns the flat lists of vert coordinates and facet indices of a mesh"""
+
+    points, triangles = mesh.Topology
+    verts = []
+    for p in points:
+        verts.extend( (p.x, p.y, p.z) )
+    facets = [i for t in triangles for i in t]
+    return verts, facets
+
+def encodeText( objdata, verts, facets, facesToFacets, wires ):
+    """Stores the geometry of an object in objdata as base90 strings"""
+
+    fmt = '{:.5f}'.format # use strings to avoid 0.00001 written as 1e-05
+    if disableCompression:
+        objdata['wires'] = [[fmt(v) for v in w] for w in wires]
+        objdata['verts'] = [fmt(v) for v in verts]
+        objdata['facets'] = facets
+        objdata['facesToFacets'] = facesToFacets
+        return
+
+    # create floats list to compress verts and wires being written into the JS
+    floats = {}
+    def floatIndices(values):
+        return [floats.setdefault(s, len(floats)) for s in map(fmt, values)]
+    objdata['wires'] = [baseEncode(floatIndices(w)) for w in wires]
+    objdata['verts'] = baseEncode(floatIndices(verts))
+    objdata['facets'] = baseEncode(facets)
+    objdata['facesToFacets'] = [baseEncode(f) for f in facesToFacets]
+    objdata['floats'] = floatEncode(list(floats))
+
+def addBinaryMesh( data, meshIndex, verts, facets, facesToFacets, wires ):
+    """Adds a mesh as base64 typed arrays to data and returns its index.
+    Meshes with identical contents are stored only once"""
+
+    mesh = { 'verts': binaryEncode(verts, 'f'),
+             'facets': binaryEncode(facets, uint32),
+             'wires': [binaryEncode(w, 'f') for w in wires],
+             'facesToFacets': [binaryEncode(f, uint32) for f in facesToFacets] }
+    key = (mesh['verts'], mesh['facets'], tuple(mesh['wires']), tuple(mesh['facesToFacets']))
+    if not key in meshIndex:
+        meshIndex[key] = len(data['meshes'])
+        data['meshes'].append( mesh )
+    return meshIndex[key]
+
+def binaryEncode( values, typecode ):
+    """Packs a list of numbers into a little-endian typed array encoded in base64"""
+
+    arr = array.array(typecode, values)
+    if sys.byteorder == 'big': arr.byteswap()
+    return base64.b64encode(arr.tobytes()).decode('ascii')
+
+def floatEncode( floats ):
+    """Compresses a list of float strings into a base90 string"""
+
+    # use ratio of 7x base13 to 4x base90 because 13^7 ~ 90^4
+    fullstr = ','.join(floats)
+    baseFloatCt = len(baseFloat)
+    baseCt = len(base)
+    output = []
+    for fs in range( 0, len(fullstr), 7 ): # chunks of 7 chars
+        str7 = fullstr[fs:(fs+7)]
+        quotient = 0
+        for c in str7:
+            quotient = quotient * baseFloatCt + baseFloat.find(c)
+        quotient *= baseFloatCt ** (7 - len(str7)) # short chunks are padded with baseFloat[0]
+        for v in range(4):
+            quotient, r = divmod(quotient, baseCt)
+            output.append( base[r] )
+    return ''.join(output)
+
 def baseEncode( arr ):
     """Compresses an array of ints into a base90 string"""
 
-    global disableCompression, base
     if disableCompression: return arr
     if len(arr) == 0: return ''
 
-    longest = 0
-    output = []
+    # encode each distinct value once
     baseCt = len(base)
-    for v in range( len(arr) ):
-        buffer = ''
-        quotient = arr[v]
+    codes = {}
+    for value in set(arr):
+        buffer = []
+        quotient = value
         while True:
-            buffer += base[ quotient % baseCt ]
-            quotient = int(quotient / baseCt)
+            quotient, r = divmod(quotient, baseCt)
+            buffer.append( base[r] )
             if quotient == 0: break
-        output.append( buffer )
-        if len(buffer) > longest: longest = len(buffer)
-    output = [('{:>'+str(longest)+'}').format(x) for x in output] # pad each element
-    return str(longest) + ('').join(output)
+        codes[value] = ''.join(buffer)
+    longest = max(len(c) for c in codes.values())
+    codes = {k: c.rjust(longest) for k, c in codes.items()} # pad each element
+    return str(longest) + ''.join([codes[v] for v in arr])
@@ -163,8 +163,9 @@ def downgrade(objects, delete=False, force=None):
                 faces.extend(o.Shape.Faces)
                 delete_list.append(o)
         u = faces.pop(0)
-        for f in faces:
-            u = u.cut(f)
+        if faces:
+            # cut all the faces in one boolean operation
+            u = u.cut(faces)
         if not u.isNull():
             newobj = doc.addObject("Part::Feature", "Subtraction")
             newobj.Shape = u
@@ -206,13 +207,11 @@ def downgrade(objects, delete=False, force=None):
 
     for o in objects:
         if hasattr(o, 'Shape'):
-            for s in o.Shape.Solids:
-                solids.append(s)
-            for f in o.Shape.Faces:
-                faces.append(f)
-            for e in o.Shape.Edges:
-                edges.append(e)
-            if o.Shape.ShapeType != "Edge":
+            shape = o.Shape
+            solids.extend(shape.Solids)
+            faces.extend(shape.Faces)
+            edges.extend(shape.Edges)
+            if shape.ShapeType != "Edge":
                 onlyedges = False
             parts.append(o)
     objects = parts
@@ -27,6 +27,7 @@
 # \ingroup draftfunctions
 # \brief Provides functions to return the SVG representation of shapes.
 
+import collections
 import math
 import lazy_loader.lazy_loader as lz
 
@@ -43,6 +44,20 @@ from draftutils.messages import _wrn, _err
 Part = lz.LazyLoader("Part", globals(), "Part")
 DraftGeomUtils = lz.LazyLoader("DraftGeomUtils", globals(), "DraftGeomUtils")
 
+# SVG paths of the shapes already exported, see _get_shape_paths,
+# the entries of a document are removed when it is closed
+SVG_CACHE_SIZE = 1000
+_svg_cache = collections.OrderedDict()
+_svg_cache_observer = None
+
+
+class _SvgCacheDocObserver:
+    """Remove the cached SVG paths of a document when it is closed."""
+
+    def slotDeletedDocument(self, doc):
+        for key in [k for k in _svg_cache if k[0] == doc.Name]:
+            del _svg_cache[key]
+
 
 ## \addtogroup draftfunctions
 # @{
@@ -837,47 +852,14 @@ def get_svg(obj,
         else:
             fill = 'none'
 
+        paths = _get_shape_paths(obj, plane,
+                                 fill, stroke, linewidth, lstyle,
+                                 fill_opacity)
         if len(obj.Shape.Vertexes) > 1:
-            wiredEdges = []
-            if obj.Shape.Faces:
-                for i, f in enumerate(obj.Shape.Faces):
-                    # place outer wire first
-                    wires = [f.OuterWire]
-                    wires.extend([w for w in f.Wires if w.hashCode() != f.OuterWire.hashCode()])
-                    svg += get_path(obj, plane,
-                                    fill, pathdata, stroke, linewidth, lstyle,
-                                    fill_opacity=fill_opacity,
-                                    wires=f.Wires,
-                                    pathname='%s_f%04d' % (obj.Name, i))
-                    wiredEdges.extend(f.Edges)
-            else:
-                for i, w in enumerate(obj.Shape.Wires):
-                    svg += get_path(obj, plane,
-                                    fill, pathdata, stroke, linewidth, lstyle,
-                                    fill_opacity=fill_opacity,
-                                    edges=w.Edges,
-                                    pathname='%s_w%04d' % (obj.Name, i))
-                    wiredEdges.extend(w.Edges)
-            if len(wiredEdges) != len(obj.Shape.Edges):
-                for i, e in enumerate(obj.Shape.Edges):
-                    if DraftGeomUtils.findEdge(e, wiredEdges) is None:
-                        svg += get_path(obj, plane,
-                                        fill, pathdata, stroke, linewidth,
-                                        lstyle, fill_opacity=fill_opacity,
-                                        edges=[e],
-                                        pathname='%s_nwe%04d' % (obj.Name, i))
-        else:
+            svg += paths
+        elif paths is not None:
             # closed circle or spline
-            if obj.Shape.Edges:
-                if isinstance(obj.Shape.Edges[0].Curve, Part.Circle):
-                    svg = get_circle(plane,
-                                     fill, stroke, linewidth, lstyle,
-                                     obj.Shape.Edges[0])
-                else:
-                    svg = get_path(obj, plane,
-                                   fill, pathdata, stroke, linewidth, lstyle,
-                                   fill_opacity=fill_opacity,
-                                   edges=obj.Shape.Edges)
+            svg = paths
 
         if (App.GuiUp
                 and hasattr(obj.ViewObject, "EndArrow")
@@ -900,6 +882,96 @@ def get_svg(obj,
     return svg
 
 
+def _get_plane_key(plane):
+    """Return a hashable key of the projection done by a plane."""
+    if not plane:
+        # arcs are then oriented with the current working plane
+        if hasattr(App, "DraftWorkingPlane"):
+            return tuple(App.DraftWorkingPlane.axis)
+        return None
+    return (tuple(plane.u), tuple(plane.v), tuple(plane.axis))
+
+
+def _get_shape_paths(obj, plane,
+                     fill, stroke, linewidth, lstyle, fill_opacity):
+    """Return the SVG paths of the faces, wires and edges of an object.
+
+    The result only depends on the shape of the object, the projection
+    plane, the styles and the `svgDiscretization` preference used to
+    discretize curves, so it is kept in an LRU cache and unchanged
+    objects are not discretized and projected again when a drawing
+    page is refreshed. The cache does not outlive the document.
+    It returns `None` if a shape with a single vertex has no edges.
+    """
+    global _svg_cache_observer
+    shape = obj.Shape
+    param = App.ParamGet("User parameter:BaseApp/Preferences/Mod/Draft")
+    discretization = param.GetFloat("svgDiscretization", 10.0)
+    doc = getattr(obj, "Document", None)
+    key = (doc.Name if doc else None, obj.Name, shape.hashCode(),
+           _get_plane_key(plane), discretization,
+           fill, stroke, linewidth, lstyle, fill_opacity)
+    cached = _svg_cache.get(key)
+    # hash codes are not unique, make sure this is the same shape
+    if cached is not None and cached[0].isSame(shape):
+        _svg_cache.move_to_end(key)
+        return cached[1]
+
+    svg = ""
+    pathdata = []
+    if len(shape.Vertexes) > 1:
+        wiredEdges = []
+        if shape.Faces:
+            for i, f in enumerate(shape.Faces):
+                svg += get_path(obj, plane,
+                                fill, pathdata, stroke, linewidth, lstyle,
+                                fill_opacity=fill_opacity,
+                                wires=f.Wires,
+                                pathname='%s_f%04d' % (obj.Name, i))
+                wiredEdges.extend(f.Edges)
+        else:
+            for i, w in enumerate(shape.Wires):
+                svg += get_path(obj, plane,
+                                fill, pathdata, stroke, linewidth, lstyle,
+                                fill_opacity=fill_opacity,
+                                edges=w.Edges,
+                                pathname='%s_w%04d' % (obj.Name, i))
+                wiredEdges.extend(w.Edges)
+        if len(wiredEdges) != len(shape.Edges):
+            for i, e in enumerate(shape.Edges):
+                if DraftGeomUtils.findEdge(e, wiredEdges) is None:
+                    svg += get_path(obj, plane,
+                                    fill, pathdata, stroke, linewidth,
+                                    lstyle, fill_opacity=fill_opacity,
+                                    edges=[e],
+                                    pathname='%s_nwe%04d' % (obj.Name, i))
+    elif shape.Edges:
+        if isinstance(shape.Edges[0].Curve, Part.Circle):
+            svg = get_circle(plane,
+                             fill, stroke, linewidth, lstyle,
+                             shape.Edges[0])
+        else:
+            svg = get_path(obj, plane,
+                           fill, pathdata, stroke, linewidth, lstyle,
+                           fill_opacity=fill_opacity,
+                           edges=shape.Edges)
+    else:
+        svg = None
+
+    if _svg_cache_observer is None:
+        _svg_cache_observer = _SvgCacheDocObserver()
+        App.addDocumentObserver(_svg_cache_observer)
+    _svg_cache[key] = (shape, svg)
+    if len(_svg_cache) > SVG_CACHE_SIZE:
+        _svg_cache.popitem(last=False)
+    return svg
+
+
+def clear_svg_cache():
+    """Empty the cache of SVG paths used by `get_svg`."""
+    _svg_cache.clear()
+
+
 def get_print_color(obj):
     """returns the print color of the parent layer, if available"""
     for parent in obj.InListRecursive:
@@ -64,23 +64,46 @@ def get_proj(vec, plane=None):
     if not plane:
         return vec
 
-    nx = DraftVecUtils.project(vec, plane.u)
-    lx = nx.Length
-
-    if abs(nx.getAngle(plane.u)) > 0.1:
-        lx = -lx
-
-    ny = DraftVecUtils.project(vec, plane.v)
-    ly = ny.Length
-
-    if abs(ny.getAngle(plane.v)) > 0.1:
-        ly = -ly
+    # Projecting on an axis and taking the signed length of the result
+    # is the same as a dot product with the normalized axis
+    lu = plane.u.Length
+    lv = plane.v.Length
+    lx = vec.dot(plane.u)/lu if lu else 0.0
+    ly = vec.dot(plane.v)/lv if lv else 0.0
 
     # if techdraw: buggy - we now simply do it at the end
     #    ly = -ly
     return App.Vector(lx, ly, 0)
 
 
+def get_proj_list(points, plane=None):
+    """Get the projections of a list of points in the plane's u and v directions.
+
+    It gives the same result as calling `get_proj` on every point,
+    but the plane axes are only normalized once.
+
+    Parameters
+    ----------
+    points: list of Base::Vector3
+        The points to project.
+
+    plane: WorkingPlane.Plane
+        An object of type `WorkingPlane`.
+
+    Returns
+    -------
+    list of Base::Vector3
+    """
+    if not plane:
+        return list(points)
+
+    lu = plane.u.Length
+    lv = plane.v.Length
+    u = App.Vector(plane.u).multiply(1.0/lu) if lu else App.Vector()
+    v = App.Vector(plane.v).multiply(1.0/lv) if lv else App.Vector()
+    return [App.Vector(p.dot(u), p.dot(v), 0) for p in points]
+
+
 def getProj(vec, plane=None):
     """Get a projection of a vector. DEPRECATED."""
     utils.use_instead("get_proj")
@@ -99,19 +122,19 @@ def get_discretized(edge, plane):
     if d == 0:
         d = 1
 
-    edata = ""
-    for i in range(d + 1):
-        _length = edge.LastParameter - edge.FirstParameter
-        _point = edge.FirstParameter + float(i)/d * _length
-        _vec = edge.valueAt(_point)
-        v = get_proj(_vec, plane)
+    first = edge.FirstParameter
+    _length = edge.LastParameter - first
+    points = [edge.valueAt(first + float(i)/d * _length)
+              for i in range(d + 1)]
 
+    edata = []
+    for v in get_proj_list(points, plane):
         if not edata:
-            edata += 'M ' + str(v.x) + ' ' + str(v.y) + ' '
+            edata.append('M ' + str(v.x) + ' ' + str(v.y) + ' ')
         else:
-            edata += 'L ' + str(v.x) + ' ' + str(v.y) + ' '
+            edata.append('L ' + str(v.x) + ' ' + str(v.y) + ' ')
 
-    return edata
+    return "".join(edata)
 
 
 def getDiscretized(edge, plane):
@@ -250,11 +250,16 @@ def upgrade(objects, delete=False, force=None):
                     # from obj.Shape.Faces. Since we cannot compare
                     # via hashCode(), we have to iterate and use a different
                     # criteria to find the original matching color
+                    # The faces are indexed by area, the first matching
+                    # face keeps its color as before
+                    colindex = {}
+                    for fcind, fcface in enumerate(facecolors[1]):
+                        colindex.setdefault(fcface.Area, []).append(fcind)
                     colarray = []
                     for ind, face in enumerate(newobj.Shape.Faces):
-                        for fcind, fcface in enumerate(facecolors[1]):
-                            if (face.Area == fcface.Area
-                                    and face.CenterOfMass == fcface.CenterOfMass):
+                        for fcind in colindex.get(face.Area, []):
+                            fcface = facecolors[1][fcind]
+                            if face.CenterOfMass == fcface.CenterOfMass:
                                 colarray.append(facecolors[0][fcind])
                                 break
                     newobj.ViewObject.DiffuseColor = colarray
@@ -276,10 +281,12 @@ def upgrade(objects, delete=False, force=None):
             _err(translate("draft","Faces must be coplanar to be refined"))
             return None
 
-        # fuse faces
+        # fuse faces, all at once: a single boolean operation only
+        # intersects the faces whose bounding boxes overlap, while
+        # fusing them one by one recomputes the growing result every time
         fuse_face = faces.pop(0)
-        for face in faces:
-            fuse_face = fuse_face.fuse(face)
+        if faces:
+            fuse_face = fuse_face.multiFuse(faces)
 
         face = DraftGeomUtils.concatenate(fuse_face)
         # to prevent create new object if concatenate fails
@@ -387,19 +394,26 @@ def upgrade(objects, delete=False, force=None):
             groups.append(ob)
         elif hasattr(ob, 'Shape'):
             parts.append(ob)
-            faces.extend(ob.Shape.Faces)
-            wires.extend(ob.Shape.Wires)
-            edges.extend(ob.Shape.Edges)
-            for f in ob.Shape.Faces:
+            # get the shape and its subshapes only once, every access
+            # to them builds new Python objects
+            shape = ob.Shape
+            obfaces = shape.Faces
+            obwires = shape.Wires
+            obedges = shape.Edges
+            faces.extend(obfaces)
+            wires.extend(obwires)
+            edges.extend(obedges)
+            for f in obfaces:
                 facewires.extend(f.Wires)
-            wirededges = []
-            for w in ob.Shape.Wires:
-                if len(w.Edges) > 1:
-                    for e in w.Edges:
-                        wirededges.append(e.hashCode())
+            wirededges = set()
+            for w in obwires:
+                wedges = w.Edges
+                if len(wedges) > 1:
+                    for e in wedges:
+                        wirededges.add(e.hashCode())
                 if not w.isClosed():
                     openwires.append(w)
-            for e in ob.Shape.Edges:
+            for e in obedges:
                 if DraftGeomUtils.geomType(e) != "Line":
                     curves.append(e)
                 if not e.hashCode() in wirededges and not e.isClosed():
@@ -0,0 +1,161 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 FreeCAD Developers                                 *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful,            *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with FreeCAD; if not, write to the Free Software        *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Provides a spatial index to find the edges of a shape near a region."""
+## @package edge_index
+# \ingroup draftgeoutils
+# \brief Provides a spatial index to find the edges of a shape near a region.
+
+## \addtogroup draftgeoutils
+# @{
+import math
+
+import FreeCAD as App
+
+
+class EdgeIndex:
+    """Uniform grid of the bounding boxes of a list of edges.
+
+    Every edge is registered in the grid cells touched by its bounding box.
+    A query returns the edges whose bounding boxes overlap a given box,
+    only looking at the cells covered by that box, so the cost of a query
+    depends on the number of edges around it and not on the total number
+    of edges.
+
+    The bounding box of a long diagonal edge covers many cells while
+    the edge crosses only a few of them. Edges touching more than
+    `max_cells` cells are not put in the grid but kept in a separate
+    list, checked by every query.
+
+    Parameters
+    ----------
+    edges: list of Part::TopoShape ('Edge')
+        The edges to index, usually `shape.Edges`.
+
+    Attributes
+    ----------
+    edges: list of Part::TopoShape ('Edge')
+        The indexed edges, in the given order.
+
+    boxes: list of Base::BoundBox
+        The bounding boxes of the edges.
+
+    large: list of int
+        The indices of the edges which are not in the grid.
+    """
+
+    max_cells = 64
+
+    def __init__(self, edges):
+        self.edges = list(edges)
+        self.boxes = [e.BoundBox for e in self.edges]
+        self.cells = {}
+        self.bound = App.BoundBox()
+        for box in self.boxes:
+            self.bound.add(box)
+
+        # Choose a cell size giving about one edge per cell,
+        # using only the axes along which the edges are spread
+        extents = [self.bound.XLength, self.bound.YLength, self.bound.ZLength]
+        spread = [x for x in extents if x > 1e-7]
+        if not self.edges or not spread:
+            self.size = 1.0
+        else:
+            per_axis = max(1, int(round(len(self.edges) ** (1.0/len(spread)))))
+            self.size = max(spread) / per_axis
+
+        self.large = []
+        for i, box in enumerate(self.boxes):
+            ranges = self._ranges(box)
+            if self._count(ranges) > self.max_cells:
+                self.large.append(i)
+                continue
+            for key in self._keys(ranges):
+                self.cells.setdefault(key, []).append(i)
+
+    def _ranges(self, box):
+        """Return the ranges of cells touched by a bounding box, per axis."""
+        b = self.bound
+        s = self.size
+        ranges = []
+        for low, high, origin in ((box.XMin, box.XMax, b.XMin),
+                                  (box.YMin, box.YMax, b.YMin),
+                                  (box.ZMin, box.ZMax, b.ZMin)):
+            first = int(math.floor((low - origin) / s))
+            last = int(math.floor((high - origin) / s))
+            ranges.append(range(first, last + 1))
+        return ranges
+
+    def _count(self, ranges):
+        """Return the number of cells in the given ranges."""
+        return len(ranges[0]) * len(ranges[1]) * len(ranges[2])
+
+    def _keys(self, ranges):
+        """Return the keys of the cells in the given ranges."""
+        return [(i, j, k)
+                for i in ranges[0] for j in ranges[1] for k in ranges[2]]
+
+    def query(self, box, tol=0.0):
+        """Return the indices of the edges whose boxes overlap a box.
+
+        Parameters
+        ----------
+        box: Base::BoundBox
+            The region to search. It is not modified.
+
+        tol: float, optional
+            It defaults to `0.0`. The box is enlarged by this value
+            in all directions before searching.
+
+        Returns
+        -------
+        list of int
+            The indices in `edges` of the candidate edges, in increasing
+            order.
+        """
+        if not self.edges:
+            return []
+        box = App.BoundBox(box)
+        if tol:
+            box.enlarge(tol)
+        if not box.intersect(self.bound):
+            return []
+        # clip the box to the indexed region to limit the cells visited
+        box = box.intersected(self.bound)
+        ranges = self._ranges(box)
+        if self._count(ranges) > len(self.edges):
+            # visiting the cells would cost more than testing every box
+            found = range(len(self.edges))
+        else:
+            found = set(self.large)
+            for key in self._keys(ranges):
+                found.update(self.cells.get(key, ()))
+        return sorted(i for i in found if self.boxes[i].intersect(box))
+
+    def query_edges(self, box, tol=0.0):
+        """Return the edges whose boxes overlap a box.
+
+        See `query` for the parameters.
+        """
+        return [self.edges[i] for i in self.query(box, tol)]
+
+## @}
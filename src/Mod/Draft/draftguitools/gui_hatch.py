@@ -23,9 +23,9 @@
 
 """This module contains FreeCAD commands for the Draft workbench"""
 
-import os
 import FreeCAD
 import draftguitools.gui_base as gui_base
+from draftobjects.hatch import get_patterns
 
 from draftutils.translate import translate, QT_TRANSLATE_NOOP
 
@@ -121,13 +121,7 @@ class Draft_Hatch_TaskPanel:
     def getPatterns(self,filename):
 
         """returns a list of pattern names found in a PAT file"""
-        patterns = []
-        if os.path.exists(filename):
-            with open(filename) as patfile:
-                for line in patfile:
-                    if line.startswith("*"):
-                        patterns.append(line.split(",")[0][1:])
-        return patterns
+        return get_patterns(filename)
 
 if FreeCAD.GuiUp:
     import FreeCADGui
@@ -50,6 +50,7 @@ import DraftVecUtils
 import DraftGeomUtils
 import draftguitools.gui_trackers as trackers
 
+from draftgeoutils.edge_index import EdgeIndex
 from draftutils.init_tools import get_draft_snap_commands
 from draftutils.messages import _wrn
 from draftutils.translate import translate
@@ -85,6 +86,7 @@ class Snapper:
     def __init__(self):
         self.activeview = None
         self.lastObj = []
+        self.edgeIndexes = {}
         self.maxEdges = 0
         self.radius = 0
         self.constraintAxis = None
@@ -1012,8 +1014,62 @@ class Snapper:
         return snaps
 
 
+    def getEdgeIndex(self, obj):
+        """Return the spatial index of the edges of an object.
+
+        The index is built the first time it is needed, and rebuilt
+        when the shape of the object changes, for example on recompute.
+        """
+        shape = obj.Shape
+        key = shape.hashCode()
+        cached = self.edgeIndexes.get(obj.Name)
+        if cached and cached[0] == key:
+            return cached[1]
+        index = EdgeIndex(shape.Edges)
+        self.edgeIndexes[obj.Name] = (key, index)
+        # only keep the indexes of the objects that can still be used
+        for name in list(self.edgeIndexes):
+            if name not in self.lastObj and name != obj.Name:
+                del self.edgeIndexes[name]
+        return index
+
+
+    def getIntersectionCandidates(self, obj, shape):
+        """Return the edges of an object that can intersect a shape.
+
+        Only the edges whose bounding boxes overlap the bounding box
+        of the shape are returned. If apparent intersections are computed
+        on the working plane, the search region extends along the
+        working plane axis, or covers all edges if that axis is not
+        a global axis.
+        """
+        index = self.getEdgeIndex(obj)
+        box = App.BoundBox(shape.BoundBox)
+        if self.isEnabled("WorkingPlane"):
+            axis = App.DraftWorkingPlane.axis
+            bound = index.bound
+            if not bound.isValid():
+                return []
+            if DraftVecUtils.isNull(axis.cross(App.Vector(0, 0, 1))):
+                box.ZMin = min(box.ZMin, bound.ZMin)
+                box.ZMax = max(box.ZMax, bound.ZMax)
+            elif DraftVecUtils.isNull(axis.cross(App.Vector(0, 1, 0))):
+                box.YMin = min(box.YMin, bound.YMin)
+                box.YMax = max(box.YMax, bound.YMax)
+            elif DraftVecUtils.isNull(axis.cross(App.Vector(1, 0, 0))):
+                box.XMin = min(box.XMin, bound.XMin)
+                box.XMax = max(box.XMax, bound.XMax)
+            else:
+                return index.edges
+        return index.query_edges(box, Draft.tolerance())
+
+
     def snapToIntersection(self, shape):
-        """Return a list of intersection snap locations."""
+        """Return a list of intersection snap locations.
+
+        Only the edges near the given shape are tested,
+        see `getIntersectionCandidates`.
+        """
         snaps = []
         if self.isEnabled("Intersection"):
             # get the stored objects to calculate intersections
@@ -1021,8 +1077,8 @@ class Snapper:
                 obj = App.ActiveDocument.getObject(o)
                 if obj:
                     if obj.isDerivedFrom("Part::Feature") or (Draft.getType(obj) == "Axis"):
-                        if (not self.maxEdges) or (len(obj.Shape.Edges) <= self.maxEdges):
-                            for e in obj.Shape.Edges:
+                        if (not self.maxEdges) or (len(self.getEdgeIndex(obj).edges) <= self.maxEdges):
+                            for e in self.getIntersectionCandidates(obj, shape):
                                 # get the intersection points
                                 try:
                                     if self.isEnabled("WorkingPlane") and hasattr(e,"Curve") and isinstance(e.Curve,(Part.Line,Part.LineSegment)) and hasattr(shape,"Curve") and isinstance(shape.Curve,(Part.Line,Part.LineSegment)):
@@ -1248,6 +1304,7 @@ class Snapper:
         self.running = False
         self.holdPoints = []
         self.lastObj = []
+        self.edgeIndexes = {}
 
 
     def setSelectMode(self, mode):
@@ -213,9 +213,11 @@ class DraftLink(DraftObject):
                 place = shape.Placement
                 shape = shape.copy()
                 shape.transformShape(place.Matrix.inverse())
+                # transformed() without copy only sets the location for
+                # rigid placements, so all copies share the base geometry
                 base = []
+                vis = getattr(obj, 'VisibilityList', [])
                 for i, pla in enumerate(pls):
-                    vis = getattr(obj, 'VisibilityList', [])
                     if len(vis) > i and not vis[i]:
                         continue
 
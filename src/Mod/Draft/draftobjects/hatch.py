@@ -24,6 +24,7 @@
 """This module contains FreeCAD commands for the Draft workbench"""
 
 import os
+import collections
 import FreeCAD as App
 from draftutils.translate import translate, QT_TRANSLATE_NOOP
 from draftgeoutils.general import geomType
@@ -31,6 +32,75 @@ from draftgeoutils.general import geomType
 from draftobjects.base import DraftObject
 
 
+# Pattern names found in PAT files, by file path: (mtime, patterns)
+_pattern_cache = {}
+
+# Hatches computed on faces in their local coordinates, by face signature
+_hatch_cache = collections.OrderedDict()
+_HATCH_CACHE_SIZE = 1000
+
+
+def get_patterns(filename):
+
+    """returns a list of pattern names found in a PAT file. The file
+    is only read again if its modification time has changed"""
+
+    if not os.path.exists(filename):
+        return []
+    mtime = os.path.getmtime(filename)
+    cached = _pattern_cache.get(filename)
+    if cached and cached[0] == mtime:
+        return list(cached[1])
+    patterns = []
+    with open(filename) as patfile:
+        for line in patfile:
+            if line.startswith("*"):
+                patterns.append(line.split(",")[0][1:])
+    _pattern_cache[filename] = (mtime, patterns)
+    return list(patterns)
+
+
+def _get_face_signature(face):
+
+    """returns a hashable description of a face, identical for faces
+    that coincide, rounded to the Draft precision. Edges are described
+    by their type, length and midpoint, so that faces with the same
+    vertices and edge lengths but differently bent edges differ"""
+
+    prec = App.ParamGet("User parameter:BaseApp/Preferences/Mod/Draft").GetInt("precision", 6)
+
+    def rounded(v):
+        return (round(v.x, prec), round(v.y, prec), round(v.z, prec))
+
+    verts = sorted(rounded(v.Point) for v in face.Vertexes)
+    edges = sorted((geomType(e),
+                    round(e.Length, prec),
+                    rounded(e.valueAt((e.FirstParameter + e.LastParameter) / 2)))
+                   for e in face.Edges)
+    return (round(face.Area, prec), tuple(verts), tuple(edges))
+
+
+def _make_hatch(face, scale, pattern, filename):
+
+    """returns TechDraw.makeGeomHatch(face, scale, pattern, filename),
+    reusing a previous result for an identical face. The returned shape
+    is a copy and can be modified"""
+
+    import TechDraw
+
+    key = (filename, os.path.getmtime(filename), pattern, scale,
+           _get_face_signature(face))
+    shape = _hatch_cache.get(key)
+    if shape is None:
+        shape = TechDraw.makeGeomHatch(face, scale, pattern, filename)
+        _hatch_cache[key] = shape
+        while len(_hatch_cache) > _HATCH_CACHE_SIZE:
+            _hatch_cache.popitem(last=False)
+    else:
+        _hatch_cache.move_to_end(key)
+    return shape.copy()
+
+
 class Hatch(DraftObject):
 
 
@@ -89,7 +159,6 @@ class Hatch(DraftObject):
             return
 
         import Part
-        import TechDraw
 
         shapes = []
         for face in obj.Base.Shape.Faces:
@@ -121,7 +190,9 @@ class Hatch(DraftObject):
                     face = face.transformGeometry(mtx.inverse()).Faces[0]
                 if obj.Rotation.Value:
                     face.rotate(App.Vector(), App.Vector(0,0,1), -obj.Rotation)
-                shape = TechDraw.makeGeomHatch(face, obj.Scale, obj.Pattern, obj.File)
+                # faces are moved to their own coordinate system above,
+                # so translated copies of a face share the same hatch
+                shape = _make_hatch(face, obj.Scale, obj.Pattern, obj.File)
                 if obj.Rotation.Value:
                     shape.rotate(App.Vector(), App.Vector(0,0,1), obj.Rotation)
                 if obj.Translate:
@@ -138,10 +209,4 @@ class Hatch(DraftObject):
     def getPatterns(self,filename):
 
         """returns a list of pattern names found in a PAT file"""
-        patterns = []
-        if os.path.exists(filename):
-            with open(filename) as patfile:
-                for line in patfile:
-                    if line.startswith("*"):
-                        patterns.append(line.split(",")[0][1:])
-        return patterns
+        return get_patterns(filename)
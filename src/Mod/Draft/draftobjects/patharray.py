@@ -63,6 +63,8 @@ a single property of type `App::PropertyLinkSub`.
 # \ingroup draftobjects
 # \brief Provides the object code for the PathArray object.
 
+import bisect
+
 import FreeCAD as App
 import DraftVecUtils
 import lazy_loader.lazy_loader as lz
@@ -441,6 +443,11 @@ def placements_on_path(shapeRotation, pathwire, count, xlate, align,
     """Calculate the placements of a shape along a given path.
 
     Copies will be distributed evenly.
+
+    The lengths of the edges are computed once, and the edge holding
+    each copy is found by bisection in the list of cumulative lengths.
+    Each copy then needs a single parameter evaluation on its edge,
+    or none at all if the edge is a straight line.
     """
     if mode == "Frenet":
         forceNormal = False
@@ -452,13 +459,13 @@ def placements_on_path(shapeRotation, pathwire, count, xlate, align,
         if normal is None:
             normal = App.Vector(0, 0, 1)
 
-    path = Part.__sortEdges__(pathwire.Edges)
+    path = [_PathEdge(e) for e in Part.__sortEdges__(pathwire.Edges)]
 
     # find cumulative edge end distance
     cdist = 0
     ends = []
     for e in path:
-        cdist += e.Length
+        cdist += e.length
         ends.append(cdist)
 
     if startOffset > (cdist - 1e-6):
@@ -475,36 +482,72 @@ def placements_on_path(shapeRotation, pathwire, count, xlate, align,
 
     cdist = cdist - start - end
     step = cdist / (count if (DraftGeomUtils.isReallyClosed(pathwire) and not (start or end)) else count - 1)
-    remains = 0
-    travel = start
     placements = []
 
     for i in range(0, count):
+        travel = start + i * step
         # which edge in path should contain this shape?
-        for j in range(0, len(ends)):
-            if travel <= ends[j]:
-                iend = j
-                remains = ends[iend] - travel
-                offset = path[iend].Length - remains
-                break
+        iend = bisect.bisect_left(ends, travel)
+        if iend < len(ends):
+            offset = path[iend].length - (ends[iend] - travel)
         else:
             # avoids problems with float math travel > ends[-1]
             iend = len(ends) - 1
-            offset = path[iend].Length
+            offset = path[iend].length
 
         # place shape at proper spot on proper edge
-        pt = path[iend].valueAt(get_parameter_from_v0(path[iend], offset))
-        place = calculate_placement(shapeRotation,
-                                    path[iend], offset,
-                                    pt, xlate, align, normal,
-                                    mode, forceNormal)
+        pt, param = path[iend].point_at(offset)
+        place = _calculate_placement(shapeRotation,
+                                     path[iend], param,
+                                     pt, xlate, align, normal,
+                                     mode, forceNormal)
         placements.append(place)
 
-        travel += step
-
     return placements
 
 
+class _PathEdge:
+    """Edge of a path with the data needed to place copies along it.
+
+    The length, the orientation and, for straight edges, the start point
+    and the direction are computed once, instead of once per copy.
+    """
+
+    def __init__(self, edge):
+        self.edge = edge
+        self.length = edge.Length
+        lpt = edge.valueAt(edge.getParameterByLength(0))
+        vpt = edge.Vertexes[0].Point
+        # flipped edges are measured from their last vertex
+        self.flipped = not DraftVecUtils.equals(vpt, lpt)
+        self.tangent = None
+        first = edge.FirstParameter
+        last = edge.LastParameter
+        if DraftGeomUtils.geomType(edge) == "Line" and last > first:
+            self.first = first
+            self.origin = edge.valueAt(first)
+            self.direction = (edge.valueAt(last) - self.origin) * (1.0 / (last - first))
+            self.tangent = edge.tangentAt(first)
+
+    def point_at(self, offset):
+        """Return the point and the parameter at a length from vertex 0."""
+        if self.flipped:
+            length = self.length - offset
+        else:
+            length = offset
+        if self.tangent is not None:
+            param = self.first + length
+            return self.origin + self.direction * length, param
+        param = self.edge.getParameterByLength(length)
+        return self.edge.valueAt(param), param
+
+    def tangent_at(self, param):
+        """Return the tangent of the edge at a parameter."""
+        if self.tangent is not None:
+            return App.Vector(self.tangent)
+        return self.edge.tangentAt(param)
+
+
 calculatePlacementsOnPath = placements_on_path
 
 
@@ -517,6 +560,23 @@ def calculate_placement(globalRotation,
     http://en.wikipedia.org/wiki/Euler_angles (previous version)
     http://en.wikipedia.org/wiki/Quaternions
     """
+    param = None
+    if align:
+        param = get_parameter_from_v0(edge, offset)
+    return _calculate_placement(globalRotation,
+                                _PathEdge(edge), param, RefPt, xlate, align,
+                                normal, mode, overrideNormal)
+
+
+def _calculate_placement(globalRotation,
+                         pathedge, param, RefPt, xlate, align,
+                         normal=App.Vector(0.0, 0.0, 1.0),
+                         mode="Original", overrideNormal=False):
+    """Orient shape in the local coordinate system at parameter param.
+
+    This is `calculate_placement` for a `_PathEdge` and an edge parameter
+    that has already been computed.
+    """
     # Default Placement:
     placement = App.Placement()
     placement.Rotation = globalRotation
@@ -528,7 +588,7 @@ def calculate_placement(globalRotation,
     tol = 1e-6 # App.Rotation() tolerance is 1e-7. Shorter vectors are ignored.
     nullv = App.Vector()
 
-    t = edge.tangentAt(get_parameter_from_v0(edge, offset))
+    t = pathedge.tangent_at(param)
     if t.isEqual(nullv, tol):
         _wrn(translate("draft", "Length of tangent vector is zero. Copy not aligned."))
         return placement
@@ -560,7 +620,7 @@ def calculate_placement(globalRotation,
 
     elif mode == "Frenet":
         try:
-            n = edge.normalAt(get_parameter_from_v0(edge, offset))
+            n = pathedge.edge.normalAt(param)
         except App.Base.FreeCADError: # no/infinite normals here
             _wrn(translate("draft", "Cannot calculate normal vector. Using the default normal instead."))
             n = normal
@@ -394,6 +394,38 @@ class DraftCreation(unittest.TestCase):
                       and math.isclose(box.YLength, width, rel_tol=0, abs_tol=1e-6))
         self.assertTrue(obj_is_ok, "'{}' failed".format(operation))
 
+    def test_hatch_cache(self):
+        """Hatch two faces with the same vertices, edge lengths and area."""
+        operation = "Draft Hatch cache"
+        _msg("  Test '{}'".format(operation))
+        import Part
+        from draftobjects import hatch
+
+        _msg("  Square with a half circle on its top or on its bottom edge")
+        p1 = Vector(0, 0, 0)
+        p2 = Vector(10, 0, 0)
+        p3 = Vector(10, 10, 0)
+        p4 = Vector(0, 10, 0)
+        top = Part.Face(Part.Wire([Part.LineSegment(p1, p2).toShape(),
+                                   Part.LineSegment(p2, p3).toShape(),
+                                   Part.Arc(p3, Vector(5, 15, 0), p4).toShape(),
+                                   Part.LineSegment(p4, p1).toShape()]))
+        bottom = Part.Face(Part.Wire([Part.Arc(p1, Vector(5, -5, 0), p2).toShape(),
+                                      Part.LineSegment(p2, p3).toShape(),
+                                      Part.LineSegment(p3, p4).toShape(),
+                                      Part.LineSegment(p4, p1).toShape()]))
+        self.assertNotEqual(hatch._get_face_signature(top),
+                            hatch._get_face_signature(bottom),
+                            "'{}' failed".format(operation))
+
+        patfile = App.getResourceDir() + "Mod/TechDraw/PAT/FCPAT.pat"
+        patname = "Horizontal5"
+        top_box = hatch._make_hatch(top, 0.1, patname, patfile).BoundBox
+        bottom_box = hatch._make_hatch(bottom, 0.1, patname, patfile).BoundBox
+        obj_is_ok = (top_box.YMax > 12 and top_box.YMin > -1
+                     and bottom_box.YMin < -2 and bottom_box.YMax < 11)
+        self.assertTrue(obj_is_ok, "'{}' failed".format(operation))
+
     def tearDown(self):
         """Finish the test.
 
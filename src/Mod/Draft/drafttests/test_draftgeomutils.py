@@ -134,6 +134,57 @@ class TestDraftGeomUtils(unittest.TestCase):
                                                    DraftGeomUtils.precision(), "'{0}.{1}' failed".format(operation, subtest))
         _msg("  Test completed, {} subtests run".format(num_subtests))
 
+    def test_edge_index(self):
+        """Test the draftgeoutils.edge_index.EdgeIndex class."""
+        operation = "draftgeoutils.edge_index.EdgeIndex"
+        _msg("  Test '{}'".format(operation))
+
+        from draftgeoutils.edge_index import EdgeIndex
+
+        # A grid of 20 horizontal and 20 vertical lines, 10 mm apart
+        edges = []
+        for i in range(20):
+            edges.append(Part.makeLine(FreeCAD.Vector(0, i * 10, 0),
+                                       FreeCAD.Vector(190, i * 10, 0)))
+            edges.append(Part.makeLine(FreeCAD.Vector(i * 10, 0, 0),
+                                       FreeCAD.Vector(i * 10, 190, 0)))
+        index = EdgeIndex(edges)
+
+        # The result must be the same as testing every bounding box
+        line = Part.makeLine(FreeCAD.Vector(42, 42, 0),
+                             FreeCAD.Vector(58, 51, 0))
+        expected = [i for i, e in enumerate(edges)
+                    if e.BoundBox.intersect(line.BoundBox)]
+        self.assertEqual(index.query(line.BoundBox), expected,
+                         "'{}' failed".format(operation))
+        self.assertEqual(len(expected), 2,
+                         "'{}' failed".format(operation))
+
+        # Nothing is found outside of the indexed region
+        far = FreeCAD.BoundBox(500, 500, 0, 510, 510, 0)
+        self.assertEqual(index.query(far), [],
+                         "'{}' failed".format(operation))
+
+        # A long diagonal edge among short ones is kept out of the grid,
+        # but it is still found
+        edges = []
+        for i in range(10):
+            for j in range(10):
+                edges.append(Part.makeLine(FreeCAD.Vector(i * 10, j * 10, 0),
+                                           FreeCAD.Vector(i * 10 + 5, j * 10, 0)))
+        edges.append(Part.makeLine(FreeCAD.Vector(0, 0, 0),
+                                   FreeCAD.Vector(95, 90, 0)))
+        index = EdgeIndex(edges)
+        self.assertEqual(index.large, [100],
+                         "'{}' failed".format(operation))
+        box = FreeCAD.BoundBox(48, 48, 0, 52, 52, 0)
+        expected = [i for i, e in enumerate(edges)
+                    if e.BoundBox.intersect(box)]
+        self.assertEqual(index.query(box), expected,
+                         "'{}' failed".format(operation))
+        self.assertIn(100, expected,
+                      "'{}' failed".format(operation))
+
     def tearDown(self):
         """Finish the test. Nothing to do here, DraftGeomUtils doesn't need a document."""
         pass
@@ -109,6 +109,37 @@ class DraftSVG(unittest.TestCase):
         else:
             self.fail("no exception thrown")
 
+    def test_get_svg_cache(self):
+        """Get the svg of a shape again after changing the shape and the style."""
+        operation = "draftfunctions.svg.get_svg cache"
+        _msg("  Test '{}'".format(operation))
+        import Part
+        import draftfunctions.svg as svg
+
+        b = App.ActiveDocument.addObject("Part::Feature", "Box")
+        b.Shape = Part.makeBox(10, 10, 10)
+        direction = App.Vector(0, 0, 1)
+        svg1 = Draft.get_svg(b, direction=direction)
+        self.assertEqual(Draft.get_svg(b, direction=direction), svg1,
+                         "'{}' failed".format(operation))
+
+        b.Shape = Part.makeBox(20, 10, 10)
+        svg2 = Draft.get_svg(b, direction=direction)
+        self.assertNotEqual(svg2, svg1,
+                            "'{}' failed, shape change".format(operation))
+
+        svg3 = Draft.get_svg(b, direction=direction, linewidth=5)
+        self.assertNotEqual(svg3, svg2,
+                            "'{}' failed, style change".format(operation))
+
+        # closing the document removes its entries
+        self.assertTrue(any(k[0] == self.doc_name for k in svg._svg_cache),
+                        "'{}' failed, no cached paths".format(operation))
+        App.closeDocument(self.doc_name)
+        self.assertFalse(any(k[0] == self.doc_name for k in svg._svg_cache),
+                         "'{}' failed, document closed".format(operation))
+        App.newDocument(self.doc_name)
+
     def tearDown(self):
         """Finish the test.
 
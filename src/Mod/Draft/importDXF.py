@@ -88,6 +88,10 @@ dxfReader = None
 dxfColorMap = None
 dxfLibrary = None
 
+# lookup tables used while exporting, see buildGroupIndex and getACI
+groupIndex = None
+aciCache = {}
+
 # Save the native open function to avoid collisions
 # with the function declared here
 if open.__module__ in ['__builtin__', 'io']:
@@ -401,10 +405,16 @@ def getGroup(ob):
         The label of the layer, or of the group, if it contains `ob`.
         Otherwise, return "0".
 
+    When an export is running, the lookup is done in the table built
+    by `buildGroupIndex`, instead of scanning the whole document
+    for every object.
+
     To do
     -----
     Use local variables, not global variables.
     """
+    if groupIndex is not None:
+        return groupIndex.get(ob.Name, "0")
     all_objs = FreeCAD.ActiveDocument.Objects
     if dxfUseDraftVisGroups:
         for layer in [o for o in all_objs if Draft.getType(o) == "Layer"]:
@@ -418,6 +428,42 @@ def getGroup(ob):
     return "0"
 
 
+def buildGroupIndex(doc):
+    """Build a table with the layer or group label of every grouped object.
+
+    It gives the same answer as `getGroup`, that is, Draft layers
+    take precedence over groups if `dxfUseDraftVisGroups` is set,
+    and the first container found in the document wins,
+    but the document is only scanned once.
+
+    Parameters
+    ----------
+    doc : App::Document
+        The document containing the exported objects.
+
+    Returns
+    -------
+    dict
+        A dictionary ``{object_name: label}``. Objects that are not
+        in a layer or group are not present in the dictionary.
+    """
+    index = {}
+    all_objs = doc.Objects
+    if dxfUseDraftVisGroups:
+        for layer in all_objs:
+            if Draft.getType(layer) == "Layer":
+                for child in layer.Group:
+                    index.setdefault(child.Name, layer.Label)
+    groups = {}
+    for i in all_objs:
+        if i.isDerivedFrom("App::DocumentObjectGroup"):
+            for j in i.Group:
+                groups.setdefault(j.Name, i.Label)
+    for name, label in groups.items():
+        index.setdefault(name, label)
+    return index
+
+
 def getACI(ob, text=False):
     """Get the AutoCAD color index (ACI) color closest to the object's color.
 
@@ -457,6 +503,9 @@ def getACI(ob, text=False):
             col = ob.ViewObject.TextColor
         else:
             col = ob.ViewObject.LineColor
+        col = tuple(col[:3])
+        if col in aciCache:
+            return aciCache[col]
         aci = [0, 442]
         for i in range(255, -1, -1):
             ref = dxfColorMap.color_map[i]
@@ -465,6 +514,7 @@ def getACI(ob, text=False):
                     + (ref[2]-col[2])**2)
             if dist <= aci[1]:
                 aci = [i, dist]
+        aciCache[col] = aci[0]
         return aci[0]
 
 
@@ -2922,7 +2972,7 @@ def getArcData(edge):
                 math.degrees(ang1), math.degrees(ang2))
 
 
-def getSplineSegs(edge):
+def getSplineSegs(edge, seglength=None):
     """Return a list of points from an edge that is a spline or bezier curve.
 
     Parameters
@@ -2930,6 +2980,11 @@ def getSplineSegs(edge):
     edge : Part::TopoShape ('Edge')
         An edge representing a spline or bezier curve.
 
+    seglength : float, optional
+        It defaults to `None`, in which case the `'maxsegmentlength'`
+        parameter is read from the parameter database.
+        Callers processing many edges can read it once and pass it here.
+
     Returns
     -------
     list of Base::Vector3
@@ -2940,8 +2995,9 @@ def getSplineSegs(edge):
         If the `segmentlength` variable is zero in the parameters database,
         then it only returns the first and the last point of the `edge`.
     """
-    params = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Draft")
-    seglength = params.GetFloat("maxsegmentlength", 5.0)
+    if seglength is None:
+        params = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Draft")
+        seglength = params.GetFloat("maxsegmentlength", 5.0)
     points = []
     if seglength == 0:
         points.append(edge.Vertexes[0].Point)
@@ -3030,10 +3086,12 @@ def getWire(wire, nospline=False, lw=True, asis=False):
         points = [fmt(v.Point) for v in wire.OrderedVertexes]
     else:
         edges = Part.__sortEdges__(wire.Edges)
+        seglength = None
         # print("processing wire ",wire.Edges)
         for edge in edges:
             v1 = edge.Vertexes[0].Point
-            if DraftGeomUtils.geomType(edge) == "Circle":
+            gtype = DraftGeomUtils.geomType(edge)
+            if gtype == "Circle":
                 # polyline bulge -> negative makes the arc go clockwise
                 angle = edge.LastParameter-edge.FirstParameter
                 bul = math.tan(angle/4)
@@ -3043,10 +3101,13 @@ def getWire(wire, nospline=False, lw=True, asis=False):
                 if edge.Curve.Axis.dot(Vector(0, 0, 1)) < 0:
                     bul = -bul
                 points.append(fmt(v1, bul))
-            elif (DraftGeomUtils.geomType(edge) in ["BSplineCurve",
-                                                    "BezierCurve",
-                                                    "Ellipse"]) and (not nospline):
-                spline = getSplineSegs(edge)
+            elif (gtype in ["BSplineCurve",
+                            "BezierCurve",
+                            "Ellipse"]) and (not nospline):
+                if seglength is None:
+                    params = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Draft")
+                    seglength = params.GetFloat("maxsegmentlength", 5.0)
+                spline = getSplineSegs(edge, seglength)
                 spline.pop()
                 for p in spline:
                     points.append(fmt(p))
@@ -3161,18 +3222,17 @@ def writeShape(sh, ob, dxfobject, nospline=False, lwPoly=False,
     dxfLibrary.LwPolyLine, dxfLibrary.PolyLine, dxfLibrary.Ellipse,
     dxfLibrary.Line
     """
-    processededges = []
+    processededges = set()
     if not layer:
         layer = getStrGroup(ob)
     if not color:
         color = getACI(ob)
+    params = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Draft")
+    seglength = params.GetFloat("maxsegmentlength", 5.0)
+    discretize = params.GetBool("DiscretizeEllipses", True)
     for wire in sh.Wires:  # polylines
-        if asis:
-            edges = wire.Edges
-        else:
-            edges = Part.__sortEdges__(wire.Edges)
-        for e in edges:
-            processededges.append(e.hashCode())
+        for e in wire.Edges:
+            processededges.add(e.hashCode())
         if (len(wire.Edges) == 1) and (DraftGeomUtils.geomType(wire.Edges[0]) == "Circle"):
             center, radius, ang1, ang2 = getArcData(wire.Edges[0])
             if center is not None:
@@ -3210,9 +3270,9 @@ def writeShape(sh, ob, dxfobject, nospline=False, lwPoly=False,
                 loneedges.append(e)
         # print("lone edges ", loneedges)
         for edge in loneedges:
+            gtype = DraftGeomUtils.geomType(edge)
             # splines
-            if (DraftGeomUtils.geomType(edge) in ["BSplineCurve",
-                                                  "BezierCurve"]):
+            if gtype in ["BSplineCurve", "BezierCurve"]:
                 if (len(edge.Vertexes) == 1) and (edge.Curve.isClosed()) and (edge.Area > 0):
                     # special case: 1-vert closed spline, approximate as a circle
                     c = DraftGeomUtils.getCircleFromSpline(edge)
@@ -3223,14 +3283,14 @@ def writeShape(sh, ob, dxfobject, nospline=False, lwPoly=False,
                                                            layer=layer))
                 else:
                     points = []
-                    spline = getSplineSegs(edge)
+                    spline = getSplineSegs(edge, seglength)
                     for p in spline:
                         points.append(((p.x, p.y, p.z), None, [None, None], 0.0))
                     dxfobject.append(dxfLibrary.PolyLine(points,
                                                          [0.0, 0.0, 0.0],
                                                          0, color=color,
                                                          layer=layer))
-            elif DraftGeomUtils.geomType(edge) == "Circle":  # curves
+            elif gtype == "Circle":  # curves
                 center, radius, ang1, ang2 = getArcData(edge)
                 if center is not None:
                     if not isinstance(center, tuple):
@@ -3246,10 +3306,10 @@ def writeShape(sh, ob, dxfobject, nospline=False, lwPoly=False,
                                                         ang1, ang2,
                                                         color=getACI(ob),
                                                         layer=layer))
-            elif DraftGeomUtils.geomType(edge) == "Ellipse":  # ellipses:
-                if FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Draft").GetBool("DiscretizeEllipses", True):
+            elif gtype == "Ellipse":  # ellipses:
+                if discretize:
                     points = []
-                    spline = getSplineSegs(edge)
+                    spline = getSplineSegs(edge, seglength)
                     for p in spline:
                         points.append(((p.x, p.y, p.z), None, [None, None], 0.0))
                     dxfobject.append(dxfLibrary.PolyLine(points,
@@ -3516,7 +3576,7 @@ def export(objectslist, filename, nospline=False, lwPoly=False):
         return
     getDXFlibs()
     if dxfLibrary:
-        global exportList
+        global exportList, groupIndex
         exportList = objectslist
         exportList = Draft.get_group_contents(exportList)
 
@@ -3554,235 +3614,270 @@ def export(objectslist, filename, nospline=False, lwPoly=False):
 
         else:
             # other cases, treat objects one by one
-            dxf = dxfLibrary.Drawing()
-            # add global variables
-            if hasattr(dxf,"header"):
-                dxf.header.append("  9\n$DIMTXT\n 40\n"+str(Draft.getParam("textheight", 20))+"\n")
-                dxf.header.append("  9\n$INSUNITS\n 70\n4\n")
-            for ob in exportLayers:
-                if ob.Label != "0":  # dxflibrary already creates it
-                    ltype = 'continuous'
-                    if ob.ViewObject:
-                        if ob.ViewObject.DrawStyle == "Dashed":
-                            ltype = 'DASHED'
-                        elif ob.ViewObject.DrawStyle == "Dotted":
-                            ltype = 'HIDDEN'
-                        elif ob.ViewObject.DrawStyle == "Dashdot":
-                            ltype = 'DASHDOT'
-                    # print("exporting layer:", ob.Label,
-                    #       getACI(ob), ltype)
-                    dxf.layers.append(dxfLibrary.Layer(name=ob.Label,
-                                                       color=getACI(ob),
-                                                       lineType=ltype))
-
-            for ob in exportList:
-                obtype = Draft.getType(ob)
-                # print("processing " + str(ob.Name))
-                if obtype == "PanelSheet":
-                    if not hasattr(ob.Proxy, "sheetborder"):
-                        ob.Proxy.execute(ob)
-                    sb = ob.Proxy.sheetborder
-                    if sb:
-                        sb.Placement = ob.Placement
-                        writeShape(sb, ob, dxf, nospline, lwPoly,
-                                   layer="Sheets", color=1)
-                    ss = ob.Proxy.sheettag
-                    if ss:
-                        ss.Placement = ob.Placement.multiply(ss.Placement)
-                        writeShape(ss, ob, dxf, nospline, lwPoly,
-                                   layer="SheetTags", color=1)
-                    for subob in ob.Group:
-                        if Draft.getType(subob) == "PanelCut":
-                            writePanelCut(subob, dxf, nospline, lwPoly,
-                                          parent=ob)
-                        elif subob.isDerivedFrom("Part::Feature"):
-                            shp = subob.Shape.copy()
-                            shp.Placement = ob.Placement.multiply(shp.Placement)
-                            writeShape(shp, ob, dxf, nospline, lwPoly,
-                                       layer="Outlines", color=5)
-
-                elif obtype == "PanelCut":
-                    writePanelCut(ob, dxf, nospline, lwPoly)
-
-                elif obtype == "Space":
-                    vobj = ob.ViewObject
-                    c = utils.get_rgb(vobj.TextColor)
-                    n = vobj.FontName
-                    a = 0
-                    if rotation != 0:
-                        a = math.radians(rotation)
-                    t1 = "".join(vobj.Proxy.text1.string.getValues())
-                    t2 = "".join(vobj.Proxy.text2.string.getValues())
-                    scale = vobj.FirstLine.Value/vobj.FontSize.Value
-                    f1 = fontsize * scale
-                    if round(FreeCAD.DraftWorkingPlane.axis.getAngle(App.Vector(0,0,1)),2) not in [0,3.14]:
-                        # if not in XY view, place the label at center
-                        p2 = obj.Shape.CenterOfMass
-                    else:
-                        _v = vobj.Proxy.coords.translation.getValue().getValue()
-                        p2 = obj.Placement.multVec(App.Vector(_v))
-                    _h = vobj.Proxy.header.translation.getValue().getValue()
-                    lspc = FreeCAD.Vector(_h)
-                    p1 = p2 + lspc
-                    dxf.append(dxfLibrary.Text(t1, p1, height=f1,
-                                               color=getACI(ob, text=True),
+            groupIndex = buildGroupIndex(FreeCAD.ActiveDocument)
+            try:
+                writeObjects(exportList, exportLayers, filename,
+                             nospline, lwPoly)
+            finally:
+                groupIndex = None
+
+        FCC.PrintMessage("successfully exported" + " " + filename + "\n")
+
+    else:
+        errorDXFLib(gui)
+
+
+def writeObjects(exportList, exportLayers, filename, nospline, lwPoly):
+    """Write the given objects and layers to a new DXF file.
+
+    This is the generic part of `export`, used when the export list
+    is not a single section view or page.
+
+    Parameters
+    ----------
+    exportList : list of App::DocumentObject
+        The objects to export, with groups already expanded.
+
+    exportLayers : list of App::DocumentObject
+        The Draft layers to create in the DXF file.
+
+    filename : str
+        The path of the new DXF file.
+
+    nospline : bool
+        See `export`.
+
+    lwPoly : bool
+        See `export`.
+    """
+    params = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Draft")
+    exportMesh = params.GetBool("dxfmesh")
+    viewDirection = None
+    if gui and params.GetBool("dxfproject"):
+        _view = FreeCADGui.ActiveDocument.ActiveView
+        viewDirection = _view.getViewDirection().multiply(-1)
+    dxf = dxfLibrary.Drawing()
+    # add global variables
+    if hasattr(dxf,"header"):
+        dxf.header.append("  9\n$DIMTXT\n 40\n"+str(Draft.getParam("textheight", 20))+"\n")
+        dxf.header.append("  9\n$INSUNITS\n 70\n4\n")
+    for ob in exportLayers:
+        if ob.Label != "0":  # dxflibrary already creates it
+            ltype = 'continuous'
+            if ob.ViewObject:
+                if ob.ViewObject.DrawStyle == "Dashed":
+                    ltype = 'DASHED'
+                elif ob.ViewObject.DrawStyle == "Dotted":
+                    ltype = 'HIDDEN'
+                elif ob.ViewObject.DrawStyle == "Dashdot":
+                    ltype = 'DASHDOT'
+            # print("exporting layer:", ob.Label,
+            #       getACI(ob), ltype)
+            dxf.layers.append(dxfLibrary.Layer(name=ob.Label,
+                                               color=getACI(ob),
+                                               lineType=ltype))
+
+    for ob in exportList:
+        obtype = Draft.getType(ob)
+        # print("processing " + str(ob.Name))
+        if obtype == "PanelSheet":
+            if not hasattr(ob.Proxy, "sheetborder"):
+                ob.Proxy.execute(ob)
+            sb = ob.Proxy.sheetborder
+            if sb:
+                sb.Placement = ob.Placement
+                writeShape(sb, ob, dxf, nospline, lwPoly,
+                           layer="Sheets", color=1)
+            ss = ob.Proxy.sheettag
+            if ss:
+                ss.Placement = ob.Placement.multiply(ss.Placement)
+                writeShape(ss, ob, dxf, nospline, lwPoly,
+                           layer="SheetTags", color=1)
+            for subob in ob.Group:
+                if Draft.getType(subob) == "PanelCut":
+                    writePanelCut(subob, dxf, nospline, lwPoly,
+                                  parent=ob)
+                elif subob.isDerivedFrom("Part::Feature"):
+                    shp = subob.Shape.copy()
+                    shp.Placement = ob.Placement.multiply(shp.Placement)
+                    writeShape(shp, ob, dxf, nospline, lwPoly,
+                               layer="Outlines", color=5)
+
+        elif obtype == "PanelCut":
+            writePanelCut(ob, dxf, nospline, lwPoly)
+
+        elif obtype == "Space":
+            vobj = ob.ViewObject
+            c = utils.get_rgb(vobj.TextColor)
+            n = vobj.FontName
+            a = 0
+            if rotation != 0:
+                a = math.radians(rotation)
+            t1 = "".join(vobj.Proxy.text1.string.getValues())
+            t2 = "".join(vobj.Proxy.text2.string.getValues())
+            scale = vobj.FirstLine.Value/vobj.FontSize.Value
+            f1 = fontsize * scale
+            if round(FreeCAD.DraftWorkingPlane.axis.getAngle(App.Vector(0,0,1)),2) not in [0,3.14]:
+                # if not in XY view, place the label at center
+                p2 = obj.Shape.CenterOfMass
+            else:
+                _v = vobj.Proxy.coords.translation.getValue().getValue()
+                p2 = obj.Placement.multVec(App.Vector(_v))
+            _h = vobj.Proxy.header.translation.getValue().getValue()
+            lspc = FreeCAD.Vector(_h)
+            p1 = p2 + lspc
+            dxf.append(dxfLibrary.Text(t1, p1, height=f1,
+                                       color=getACI(ob, text=True),
+                                       style='STANDARD',
+                                       layer=getStrGroup(ob)))
+            if t2:
+                ofs = FreeCAD.Vector(0, -lspc.Length, 0)
+                if a:
+                    Z = FreeCAD.Vector(0, 0, 1)
+                    ofs = FreeCAD.Rotation(Z, -rotation).multVec(ofs)
+                dxf.append(dxfLibrary.Text(t2, p1.add(ofs), height=f1,
+                                           color=getACI(ob, text=True),
+                                           style='STANDARD',
+                                           layer=getStrGroup(ob)))
+
+        elif obtype == "Axis":
+            axes = ob.Proxy.getAxisData(ob)
+            if not axes:
+                continue
+            for ax in axes:
+                dxf.append(dxfLibrary.Line([ax[0],
+                                            ax[1]],
+                                            color=getACI(ob),
+                                            layer=getStrGroup(ob)))
+            h = 1
+            if FreeCAD.GuiUp:
+                vobj = ob.ViewObject
+                h = float(ob.ViewObject.FontSize)
+                for text in vobj.Proxy.getTextData():
+                    pos = text[1].add(FreeCAD.Vector(-h/2,-h/2,0))
+                    dxf.append(dxfLibrary.Text(text[0],
+                                               pos,
+                                               height=h,
+                                               color=getACI(ob),
                                                style='STANDARD',
                                                layer=getStrGroup(ob)))
-                    if t2:
-                        ofs = FreeCAD.Vector(0, -lspc.Length, 0)
-                        if a:
-                            Z = FreeCAD.Vector(0, 0, 1)
-                            ofs = FreeCAD.Rotation(Z, -rotation).multVec(ofs)
-                        dxf.append(dxfLibrary.Text(t2, p1.add(ofs), height=f1,
-                                                   color=getACI(ob, text=True),
-                                                   style='STANDARD',
-                                                   layer=getStrGroup(ob)))
-
-                elif obtype == "Axis":
-                    axes = ob.Proxy.getAxisData(ob)
-                    if not axes:
-                        continue
-                    for ax in axes:
-                        dxf.append(dxfLibrary.Line([ax[0],
-                                                    ax[1]],
-                                                    color=getACI(ob),
-                                                    layer=getStrGroup(ob)))
-                    h = 1
-                    if FreeCAD.GuiUp:
-                        vobj = ob.ViewObject
-                        h = float(ob.ViewObject.FontSize)
-                        for text in vobj.Proxy.getTextData():
-                            pos = text[1].add(FreeCAD.Vector(-h/2,-h/2,0))
-                            dxf.append(dxfLibrary.Text(text[0],
-                                                       pos,
-                                                       height=h,
-                                                       color=getACI(ob),
-                                                       style='STANDARD',
-                                                       layer=getStrGroup(ob)))
-                        for shape in vobj.Proxy.getShapeData():
-                            if hasattr(shape,"Curve") and isinstance(shape.Curve,Part.Circle):
-                                dxf.append(dxfLibrary.Circle(shape.Curve.Center,
-                                                             shape.Curve.Radius,
-                                                             color=getACI(ob),
-                                                             layer=getStrGroup(ob)))
-                            else:
-                                if lwPoly:
-                                    points = [(v.Point.x, v.Point.y, v.Point.z, None, None, 0.0) for v in shape.Vertexes]
-                                    dxf.append(dxfLibrary.LwPolyLine(points,
-                                                                     [0.0, 0.0],
-                                                                     1,
-                                                                     color=getACI(ob),
-                                                                     layer=getGroup(ob)))
-                                else:
-                                    points = [((v.Point.x, v.Point.y, v.Point.z), None, [None, None], 0.0) for v in shape.Vertexes]
-                                    dxf.append(dxfLibrary.PolyLine(points,
-                                                                   [0.0, 0.0, 0.0],
-                                                                   1,
-                                                                   color=getACI(ob),
-                                                                   layer=getGroup(ob)))
-
-                elif ob.isDerivedFrom("Part::Feature"):
-                    tess = None
-                    if hasattr(ob, "Tessellation"):
-                        if ob.Tessellation:
-                            tess = [ob.Tessellation, ob.SegmentLength]
-                    if FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Draft").GetBool("dxfmesh"):
-                        sh = None
-                        if not ob.Shape.isNull():
-                            writeMesh(ob, dxf)
-                    elif gui and FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Draft").GetBool("dxfproject"):
-                        _view = FreeCADGui.ActiveDocument.ActiveView
-                        direction = _view.getViewDirection().multiply(-1)
-                        sh = projectShape(ob.Shape, direction, tess)
+                for shape in vobj.Proxy.getShapeData():
+                    if hasattr(shape,"Curve") and isinstance(shape.Curve,Part.Circle):
+                        dxf.append(dxfLibrary.Circle(shape.Curve.Center,
+                                                     shape.Curve.Radius,
+                                                     color=getACI(ob),
+                                                     layer=getStrGroup(ob)))
                     else:
-                        if ob.Shape.Volume > 0:
-                            sh = projectShape(ob.Shape, Vector(0, 0, 1), tess)
+                        if lwPoly:
+                            points = [(v.Point.x, v.Point.y, v.Point.z, None, None, 0.0) for v in shape.Vertexes]
+                            dxf.append(dxfLibrary.LwPolyLine(points,
+                                                             [0.0, 0.0],
+                                                             1,
+                                                             color=getACI(ob),
+                                                             layer=getGroup(ob)))
                         else:
-                            sh = ob.Shape
-                    if sh:
-                        if not sh.isNull():
-                            if sh.ShapeType == 'Compound':
-                                if len(sh.Wires) == 1:
-                                    # only one wire in this compound,
-                                    # no lone edge -> polyline
-                                    if len(sh.Wires[0].Edges) == len(sh.Edges):
-                                        writeShape(sh, ob, dxf,
-                                                   nospline, lwPoly)
-                                    else:
-                                        # 1 wire + lone edges -> block
-                                        block = getBlock(sh, ob, lwPoly)
-                                        dxf.blocks.append(block)
-                                        dxf.append(dxfLibrary.Insert(name=ob.Name.upper(),
-                                                                     color=getACI(ob),
-                                                                     layer=getStrGroup(ob)))
-                                else:
-                                    # all other cases: block
-                                    block = getBlock(sh, ob, lwPoly)
-                                    dxf.blocks.append(block)
-                                    dxf.append(dxfLibrary.Insert(name=ob.Name.upper(),
-                                                                 color=getACI(ob),
-                                                                 layer=getStrGroup(ob)))
+                            points = [((v.Point.x, v.Point.y, v.Point.z), None, [None, None], 0.0) for v in shape.Vertexes]
+                            dxf.append(dxfLibrary.PolyLine(points,
+                                                           [0.0, 0.0, 0.0],
+                                                           1,
+                                                           color=getACI(ob),
+                                                           layer=getGroup(ob)))
+
+        elif ob.isDerivedFrom("Part::Feature"):
+            tess = None
+            if hasattr(ob, "Tessellation"):
+                if ob.Tessellation:
+                    tess = [ob.Tessellation, ob.SegmentLength]
+            if exportMesh:
+                sh = None
+                if not ob.Shape.isNull():
+                    writeMesh(ob, dxf)
+            elif viewDirection is not None:
+                sh = projectShape(ob.Shape, viewDirection, tess)
+            else:
+                if ob.Shape.Volume > 0:
+                    sh = projectShape(ob.Shape, Vector(0, 0, 1), tess)
+                else:
+                    sh = ob.Shape
+            if sh:
+                if not sh.isNull():
+                    if sh.ShapeType == 'Compound':
+                        if len(sh.Wires) == 1:
+                            # only one wire in this compound,
+                            # no lone edge -> polyline
+                            if len(sh.Wires[0].Edges) == len(sh.Edges):
+                                writeShape(sh, ob, dxf,
+                                           nospline, lwPoly)
                             else:
-                                writeShape(sh, ob, dxf, nospline, lwPoly)
-
-                elif obtype == "Annotation":
-                    # old-style texts
-                    # temporary - as dxfLibrary doesn't support mtexts well,
-                    # we use several single-line texts
-                    # well, anyway, at the moment, Draft only writes
-                    # single-line texts, so...
-                    for text in ob.LabelText:
-                        point = DraftVecUtils.tup(Vector(ob.Position.x,
-                                                         ob.Position.y - ob.LabelText.index(text),
-                                                         ob.Position.z))
-                        if gui:
-                            height = float(ob.ViewObject.FontSize)
+                                # 1 wire + lone edges -> block
+                                block = getBlock(sh, ob, lwPoly)
+                                dxf.blocks.append(block)
+                                dxf.append(dxfLibrary.Insert(name=ob.Name.upper(),
+                                                             color=getACI(ob),
+                                                             layer=getStrGroup(ob)))
                         else:
-                            height = 1
-                        dxf.append(dxfLibrary.Text(text, point, height=height,
-                                                   color=getACI(ob, text=True),
-                                                   style='STANDARD',
-                                                   layer=getStrGroup(ob)))
-
-                elif obtype in ("DraftText","Text"):
-                    # texts
-                    if gui:
-                        height = float(ob.ViewObject.FontSize)
-                    else:
-                        height = 1
-                    for text in ob.Text:
-                        point = DraftVecUtils.tup(Vector(ob.Placement.Base.x,
-                                                         ob.Placement.Base.y - (height * 1.2 * ob.Text.index(text)),
-                                                         ob.Placement.Base.z))
-                        rotation = math.degrees(ob.Placement.Rotation.Angle)
-                        dxf.append(dxfLibrary.Text(text,
-                                                   point,
-                                                   height=height * 0.8,
-                                                   rotation=rotation,
-                                                   color=getACI(ob, text=True),
-                                                   style='STANDARD',
-                                                   layer=getStrGroup(ob)))
-
-                elif obtype in ["Dimension","LinearDimension"]:
-                    p1 = DraftVecUtils.tup(ob.Start)
-                    p2 = DraftVecUtils.tup(ob.End)
-                    base = Part.LineSegment(ob.Start, ob.End).toShape()
-                    proj = DraftGeomUtils.findDistance(ob.Dimline, base)
-                    if not proj:
-                        pbase = DraftVecUtils.tup(ob.End)
+                            # all other cases: block
+                            block = getBlock(sh, ob, lwPoly)
+                            dxf.blocks.append(block)
+                            dxf.append(dxfLibrary.Insert(name=ob.Name.upper(),
+                                                         color=getACI(ob),
+                                                         layer=getStrGroup(ob)))
                     else:
-                        pbase = DraftVecUtils.tup(ob.End.add(proj.negative()))
-                    dxf.append(dxfLibrary.Dimension(pbase,
-                                                    p1, p2,
-                                                    color=getACI(ob),
-                                                    layer=getStrGroup(ob)))
-
-            dxf.saveas(filename)
-
-        FCC.PrintMessage("successfully exported" + " " + filename + "\n")
+                        writeShape(sh, ob, dxf, nospline, lwPoly)
+
+        elif obtype == "Annotation":
+            # old-style texts
+            # temporary - as dxfLibrary doesn't support mtexts well,
+            # we use several single-line texts
+            # well, anyway, at the moment, Draft only writes
+            # single-line texts, so...
+            for text in ob.LabelText:
+                point = DraftVecUtils.tup(Vector(ob.Position.x,
+                                                 ob.Position.y - ob.LabelText.index(text),
+                                                 ob.Position.z))
+                if gui:
+                    height = float(ob.ViewObject.FontSize)
+                else:
+                    height = 1
+                dxf.append(dxfLibrary.Text(text, point, height=height,
+                                           color=getACI(ob, text=True),
+                                           style='STANDARD',
+                                           layer=getStrGroup(ob)))
+
+        elif obtype in ("DraftText","Text"):
+            # texts
+            if gui:
+                height = float(ob.ViewObject.FontSize)
+            else:
+                height = 1
+            for text in ob.Text:
+                point = DraftVecUtils.tup(Vector(ob.Placement.Base.x,
+                                                 ob.Placement.Base.y - (height * 1.2 * ob.Text.index(text)),
+                                                 ob.Placement.Base.z))
+                rotation = math.degrees(ob.Placement.Rotation.Angle)
+                dxf.append(dxfLibrary.Text(text,
+                                           point,
+                                           height=height * 0.8,
+                                           rotation=rotation,
+                                           color=getACI(ob, text=True),
+                                           style='STANDARD',
+                                           layer=getStrGroup(ob)))
+
+        elif obtype in ["Dimension","LinearDimension"]:
+            p1 = DraftVecUtils.tup(ob.Start)
+            p2 = DraftVecUtils.tup(ob.End)
+            base = Part.LineSegment(ob.Start, ob.End).toShape()
+            proj = DraftGeomUtils.findDistance(ob.Dimline, base)
+            if not proj:
+                pbase = DraftVecUtils.tup(ob.End)
+            else:
+                pbase = DraftVecUtils.tup(ob.End.add(proj.negative()))
+            dxf.append(dxfLibrary.Dimension(pbase,
+                                            p1, p2,
+                                            color=getACI(ob),
+                                            layer=getStrGroup(ob)))
 
-    else:
-        errorDXFLib(gui)
+    dxf.saveas(filename)
 
 
 class dxfcounter:
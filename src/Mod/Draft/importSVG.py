@@ -229,6 +229,18 @@ svgcolors = {
 svgcolorslower = \
     dict((key.lower(), value) for (key, value) in list(svgcolors.items()))
 
+# Regular expressions used for every element are compiled only once
+_num = r'[-+]?[0-9]*\.?[0-9]+'
+_exp = r'([eE][-+]?[0-9]+)?'
+_sizere = re.compile('(' + _num + _exp + ')'
+                     + '(px|pt|pc|mm|cm|in|em|ex|%)?')
+_pathcommandsre = re.compile(r'\s*?([mMlLhHvVaAcCqQsStTzZ])'
+                             r'\s*?([^mMlLhHvVaAcCqQsStTzZ]*)\s*?',
+                             re.DOTALL)
+_pathnumbersre = re.compile(_num + '(?:[eE][-+]?[0-9]+)?', re.DOTALL)
+_transformre = re.compile(r'(matrix|translate|scale|rotate|skewX|skewY)'
+                          r'\s*?\((.*?)\)', re.DOTALL)
+
 
 def getcolor(color):
     """Check if the given string is an RGB value, or if it is a named color.
@@ -403,10 +415,7 @@ def getsize(length, mode='discard', base=1):
         }
 
     # Extract a number from a string like '+56215.14565E+6mm'
-    _num = '([-+]?[0-9]*\.?[0-9]+([eE][-+]?[0-9]+)?)'
-    _unit = '(px|pt|pc|mm|cm|in|em|ex|%)?'
-    _full_num = _num + _unit
-    number, exponent, unit = re.findall(_full_num, length)[0]
+    number, exponent, unit = _sizere.findall(length)[0]
     if mode == 'discard':
         return float(number)
     elif mode == 'tuple':
@@ -422,6 +431,28 @@ def getsize(length, mode='discard', base=1):
             return float(number) * base
 
 
+def parsepathdata(d):
+    """Split the data of an SVG path into commands and numbers.
+
+    Parameters
+    ----------
+    d : str
+        The `d` attribute of a path, for example `'M 0,0 l 10 0 z'`.
+
+    Returns
+    -------
+    list of tuples
+        A list ``[(command, [number, ...]), ...]`` where `command`
+        is a single letter and the numbers are its arguments,
+        in the same order as in the path.
+    """
+    commands = []
+    for command, numbers in _pathcommandsre.findall(d):
+        values = _pathnumbersre.findall(numbers)
+        commands.append((command, [float(v) for v in values]))
+    return commands
+
+
 def makewire(path, checkclosed=False, donttry=False):
     '''Try to make a wire out of the list of edges.
 
@@ -650,6 +681,9 @@ class svgHandler(xml.sax.ContentHandler):
         self.style = params.GetInt("svgstyle")
         self.disableUnitScaling = params.GetBool("svgDisableUnitScaling",
                                                  False)
+        # Per-element reports are very slow on big files, so they are
+        # only printed on request
+        self.verbose = params.GetBool("svgVerbose", False)
         self.count = 0
         self.transform = None
         self.grouptransform = []
@@ -658,6 +692,9 @@ class svgHandler(xml.sax.ContentHandler):
         self.symbols = {}
         self.currentsymbol = None
         self.svgdpi = 1.0
+        # matrices already computed from transform attributes of this file,
+        # see getMatrix
+        self.transformcache = {}
 
         global Part
         import Part
@@ -698,13 +735,15 @@ class svgHandler(xml.sax.ContentHandler):
             Dictionary of content of the elements
         """
         self.count += 1
-        _msg('processing element {0}: {1}'.format(self.count, name))
-        _msg('existing group transform: {}'.format(self.grouptransform))
+        if self.verbose:
+            _msg('processing element {0}: {1}'.format(self.count, name))
+            _msg('existing group transform: {}'.format(self.grouptransform))
 
         data = {}
-        for (keyword, content) in list(attrs.items()):
+        for (keyword, content) in attrs.items():
             # print(keyword, content)
-            if keyword != "style":
+            # path data is tokenized later by parsepathdata
+            if keyword not in ("style", "d"):
                 content = content.replace(',', ' ')
                 content = content.split()
             # print(keyword, content)
@@ -860,11 +899,13 @@ class svgHandler(xml.sax.ContentHandler):
         pathname = None
         if 'id' in data:
             pathname = data['id'][0]
-            _msg('name: {}'.format(pathname))
+            if self.verbose:
+                _msg('name: {}'.format(pathname))
 
         # Process paths
         if name == "path":
-            _msg('data: {}'.format(data))
+            if self.verbose:
+                _msg('data: {}'.format(data))
 
             if not pathname:
                 pathname = 'Path'
@@ -888,22 +929,26 @@ class svgHandler(xml.sax.ContentHandler):
                 self.applyTrans(obj)
                 self.format(obj)
                 self.lastdim = obj
-                data['d'] = []
-
-            _op = '([mMlLhHvVaAcCqQsStTzZ])'
-            _op2 = '([^mMlLhHvVaAcCqQsStTzZ]*)'
-            _command = '\s*?' + _op + '\s*?' + _op2 + '\s*?'
-            pathcommandsre = re.compile(_command, re.DOTALL)
-
-            _num = '[-+]?[0-9]*\.?[0-9]+'
-            _exp = '([eE][-+]?[0-9]+)?'
-            _point = '(' + _num + _exp + ')'
-            pointsre = re.compile(_point, re.DOTALL)
-            _commands = pathcommandsre.findall(' '.join(data['d']))
-            for d, pointsstr in _commands:
+                data['d'] = ''
+
+            # Consecutive straight segments are collected as a list
+            # of points, and turned into edges with a single call
+            linerun = []
+
+            def flushlines():
+                if len(linerun) > 1:
+                    path.extend(Part.makePolygon(linerun).Edges)
+                del linerun[:]
+
+            def addline(v1, v2):
+                if not linerun:
+                    linerun.append(v1)
+                linerun.append(v2)
+
+            for d, pointlist in parsepathdata(data.get('d', '')):
                 relative = d.islower()
-                _points = pointsre.findall(pointsstr.replace(',', ' '))
-                pointlist = [float(number) for number, exponent in _points]
+                if d not in "lLhHvV":
+                    flushlines()
 
                 if (d == "M" or d == "m"):
                     x = pointlist.pop(0)
@@ -929,7 +974,8 @@ class svgHandler(xml.sax.ContentHandler):
                     else:
                         lastvec = Vector(x, -y, 0)
                     firstvec = lastvec
-                    _msg('move {}'.format(lastvec))
+                    if self.verbose:
+                        _msg('move {}'.format(lastvec))
                     lastpole = None
 
                 if (d == "L" or d == "l") \
@@ -940,11 +986,11 @@ class svgHandler(xml.sax.ContentHandler):
                         else:
                             currentvec = Vector(x, -y, 0)
                         if not DraftVecUtils.equals(lastvec, currentvec):
-                            _seg = Part.LineSegment(lastvec, currentvec)
-                            seg = _seg.toShape()
-                            _msg("line {} {}".format(lastvec, currentvec))
+                            addline(lastvec, currentvec)
+                            if self.verbose:
+                                _msg("line {} {}".format(lastvec,
+                                                         currentvec))
                             lastvec = currentvec
-                            path.append(seg)
                         lastpole = None
                 elif (d == "H" or d == "h"):
                     for x in pointlist:
@@ -952,22 +998,20 @@ class svgHandler(xml.sax.ContentHandler):
                             currentvec = lastvec.add(Vector(x, 0, 0))
                         else:
                             currentvec = Vector(x, lastvec.y, 0)
-                        seg = Part.LineSegment(lastvec, currentvec).toShape()
-                        lastvec = currentvec
+                        if not DraftVecUtils.equals(lastvec, currentvec):
+                            addline(lastvec, currentvec)
+                            lastvec = currentvec
                         lastpole = None
-                        path.append(seg)
                 elif (d == "V" or d == "v"):
                     for y in pointlist:
                         if relative:
                             currentvec = lastvec.add(Vector(0, -y, 0))
                         else:
                             currentvec = Vector(lastvec.x, -y, 0)
-                        if lastvec != currentvec:
-                            _seg = Part.LineSegment(lastvec, currentvec)
-                            seg = _seg.toShape()
+                        if not DraftVecUtils.equals(lastvec, currentvec):
+                            addline(lastvec, currentvec)
                             lastvec = currentvec
                             lastpole = None
-                            path.append(seg)
                 elif (d == "A" or d == "a"):
                     piter = zip(pointlist[0::7], pointlist[1::7],
                                 pointlist[2::7], pointlist[3::7],
@@ -1197,6 +1241,7 @@ class svgHandler(xml.sax.ContentHandler):
                         # command = None
                         if self.currentsymbol:
                             self.symbols[self.currentsymbol].append(obj)
+            flushlines()
             if path:
                 sh = makewire(path, checkclosed=False)
                 # sh = Part.Wire(path)
@@ -1335,22 +1380,22 @@ class svgHandler(xml.sax.ContentHandler):
             if not pathname:
                 pathname = 'Polyline'
             points = [float(d) for d in data['points']]
-            _msg('points {}'.format(points))
+            if self.verbose:
+                _msg('points {}'.format(points))
             lenpoints = len(points)
             if lenpoints >= 4 and lenpoints % 2 == 0:
                 lastvec = Vector(points[0], -points[1], 0)
-                path = []
+                verts = [lastvec]
                 if name == 'polygon':
                     points = points + points[:2]  # emulate closepath
                 for svgx, svgy in zip(points[2::2], points[3::2]):
                     currentvec = Vector(svgx, -svgy, 0)
                     if not DraftVecUtils.equals(lastvec, currentvec):
-                        seg = Part.LineSegment(lastvec, currentvec).toShape()
                         # print("polyline seg ", lastvec, currentvec)
                         lastvec = currentvec
-                        path.append(seg)
-                if path:
-                    sh = Part.Wire(path)
+                        verts.append(currentvec)
+                if len(verts) > 1:
+                    sh = Part.makePolygon(verts)
                     if self.fill and sh.isClosed():
                         sh = Part.Face(sh)
                     sh = self.applyTrans(sh)
@@ -1406,7 +1451,8 @@ class svgHandler(xml.sax.ContentHandler):
         # Process texts
         if name in ["text", "tspan"]:
             if "freecad:skip" not in data:
-                _msg("processing a text")
+                if self.verbose:
+                    _msg("processing a text")
                 if 'x' in data:
                     self.x = data['x']
                 else:
@@ -1435,7 +1481,8 @@ class svgHandler(xml.sax.ContentHandler):
             if "xlink:href" in data:
                 symbol = data["xlink:href"][0][1:]
                 if symbol in self.symbols:
-                    _msg("using symbol " + symbol)
+                    if self.verbose:
+                        _msg("using symbol " + symbol)
                     shapes = []
                     for o in self.symbols[symbol]:
                         if o.isDerivedFrom("Part::Feature"):
@@ -1448,16 +1495,18 @@ class svgHandler(xml.sax.ContentHandler):
                         obj = self.doc.addObject("Part::Feature", symbol)
                         obj.Shape = sh
                         self.format(obj)
-                else:
+                elif self.verbose:
                     _msg("no symbol data")
 
-        _msg("done processing element {}".format(self.count))
+        if self.verbose:
+            _msg("done processing element {}".format(self.count))
     # startElement()
 
     def characters(self, content):
         """Read characters from the given string."""
         if self.text:
-            _msg("reading characters {}".format(content))
+            if self.verbose:
+                _msg("reading characters {}".format(content))
             obj = self.doc.addObject("App::Annotation", 'Text')
             # use ignore to not break import if char is not found in latin1
             obj.LabelText = content.encode('latin1', 'ignore')
@@ -1491,7 +1540,8 @@ class svgHandler(xml.sax.ContentHandler):
             self.transform = None
             self.text = None
         if name == "g" or name == "svg":
-            _msg("closing group")
+            if self.verbose:
+                _msg("closing group")
             self.grouptransform.pop()
         if name == "symbol":
             if self.doc.getObject("svgsymbols"):
@@ -1513,12 +1563,15 @@ class svgHandler(xml.sax.ContentHandler):
         """
         if isinstance(sh, Part.Shape):
             if self.transform:
-                _msg("applying object transform: {}".format(self.transform))
+                if self.verbose:
+                    _msg("applying object transform: "
+                         "{}".format(self.transform))
                 # sh = transformCopyShape(sh, self.transform)
                 # see issue #2062
                 sh = sh.transformGeometry(self.transform)
             for transform in self.grouptransform[::-1]:
-                _msg("applying group transform: {}".format(transform))
+                if self.verbose:
+                    _msg("applying group transform: {}".format(transform))
                 # sh = transformCopyShape(sh, transform)
                 # see issue #2062
                 sh = sh.transformGeometry(transform)
@@ -1528,11 +1581,14 @@ class svgHandler(xml.sax.ContentHandler):
             for p in [sh.Start, sh.End, sh.Dimline]:
                 cp = Vector(p)
                 if self.transform:
-                    _msg("applying object transform: "
-                         "{}".format(self.transform))
+                    if self.verbose:
+                        _msg("applying object transform: "
+                             "{}".format(self.transform))
                     cp = self.transform.multiply(cp)
                 for transform in self.grouptransform[::-1]:
-                    _msg("applying group transform: {}".format(transform))
+                    if self.verbose:
+                        _msg("applying group transform: "
+                             "{}".format(transform))
                     cp = transform.multiply(cp)
                 pts.append(cp)
             sh.Start = pts[0]
@@ -1566,13 +1622,14 @@ class svgHandler(xml.sax.ContentHandler):
         -------
         Base::Matrix4D
             The translated matrix.
+            Identical transform strings, which are very common in
+            plotted files, are only parsed once; a copy of the cached
+            matrix is returned.
         """
-        _op = '(matrix|translate|scale|rotate|skewX|skewY)'
-        _val = '\((.*?)\)'
-        _transf = _op + '\s*?' + _val
-        transformre = re.compile(_transf, re.DOTALL)
+        if tr in self.transformcache:
+            return FreeCAD.Matrix(self.transformcache[tr])
         m = FreeCAD.Matrix()
-        for transformation, arguments in transformre.findall(tr):
+        for transformation, arguments in _transformre.findall(tr):
             _args_rep = arguments.replace(',', ' ').split()
             argsplit = [float(arg) for arg in _args_rep]
             # m.multiply(FreeCAD.Matrix(1, 0, 0, 0, 0, -1))
@@ -1626,6 +1683,7 @@ class svgHandler(xml.sax.ContentHandler):
             #    print('SKIPPED %s' % transformation)
             # print("m = ", m)
         # print("generating transformation: ", m)
+        self.transformcache[tr] = FreeCAD.Matrix(m)
         return m
     # getMatrix
 # class svgHandler
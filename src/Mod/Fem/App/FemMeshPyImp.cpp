@@ -28,6 +28,7 @@
 # include <Python.h>
 # include <SMESH_Group.hxx>
 # include <SMESH_Mesh.hxx>
+# include <SMESH_MeshEditor.hxx>
 # include <SMESHDS_Group.hxx>
 # include <SMDSAbs_ElementType.hxx>
 # include <SMDS_MeshElement.hxx>
@@ -575,6 +576,117 @@ PyObject* FemMeshPy::addVolume(PyObject *args)
     return nullptr;
 }
 
+PyObject* FemMeshPy::addNodes(PyObject *args)
+{
+    PyObject *coords;
+    PyObject *ids = nullptr;
+    if (!PyArg_ParseTuple(args, "O|O", &coords, &ids))
+        return nullptr;
+
+    try {
+        SMESH_Mesh* mesh = getFemMeshPtr()->getSMesh();
+        SMESHDS_Mesh* meshDS = mesh->GetMeshDS();
+
+        Py::Sequence coordList(coords);
+        std::vector<int> nodeIds;
+        if (ids) {
+            Py::Sequence idList(ids);
+            if (idList.size() != coordList.size())
+                throw std::runtime_error("Number of node ids and coordinates differ");
+            nodeIds.reserve(idList.size());
+            for (Py::Sequence::size_type i = 0; i < idList.size(); ++i)
+                nodeIds.push_back(static_cast<int>(Py::Long(idList[i])));
+        }
+
+        for (Py::Sequence::size_type i = 0; i < coordList.size(); ++i) {
+            Py::Sequence point(coordList[i]);
+            if (point.size() != 3)
+                throw std::runtime_error("Node coordinates must be given as (x,y,z)");
+            double x = static_cast<double>(Py::Float(point[0]));
+            double y = static_cast<double>(Py::Float(point[1]));
+            double z = static_cast<double>(Py::Float(point[2]));
+            SMDS_MeshNode* node = ids ? meshDS->AddNodeWithID(x,y,z,nodeIds[i])
+                                      : meshDS->AddNode(x,y,z);
+            if (!node)
+                throw std::runtime_error("Failed to add node");
+        }
+    }
+    catch (const Py::Exception&) {
+        return nullptr;
+    }
+    catch (const std::exception& e) {
+        PyErr_SetString(Base::PyExc_FC_GeneralError, e.what());
+        return nullptr;
+    }
+
+    Py_Return;
+}
+
+PyObject* FemMeshPy::addElements(PyObject *args)
+{
+    const char* typeStr;
+    PyObject *elems;
+    PyObject *ids = nullptr;
+    if (!PyArg_ParseTuple(args, "sO|O", &typeStr, &elems, &ids))
+        return nullptr;
+
+    SMDSAbs_ElementType elemType;
+    std::string type(typeStr);
+    if (type == "Edge")
+        elemType = SMDSAbs_Edge;
+    else if (type == "Face")
+        elemType = SMDSAbs_Face;
+    else if (type == "Volume")
+        elemType = SMDSAbs_Volume;
+    else {
+        PyErr_SetString(PyExc_ValueError, "Invalid element type, Edge, Face or Volume are allowed");
+        return nullptr;
+    }
+
+    try {
+        SMESH_Mesh* mesh = getFemMeshPtr()->getSMesh();
+        SMESHDS_Mesh* meshDS = mesh->GetMeshDS();
+        SMESH_MeshEditor editor(mesh);
+        SMESH_MeshEditor::ElemFeatures elemFeat(elemType);
+
+        Py::Sequence elemList(elems);
+        std::vector<int> elemIds;
+        if (ids) {
+            Py::Sequence idList(ids);
+            if (idList.size() != elemList.size())
+                throw std::runtime_error("Number of element ids and elements differ");
+            elemIds.reserve(idList.size());
+            for (Py::Sequence::size_type i = 0; i < idList.size(); ++i)
+                elemIds.push_back(static_cast<int>(Py::Long(idList[i])));
+        }
+
+        // the node count of each element selects its shape like in addEdge, addFace, addVolume
+        std::vector<const SMDS_MeshNode*> Nodes;
+        for (Py::Sequence::size_type i = 0; i < elemList.size(); ++i) {
+            Py::Sequence nodeList(elemList[i]);
+            Nodes.resize(nodeList.size());
+            for (Py::Sequence::size_type j = 0; j < nodeList.size(); ++j) {
+                const SMDS_MeshNode* node = meshDS->FindNode(static_cast<int>(Py::Long(nodeList[j])));
+                if (!node)
+                    throw std::runtime_error("Failed to get node of the given indices");
+                Nodes[j] = node;
+            }
+            elemFeat.SetID(ids ? elemIds[i] : -1);
+            if (!editor.AddElement(Nodes, elemFeat))
+                throw std::runtime_error("Failed to add element, check the node count and the ElementId");
+        }
+    }
+    catch (const Py::Exception&) {
+        return nullptr;
+    }
+    catch (const std::exception& e) {
+        PyErr_SetString(Base::PyExc_FC_GeneralError, e.what());
+        return nullptr;
+    }
+
+    Py_Return;
+}
+
 PyObject* FemMeshPy::copy(PyObject *args)
 {
     if (!PyArg_ParseTuple(args, ""))
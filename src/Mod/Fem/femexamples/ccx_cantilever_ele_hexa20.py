@@ -79,12 +79,12 @@ def setup(doc=None, solvertype="ccxtools"):
     doc.recompute()
 
     # load the hexa20 mesh
-    from .meshes.mesh_canticcx_hexa20 import create_nodes, create_elements
+    from .meshes import create_nodes, create_elements
     new_fem_mesh = Fem.FemMesh()
-    control = create_nodes(new_fem_mesh)
+    control = create_nodes(new_fem_mesh, "mesh_canticcx_hexa20")
     if not control:
         FreeCAD.Console.PrintError("Error on creating nodes.\n")
-    control = create_elements(new_fem_mesh)
+    control = create_elements(new_fem_mesh, "mesh_canticcx_hexa20")
     if not control:
         FreeCAD.Console.PrintError("Error on creating elements.\n")
 
@@ -127,13 +127,13 @@ def setup(doc=None, solvertype="elmer"):
     analysis.addObject(con_fixed)
 
     # mesh
-    from .meshes.mesh_eigenvalue_of_elastic_beam_tetra10 import create_nodes
-    from .meshes.mesh_eigenvalue_of_elastic_beam_tetra10 import create_elements
+    from .meshes import create_nodes
+    from .meshes import create_elements
     fem_mesh = Fem.FemMesh()
-    control = create_nodes(fem_mesh)
+    control = create_nodes(fem_mesh, "mesh_eigenvalue_of_elastic_beam_tetra10")
     if not control:
         FreeCAD.Console.PrintError("Error on creating nodes.\n")
-    control = create_elements(fem_mesh)
+    control = create_elements(fem_mesh, "mesh_eigenvalue_of_elastic_beam_tetra10")
     if not control:
         FreeCAD.Console.PrintError("Error on creating elements.\n")
     femmesh_obj = analysis.addObject(ObjectsFem.makeMeshGmsh(doc, get_meshname()))[0]
@@ -247,12 +247,12 @@ def setup(doc=None, solvertype="elmer"):
         )
     if error:
         # try to create from existing rough mesh
-        from .meshes.mesh_electricforce_elmer_nongui6_tetra10 import create_nodes, create_elements
+        from .meshes import create_nodes, create_elements
         fem_mesh = Fem.FemMesh()
-        control = create_nodes(fem_mesh)
+        control = create_nodes(fem_mesh, "mesh_electricforce_elmer_nongui6_tetra10")
         if not control:
             FreeCAD.Console.PrintError("Error on creating nodes.\n")
-        control = create_elements(fem_mesh)
+        control = create_elements(fem_mesh, "mesh_electricforce_elmer_nongui6_tetra10")
         if not control:
             FreeCAD.Console.PrintError("Error on creating elements.\n")
         femmesh_obj.FemMesh = fem_mesh
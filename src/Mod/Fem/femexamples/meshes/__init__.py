@@ -0,0 +1,61 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 FreeCAD Developers                                 *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "FEM example meshes"
+__author__ = "FreeCAD Developers"
+__url__ = "https://www.freecadweb.org"
+
+## @package meshes
+#  \ingroup FEM
+#  \brief meshes of the FEM examples
+
+# the meshes are stored as binary mesh files, see module femmesh.binarymesh
+# a new one is written by
+# from femmesh import binarymesh
+# binarymesh.write_femmesh(fem_mesh, "mesh_mymesh_tetra10.npz")
+
+import os
+
+from femmesh import binarymesh
+
+
+def get_mesh_file(
+    mesh_name
+):
+    """ returns the file of an example mesh, mesh_name is without extension
+    """
+    return os.path.join(os.path.dirname(__file__), mesh_name + ".npz")
+
+
+def create_nodes(
+    femmesh,
+    mesh_name
+):
+    return binarymesh.read_nodes(femmesh, get_mesh_file(mesh_name))
+
+
+def create_elements(
+    femmesh,
+    mesh_name
+):
+    return binarymesh.read_elements(femmesh, get_mesh_file(mesh_name))
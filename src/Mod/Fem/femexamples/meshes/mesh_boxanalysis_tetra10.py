@@ -1,417 +0,0 @@
-def create_nodes(femmesh):
-    # nodes
-    femmesh.addNode(0.0, 0.0, 0.0, 1)
-    femmesh.addNode(0.0, 0.0, 10.0, 2)
-    femmesh.addNode(0.0, 10.0, 0.0, 3)
-    femmesh.addNode(0.0, 10.0, 10.0, 4)
-    femmesh.addNode(10.0, 0.0, 0.0, 5)
-    femmesh.addNode(10.0, 0.0, 10.0, 6)
-    femmesh.addNode(10.0, 10.0, 0.0, 7)
-    femmesh.addNode(10.0, 10.0, 10.0, 8)
-    femmesh.addNode(0.0, 0.0, 5.0, 9)
-    femmesh.addNode(0.0, 0.0, 2.5, 10)
-    femmesh.addNode(0.0, 0.0, 7.5, 11)
-    femmesh.addNode(0.0, 5.0, 0.0, 12)
-    femmesh.addNode(0.0, 2.5, 0.0, 13)
-    femmesh.addNode(0.0, 7.5, 0.0, 14)
-    femmesh.addNode(0.0, 10.0, 5.0, 15)
-    femmesh.addNode(0.0, 10.0, 2.5, 16)
-    femmesh.addNode(0.0, 10.0, 7.5, 17)
-    femmesh.addNode(0.0, 5.0, 10.0, 18)
-    femmesh.addNode(0.0, 2.5, 10.0, 19)
-    femmesh.addNode(0.0, 7.5, 10.0, 20)
-    femmesh.addNode(10.0, 0.0, 5.0, 21)
-    femmesh.addNode(10.0, 0.0, 2.5, 22)
-    femmesh.addNode(10.0, 0.0, 7.5, 23)
-    femmesh.addNode(10.0, 5.0, 0.0, 24)
-    femmesh.addNode(10.0, 2.5, 0.0, 25)
-    femmesh.addNode(10.0, 7.5, 0.0, 26)
-    femmesh.addNode(10.0, 10.0, 5.0, 27)
-    femmesh.addNode(10.0, 10.0, 2.5, 28)
-    femmesh.addNode(10.0, 10.0, 7.5, 29)
-    femmesh.addNode(10.0, 5.0, 10.0, 30)
-    femmesh.addNode(10.0, 2.5, 10.0, 31)
-    femmesh.addNode(10.0, 7.5, 10.0, 32)
-    femmesh.addNode(5.0, 0.0, 0.0, 33)
-    femmesh.addNode(2.5, 0.0, 0.0, 34)
-    femmesh.addNode(7.5, 0.0, 0.0, 35)
-    femmesh.addNode(5.0, 0.0, 10.0, 36)
-    femmesh.addNode(2.5, 0.0, 10.0, 37)
-    femmesh.addNode(7.5, 0.0, 10.0, 38)
-    femmesh.addNode(5.0, 10.0, 0.0, 39)
-    femmesh.addNode(2.5, 10.0, 0.0, 40)
-    femmesh.addNode(7.5, 10.0, 0.0, 41)
-    femmesh.addNode(5.0, 10.0, 10.0, 42)
-    femmesh.addNode(2.5, 10.0, 10.0, 43)
-    femmesh.addNode(7.5, 10.0, 10.0, 44)
-    femmesh.addNode(0.0, 5.0, 5.0, 45)
-    femmesh.addNode(0.0, 2.5, 7.5, 46)
-    femmesh.addNode(0.0, 2.5, 2.5, 47)
-    femmesh.addNode(0.0, 7.5, 7.5, 48)
-    femmesh.addNode(0.0, 7.5, 2.5, 49)
-    femmesh.addNode(0.0, 1.25, 8.75, 50)
-    femmesh.addNode(0.0, 1.25, 6.25, 51)
-    femmesh.addNode(0.0, 2.5, 5.0, 52)
-    femmesh.addNode(0.0, 3.75, 6.25, 53)
-    femmesh.addNode(0.0, 1.25, 3.75, 54)
-    femmesh.addNode(0.0, 1.25, 1.25, 55)
-    femmesh.addNode(0.0, 3.75, 3.75, 56)
-    femmesh.addNode(0.0, 3.75, 1.25, 57)
-    femmesh.addNode(0.0, 5.0, 2.5, 58)
-    femmesh.addNode(0.0, 6.25, 1.25, 59)
-    femmesh.addNode(0.0, 8.75, 1.25, 60)
-    femmesh.addNode(0.0, 6.25, 3.75, 61)
-    femmesh.addNode(0.0, 3.75, 8.75, 62)
-    femmesh.addNode(0.0, 5.0, 7.5, 63)
-    femmesh.addNode(0.0, 8.75, 6.25, 64)
-    femmesh.addNode(0.0, 8.75, 8.75, 65)
-    femmesh.addNode(0.0, 6.25, 6.25, 66)
-    femmesh.addNode(0.0, 7.5, 5.0, 67)
-    femmesh.addNode(0.0, 6.25, 8.75, 68)
-    femmesh.addNode(0.0, 8.75, 3.75, 69)
-    femmesh.addNode(10.0, 5.0, 5.0, 70)
-    femmesh.addNode(10.0, 2.5, 7.5, 71)
-    femmesh.addNode(10.0, 7.5, 7.5, 72)
-    femmesh.addNode(10.0, 7.5, 2.5, 73)
-    femmesh.addNode(10.0, 2.5, 2.5, 74)
-    femmesh.addNode(10.0, 6.25, 8.75, 75)
-    femmesh.addNode(10.0, 8.75, 8.75, 76)
-    femmesh.addNode(10.0, 8.75, 6.25, 77)
-    femmesh.addNode(10.0, 5.0, 7.5, 78)
-    femmesh.addNode(10.0, 6.25, 6.25, 79)
-    femmesh.addNode(10.0, 7.5, 5.0, 80)
-    femmesh.addNode(10.0, 6.25, 1.25, 81)
-    femmesh.addNode(10.0, 8.75, 1.25, 82)
-    femmesh.addNode(10.0, 8.75, 3.75, 83)
-    femmesh.addNode(10.0, 6.25, 3.75, 84)
-    femmesh.addNode(10.0, 5.0, 2.5, 85)
-    femmesh.addNode(10.0, 3.75, 1.25, 86)
-    femmesh.addNode(10.0, 1.25, 1.25, 87)
-    femmesh.addNode(10.0, 1.25, 3.75, 88)
-    femmesh.addNode(10.0, 3.75, 3.75, 89)
-    femmesh.addNode(10.0, 2.5, 5.0, 90)
-    femmesh.addNode(10.0, 3.75, 8.75, 91)
-    femmesh.addNode(10.0, 1.25, 8.75, 92)
-    femmesh.addNode(10.0, 3.75, 6.25, 93)
-    femmesh.addNode(10.0, 1.25, 6.25, 94)
-    femmesh.addNode(5.0, 0.0, 5.0, 95)
-    femmesh.addNode(7.5, 0.0, 7.5, 96)
-    femmesh.addNode(7.5, 0.0, 2.5, 97)
-    femmesh.addNode(2.5, 0.0, 2.5, 98)
-    femmesh.addNode(2.5, 0.0, 7.5, 99)
-    femmesh.addNode(1.25, 0.0, 1.25, 100)
-    femmesh.addNode(1.25, 0.0, 3.75, 101)
-    femmesh.addNode(2.5, 0.0, 5.0, 102)
-    femmesh.addNode(3.75, 0.0, 3.75, 103)
-    femmesh.addNode(3.75, 0.0, 6.25, 104)
-    femmesh.addNode(1.25, 0.0, 6.25, 105)
-    femmesh.addNode(1.25, 0.0, 8.75, 106)
-    femmesh.addNode(6.25, 0.0, 6.25, 107)
-    femmesh.addNode(6.25, 0.0, 8.75, 108)
-    femmesh.addNode(5.0, 0.0, 7.5, 109)
-    femmesh.addNode(7.5, 0.0, 5.0, 110)
-    femmesh.addNode(8.75, 0.0, 6.25, 111)
-    femmesh.addNode(8.75, 0.0, 8.75, 112)
-    femmesh.addNode(6.25, 0.0, 3.75, 113)
-    femmesh.addNode(8.75, 0.0, 3.75, 114)
-    femmesh.addNode(5.0, 0.0, 2.5, 115)
-    femmesh.addNode(6.25, 0.0, 1.25, 116)
-    femmesh.addNode(8.75, 0.0, 1.25, 117)
-    femmesh.addNode(3.75, 0.0, 1.25, 118)
-    femmesh.addNode(3.75, 0.0, 8.75, 119)
-    femmesh.addNode(5.0, 10.0, 5.0, 120)
-    femmesh.addNode(7.5, 10.0, 2.5, 121)
-    femmesh.addNode(2.5, 10.0, 2.5, 122)
-    femmesh.addNode(7.5, 10.0, 7.5, 123)
-    femmesh.addNode(2.5, 10.0, 7.5, 124)
-    femmesh.addNode(6.25, 10.0, 8.75, 125)
-    femmesh.addNode(6.25, 10.0, 6.25, 126)
-    femmesh.addNode(5.0, 10.0, 7.5, 127)
-    femmesh.addNode(8.75, 10.0, 8.75, 128)
-    femmesh.addNode(3.75, 10.0, 8.75, 129)
-    femmesh.addNode(3.75, 10.0, 6.25, 130)
-    femmesh.addNode(1.25, 10.0, 8.75, 131)
-    femmesh.addNode(6.25, 10.0, 1.25, 132)
-    femmesh.addNode(5.0, 10.0, 2.5, 133)
-    femmesh.addNode(6.25, 10.0, 3.75, 134)
-    femmesh.addNode(8.75, 10.0, 1.25, 135)
-    femmesh.addNode(8.75, 10.0, 3.75, 136)
-    femmesh.addNode(7.5, 10.0, 5.0, 137)
-    femmesh.addNode(1.25, 10.0, 3.75, 138)
-    femmesh.addNode(2.5, 10.0, 5.0, 139)
-    femmesh.addNode(3.75, 10.0, 3.75, 140)
-    femmesh.addNode(1.25, 10.0, 1.25, 141)
-    femmesh.addNode(3.75, 10.0, 1.25, 142)
-    femmesh.addNode(8.75, 10.0, 6.25, 143)
-    femmesh.addNode(1.25, 10.0, 6.25, 144)
-    femmesh.addNode(5.0, 5.0, 0.0, 145)
-    femmesh.addNode(2.5, 7.5, 0.0, 146)
-    femmesh.addNode(7.5, 7.5, 0.0, 147)
-    femmesh.addNode(7.5, 2.5, 0.0, 148)
-    femmesh.addNode(2.5, 2.5, 0.0, 149)
-    femmesh.addNode(1.25, 3.75, 0.0, 150)
-    femmesh.addNode(1.25, 1.25, 0.0, 151)
-    femmesh.addNode(2.5, 5.0, 0.0, 152)
-    femmesh.addNode(1.25, 6.25, 0.0, 153)
-    femmesh.addNode(3.75, 6.25, 0.0, 154)
-    femmesh.addNode(3.75, 3.75, 0.0, 155)
-    femmesh.addNode(1.25, 8.75, 0.0, 156)
-    femmesh.addNode(3.75, 1.25, 0.0, 157)
-    femmesh.addNode(3.75, 8.75, 0.0, 158)
-    femmesh.addNode(5.0, 7.5, 0.0, 159)
-    femmesh.addNode(6.25, 8.75, 0.0, 160)
-    femmesh.addNode(6.25, 6.25, 0.0, 161)
-    femmesh.addNode(8.75, 8.75, 0.0, 162)
-    femmesh.addNode(8.75, 6.25, 0.0, 163)
-    femmesh.addNode(7.5, 5.0, 0.0, 164)
-    femmesh.addNode(8.75, 3.75, 0.0, 165)
-    femmesh.addNode(6.25, 3.75, 0.0, 166)
-    femmesh.addNode(6.25, 1.25, 0.0, 167)
-    femmesh.addNode(5.0, 2.5, 0.0, 168)
-    femmesh.addNode(8.75, 1.25, 0.0, 169)
-    femmesh.addNode(5.0, 5.0, 10.0, 170)
-    femmesh.addNode(7.5, 7.5, 10.0, 171)
-    femmesh.addNode(7.5, 2.5, 10.0, 172)
-    femmesh.addNode(2.5, 7.5, 10.0, 173)
-    femmesh.addNode(2.5, 2.5, 10.0, 174)
-    femmesh.addNode(3.75, 8.75, 10.0, 175)
-    femmesh.addNode(1.25, 8.75, 10.0, 176)
-    femmesh.addNode(3.75, 6.25, 10.0, 177)
-    femmesh.addNode(5.0, 7.5, 10.0, 178)
-    femmesh.addNode(6.25, 8.75, 10.0, 179)
-    femmesh.addNode(8.75, 8.75, 10.0, 180)
-    femmesh.addNode(6.25, 6.25, 10.0, 181)
-    femmesh.addNode(6.25, 1.25, 10.0, 182)
-    femmesh.addNode(6.25, 3.75, 10.0, 183)
-    femmesh.addNode(5.0, 2.5, 10.0, 184)
-    femmesh.addNode(8.75, 1.25, 10.0, 185)
-    femmesh.addNode(8.75, 3.75, 10.0, 186)
-    femmesh.addNode(7.5, 5.0, 10.0, 187)
-    femmesh.addNode(1.25, 6.25, 10.0, 188)
-    femmesh.addNode(2.5, 5.0, 10.0, 189)
-    femmesh.addNode(3.75, 1.25, 10.0, 190)
-    femmesh.addNode(3.75, 3.75, 10.0, 191)
-    femmesh.addNode(1.25, 1.25, 10.0, 192)
-    femmesh.addNode(1.25, 3.75, 10.0, 193)
-    femmesh.addNode(8.75, 6.25, 10.0, 194)
-    femmesh.addNode(3.75, 6.25, 6.25, 195)
-    femmesh.addNode(6.25, 3.75, 3.75, 196)
-    femmesh.addNode(1.25, 1.25, 2.5, 197)
-    femmesh.addNode(2.5, 1.25, 3.75, 198)
-    femmesh.addNode(4.375, 1.875, 3.125, 199)
-    femmesh.addNode(5.625, 1.875, 4.375, 200)
-    femmesh.addNode(3.125, 3.125, 3.125, 201)
-    femmesh.addNode(6.25, 7.5, 1.25, 202)
-    femmesh.addNode(7.5, 8.75, 1.25, 203)
-    femmesh.addNode(6.875, 6.875, 3.125, 204)
-    femmesh.addNode(6.875, 5.625, 1.875, 205)
-    femmesh.addNode(5.625, 4.375, 1.875, 206)
-    femmesh.addNode(8.75, 7.5, 3.75, 207)
-    femmesh.addNode(8.75, 8.75, 2.5, 208)
-    femmesh.addNode(7.5, 6.25, 8.75, 209)
-    femmesh.addNode(8.75, 7.5, 8.75, 210)
-    femmesh.addNode(8.75, 3.75, 7.5, 211)
-    femmesh.addNode(8.75, 2.5, 8.75, 212)
-    femmesh.addNode(3.75, 2.5, 8.75, 213)
-    femmesh.addNode(2.5, 1.25, 8.75, 214)
-    femmesh.addNode(1.25, 2.5, 1.25, 215)
-    femmesh.addNode(2.5, 3.75, 1.25, 216)
-    femmesh.addNode(8.75, 7.5, 6.25, 217)
-    femmesh.addNode(8.75, 8.75, 7.5, 218)
-    femmesh.addNode(7.5, 7.5, 5.0, 219)
-    femmesh.addNode(5.625, 6.875, 4.375, 220)
-    femmesh.addNode(8.125, 4.375, 4.375, 221)
-    femmesh.addNode(7.5, 5.0, 7.5, 222)
-    femmesh.addNode(6.875, 3.125, 6.875, 223)
-    femmesh.addNode(5.625, 4.375, 6.875, 224)
-    femmesh.addNode(5.0, 2.5, 7.5, 225)
-    femmesh.addNode(3.125, 3.125, 6.875, 226)
-    femmesh.addNode(4.375, 3.125, 5.625, 227)
-    femmesh.addNode(4.375, 5.625, 8.125, 228)
-    femmesh.addNode(2.5, 5.0, 2.5, 229)
-    femmesh.addNode(3.125, 4.375, 4.375, 230)
-    femmesh.addNode(5.625, 8.125, 6.875, 231)
-    femmesh.addNode(6.875, 5.625, 5.625, 232)
-    femmesh.addNode(4.375, 8.125, 5.625, 233)
-    femmesh.addNode(2.5, 2.5, 5.0, 234)
-    femmesh.addNode(5.0, 7.5, 2.5, 235)
-    femmesh.addNode(4.375, 5.625, 3.125, 236)
-    femmesh.addNode(1.875, 5.625, 5.625, 237)
-    femmesh.addNode(5.0, 5.0, 5.0, 238)
-    femmesh.addNode(8.75, 2.5, 1.25, 239)
-    femmesh.addNode(8.125, 4.375, 1.875, 240)
-    femmesh.addNode(8.125, 3.125, 3.125, 241)
-    femmesh.addNode(6.875, 3.125, 1.875, 242)
-    femmesh.addNode(8.75, 1.25, 2.5, 243)
-    femmesh.addNode(8.125, 1.875, 4.375, 244)
-    femmesh.addNode(6.875, 1.875, 3.125, 245)
-    femmesh.addNode(7.5, 1.25, 1.25, 246)
-    femmesh.addNode(5.625, 1.875, 1.875, 247)
-    femmesh.addNode(2.5, 8.75, 8.75, 248)
-    femmesh.addNode(3.125, 8.125, 6.875, 249)
-    femmesh.addNode(3.125, 6.875, 8.125, 250)
-    femmesh.addNode(4.375, 8.125, 8.125, 251)
-    femmesh.addNode(1.25, 8.75, 7.5, 252)
-    femmesh.addNode(1.875, 8.125, 5.625, 253)
-    femmesh.addNode(1.875, 6.875, 6.875, 254)
-    femmesh.addNode(1.25, 7.5, 8.75, 255)
-    femmesh.addNode(1.875, 5.625, 8.125, 256)
-    femmesh.addNode(3.125, 8.125, 4.375, 257)
-    femmesh.addNode(6.875, 1.875, 5.625, 258)
-    femmesh.addNode(1.875, 4.375, 6.875, 259)
-    femmesh.addNode(1.25, 8.75, 2.5, 260)
-    femmesh.addNode(1.25, 7.5, 1.25, 261)
-    femmesh.addNode(8.75, 7.5, 1.25, 262)
-    femmesh.addNode(7.5, 1.25, 8.75, 263)
-    femmesh.addNode(1.25, 2.5, 8.75, 264)
-    femmesh.addNode(2.5, 1.25, 1.25, 265)
-    femmesh.addNode(1.25, 1.25, 7.5, 266)
-    femmesh.addNode(7.5, 8.75, 8.75, 267)
-    femmesh.addNode(2.5, 8.75, 1.25, 268)
-    femmesh.addNode(8.75, 1.25, 7.5, 269)
-    femmesh.addNode(8.75, 6.25, 2.5, 270)
-    femmesh.addNode(1.25, 6.25, 2.5, 271)
-    femmesh.addNode(3.125, 6.875, 3.125, 272)
-    femmesh.addNode(3.75, 2.5, 1.25, 273)
-    femmesh.addNode(6.25, 1.25, 7.5, 274)
-    femmesh.addNode(8.75, 2.5, 6.25, 275)
-    femmesh.addNode(1.25, 2.5, 6.25, 276)
-    femmesh.addNode(6.25, 7.5, 8.75, 277)
-    femmesh.addNode(3.75, 8.75, 2.5, 278)
-    femmesh.addNode(2.5, 3.75, 8.75, 279)
-    femmesh.addNode(1.25, 7.5, 3.75, 280)
-    return True
-
-
-def create_elements(femmesh):
-    # elements
-    femmesh.addVolume([98, 95, 47, 196, 103, 198, 197, 199, 200, 201], 1)
-    femmesh.addVolume([121, 147, 145, 196, 203, 161, 202, 204, 205, 206], 2)
-    femmesh.addVolume([70, 73, 27, 121, 84, 83, 80, 207, 208, 136], 3)
-    femmesh.addVolume([170, 72, 30, 171, 209, 75, 187, 181, 210, 194], 4)
-    femmesh.addVolume([98, 9, 47, 95, 101, 54, 197, 103, 102, 198], 5)
-    femmesh.addVolume([70, 172, 30, 71, 211, 186, 78, 93, 212, 91], 6)
-    femmesh.addVolume([99, 170, 36, 174, 213, 184, 119, 214, 191, 190], 7)
-    femmesh.addVolume([47, 12, 149, 145, 57, 150, 215, 216, 152, 155], 8)
-    femmesh.addVolume([27, 70, 123, 72, 80, 217, 143, 77, 79, 218], 9)
-    femmesh.addVolume([147, 39, 121, 145, 160, 132, 203, 161, 159, 202], 10)
-    femmesh.addVolume([120, 70, 121, 196, 219, 207, 134, 220, 221, 204], 11)
-    femmesh.addVolume([172, 70, 170, 196, 211, 222, 183, 223, 221, 224], 12)
-    femmesh.addVolume([99, 95, 170, 195, 104, 225, 213, 226, 227, 228], 13)
-    femmesh.addVolume([45, 145, 47, 196, 229, 216, 56, 230, 206, 201], 14)
-    femmesh.addVolume([123, 70, 120, 195, 217, 219, 126, 231, 232, 233], 15)
-    femmesh.addVolume([45, 47, 95, 196, 56, 198, 234, 230, 201, 200], 16)
-    femmesh.addVolume([120, 121, 145, 196, 134, 202, 235, 220, 204, 206], 17)
-    femmesh.addVolume([39, 145, 120, 121, 159, 235, 133, 132, 202, 134], 18)
-    femmesh.addVolume([120, 70, 27, 121, 219, 80, 137, 134, 207, 136], 19)
-    femmesh.addVolume([47, 9, 45, 95, 54, 52, 56, 198, 102, 234], 20)
-    femmesh.addVolume([27, 70, 120, 123, 80, 219, 137, 143, 217, 126], 21)
-    femmesh.addVolume([47, 45, 12, 145, 56, 58, 57, 216, 229, 152], 22)
-    femmesh.addVolume([95, 170, 36, 99, 225, 184, 109, 104, 213, 119], 23)
-    femmesh.addVolume([45, 195, 145, 196, 237, 236, 229, 230, 238, 206], 24)
-    femmesh.addVolume([45, 95, 195, 196, 234, 227, 237, 230, 200, 238], 25)
-    femmesh.addVolume([95, 170, 195, 196, 225, 228, 227, 200, 224, 238], 26)
-    femmesh.addVolume([170, 70, 195, 196, 222, 232, 228, 224, 221, 238], 27)
-    femmesh.addVolume([120, 195, 70, 196, 233, 232, 219, 220, 238, 221], 28)
-    femmesh.addVolume([120, 145, 195, 196, 235, 236, 233, 220, 206, 238], 29)
-    femmesh.addVolume([24, 74, 148, 196, 86, 239, 165, 240, 241, 242], 30)
-    femmesh.addVolume([74, 21, 97, 196, 88, 114, 243, 241, 244, 245], 31)
-    femmesh.addVolume([33, 148, 97, 196, 167, 246, 116, 247, 242, 245], 32)
-    femmesh.addVolume([124, 173, 42, 195, 248, 175, 129, 249, 250, 251], 33)
-    femmesh.addVolume([15, 48, 124, 195, 64, 252, 144, 253, 254, 249], 34)
-    femmesh.addVolume([48, 18, 173, 195, 68, 188, 255, 254, 256, 250], 35)
-    femmesh.addVolume([70, 74, 24, 196, 89, 86, 85, 221, 241, 240], 36)
-    femmesh.addVolume([18, 170, 173, 195, 189, 177, 188, 256, 228, 250], 37)
-    femmesh.addVolume([74, 70, 21, 196, 89, 90, 88, 241, 221, 244], 38)
-    femmesh.addVolume([123, 120, 42, 195, 126, 127, 125, 231, 233, 251], 39)
-    femmesh.addVolume([173, 170, 42, 195, 177, 178, 175, 250, 228, 251], 40)
-    femmesh.addVolume([124, 42, 120, 195, 129, 127, 130, 249, 251, 233], 41)
-    femmesh.addVolume([122, 15, 120, 195, 138, 139, 140, 257, 253, 233], 42)
-    femmesh.addVolume([15, 124, 120, 195, 144, 130, 139, 253, 249, 233], 43)
-    femmesh.addVolume([48, 15, 45, 195, 64, 67, 66, 254, 253, 237], 44)
-    femmesh.addVolume([147, 24, 145, 196, 163, 164, 161, 205, 240, 206], 45)
-    femmesh.addVolume([97, 95, 33, 196, 113, 115, 116, 245, 200, 247], 46)
-    femmesh.addVolume([98, 33, 95, 196, 118, 115, 103, 199, 247, 200], 47)
-    femmesh.addVolume([96, 95, 21, 196, 107, 110, 111, 258, 200, 244], 48)
-    femmesh.addVolume([95, 97, 21, 196, 113, 114, 110, 200, 245, 244], 49)
-    femmesh.addVolume([33, 145, 148, 196, 168, 166, 167, 247, 206, 242], 50)
-    femmesh.addVolume([145, 24, 148, 196, 164, 165, 166, 206, 240, 242], 51)
-    femmesh.addVolume([45, 18, 48, 195, 63, 68, 66, 237, 256, 254], 52)
-    femmesh.addVolume([18, 45, 46, 195, 63, 53, 62, 256, 237, 259], 53)
-    femmesh.addVolume([124, 48, 173, 195, 252, 255, 248, 249, 254, 250], 54)
-    femmesh.addVolume([97, 148, 74, 196, 246, 239, 243, 245, 242, 241], 55)
-    femmesh.addVolume([24, 74, 5, 148, 86, 87, 25, 165, 239, 169], 56)
-    femmesh.addVolume([49, 3, 122, 15, 60, 141, 260, 69, 16, 138], 57)
-    femmesh.addVolume([12, 146, 49, 3, 153, 261, 59, 14, 156, 60], 58)
-    femmesh.addVolume([124, 15, 4, 48, 144, 17, 131, 252, 64, 65], 59)
-    femmesh.addVolume([1, 149, 47, 12, 151, 215, 55, 13, 150, 57], 60)
-    femmesh.addVolume([7, 147, 73, 24, 162, 262, 82, 26, 163, 81], 61)
-    femmesh.addVolume([172, 36, 6, 96, 182, 38, 185, 263, 108, 112], 62)
-    femmesh.addVolume([47, 98, 1, 9, 197, 100, 55, 54, 101, 10], 63)
-    femmesh.addVolume([174, 2, 46, 18, 192, 50, 264, 193, 19, 62], 64)
-    femmesh.addVolume([149, 1, 98, 33, 151, 100, 265, 157, 34, 118], 65)
-    femmesh.addVolume([173, 48, 4, 18, 255, 65, 176, 188, 68, 20], 66)
-    femmesh.addVolume([72, 30, 171, 8, 75, 194, 210, 76, 32, 180], 67)
-    femmesh.addVolume([21, 97, 5, 74, 114, 117, 22, 88, 243, 87], 68)
-    femmesh.addVolume([46, 9, 2, 99, 51, 11, 50, 266, 105, 106], 69)
-    femmesh.addVolume([123, 8, 171, 42, 128, 180, 267, 125, 44, 179], 70)
-    femmesh.addVolume([5, 97, 33, 148, 117, 116, 35, 169, 246, 167], 71)
-    femmesh.addVolume([174, 99, 2, 36, 214, 106, 192, 190, 119, 37], 72)
-    femmesh.addVolume([124, 173, 4, 42, 248, 176, 131, 129, 175, 43], 73)
-    femmesh.addVolume([122, 3, 146, 39, 141, 156, 268, 142, 40, 158], 74)
-    femmesh.addVolume([72, 8, 123, 27, 76, 128, 218, 77, 29, 143], 75)
-    femmesh.addVolume([172, 71, 6, 30, 212, 92, 185, 186, 91, 31], 76)
-    femmesh.addVolume([121, 147, 7, 39, 203, 162, 135, 132, 160, 41], 77)
-    femmesh.addVolume([121, 73, 27, 7, 208, 83, 136, 135, 82, 28], 78)
-    femmesh.addVolume([6, 71, 96, 21, 92, 269, 112, 23, 94, 111], 79)
-    femmesh.addVolume([49, 146, 122, 3, 261, 268, 260, 60, 156, 141], 80)
-    femmesh.addVolume([46, 2, 174, 99, 50, 192, 264, 266, 106, 214], 81)
-    femmesh.addVolume([171, 123, 72, 8, 267, 218, 210, 180, 128, 76], 82)
-    femmesh.addVolume([73, 7, 121, 147, 82, 135, 208, 262, 162, 203], 83)
-    femmesh.addVolume([4, 173, 124, 48, 176, 248, 131, 65, 255, 252], 84)
-    femmesh.addVolume([172, 96, 6, 71, 263, 112, 185, 212, 269, 92], 85)
-    femmesh.addVolume([5, 74, 97, 148, 87, 243, 117, 169, 239, 246], 86)
-    femmesh.addVolume([98, 1, 149, 47, 100, 151, 265, 197, 55, 215], 87)
-    femmesh.addVolume([121, 147, 70, 73, 203, 270, 207, 208, 262, 84], 88)
-    femmesh.addVolume([147, 121, 70, 196, 203, 207, 270, 205, 204, 221], 89)
-    femmesh.addVolume([70, 147, 24, 73, 270, 163, 85, 84, 262, 81], 90)
-    femmesh.addVolume([147, 70, 24, 196, 270, 85, 163, 205, 221, 240], 91)
-    femmesh.addVolume([195, 146, 45, 145, 272, 271, 237, 236, 154, 229], 92)
-    femmesh.addVolume([45, 12, 146, 49, 58, 153, 271, 61, 59, 261], 93)
-    femmesh.addVolume([45, 146, 12, 145, 271, 153, 58, 229, 154, 152], 94)
-    femmesh.addVolume([47, 98, 145, 149, 197, 273, 216, 215, 265, 155], 95)
-    femmesh.addVolume([47, 145, 98, 196, 216, 273, 197, 201, 206, 199], 96)
-    femmesh.addVolume([98, 33, 145, 149, 118, 168, 273, 265, 157, 155], 97)
-    femmesh.addVolume([98, 145, 33, 196, 273, 168, 118, 199, 206, 247], 98)
-    femmesh.addVolume([196, 95, 172, 96, 200, 274, 223, 258, 107, 263], 99)
-    femmesh.addVolume([196, 172, 95, 170, 223, 274, 200, 224, 183, 225], 100)
-    femmesh.addVolume([95, 36, 172, 96, 109, 182, 274, 107, 108, 263], 101)
-    femmesh.addVolume([95, 172, 36, 170, 274, 182, 109, 225, 183, 184], 102)
-    femmesh.addVolume([70, 96, 172, 71, 275, 263, 211, 93, 269, 212], 103)
-    femmesh.addVolume([70, 172, 96, 196, 211, 263, 275, 221, 223, 258], 104)
-    femmesh.addVolume([21, 96, 70, 71, 111, 275, 90, 94, 269, 93], 105)
-    femmesh.addVolume([21, 70, 96, 196, 90, 275, 111, 244, 221, 258], 106)
-    femmesh.addVolume([195, 45, 99, 95, 237, 276, 226, 227, 234, 104], 107)
-    femmesh.addVolume([195, 99, 45, 46, 226, 276, 237, 259, 266, 53], 108)
-    femmesh.addVolume([45, 9, 99, 95, 52, 105, 276, 234, 102, 104], 109)
-    femmesh.addVolume([45, 99, 9, 46, 276, 105, 52, 53, 266, 51], 110)
-    femmesh.addVolume([170, 123, 72, 171, 277, 218, 209, 181, 267, 210], 111)
-    femmesh.addVolume([170, 42, 123, 171, 178, 125, 277, 181, 179, 267], 112)
-    femmesh.addVolume([42, 170, 123, 195, 178, 277, 125, 251, 228, 231], 113)
-    femmesh.addVolume([70, 170, 123, 72, 222, 277, 217, 79, 209, 218], 114)
-    femmesh.addVolume([70, 123, 170, 195, 217, 277, 222, 232, 231, 228], 115)
-    femmesh.addVolume([146, 120, 195, 122, 278, 233, 272, 268, 140, 257], 116)
-    femmesh.addVolume([120, 146, 195, 145, 278, 272, 233, 235, 154, 236], 117)
-    femmesh.addVolume([146, 39, 120, 122, 158, 133, 278, 268, 142, 140], 118)
-    femmesh.addVolume([39, 146, 120, 145, 158, 278, 133, 159, 154, 235], 119)
-    femmesh.addVolume([99, 46, 170, 174, 266, 279, 213, 214, 264, 191], 120)
-    femmesh.addVolume([99, 170, 46, 195, 213, 279, 266, 226, 228, 259], 121)
-    femmesh.addVolume([46, 18, 170, 174, 62, 189, 279, 264, 193, 191], 122)
-    femmesh.addVolume([46, 170, 18, 195, 279, 189, 62, 259, 228, 256], 123)
-    femmesh.addVolume([30, 70, 170, 172, 78, 222, 187, 186, 211, 183], 124)
-    femmesh.addVolume([30, 170, 70, 72, 187, 222, 78, 75, 209, 79], 125)
-    femmesh.addVolume([45, 122, 146, 195, 280, 268, 271, 237, 257, 272], 126)
-    femmesh.addVolume([45, 146, 122, 49, 271, 268, 280, 61, 261, 260], 127)
-    femmesh.addVolume([15, 122, 45, 195, 138, 280, 67, 253, 257, 237], 128)
-    femmesh.addVolume([15, 45, 122, 49, 67, 280, 138, 69, 61, 260], 129)
-    return True
@@ -1,857 +0,0 @@
-def create_nodes(femmesh):
-    # nodes
-    femmesh.addNode(0.0, 0.0, 10.0, 1)
-    femmesh.addNode(0.0, 0.0, 20.0, 2)
-    femmesh.addNode(0.0, 10.0, 10.0, 3)
-    femmesh.addNode(0.0, 10.0, 20.0, 4)
-    femmesh.addNode(10.0, 0.0, 10.0, 5)
-    femmesh.addNode(10.0, 0.0, 20.0, 6)
-    femmesh.addNode(10.0, 10.0, 10.0, 7)
-    femmesh.addNode(10.0, 10.0, 20.0, 8)
-    femmesh.addNode(0.0, 0.0, 0.0, 9)
-    femmesh.addNode(0.0, 10.0, 0.0, 10)
-    femmesh.addNode(10.0, 0.0, 0.0, 11)
-    femmesh.addNode(10.0, 10.0, 0.0, 12)
-    femmesh.addNode(0.0, 0.0, 15.0, 13)
-    femmesh.addNode(0.0, 0.0, 12.5, 14)
-    femmesh.addNode(0.0, 0.0, 17.5, 15)
-    femmesh.addNode(0.0, 5.0, 10.0, 16)
-    femmesh.addNode(0.0, 2.5, 10.0, 17)
-    femmesh.addNode(0.0, 7.5, 10.0, 18)
-    femmesh.addNode(0.0, 5.0, 20.0, 19)
-    femmesh.addNode(0.0, 2.5, 20.0, 20)
-    femmesh.addNode(0.0, 7.5, 20.0, 21)
-    femmesh.addNode(0.0, 10.0, 15.0, 22)
-    femmesh.addNode(0.0, 10.0, 12.5, 23)
-    femmesh.addNode(0.0, 10.0, 17.5, 24)
-    femmesh.addNode(5.0, 0.0, 10.0, 25)
-    femmesh.addNode(2.5, 0.0, 10.0, 26)
-    femmesh.addNode(7.5, 0.0, 10.0, 27)
-    femmesh.addNode(10.0, 0.0, 15.0, 28)
-    femmesh.addNode(10.0, 0.0, 12.5, 29)
-    femmesh.addNode(10.0, 0.0, 17.5, 30)
-    femmesh.addNode(5.0, 0.0, 20.0, 31)
-    femmesh.addNode(2.5, 0.0, 20.0, 32)
-    femmesh.addNode(7.5, 0.0, 20.0, 33)
-    femmesh.addNode(5.0, 10.0, 10.0, 34)
-    femmesh.addNode(2.5, 10.0, 10.0, 35)
-    femmesh.addNode(7.5, 10.0, 10.0, 36)
-    femmesh.addNode(10.0, 5.0, 10.0, 37)
-    femmesh.addNode(10.0, 2.5, 10.0, 38)
-    femmesh.addNode(10.0, 7.5, 10.0, 39)
-    femmesh.addNode(5.0, 10.0, 20.0, 40)
-    femmesh.addNode(2.5, 10.0, 20.0, 41)
-    femmesh.addNode(7.5, 10.0, 20.0, 42)
-    femmesh.addNode(10.0, 5.0, 20.0, 43)
-    femmesh.addNode(10.0, 2.5, 20.0, 44)
-    femmesh.addNode(10.0, 7.5, 20.0, 45)
-    femmesh.addNode(10.0, 10.0, 15.0, 46)
-    femmesh.addNode(10.0, 10.0, 12.5, 47)
-    femmesh.addNode(10.0, 10.0, 17.5, 48)
-    femmesh.addNode(0.0, 0.0, 5.0, 49)
-    femmesh.addNode(0.0, 0.0, 2.5, 50)
-    femmesh.addNode(0.0, 0.0, 7.5, 51)
-    femmesh.addNode(0.0, 5.0, 0.0, 52)
-    femmesh.addNode(0.0, 2.5, 0.0, 53)
-    femmesh.addNode(0.0, 7.5, 0.0, 54)
-    femmesh.addNode(0.0, 10.0, 5.0, 55)
-    femmesh.addNode(0.0, 10.0, 2.5, 56)
-    femmesh.addNode(0.0, 10.0, 7.5, 57)
-    femmesh.addNode(5.0, 0.0, 0.0, 58)
-    femmesh.addNode(2.5, 0.0, 0.0, 59)
-    femmesh.addNode(7.5, 0.0, 0.0, 60)
-    femmesh.addNode(10.0, 0.0, 5.0, 61)
-    femmesh.addNode(10.0, 0.0, 2.5, 62)
-    femmesh.addNode(10.0, 0.0, 7.5, 63)
-    femmesh.addNode(5.0, 10.0, 0.0, 64)
-    femmesh.addNode(2.5, 10.0, 0.0, 65)
-    femmesh.addNode(7.5, 10.0, 0.0, 66)
-    femmesh.addNode(10.0, 5.0, 0.0, 67)
-    femmesh.addNode(10.0, 2.5, 0.0, 68)
-    femmesh.addNode(10.0, 7.5, 0.0, 69)
-    femmesh.addNode(10.0, 10.0, 5.0, 70)
-    femmesh.addNode(10.0, 10.0, 2.5, 71)
-    femmesh.addNode(10.0, 10.0, 7.5, 72)
-    femmesh.addNode(0.0, 5.0, 15.0, 73)
-    femmesh.addNode(0.0, 2.5, 12.5, 74)
-    femmesh.addNode(0.0, 2.5, 17.5, 75)
-    femmesh.addNode(0.0, 7.5, 12.5, 76)
-    femmesh.addNode(0.0, 7.5, 17.5, 77)
-    femmesh.addNode(0.0, 1.25, 13.75, 78)
-    femmesh.addNode(0.0, 1.25, 11.25, 79)
-    femmesh.addNode(0.0, 3.75, 11.25, 80)
-    femmesh.addNode(0.0, 1.25, 16.25, 81)
-    femmesh.addNode(0.0, 1.25, 18.75, 82)
-    femmesh.addNode(0.0, 3.75, 18.75, 83)
-    femmesh.addNode(0.0, 6.25, 11.25, 84)
-    femmesh.addNode(0.0, 8.75, 11.25, 85)
-    femmesh.addNode(0.0, 8.75, 13.75, 86)
-    femmesh.addNode(0.0, 6.25, 18.75, 87)
-    femmesh.addNode(0.0, 8.75, 18.75, 88)
-    femmesh.addNode(0.0, 8.75, 16.25, 89)
-    femmesh.addNode(0.0, 2.5, 15.0, 90)
-    femmesh.addNode(0.0, 5.0, 12.5, 91)
-    femmesh.addNode(0.0, 5.0, 17.5, 92)
-    femmesh.addNode(0.0, 7.5, 15.0, 93)
-    femmesh.addNode(0.0, 3.75, 16.25, 94)
-    femmesh.addNode(0.0, 3.75, 13.75, 95)
-    femmesh.addNode(0.0, 6.25, 13.75, 96)
-    femmesh.addNode(0.0, 6.25, 16.25, 97)
-    femmesh.addNode(5.0, 0.0, 15.0, 98)
-    femmesh.addNode(7.5, 0.0, 12.5, 99)
-    femmesh.addNode(7.5, 0.0, 17.5, 100)
-    femmesh.addNode(2.5, 0.0, 12.5, 101)
-    femmesh.addNode(2.5, 0.0, 17.5, 102)
-    femmesh.addNode(1.25, 0.0, 11.25, 103)
-    femmesh.addNode(1.25, 0.0, 13.75, 104)
-    femmesh.addNode(3.75, 0.0, 11.25, 105)
-    femmesh.addNode(1.25, 0.0, 16.25, 106)
-    femmesh.addNode(1.25, 0.0, 18.75, 107)
-    femmesh.addNode(3.75, 0.0, 18.75, 108)
-    femmesh.addNode(8.75, 0.0, 11.25, 109)
-    femmesh.addNode(6.25, 0.0, 11.25, 110)
-    femmesh.addNode(8.75, 0.0, 13.75, 111)
-    femmesh.addNode(8.75, 0.0, 18.75, 112)
-    femmesh.addNode(8.75, 0.0, 16.25, 113)
-    femmesh.addNode(6.25, 0.0, 18.75, 114)
-    femmesh.addNode(2.5, 0.0, 15.0, 115)
-    femmesh.addNode(5.0, 0.0, 12.5, 116)
-    femmesh.addNode(7.5, 0.0, 15.0, 117)
-    femmesh.addNode(5.0, 0.0, 17.5, 118)
-    femmesh.addNode(6.25, 0.0, 13.75, 119)
-    femmesh.addNode(6.25, 0.0, 16.25, 120)
-    femmesh.addNode(3.75, 0.0, 13.75, 121)
-    femmesh.addNode(3.75, 0.0, 16.25, 122)
-    femmesh.addNode(5.0, 5.0, 10.0, 123)
-    femmesh.addNode(2.5, 7.5, 10.0, 124)
-    femmesh.addNode(7.5, 7.5, 10.0, 125)
-    femmesh.addNode(2.5, 2.5, 10.0, 126)
-    femmesh.addNode(7.5, 2.5, 10.0, 127)
-    femmesh.addNode(1.25, 3.75, 10.0, 128)
-    femmesh.addNode(1.25, 1.25, 10.0, 129)
-    femmesh.addNode(3.75, 1.25, 10.0, 130)
-    femmesh.addNode(1.25, 8.75, 10.0, 131)
-    femmesh.addNode(1.25, 6.25, 10.0, 132)
-    femmesh.addNode(3.75, 8.75, 10.0, 133)
-    femmesh.addNode(6.25, 1.25, 10.0, 134)
-    femmesh.addNode(8.75, 1.25, 10.0, 135)
-    femmesh.addNode(8.75, 3.75, 10.0, 136)
-    femmesh.addNode(8.75, 8.75, 10.0, 137)
-    femmesh.addNode(6.25, 8.75, 10.0, 138)
-    femmesh.addNode(8.75, 6.25, 10.0, 139)
-    femmesh.addNode(2.5, 5.0, 10.0, 140)
-    femmesh.addNode(5.0, 2.5, 10.0, 141)
-    femmesh.addNode(5.0, 7.5, 10.0, 142)
-    femmesh.addNode(7.5, 5.0, 10.0, 143)
-    femmesh.addNode(3.75, 6.25, 10.0, 144)
-    femmesh.addNode(6.25, 6.25, 10.0, 145)
-    femmesh.addNode(3.75, 3.75, 10.0, 146)
-    femmesh.addNode(6.25, 3.75, 10.0, 147)
-    femmesh.addNode(5.0, 5.0, 20.0, 148)
-    femmesh.addNode(2.5, 7.5, 20.0, 149)
-    femmesh.addNode(7.5, 7.5, 20.0, 150)
-    femmesh.addNode(2.5, 2.5, 20.0, 151)
-    femmesh.addNode(7.5, 2.5, 20.0, 152)
-    femmesh.addNode(1.25, 3.75, 20.0, 153)
-    femmesh.addNode(1.25, 1.25, 20.0, 154)
-    femmesh.addNode(3.75, 1.25, 20.0, 155)
-    femmesh.addNode(1.25, 6.25, 20.0, 156)
-    femmesh.addNode(1.25, 8.75, 20.0, 157)
-    femmesh.addNode(3.75, 8.75, 20.0, 158)
-    femmesh.addNode(6.25, 1.25, 20.0, 159)
-    femmesh.addNode(8.75, 1.25, 20.0, 160)
-    femmesh.addNode(8.75, 3.75, 20.0, 161)
-    femmesh.addNode(6.25, 8.75, 20.0, 162)
-    femmesh.addNode(8.75, 8.75, 20.0, 163)
-    femmesh.addNode(8.75, 6.25, 20.0, 164)
-    femmesh.addNode(2.5, 5.0, 20.0, 165)
-    femmesh.addNode(5.0, 2.5, 20.0, 166)
-    femmesh.addNode(5.0, 7.5, 20.0, 167)
-    femmesh.addNode(7.5, 5.0, 20.0, 168)
-    femmesh.addNode(3.75, 6.25, 20.0, 169)
-    femmesh.addNode(6.25, 6.25, 20.0, 170)
-    femmesh.addNode(3.75, 3.75, 20.0, 171)
-    femmesh.addNode(6.25, 3.75, 20.0, 172)
-    femmesh.addNode(5.0, 10.0, 15.0, 173)
-    femmesh.addNode(2.5, 10.0, 12.5, 174)
-    femmesh.addNode(7.5, 10.0, 12.5, 175)
-    femmesh.addNode(7.5, 10.0, 17.5, 176)
-    femmesh.addNode(2.5, 10.0, 17.5, 177)
-    femmesh.addNode(1.25, 10.0, 13.75, 178)
-    femmesh.addNode(1.25, 10.0, 11.25, 179)
-    femmesh.addNode(3.75, 10.0, 11.25, 180)
-    femmesh.addNode(1.25, 10.0, 16.25, 181)
-    femmesh.addNode(1.25, 10.0, 18.75, 182)
-    femmesh.addNode(3.75, 10.0, 18.75, 183)
-    femmesh.addNode(6.25, 10.0, 11.25, 184)
-    femmesh.addNode(8.75, 10.0, 11.25, 185)
-    femmesh.addNode(8.75, 10.0, 13.75, 186)
-    femmesh.addNode(6.25, 10.0, 18.75, 187)
-    femmesh.addNode(8.75, 10.0, 18.75, 188)
-    femmesh.addNode(8.75, 10.0, 16.25, 189)
-    femmesh.addNode(2.5, 10.0, 15.0, 190)
-    femmesh.addNode(5.0, 10.0, 12.5, 191)
-    femmesh.addNode(5.0, 10.0, 17.5, 192)
-    femmesh.addNode(7.5, 10.0, 15.0, 193)
-    femmesh.addNode(3.75, 10.0, 13.75, 194)
-    femmesh.addNode(6.25, 10.0, 13.75, 195)
-    femmesh.addNode(3.75, 10.0, 16.25, 196)
-    femmesh.addNode(6.25, 10.0, 16.25, 197)
-    femmesh.addNode(10.0, 5.0, 15.0, 198)
-    femmesh.addNode(10.0, 2.5, 12.5, 199)
-    femmesh.addNode(10.0, 2.5, 17.5, 200)
-    femmesh.addNode(10.0, 7.5, 12.5, 201)
-    femmesh.addNode(10.0, 7.5, 17.5, 202)
-    femmesh.addNode(10.0, 1.25, 11.25, 203)
-    femmesh.addNode(10.0, 1.25, 13.75, 204)
-    femmesh.addNode(10.0, 3.75, 11.25, 205)
-    femmesh.addNode(10.0, 1.25, 16.25, 206)
-    femmesh.addNode(10.0, 1.25, 18.75, 207)
-    femmesh.addNode(10.0, 3.75, 18.75, 208)
-    femmesh.addNode(10.0, 8.75, 11.25, 209)
-    femmesh.addNode(10.0, 6.25, 11.25, 210)
-    femmesh.addNode(10.0, 8.75, 13.75, 211)
-    femmesh.addNode(10.0, 6.25, 18.75, 212)
-    femmesh.addNode(10.0, 8.75, 18.75, 213)
-    femmesh.addNode(10.0, 8.75, 16.25, 214)
-    femmesh.addNode(10.0, 2.5, 15.0, 215)
-    femmesh.addNode(10.0, 5.0, 12.5, 216)
-    femmesh.addNode(10.0, 5.0, 17.5, 217)
-    femmesh.addNode(10.0, 7.5, 15.0, 218)
-    femmesh.addNode(10.0, 3.75, 16.25, 219)
-    femmesh.addNode(10.0, 3.75, 13.75, 220)
-    femmesh.addNode(10.0, 6.25, 13.75, 221)
-    femmesh.addNode(10.0, 6.25, 16.25, 222)
-    femmesh.addNode(0.0, 5.0, 5.0, 223)
-    femmesh.addNode(0.0, 2.5, 7.5, 224)
-    femmesh.addNode(0.0, 7.5, 7.5, 225)
-    femmesh.addNode(0.0, 2.5, 2.5, 226)
-    femmesh.addNode(0.0, 7.5, 2.5, 227)
-    femmesh.addNode(0.0, 3.75, 8.75, 228)
-    femmesh.addNode(0.0, 1.25, 8.75, 229)
-    femmesh.addNode(0.0, 1.25, 6.25, 230)
-    femmesh.addNode(0.0, 6.25, 8.75, 231)
-    femmesh.addNode(0.0, 8.75, 8.75, 232)
-    femmesh.addNode(0.0, 8.75, 6.25, 233)
-    femmesh.addNode(0.0, 1.25, 3.75, 234)
-    femmesh.addNode(0.0, 1.25, 1.25, 235)
-    femmesh.addNode(0.0, 3.75, 1.25, 236)
-    femmesh.addNode(0.0, 6.25, 1.25, 237)
-    femmesh.addNode(0.0, 8.75, 1.25, 238)
-    femmesh.addNode(0.0, 8.75, 3.75, 239)
-    femmesh.addNode(0.0, 5.0, 7.5, 240)
-    femmesh.addNode(0.0, 2.5, 5.0, 241)
-    femmesh.addNode(0.0, 5.0, 2.5, 242)
-    femmesh.addNode(0.0, 7.5, 5.0, 243)
-    femmesh.addNode(0.0, 6.25, 6.25, 244)
-    femmesh.addNode(0.0, 3.75, 6.25, 245)
-    femmesh.addNode(0.0, 3.75, 3.75, 246)
-    femmesh.addNode(0.0, 6.25, 3.75, 247)
-    femmesh.addNode(5.0, 0.0, 5.0, 248)
-    femmesh.addNode(7.5, 0.0, 7.5, 249)
-    femmesh.addNode(2.5, 0.0, 2.5, 250)
-    femmesh.addNode(7.5, 0.0, 2.5, 251)
-    femmesh.addNode(2.5, 0.0, 7.5, 252)
-    femmesh.addNode(3.75, 0.0, 8.75, 253)
-    femmesh.addNode(1.25, 0.0, 8.75, 254)
-    femmesh.addNode(1.25, 0.0, 6.25, 255)
-    femmesh.addNode(6.25, 0.0, 8.75, 256)
-    femmesh.addNode(8.75, 0.0, 8.75, 257)
-    femmesh.addNode(8.75, 0.0, 6.25, 258)
-    femmesh.addNode(1.25, 0.0, 3.75, 259)
-    femmesh.addNode(1.25, 0.0, 1.25, 260)
-    femmesh.addNode(3.75, 0.0, 1.25, 261)
-    femmesh.addNode(6.25, 0.0, 1.25, 262)
-    femmesh.addNode(8.75, 0.0, 1.25, 263)
-    femmesh.addNode(8.75, 0.0, 3.75, 264)
-    femmesh.addNode(5.0, 0.0, 7.5, 265)
-    femmesh.addNode(2.5, 0.0, 5.0, 266)
-    femmesh.addNode(5.0, 0.0, 2.5, 267)
-    femmesh.addNode(7.5, 0.0, 5.0, 268)
-    femmesh.addNode(6.25, 0.0, 6.25, 269)
-    femmesh.addNode(6.25, 0.0, 3.75, 270)
-    femmesh.addNode(3.75, 0.0, 6.25, 271)
-    femmesh.addNode(3.75, 0.0, 3.75, 272)
-    femmesh.addNode(5.0, 5.0, 0.0, 273)
-    femmesh.addNode(2.5, 7.5, 0.0, 274)
-    femmesh.addNode(7.5, 7.5, 0.0, 275)
-    femmesh.addNode(2.5, 2.5, 0.0, 276)
-    femmesh.addNode(7.5, 2.5, 0.0, 277)
-    femmesh.addNode(1.25, 3.75, 0.0, 278)
-    femmesh.addNode(1.25, 1.25, 0.0, 279)
-    femmesh.addNode(3.75, 1.25, 0.0, 280)
-    femmesh.addNode(1.25, 8.75, 0.0, 281)
-    femmesh.addNode(1.25, 6.25, 0.0, 282)
-    femmesh.addNode(3.75, 8.75, 0.0, 283)
-    femmesh.addNode(6.25, 1.25, 0.0, 284)
-    femmesh.addNode(8.75, 1.25, 0.0, 285)
-    femmesh.addNode(8.75, 3.75, 0.0, 286)
-    femmesh.addNode(8.75, 8.75, 0.0, 287)
-    femmesh.addNode(6.25, 8.75, 0.0, 288)
-    femmesh.addNode(8.75, 6.25, 0.0, 289)
-    femmesh.addNode(2.5, 5.0, 0.0, 290)
-    femmesh.addNode(5.0, 2.5, 0.0, 291)
-    femmesh.addNode(5.0, 7.5, 0.0, 292)
-    femmesh.addNode(7.5, 5.0, 0.0, 293)
-    femmesh.addNode(3.75, 6.25, 0.0, 294)
-    femmesh.addNode(6.25, 6.25, 0.0, 295)
-    femmesh.addNode(3.75, 3.75, 0.0, 296)
-    femmesh.addNode(6.25, 3.75, 0.0, 297)
-    femmesh.addNode(5.0, 10.0, 5.0, 298)
-    femmesh.addNode(7.5, 10.0, 7.5, 299)
-    femmesh.addNode(7.5, 10.0, 2.5, 300)
-    femmesh.addNode(2.5, 10.0, 7.5, 301)
-    femmesh.addNode(2.5, 10.0, 2.5, 302)
-    femmesh.addNode(3.75, 10.0, 8.75, 303)
-    femmesh.addNode(1.25, 10.0, 8.75, 304)
-    femmesh.addNode(1.25, 10.0, 6.25, 305)
-    femmesh.addNode(8.75, 10.0, 8.75, 306)
-    femmesh.addNode(6.25, 10.0, 8.75, 307)
-    femmesh.addNode(8.75, 10.0, 6.25, 308)
-    femmesh.addNode(1.25, 10.0, 3.75, 309)
-    femmesh.addNode(1.25, 10.0, 1.25, 310)
-    femmesh.addNode(3.75, 10.0, 1.25, 311)
-    femmesh.addNode(6.25, 10.0, 1.25, 312)
-    femmesh.addNode(8.75, 10.0, 1.25, 313)
-    femmesh.addNode(8.75, 10.0, 3.75, 314)
-    femmesh.addNode(5.0, 10.0, 7.5, 315)
-    femmesh.addNode(2.5, 10.0, 5.0, 316)
-    femmesh.addNode(5.0, 10.0, 2.5, 317)
-    femmesh.addNode(7.5, 10.0, 5.0, 318)
-    femmesh.addNode(6.25, 10.0, 6.25, 319)
-    femmesh.addNode(6.25, 10.0, 3.75, 320)
-    femmesh.addNode(3.75, 10.0, 6.25, 321)
-    femmesh.addNode(3.75, 10.0, 3.75, 322)
-    femmesh.addNode(10.0, 5.0, 5.0, 323)
-    femmesh.addNode(10.0, 2.5, 7.5, 324)
-    femmesh.addNode(10.0, 7.5, 7.5, 325)
-    femmesh.addNode(10.0, 2.5, 2.5, 326)
-    femmesh.addNode(10.0, 7.5, 2.5, 327)
-    femmesh.addNode(10.0, 1.25, 8.75, 328)
-    femmesh.addNode(10.0, 3.75, 8.75, 329)
-    femmesh.addNode(10.0, 1.25, 6.25, 330)
-    femmesh.addNode(10.0, 6.25, 8.75, 331)
-    femmesh.addNode(10.0, 8.75, 8.75, 332)
-    femmesh.addNode(10.0, 8.75, 6.25, 333)
-    femmesh.addNode(10.0, 1.25, 1.25, 334)
-    femmesh.addNode(10.0, 1.25, 3.75, 335)
-    femmesh.addNode(10.0, 3.75, 1.25, 336)
-    femmesh.addNode(10.0, 8.75, 1.25, 337)
-    femmesh.addNode(10.0, 6.25, 1.25, 338)
-    femmesh.addNode(10.0, 8.75, 3.75, 339)
-    femmesh.addNode(10.0, 5.0, 7.5, 340)
-    femmesh.addNode(10.0, 2.5, 5.0, 341)
-    femmesh.addNode(10.0, 5.0, 2.5, 342)
-    femmesh.addNode(10.0, 7.5, 5.0, 343)
-    femmesh.addNode(10.0, 6.25, 6.25, 344)
-    femmesh.addNode(10.0, 3.75, 6.25, 345)
-    femmesh.addNode(10.0, 3.75, 3.75, 346)
-    femmesh.addNode(10.0, 6.25, 3.75, 347)
-    femmesh.addNode(5.0, 5.0, 15.0, 348)
-    femmesh.addNode(2.5, 7.5, 15.0, 349)
-    femmesh.addNode(1.25, 7.5, 16.25, 350)
-    femmesh.addNode(2.5, 5.0, 15.0, 351)
-    femmesh.addNode(3.75, 7.5, 16.25, 352)
-    femmesh.addNode(5.0, 7.5, 15.0, 353)
-    femmesh.addNode(5.0, 7.5, 17.5, 354)
-    femmesh.addNode(3.75, 7.5, 18.75, 355)
-    femmesh.addNode(5.0, 5.0, 17.5, 356)
-    femmesh.addNode(2.5, 5.0, 12.5, 357)
-    femmesh.addNode(1.25, 6.25, 12.5, 358)
-    femmesh.addNode(3.75, 6.25, 12.5, 359)
-    femmesh.addNode(5.0, 5.0, 12.5, 360)
-    femmesh.addNode(5.0, 7.5, 12.5, 361)
-    femmesh.addNode(3.75, 8.75, 12.5, 362)
-    femmesh.addNode(2.5, 6.25, 18.75, 363)
-    femmesh.addNode(2.5, 5.0, 17.5, 364)
-    femmesh.addNode(2.5, 6.25, 16.25, 365)
-    femmesh.addNode(6.25, 7.5, 18.75, 366)
-    femmesh.addNode(6.25, 7.5, 16.25, 367)
-    femmesh.addNode(7.5, 7.5, 15.0, 368)
-    femmesh.addNode(8.75, 7.5, 16.25, 369)
-    femmesh.addNode(7.5, 5.0, 15.0, 370)
-    femmesh.addNode(8.75, 7.5, 13.75, 371)
-    femmesh.addNode(6.25, 7.5, 13.75, 372)
-    femmesh.addNode(6.25, 7.5, 11.25, 373)
-    femmesh.addNode(3.75, 2.5, 18.75, 374)
-    femmesh.addNode(5.0, 2.5, 17.5, 375)
-    femmesh.addNode(3.75, 2.5, 16.25, 376)
-    femmesh.addNode(5.0, 2.5, 15.0, 377)
-    femmesh.addNode(2.5, 2.5, 15.0, 378)
-    femmesh.addNode(1.25, 2.5, 16.25, 379)
-    femmesh.addNode(1.25, 2.5, 13.75, 380)
-    femmesh.addNode(3.75, 2.5, 13.75, 381)
-    femmesh.addNode(5.0, 2.5, 12.5, 382)
-    femmesh.addNode(3.75, 2.5, 11.25, 383)
-    femmesh.addNode(2.5, 8.75, 13.75, 384)
-    femmesh.addNode(2.5, 6.25, 13.75, 385)
-    femmesh.addNode(7.5, 5.0, 17.5, 386)
-    femmesh.addNode(7.5, 6.25, 18.75, 387)
-    femmesh.addNode(7.5, 6.25, 16.25, 388)
-    femmesh.addNode(8.75, 6.25, 12.5, 389)
-    femmesh.addNode(7.5, 5.0, 12.5, 390)
-    femmesh.addNode(6.25, 6.25, 12.5, 391)
-    femmesh.addNode(7.5, 2.5, 15.0, 392)
-    femmesh.addNode(7.5, 1.25, 16.25, 393)
-    femmesh.addNode(7.5, 3.75, 16.25, 394)
-    femmesh.addNode(7.5, 3.75, 18.75, 395)
-    femmesh.addNode(6.25, 2.5, 11.25, 396)
-    femmesh.addNode(6.25, 2.5, 13.75, 397)
-    femmesh.addNode(8.75, 2.5, 13.75, 398)
-    femmesh.addNode(2.5, 3.75, 18.75, 399)
-    femmesh.addNode(2.5, 3.75, 16.25, 400)
-    femmesh.addNode(2.5, 3.75, 11.25, 401)
-    femmesh.addNode(2.5, 3.75, 13.75, 402)
-    femmesh.addNode(6.25, 2.5, 18.75, 403)
-    femmesh.addNode(6.25, 2.5, 16.25, 404)
-    femmesh.addNode(8.75, 3.75, 12.5, 405)
-    femmesh.addNode(6.25, 3.75, 12.5, 406)
-    femmesh.addNode(1.25, 8.75, 15.0, 407)
-    femmesh.addNode(1.25, 5.0, 11.25, 408)
-    femmesh.addNode(8.75, 1.25, 15.0, 409)
-    femmesh.addNode(5.0, 8.75, 11.25, 410)
-    femmesh.addNode(1.25, 8.75, 17.5, 411)
-    femmesh.addNode(1.25, 7.5, 11.25, 412)
-    femmesh.addNode(2.5, 8.75, 18.75, 413)
-    femmesh.addNode(3.75, 6.25, 17.5, 414)
-    femmesh.addNode(1.25, 7.5, 18.75, 415)
-    femmesh.addNode(8.75, 8.75, 17.5, 416)
-    femmesh.addNode(7.5, 8.75, 11.25, 417)
-    femmesh.addNode(1.25, 1.25, 17.5, 418)
-    femmesh.addNode(1.25, 1.25, 12.5, 419)
-    femmesh.addNode(2.5, 8.75, 11.25, 420)
-    femmesh.addNode(3.75, 7.5, 13.75, 421)
-    femmesh.addNode(1.25, 8.75, 12.5, 422)
-    femmesh.addNode(7.5, 8.75, 18.75, 423)
-    femmesh.addNode(6.25, 6.25, 17.5, 424)
-    femmesh.addNode(8.75, 7.5, 18.75, 425)
-    femmesh.addNode(8.75, 8.75, 12.5, 426)
-    femmesh.addNode(7.5, 6.25, 13.75, 427)
-    femmesh.addNode(8.75, 7.5, 11.25, 428)
-    femmesh.addNode(8.75, 1.25, 17.5, 429)
-    femmesh.addNode(7.5, 1.25, 11.25, 430)
-    femmesh.addNode(2.5, 1.25, 18.75, 431)
-    femmesh.addNode(3.75, 3.75, 17.5, 432)
-    femmesh.addNode(1.25, 2.5, 18.75, 433)
-    femmesh.addNode(2.5, 1.25, 11.25, 434)
-    femmesh.addNode(3.75, 3.75, 12.5, 435)
-    femmesh.addNode(1.25, 2.5, 11.25, 436)
-    femmesh.addNode(8.75, 2.5, 18.75, 437)
-    femmesh.addNode(6.25, 3.75, 17.5, 438)
-    femmesh.addNode(7.5, 1.25, 18.75, 439)
-    femmesh.addNode(8.75, 1.25, 12.5, 440)
-    femmesh.addNode(7.5, 3.75, 13.75, 441)
-    femmesh.addNode(8.75, 2.5, 11.25, 442)
-    femmesh.addNode(5.0, 8.75, 18.75, 443)
-    femmesh.addNode(5.0, 1.25, 11.25, 444)
-    femmesh.addNode(8.75, 8.75, 15.0, 445)
-    femmesh.addNode(8.75, 5.0, 11.25, 446)
-    femmesh.addNode(1.25, 1.25, 15.0, 447)
-    femmesh.addNode(8.75, 5.0, 18.75, 448)
-    femmesh.addNode(5.0, 1.25, 18.75, 449)
-    femmesh.addNode(1.25, 5.0, 18.75, 450)
-    femmesh.addNode(5.0, 5.0, 5.0, 451)
-    femmesh.addNode(6.25, 8.75, 7.5, 452)
-    femmesh.addNode(5.0, 7.5, 7.5, 453)
-    femmesh.addNode(5.0, 7.5, 5.0, 454)
-    femmesh.addNode(5.0, 5.0, 7.5, 455)
-    femmesh.addNode(6.25, 6.25, 7.5, 456)
-    femmesh.addNode(8.75, 6.25, 7.5, 457)
-    femmesh.addNode(7.5, 5.0, 7.5, 458)
-    femmesh.addNode(7.5, 5.0, 5.0, 459)
-    femmesh.addNode(3.75, 8.75, 7.5, 460)
-    femmesh.addNode(3.75, 6.25, 7.5, 461)
-    femmesh.addNode(2.5, 5.0, 7.5, 462)
-    femmesh.addNode(1.25, 6.25, 7.5, 463)
-    femmesh.addNode(2.5, 5.0, 5.0, 464)
-    femmesh.addNode(2.5, 5.0, 2.5, 465)
-    femmesh.addNode(1.25, 6.25, 2.5, 466)
-    femmesh.addNode(3.75, 6.25, 2.5, 467)
-    femmesh.addNode(5.0, 5.0, 2.5, 468)
-    femmesh.addNode(5.0, 7.5, 2.5, 469)
-    femmesh.addNode(3.75, 8.75, 2.5, 470)
-    femmesh.addNode(6.25, 8.75, 2.5, 471)
-    femmesh.addNode(6.25, 6.25, 2.5, 472)
-    femmesh.addNode(7.5, 5.0, 2.5, 473)
-    femmesh.addNode(8.75, 6.25, 2.5, 474)
-    femmesh.addNode(7.5, 7.5, 5.0, 475)
-    femmesh.addNode(8.75, 7.5, 6.25, 476)
-    femmesh.addNode(6.25, 7.5, 6.25, 477)
-    femmesh.addNode(2.5, 7.5, 5.0, 478)
-    femmesh.addNode(2.5, 8.75, 6.25, 479)
-    femmesh.addNode(2.5, 6.25, 6.25, 480)
-    femmesh.addNode(1.25, 3.75, 7.5, 481)
-    femmesh.addNode(3.75, 3.75, 7.5, 482)
-    femmesh.addNode(5.0, 2.5, 7.5, 483)
-    femmesh.addNode(3.75, 1.25, 7.5, 484)
-    femmesh.addNode(5.0, 2.5, 5.0, 485)
-    femmesh.addNode(7.5, 2.5, 5.0, 486)
-    femmesh.addNode(8.75, 2.5, 6.25, 487)
-    femmesh.addNode(6.25, 2.5, 6.25, 488)
-    femmesh.addNode(6.25, 2.5, 8.75, 489)
-    femmesh.addNode(8.75, 3.75, 2.5, 490)
-    femmesh.addNode(6.25, 3.75, 2.5, 491)
-    femmesh.addNode(5.0, 2.5, 2.5, 492)
-    femmesh.addNode(6.25, 1.25, 2.5, 493)
-    femmesh.addNode(1.25, 3.75, 2.5, 494)
-    femmesh.addNode(3.75, 3.75, 2.5, 495)
-    femmesh.addNode(3.75, 1.25, 2.5, 496)
-    femmesh.addNode(2.5, 8.75, 3.75, 497)
-    femmesh.addNode(2.5, 6.25, 3.75, 498)
-    femmesh.addNode(8.75, 7.5, 3.75, 499)
-    femmesh.addNode(6.25, 7.5, 3.75, 500)
-    femmesh.addNode(2.5, 2.5, 5.0, 501)
-    femmesh.addNode(1.25, 2.5, 6.25, 502)
-    femmesh.addNode(3.75, 2.5, 6.25, 503)
-    femmesh.addNode(8.75, 3.75, 7.5, 504)
-    femmesh.addNode(6.25, 3.75, 7.5, 505)
-    femmesh.addNode(8.75, 2.5, 3.75, 506)
-    femmesh.addNode(6.25, 2.5, 3.75, 507)
-    femmesh.addNode(1.25, 2.5, 3.75, 508)
-    femmesh.addNode(3.75, 2.5, 3.75, 509)
-    femmesh.addNode(5.0, 1.25, 8.75, 510)
-    femmesh.addNode(7.5, 8.75, 8.75, 511)
-    femmesh.addNode(1.25, 7.5, 8.75, 512)
-    femmesh.addNode(1.25, 7.5, 1.25, 513)
-    femmesh.addNode(7.5, 8.75, 1.25, 514)
-    femmesh.addNode(8.75, 8.75, 7.5, 515)
-    femmesh.addNode(7.5, 6.25, 6.25, 516)
-    femmesh.addNode(8.75, 7.5, 8.75, 517)
-    femmesh.addNode(1.25, 8.75, 7.5, 518)
-    femmesh.addNode(3.75, 7.5, 6.25, 519)
-    femmesh.addNode(2.5, 8.75, 8.75, 520)
-    femmesh.addNode(2.5, 1.25, 8.75, 521)
-    femmesh.addNode(7.5, 1.25, 8.75, 522)
-    femmesh.addNode(7.5, 1.25, 1.25, 523)
-    femmesh.addNode(2.5, 1.25, 1.25, 524)
-    femmesh.addNode(1.25, 8.75, 2.5, 525)
-    femmesh.addNode(3.75, 7.5, 3.75, 526)
-    femmesh.addNode(2.5, 8.75, 1.25, 527)
-    femmesh.addNode(8.75, 8.75, 2.5, 528)
-    femmesh.addNode(7.5, 6.25, 3.75, 529)
-    femmesh.addNode(8.75, 7.5, 1.25, 530)
-    femmesh.addNode(1.25, 1.25, 7.5, 531)
-    femmesh.addNode(2.5, 3.75, 6.25, 532)
-    femmesh.addNode(1.25, 2.5, 8.75, 533)
-    femmesh.addNode(8.75, 2.5, 8.75, 534)
-    femmesh.addNode(7.5, 3.75, 6.25, 535)
-    femmesh.addNode(8.75, 1.25, 7.5, 536)
-    femmesh.addNode(8.75, 2.5, 1.25, 537)
-    femmesh.addNode(7.5, 3.75, 3.75, 538)
-    femmesh.addNode(8.75, 1.25, 2.5, 539)
-    femmesh.addNode(1.25, 1.25, 2.5, 540)
-    femmesh.addNode(2.5, 3.75, 3.75, 541)
-    femmesh.addNode(1.25, 2.5, 1.25, 542)
-    femmesh.addNode(8.75, 5.0, 8.75, 543)
-    femmesh.addNode(8.75, 8.75, 5.0, 544)
-    femmesh.addNode(5.0, 8.75, 1.25, 545)
-    femmesh.addNode(1.25, 5.0, 1.25, 546)
-    femmesh.addNode(5.0, 8.75, 8.75, 547)
-    femmesh.addNode(1.25, 1.25, 5.0, 548)
-    femmesh.addNode(8.75, 5.0, 1.25, 549)
-    femmesh.addNode(1.25, 5.0, 8.75, 550)
-    femmesh.addNode(5.0, 1.25, 1.25, 551)
-    femmesh.addNode(1.25, 8.75, 5.0, 552)
-    femmesh.addNode(8.75, 1.25, 5.0, 553)
-    return True
-
-
-def create_elements(femmesh):
-    # elements
-    femmesh.addVolume([73, 177, 173, 348, 350, 196, 349, 351, 352, 353], 1)
-    femmesh.addVolume([177, 148, 173, 348, 355, 354, 196, 352, 356, 353], 2)
-    femmesh.addVolume([73, 124, 123, 348, 358, 144, 357, 351, 359, 360], 3)
-    femmesh.addVolume([124, 173, 123, 348, 362, 361, 144, 359, 353, 360], 4)
-    femmesh.addVolume([77, 73, 148, 348, 97, 364, 363, 365, 351, 356], 5)
-    femmesh.addVolume([176, 173, 148, 348, 197, 354, 366, 367, 353, 356], 6)
-    femmesh.addVolume([176, 198, 173, 348, 369, 368, 197, 367, 370, 353], 7)
-    femmesh.addVolume([198, 175, 173, 348, 371, 195, 368, 370, 372, 353], 8)
-    femmesh.addVolume([173, 175, 123, 348, 195, 373, 361, 353, 372, 360], 9)
-    femmesh.addVolume([102, 98, 148, 348, 122, 375, 374, 376, 377, 356], 10)
-    femmesh.addVolume([102, 73, 98, 348, 379, 378, 122, 376, 351, 377], 11)
-    femmesh.addVolume([101, 98, 73, 348, 121, 378, 380, 381, 377, 351], 12)
-    femmesh.addVolume([101, 123, 98, 348, 383, 382, 121, 381, 360, 377], 13)
-    femmesh.addVolume([76, 73, 173, 348, 96, 349, 384, 385, 351, 353], 14)
-    femmesh.addVolume([198, 202, 148, 348, 222, 387, 386, 370, 388, 356], 15)
-    femmesh.addVolume([198, 123, 125, 348, 390, 145, 389, 370, 360, 391], 16)
-    femmesh.addVolume([200, 98, 198, 348, 393, 392, 219, 394, 377, 370], 17)
-    femmesh.addVolume([200, 198, 148, 348, 219, 386, 395, 394, 370, 356], 18)
-    femmesh.addVolume([123, 99, 98, 348, 396, 119, 382, 360, 397, 377], 19)
-    femmesh.addVolume([99, 198, 98, 348, 398, 392, 119, 397, 370, 377], 20)
-    femmesh.addVolume([73, 75, 148, 348, 94, 399, 364, 351, 400, 356], 21)
-    femmesh.addVolume([74, 73, 123, 348, 95, 357, 401, 402, 351, 360], 22)
-    femmesh.addVolume([100, 148, 98, 348, 403, 375, 120, 404, 356, 377], 23)
-    femmesh.addVolume([123, 198, 127, 348, 390, 405, 147, 360, 370, 406], 24)
-    femmesh.addVolume([198, 175, 176, 173, 371, 193, 369, 368, 195, 197], 25)
-    femmesh.addVolume([76, 73, 177, 173, 96, 350, 407, 384, 349, 196], 26)
-    femmesh.addVolume([73, 101, 102, 98, 380, 115, 379, 378, 121, 122], 27)
-    femmesh.addVolume([148, 102, 100, 98, 374, 118, 403, 375, 122, 120], 28)
-    femmesh.addVolume([148, 176, 177, 173, 366, 192, 355, 354, 197, 196], 29)
-    femmesh.addVolume([74, 73, 124, 123, 95, 358, 408, 401, 357, 144], 30)
-    femmesh.addVolume([75, 148, 77, 73, 399, 363, 92, 94, 364, 97], 31)
-    femmesh.addVolume([200, 98, 99, 198, 393, 119, 409, 219, 392, 398], 32)
-    femmesh.addVolume([148, 200, 202, 198, 395, 217, 387, 386, 219, 222], 33)
-    femmesh.addVolume([99, 101, 123, 98, 116, 383, 396, 119, 121, 382], 34)
-    femmesh.addVolume([127, 123, 125, 198, 147, 145, 143, 405, 390, 389], 35)
-    femmesh.addVolume([175, 123, 124, 173, 373, 144, 410, 195, 361, 362], 36)
-    femmesh.addVolume([177, 73, 77, 348, 350, 97, 411, 352, 351, 365], 37)
-    femmesh.addVolume([124, 73, 76, 348, 358, 96, 412, 359, 351, 385], 38)
-    femmesh.addVolume([177, 149, 148, 348, 413, 169, 355, 352, 414, 356], 39)
-    femmesh.addVolume([149, 77, 148, 348, 415, 363, 169, 414, 365, 356], 40)
-    femmesh.addVolume([176, 202, 198, 348, 416, 222, 369, 367, 388, 370], 41)
-    femmesh.addVolume([175, 125, 123, 348, 417, 145, 373, 372, 391, 360], 42)
-    femmesh.addVolume([73, 102, 75, 348, 379, 418, 94, 351, 376, 400], 43)
-    femmesh.addVolume([74, 101, 73, 348, 419, 380, 95, 402, 381, 351], 44)
-    femmesh.addVolume([174, 173, 124, 348, 194, 362, 420, 421, 353, 359], 45)
-    femmesh.addVolume([174, 76, 173, 348, 422, 384, 194, 421, 385, 353], 46)
-    femmesh.addVolume([148, 150, 176, 348, 170, 423, 366, 356, 424, 367], 47)
-    femmesh.addVolume([148, 202, 150, 348, 387, 425, 170, 356, 388, 424], 48)
-    femmesh.addVolume([198, 201, 175, 348, 221, 426, 371, 370, 427, 372], 49)
-    femmesh.addVolume([198, 125, 201, 348, 389, 428, 221, 370, 391, 427], 50)
-    femmesh.addVolume([100, 98, 200, 348, 120, 393, 429, 404, 377, 394], 51)
-    femmesh.addVolume([123, 127, 99, 348, 147, 430, 396, 360, 406, 397], 52)
-    femmesh.addVolume([102, 148, 151, 348, 374, 171, 431, 376, 356, 432], 53)
-    femmesh.addVolume([75, 151, 148, 348, 433, 171, 399, 400, 432, 356], 54)
-    femmesh.addVolume([126, 123, 101, 348, 146, 383, 434, 435, 360, 381], 55)
-    femmesh.addVolume([126, 74, 123, 348, 436, 401, 146, 435, 402, 360], 56)
-    femmesh.addVolume([148, 152, 200, 348, 172, 437, 395, 356, 438, 394], 57)
-    femmesh.addVolume([148, 100, 152, 348, 403, 439, 172, 356, 404, 438], 58)
-    femmesh.addVolume([99, 199, 198, 348, 440, 220, 398, 397, 441, 370], 59)
-    femmesh.addVolume([198, 199, 127, 348, 220, 442, 405, 370, 441, 406], 60)
-    femmesh.addVolume([150, 176, 149, 148, 423, 443, 167, 170, 366, 169], 61)
-    femmesh.addVolume([101, 126, 127, 123, 434, 141, 444, 383, 146, 147], 62)
-    femmesh.addVolume([74, 124, 126, 123, 408, 140, 436, 401, 144, 146], 63)
-    femmesh.addVolume([201, 198, 176, 202, 221, 369, 445, 218, 222, 416], 64)
-    femmesh.addVolume([176, 177, 149, 148, 192, 413, 443, 366, 355, 169], 65)
-    femmesh.addVolume([76, 124, 74, 73, 412, 408, 91, 96, 358, 95], 66)
-    femmesh.addVolume([125, 198, 199, 127, 389, 220, 446, 143, 405, 442], 67)
-    femmesh.addVolume([123, 101, 99, 127, 383, 116, 396, 147, 444, 430], 68)
-    femmesh.addVolume([199, 198, 200, 99, 220, 219, 215, 440, 398, 409], 69)
-    femmesh.addVolume([74, 101, 102, 73, 419, 115, 447, 95, 380, 379], 70)
-    femmesh.addVolume([201, 175, 176, 198, 426, 193, 445, 221, 371, 369], 71)
-    femmesh.addVolume([200, 202, 150, 148, 217, 425, 448, 395, 387, 170], 72)
-    femmesh.addVolume([99, 200, 100, 98, 409, 429, 117, 119, 393, 120], 73)
-    femmesh.addVolume([152, 200, 150, 148, 437, 448, 168, 172, 395, 170], 74)
-    femmesh.addVolume([151, 102, 152, 148, 431, 449, 166, 171, 374, 172], 75)
-    femmesh.addVolume([149, 77, 75, 148, 415, 92, 450, 169, 363, 399], 76)
-    femmesh.addVolume([148, 152, 100, 102, 172, 439, 403, 374, 449, 118], 77)
-    femmesh.addVolume([74, 73, 102, 75, 95, 379, 447, 90, 94, 418], 78)
-    femmesh.addVolume([174, 76, 177, 173, 422, 407, 190, 194, 384, 196], 79)
-    femmesh.addVolume([149, 148, 75, 151, 169, 399, 450, 165, 171, 433], 80)
-    femmesh.addVolume([77, 177, 76, 73, 411, 407, 93, 97, 350, 96], 81)
-    femmesh.addVolume([199, 125, 201, 198, 446, 428, 216, 220, 389, 221], 82)
-    femmesh.addVolume([175, 125, 124, 123, 417, 142, 410, 373, 145, 144], 83)
-    femmesh.addVolume([175, 124, 174, 173, 410, 420, 191, 195, 362, 194], 84)
-    femmesh.addVolume([176, 40, 149, 177, 187, 158, 443, 192, 183, 413], 85)
-    femmesh.addVolume([200, 43, 150, 202, 208, 164, 448, 217, 212, 425], 86)
-    femmesh.addVolume([175, 34, 174, 124, 184, 180, 191, 410, 133, 420], 87)
-    femmesh.addVolume([177, 76, 174, 22, 407, 422, 190, 181, 86, 178], 88)
-    femmesh.addVolume([76, 16, 74, 124, 84, 80, 91, 412, 132, 408], 89)
-    femmesh.addVolume([199, 99, 200, 28, 440, 409, 215, 204, 111, 206], 90)
-    femmesh.addVolume([102, 152, 100, 31, 449, 439, 118, 108, 159, 114], 91)
-    femmesh.addVolume([99, 127, 101, 25, 430, 444, 116, 110, 134, 105], 92)
-    femmesh.addVolume([149, 19, 75, 77, 156, 83, 450, 415, 87, 92], 93)
-    femmesh.addVolume([74, 13, 102, 101, 78, 106, 447, 419, 104, 115], 94)
-    femmesh.addVolume([201, 125, 199, 37, 428, 446, 216, 210, 139, 205], 95)
-    femmesh.addVolume([150, 200, 152, 43, 448, 437, 168, 164, 208, 161], 96)
-    femmesh.addVolume([125, 127, 199, 37, 143, 442, 446, 139, 136, 205], 97)
-    femmesh.addVolume([77, 22, 76, 177, 89, 86, 93, 411, 181, 407], 98)
-    femmesh.addVolume([152, 102, 151, 31, 449, 431, 166, 159, 108, 155], 99)
-    femmesh.addVolume([75, 19, 149, 151, 83, 156, 450, 433, 153, 165], 100)
-    femmesh.addVolume([100, 200, 99, 28, 429, 409, 117, 113, 206, 111], 101)
-    femmesh.addVolume([149, 176, 150, 40, 443, 423, 167, 158, 187, 162], 102)
-    femmesh.addVolume([102, 13, 74, 75, 106, 78, 447, 418, 81, 90], 103)
-    femmesh.addVolume([176, 46, 201, 202, 189, 211, 445, 416, 214, 218], 104)
-    femmesh.addVolume([127, 126, 101, 25, 141, 434, 444, 134, 130, 105], 105)
-    femmesh.addVolume([124, 125, 175, 34, 142, 417, 410, 133, 138, 184], 106)
-    femmesh.addVolume([126, 124, 74, 16, 140, 408, 436, 128, 132, 80], 107)
-    femmesh.addVolume([201, 46, 176, 175, 211, 189, 445, 426, 186, 193], 108)
-    femmesh.addVolume([177, 77, 149, 348, 411, 415, 413, 352, 365, 414], 109)
-    femmesh.addVolume([174, 124, 76, 348, 420, 412, 422, 421, 359, 385], 110)
-    femmesh.addVolume([202, 176, 150, 348, 416, 423, 425, 388, 367, 424], 111)
-    femmesh.addVolume([175, 201, 125, 348, 426, 428, 417, 372, 427, 391], 112)
-    femmesh.addVolume([102, 151, 75, 348, 431, 433, 418, 376, 432, 400], 113)
-    femmesh.addVolume([126, 101, 74, 348, 434, 419, 436, 435, 381, 402], 114)
-    femmesh.addVolume([100, 200, 152, 348, 429, 437, 439, 404, 394, 438], 115)
-    femmesh.addVolume([99, 127, 199, 348, 430, 442, 440, 397, 406, 441], 116)
-    femmesh.addVolume([152, 200, 6, 43, 437, 207, 160, 161, 208, 44], 117)
-    femmesh.addVolume([6, 100, 152, 31, 112, 439, 160, 33, 114, 159], 118)
-    femmesh.addVolume([3, 174, 76, 22, 179, 422, 85, 23, 178, 86], 119)
-    femmesh.addVolume([175, 201, 46, 7, 426, 211, 186, 185, 209, 47], 120)
-    femmesh.addVolume([149, 77, 4, 19, 415, 88, 157, 156, 87, 21], 121)
-    femmesh.addVolume([4, 177, 22, 77, 182, 181, 24, 88, 411, 89], 122)
-    femmesh.addVolume([74, 16, 1, 126, 80, 17, 79, 436, 128, 129], 123)
-    femmesh.addVolume([75, 2, 19, 151, 82, 20, 83, 433, 154, 153], 124)
-    femmesh.addVolume([76, 124, 3, 16, 412, 131, 85, 84, 132, 18], 125)
-    femmesh.addVolume([75, 13, 2, 102, 81, 15, 82, 418, 106, 107], 126)
-    femmesh.addVolume([2, 151, 102, 31, 154, 431, 107, 32, 155, 108], 127)
-    femmesh.addVolume([13, 74, 1, 101, 78, 79, 14, 104, 419, 103], 128)
-    femmesh.addVolume([37, 127, 199, 5, 136, 442, 205, 38, 135, 203], 129)
-    femmesh.addVolume([28, 200, 6, 100, 206, 207, 30, 113, 429, 112], 130)
-    femmesh.addVolume([176, 150, 40, 8, 423, 162, 187, 188, 163, 42], 131)
-    femmesh.addVolume([177, 149, 4, 40, 413, 157, 182, 183, 158, 41], 132)
-    femmesh.addVolume([202, 8, 176, 46, 213, 188, 416, 214, 48, 189], 133)
-    femmesh.addVolume([43, 150, 202, 8, 164, 425, 212, 45, 163, 213], 134)
-    femmesh.addVolume([28, 199, 99, 5, 204, 440, 111, 29, 203, 109], 135)
-    femmesh.addVolume([175, 7, 34, 125, 185, 36, 184, 417, 137, 138], 136)
-    femmesh.addVolume([3, 124, 174, 34, 131, 420, 179, 35, 133, 180], 137)
-    femmesh.addVolume([1, 101, 126, 25, 103, 434, 129, 26, 105, 130], 138)
-    femmesh.addVolume([7, 125, 201, 37, 137, 428, 209, 39, 139, 210], 139)
-    femmesh.addVolume([99, 127, 25, 5, 430, 134, 110, 109, 135, 27], 140)
-    femmesh.addVolume([201, 7, 175, 125, 209, 185, 426, 428, 137, 417], 141)
-    femmesh.addVolume([76, 174, 3, 124, 422, 179, 85, 412, 420, 131], 142)
-    femmesh.addVolume([4, 149, 177, 77, 157, 413, 182, 88, 415, 411], 143)
-    femmesh.addVolume([6, 200, 152, 100, 207, 437, 160, 112, 429, 439], 144)
-    femmesh.addVolume([74, 126, 1, 101, 436, 129, 79, 419, 434, 103], 145)
-    femmesh.addVolume([75, 102, 2, 151, 418, 107, 82, 433, 431, 154], 146)
-    femmesh.addVolume([202, 150, 176, 8, 425, 423, 416, 213, 163, 188], 147)
-    femmesh.addVolume([199, 127, 99, 5, 442, 430, 440, 203, 135, 109], 148)
-    femmesh.addVolume([298, 123, 125, 451, 453, 145, 452, 454, 455, 456], 149)
-    femmesh.addVolume([125, 123, 323, 451, 145, 458, 457, 456, 455, 459], 150)
-    femmesh.addVolume([124, 123, 298, 451, 144, 453, 460, 461, 455, 454], 151)
-    femmesh.addVolume([124, 223, 123, 451, 463, 462, 144, 461, 464, 455], 152)
-    femmesh.addVolume([223, 274, 273, 451, 466, 294, 465, 464, 467, 468], 153)
-    femmesh.addVolume([274, 298, 273, 451, 470, 469, 294, 467, 454, 468], 154)
-    femmesh.addVolume([298, 275, 273, 451, 471, 295, 469, 454, 472, 468], 155)
-    femmesh.addVolume([275, 323, 273, 451, 474, 473, 295, 472, 459, 468], 156)
-    femmesh.addVolume([298, 299, 323, 451, 319, 476, 475, 454, 477, 459], 157)
-    femmesh.addVolume([223, 225, 298, 451, 244, 479, 478, 464, 480, 454], 158)
-    femmesh.addVolume([126, 123, 223, 451, 146, 462, 481, 482, 455, 464], 159)
-    femmesh.addVolume([126, 248, 123, 451, 484, 483, 146, 482, 485, 455], 160)
-    femmesh.addVolume([323, 249, 248, 451, 487, 269, 486, 459, 488, 485], 161)
-    femmesh.addVolume([123, 248, 249, 451, 483, 269, 489, 455, 485, 488], 162)
-    femmesh.addVolume([277, 273, 323, 451, 297, 473, 490, 491, 468, 459], 163)
-    femmesh.addVolume([277, 248, 273, 451, 493, 492, 297, 491, 485, 468], 164)
-    femmesh.addVolume([223, 273, 276, 451, 465, 296, 494, 464, 468, 495], 165)
-    femmesh.addVolume([276, 273, 248, 451, 296, 492, 496, 495, 468, 485], 166)
-    femmesh.addVolume([298, 227, 223, 451, 497, 247, 478, 454, 498, 464], 167)
-    femmesh.addVolume([323, 300, 298, 451, 499, 320, 475, 459, 500, 454], 168)
-    femmesh.addVolume([252, 223, 248, 451, 502, 501, 271, 503, 464, 485], 169)
-    femmesh.addVolume([123, 127, 323, 451, 147, 504, 458, 455, 505, 459], 170)
-    femmesh.addVolume([251, 323, 248, 451, 506, 486, 270, 507, 459, 485], 171)
-    femmesh.addVolume([250, 248, 223, 451, 272, 501, 508, 509, 485, 464], 172)
-    femmesh.addVolume([252, 223, 250, 248, 502, 508, 266, 271, 501, 272], 173)
-    femmesh.addVolume([276, 273, 277, 248, 296, 297, 291, 496, 492, 493], 174)
-    femmesh.addVolume([323, 249, 251, 248, 487, 268, 506, 486, 269, 270], 175)
-    femmesh.addVolume([277, 273, 275, 323, 297, 295, 293, 490, 473, 474], 176)
-    femmesh.addVolume([274, 273, 276, 223, 294, 296, 290, 466, 465, 494], 177)
-    femmesh.addVolume([125, 127, 323, 123, 143, 504, 457, 145, 147, 458], 178)
-    femmesh.addVolume([227, 225, 298, 223, 243, 479, 497, 247, 244, 478], 179)
-    femmesh.addVolume([298, 124, 125, 123, 460, 142, 452, 453, 144, 145], 180)
-    femmesh.addVolume([323, 298, 300, 299, 475, 320, 499, 476, 319, 318], 181)
-    femmesh.addVolume([275, 273, 274, 298, 295, 294, 292, 471, 469, 470], 182)
-    femmesh.addVolume([126, 248, 249, 123, 484, 269, 510, 146, 483, 489], 183)
-    femmesh.addVolume([124, 223, 126, 123, 463, 481, 140, 144, 462, 146], 184)
-    femmesh.addVolume([298, 125, 299, 451, 452, 511, 319, 454, 456, 477], 185)
-    femmesh.addVolume([223, 124, 225, 451, 463, 512, 244, 464, 461, 480], 186)
-    femmesh.addVolume([227, 274, 223, 451, 513, 466, 247, 498, 467, 464], 187)
-    femmesh.addVolume([300, 275, 298, 451, 514, 471, 320, 500, 472, 454], 188)
-    femmesh.addVolume([299, 325, 323, 451, 515, 344, 476, 477, 516, 459], 189)
-    femmesh.addVolume([325, 125, 323, 451, 517, 457, 344, 516, 456, 459], 190)
-    femmesh.addVolume([225, 301, 298, 451, 518, 321, 479, 480, 519, 454], 191)
-    femmesh.addVolume([301, 124, 298, 451, 520, 460, 321, 519, 461, 454], 192)
-    femmesh.addVolume([252, 248, 126, 451, 271, 484, 521, 503, 485, 482], 193)
-    femmesh.addVolume([123, 249, 127, 451, 489, 522, 147, 455, 488, 505], 194)
-    femmesh.addVolume([251, 248, 277, 451, 270, 493, 523, 507, 485, 491], 195)
-    femmesh.addVolume([250, 276, 248, 451, 524, 496, 272, 509, 495, 485], 196)
-    femmesh.addVolume([298, 302, 227, 451, 322, 525, 497, 454, 526, 498], 197)
-    femmesh.addVolume([298, 274, 302, 451, 470, 527, 322, 454, 467, 526], 198)
-    femmesh.addVolume([300, 323, 327, 451, 499, 347, 528, 500, 459, 529], 199)
-    femmesh.addVolume([323, 275, 327, 451, 474, 530, 347, 459, 472, 529], 200)
-    femmesh.addVolume([224, 223, 252, 451, 245, 502, 531, 532, 464, 503], 201)
-    femmesh.addVolume([224, 126, 223, 451, 533, 481, 245, 532, 482, 464], 202)
-    femmesh.addVolume([323, 127, 324, 451, 504, 534, 345, 459, 505, 535], 203)
-    femmesh.addVolume([323, 324, 249, 451, 345, 536, 487, 459, 535, 488], 204)
-    femmesh.addVolume([323, 326, 277, 451, 346, 537, 490, 459, 538, 491], 205)
-    femmesh.addVolume([323, 251, 326, 451, 506, 539, 346, 459, 507, 538], 206)
-    femmesh.addVolume([250, 223, 226, 451, 508, 246, 540, 509, 464, 541], 207)
-    femmesh.addVolume([276, 226, 223, 451, 542, 246, 494, 495, 541, 464], 208)
-    femmesh.addVolume([125, 323, 324, 325, 457, 345, 543, 517, 344, 340], 209)
-    femmesh.addVolume([323, 299, 300, 327, 476, 318, 499, 347, 544, 528], 210)
-    femmesh.addVolume([300, 274, 302, 298, 545, 527, 317, 320, 470, 322], 211)
-    femmesh.addVolume([227, 274, 226, 223, 513, 546, 242, 247, 466, 246], 212)
-    femmesh.addVolume([327, 299, 325, 323, 544, 515, 343, 347, 476, 344], 213)
-    femmesh.addVolume([249, 126, 252, 248, 510, 521, 265, 269, 484, 271], 214)
-    femmesh.addVolume([125, 124, 298, 299, 142, 460, 452, 511, 547, 319], 215)
-    femmesh.addVolume([252, 223, 226, 250, 502, 246, 548, 266, 508, 540], 216)
-    femmesh.addVolume([275, 323, 326, 277, 474, 346, 549, 293, 490, 537], 217)
-    femmesh.addVolume([252, 224, 226, 223, 531, 241, 548, 502, 245, 246], 218)
-    femmesh.addVolume([274, 298, 300, 275, 470, 320, 545, 292, 471, 514], 219)
-    femmesh.addVolume([124, 225, 224, 223, 512, 240, 550, 463, 244, 245], 220)
-    femmesh.addVolume([274, 276, 226, 223, 290, 542, 546, 466, 494, 246], 221)
-    femmesh.addVolume([276, 277, 251, 248, 291, 523, 551, 496, 493, 270], 222)
-    femmesh.addVolume([124, 223, 224, 126, 463, 245, 550, 140, 481, 533], 223)
-    femmesh.addVolume([299, 298, 301, 124, 319, 321, 315, 547, 460, 520], 224)
-    femmesh.addVolume([326, 275, 327, 323, 549, 530, 342, 346, 474, 347], 225)
-    femmesh.addVolume([302, 225, 301, 298, 552, 518, 316, 322, 479, 321], 226)
-    femmesh.addVolume([298, 225, 227, 302, 479, 243, 497, 322, 552, 525], 227)
-    femmesh.addVolume([250, 276, 251, 248, 524, 551, 267, 272, 496, 270], 228)
-    femmesh.addVolume([125, 127, 324, 323, 143, 534, 543, 457, 504, 345], 229)
-    femmesh.addVolume([323, 326, 251, 249, 346, 539, 506, 487, 553, 268], 230)
-    femmesh.addVolume([326, 323, 324, 249, 346, 345, 341, 553, 487, 536], 231)
-    femmesh.addVolume([126, 249, 127, 123, 510, 522, 141, 146, 489, 147], 232)
-    femmesh.addVolume([251, 61, 249, 326, 264, 258, 268, 539, 335, 553], 233)
-    femmesh.addVolume([251, 276, 250, 58, 551, 524, 267, 262, 280, 261], 234)
-    femmesh.addVolume([226, 274, 227, 52, 546, 513, 242, 236, 282, 237], 235)
-    femmesh.addVolume([302, 274, 300, 64, 527, 545, 317, 311, 283, 312], 236)
-    femmesh.addVolume([274, 52, 226, 276, 282, 236, 546, 290, 278, 542], 237)
-    femmesh.addVolume([226, 49, 252, 250, 234, 255, 548, 540, 259, 266], 238)
-    femmesh.addVolume([300, 327, 299, 70, 528, 544, 318, 314, 339, 308], 239)
-    femmesh.addVolume([224, 16, 124, 126, 228, 132, 550, 533, 128, 140], 240)
-    femmesh.addVolume([249, 25, 252, 126, 256, 253, 265, 510, 130, 521], 241)
-    femmesh.addVolume([275, 277, 326, 67, 293, 537, 549, 289, 286, 336], 242)
-    femmesh.addVolume([274, 275, 300, 64, 292, 514, 545, 283, 288, 312], 243)
-    femmesh.addVolume([276, 58, 251, 277, 280, 262, 551, 291, 284, 523], 244)
-    femmesh.addVolume([327, 275, 326, 67, 530, 549, 342, 338, 289, 336], 245)
-    femmesh.addVolume([124, 16, 224, 225, 132, 228, 550, 512, 231, 240], 246)
-    femmesh.addVolume([252, 49, 226, 224, 255, 234, 548, 531, 230, 241], 247)
-    femmesh.addVolume([125, 37, 324, 127, 139, 329, 543, 143, 136, 534], 248)
-    femmesh.addVolume([225, 55, 227, 302, 233, 239, 243, 552, 309, 525], 249)
-    femmesh.addVolume([301, 225, 302, 55, 518, 552, 316, 305, 233, 309], 250)
-    femmesh.addVolume([125, 34, 124, 299, 138, 133, 142, 511, 307, 547], 251)
-    femmesh.addVolume([324, 37, 125, 325, 329, 139, 543, 340, 331, 517], 252)
-    femmesh.addVolume([325, 299, 327, 70, 515, 544, 343, 333, 308, 339], 253)
-    femmesh.addVolume([126, 25, 127, 249, 130, 134, 141, 510, 256, 522], 254)
-    femmesh.addVolume([326, 249, 324, 61, 553, 536, 341, 335, 258, 330], 255)
-    femmesh.addVolume([299, 124, 301, 34, 547, 520, 315, 307, 133, 303], 256)
-    femmesh.addVolume([299, 125, 325, 451, 511, 517, 515, 477, 456, 516], 257)
-    femmesh.addVolume([225, 124, 301, 451, 512, 520, 518, 480, 461, 519], 258)
-    femmesh.addVolume([227, 302, 274, 451, 525, 527, 513, 498, 526, 467], 259)
-    femmesh.addVolume([300, 327, 275, 451, 528, 530, 514, 500, 529, 472], 260)
-    femmesh.addVolume([224, 252, 126, 451, 531, 521, 533, 532, 503, 482], 261)
-    femmesh.addVolume([324, 127, 249, 451, 534, 522, 536, 535, 505, 488], 262)
-    femmesh.addVolume([251, 277, 326, 451, 523, 537, 539, 507, 491, 538], 263)
-    femmesh.addVolume([250, 226, 276, 451, 540, 542, 524, 509, 541, 495], 264)
-    femmesh.addVolume([252, 49, 224, 1, 255, 230, 531, 254, 51, 229], 265)
-    femmesh.addVolume([276, 226, 9, 52, 542, 235, 279, 278, 236, 53], 266)
-    femmesh.addVolume([250, 49, 9, 226, 259, 50, 260, 540, 234, 235], 267)
-    femmesh.addVolume([3, 124, 225, 16, 131, 512, 232, 18, 132, 231], 268)
-    femmesh.addVolume([324, 249, 5, 61, 536, 257, 328, 330, 258, 63], 269)
-    femmesh.addVolume([324, 127, 37, 5, 534, 136, 329, 328, 135, 38], 270)
-    femmesh.addVolume([301, 225, 55, 3, 518, 233, 305, 304, 232, 57], 271)
-    femmesh.addVolume([12, 64, 300, 275, 66, 312, 313, 287, 288, 514], 272)
-    femmesh.addVolume([302, 227, 10, 55, 525, 238, 310, 309, 239, 56], 273)
-    femmesh.addVolume([52, 10, 274, 227, 54, 281, 282, 237, 238, 513], 274)
-    femmesh.addVolume([250, 276, 9, 58, 524, 279, 260, 261, 280, 59], 275)
-    femmesh.addVolume([274, 302, 10, 64, 527, 310, 281, 283, 311, 65], 276)
-    femmesh.addVolume([325, 125, 7, 37, 517, 137, 332, 331, 139, 39], 277)
-    femmesh.addVolume([299, 325, 7, 70, 515, 332, 306, 308, 333, 72], 278)
-    femmesh.addVolume([25, 5, 127, 249, 27, 135, 134, 256, 257, 522], 279)
-    femmesh.addVolume([1, 16, 224, 126, 17, 228, 229, 129, 128, 533], 280)
-    femmesh.addVolume([12, 275, 327, 67, 287, 530, 337, 69, 289, 338], 281)
-    femmesh.addVolume([300, 70, 12, 327, 314, 71, 313, 528, 339, 337], 282)
-    femmesh.addVolume([301, 124, 3, 34, 520, 131, 304, 303, 133, 35], 283)
-    femmesh.addVolume([277, 58, 251, 11, 284, 262, 523, 285, 60, 263], 284)
-    femmesh.addVolume([7, 299, 34, 125, 306, 307, 36, 137, 511, 138], 285)
-    femmesh.addVolume([67, 11, 277, 326, 68, 285, 286, 336, 334, 537], 286)
-    femmesh.addVolume([1, 126, 252, 25, 129, 521, 254, 26, 130, 253], 287)
-    femmesh.addVolume([251, 11, 61, 326, 263, 62, 264, 539, 334, 335], 288)
-    femmesh.addVolume([9, 276, 250, 226, 279, 524, 260, 235, 542, 540], 289)
-    femmesh.addVolume([225, 3, 301, 124, 232, 304, 518, 512, 131, 520], 290)
-    femmesh.addVolume([10, 302, 274, 227, 310, 527, 281, 238, 525, 513], 291)
-    femmesh.addVolume([252, 1, 224, 126, 254, 229, 531, 521, 129, 533], 292)
-    femmesh.addVolume([7, 325, 299, 125, 332, 515, 306, 137, 517, 511], 293)
-    femmesh.addVolume([300, 327, 12, 275, 528, 337, 313, 514, 530, 287], 294)
-    femmesh.addVolume([127, 5, 324, 249, 135, 328, 534, 522, 257, 536], 295)
-    femmesh.addVolume([277, 11, 251, 326, 285, 263, 523, 537, 334, 539], 296)
-    return True
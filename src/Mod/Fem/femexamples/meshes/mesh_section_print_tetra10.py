@@ -1,3222 +0,0 @@
-def create_nodes(femmesh):
-    # nodes
-    femmesh.addNode(67.0, -1.77635683819838e-15, -15.0, 1)
-    femmesh.addNode(67.0, -1.77635683819838e-15, 15.0, 2)
-    femmesh.addNode(47.0, 0.0, -15.0, 3)
-    femmesh.addNode(47.0, 0.0, 15.0, 4)
-    femmesh.addNode(42.6900302834928, 41.2380386162628, -15.0, 5)
-    femmesh.addNode(42.6900302834928, 41.2380386162628, 15.0, 6)
-    femmesh.addNode(34.638004395907, 31.7680445018123, -15.0, 7)
-    femmesh.addNode(34.638004395907, 31.7680445018123, 15.0, 8)
-    femmesh.addNode(-105.0, 5.32907051820075e-15, -15.0, 9)
-    femmesh.addNode(-105.0, 5.32907051820075e-15, 15.0, 10)
-    femmesh.addNode(-47.0, 2.87791998446114e-15, -15.0, 11)
-    femmesh.addNode(-47.0, 2.87791998446114e-15, 15.0, 12)
-    femmesh.addNode(66.99999999999999, -1.7763568381983844e-15, -5.0, 13)
-    femmesh.addNode(66.99999999999999, -1.7763568381983844e-15, 5.0, 14)
-    femmesh.addNode(66.99999999999999, -1.7763568381983844e-15, -10.0, 15)
-    femmesh.addNode(66.99999999999999, -1.7763568381983844e-15, 0.0, 16)
-    femmesh.addNode(66.99999999999999, -1.7763568381983844e-15, 10.0, 17)
-    femmesh.addNode(47.0, 0.0, -5.0, 18)
-    femmesh.addNode(47.0, 0.0, 5.0, 19)
-    femmesh.addNode(47.0, 0.0, -10.0, 20)
-    femmesh.addNode(47.0, 0.0, 0.0, 21)
-    femmesh.addNode(47.0, 0.0, 10.0, 22)
-    femmesh.addNode(57.0, 0.0, -15.0, 23)
-    femmesh.addNode(62.0, 0.0, -15.0, 24)
-    femmesh.addNode(52.0, 0.0, -15.0, 25)
-    femmesh.addNode(57.0, 0.0, 15.0, 26)
-    femmesh.addNode(62.0, 0.0, 15.0, 27)
-    femmesh.addNode(52.0, 0.0, 15.0, 28)
-    femmesh.addNode(63.999818806592856, 9.212346474981896, -15.0, 29)
-    femmesh.addNode(60.01604192862089, 18.043990520963415, -15.0, 30)
-    femmesh.addNode(55.09587941788642, 26.390272066439092, -15.0, 31)
-    femmesh.addNode(49.29763803556676, 34.15228286524248, -15.0, 32)
-    femmesh.addNode(65.62535979869793, 4.647028617606235, -15.0, 33)
-    femmesh.addNode(62.12819649531089, 13.682418127628925, -15.0, 34)
-    femmesh.addNode(57.66961731033909, 22.28413228352372, -15.0, 35)
-    femmesh.addNode(52.30245897654514, 30.35023581548828, -15.0, 36)
-    femmesh.addNode(46.09032541320741, 37.785140748279176, -15.0, 37)
-    femmesh.addNode(42.690030283492774, 41.2380386162628, 5.0, 38)
-    femmesh.addNode(42.690030283492774, 41.2380386162628, -5.0, 39)
-    femmesh.addNode(42.690030283492774, 41.2380386162628, 10.0, 40)
-    femmesh.addNode(42.690030283492774, 41.2380386162628, 0.0, 41)
-    femmesh.addNode(42.690030283492774, 41.2380386162628, -10.0, 42)
-    femmesh.addNode(63.999818806592856, 9.212346474981896, 15.0, 43)
-    femmesh.addNode(60.01604192862089, 18.043990520963415, 15.0, 44)
-    femmesh.addNode(55.09587941788642, 26.390272066439092, 15.0, 45)
-    femmesh.addNode(49.29763803556676, 34.15228286524248, 15.0, 46)
-    femmesh.addNode(65.62535979869793, 4.647028617606235, 15.0, 47)
-    femmesh.addNode(62.12819649531089, 13.682418127628925, 15.0, 48)
-    femmesh.addNode(57.66961731033909, 22.28413228352372, 15.0, 49)
-    femmesh.addNode(52.30245897654514, 30.35023581548828, 15.0, 50)
-    femmesh.addNode(46.09032541320741, 37.785140748279176, 15.0, 51)
-    femmesh.addNode(46.19322727035566, 8.67097193798193, -15.0, 52)
-    femmesh.addNode(43.800606197903406, 17.044262867492556, -15.0, 53)
-    femmesh.addNode(39.904277269180554, 24.83241139366776, -15.0, 54)
-    femmesh.addNode(46.79787218296744, 4.354211656160271, -15.0, 55)
-    femmesh.addNode(45.191265924133425, 12.913151597276988, -15.0, 56)
-    femmesh.addNode(42.03320941143999, 21.028773301693853, -15.0, 57)
-    femmesh.addNode(37.432121107572975, 28.422461353443506, -15.0, 58)
-    femmesh.addNode(34.638004395907004, 31.768044501812312, 5.0, 59)
-    femmesh.addNode(34.638004395907004, 31.768044501812312, -5.0, 60)
-    femmesh.addNode(34.638004395907004, 31.768044501812312, 10.0, 61)
-    femmesh.addNode(34.638004395907004, 31.768044501812312, 0.0, 62)
-    femmesh.addNode(34.638004395907004, 31.768044501812312, -10.0, 63)
-    femmesh.addNode(46.19322727035566, 8.67097193798193, 15.0, 64)
-    femmesh.addNode(43.800606197903406, 17.044262867492556, 15.0, 65)
-    femmesh.addNode(39.904277269180554, 24.83241139366776, 15.0, 66)
-    femmesh.addNode(46.79787218296744, 4.354211656160271, 15.0, 67)
-    femmesh.addNode(45.191265924133425, 12.913151597276988, 15.0, 68)
-    femmesh.addNode(42.03320941143999, 21.028773301693853, 15.0, 69)
-    femmesh.addNode(37.432121107572975, 28.422461353443506, 15.0, 70)
-    femmesh.addNode(38.66401733969989, 36.503041559037555, -15.0, 71)
-    femmesh.addNode(36.65101086780346, 34.13554303042495, -15.0, 72)
-    femmesh.addNode(40.677023811596314, 38.87054008765016, -15.0, 73)
-    femmesh.addNode(38.66401733969989, 36.503041559037555, 14.999999999999998, 74)
-    femmesh.addNode(36.65101086780346, 34.13554303042495, 14.999999999999998, 75)
-    femmesh.addNode(40.677023811596314, 38.87054008765016, 14.999999999999998, 76)
-    femmesh.addNode(35.32579297658627, 47.5832789911784, -15.0, 77)
-    femmesh.addNode(27.313472713524018, 53.08753103210219, -15.0, 78)
-    femmesh.addNode(18.748652971642247, 57.685131418930496, -15.0, 79)
-    femmesh.addNode(9.733508305478086, 61.321232789357865, -15.0, 80)
-    femmesh.addNode(0.3755854490099608, 63.95245804392724, -15.0, 81)
-    femmesh.addNode(-9.213479669853772, 65.54741781585977, -15.0, 82)
-    femmesh.addNode(-18.91929369708178, 66.08708493247548, -15.0, 83)
-    femmesh.addNode(-28.6260705152146, 65.56502140104357, -15.0, 84)
-    femmesh.addNode(-38.21801252111828, 63.98745521122078, -15.0, 85)
-    femmesh.addNode(-47.58069204075702, 61.37320603785794, -15.0, 86)
-    femmesh.addNode(-56.60241640131075, 57.75346073050791, -15.0, 87)
-    femmesh.addNode(-65.17556037592391, 53.17140126794695, -15.0, 88)
-    femmesh.addNode(-73.19785010560273, 47.6816896160493, -15.0, 89)
-    femmesh.addNode(-80.57358318163332, 41.34981563443539, -15.0, 90)
-    femmesh.addNode(-87.2147703334718, 34.251315811082094, -15.0, 91)
-    femmesh.addNode(-93.04218510226825, 26.470872145049665, -15.0, 92)
-    femmesh.addNode(-97.986308977879, 18.101301927260206, -15.0, 93)
-    femmesh.addNode(-101.98816072429543, 9.242450470801689, -15.0, 94)
-    femmesh.addNode(39.09460672499932, 44.51127646592185, -15.0, 95)
-    femmesh.addNode(31.39483750637218, 50.444877439005026, -15.0, 96)
-    femmesh.addNode(23.09387991153123, 55.50335245985313, -15.0, 97)
-    femmesh.addNode(14.290760734973684, 59.62635613329513, -15.0, 98)
-    femmesh.addNode(5.090497339295439, 62.764702828297985, -15.0, 99)
-    femmesh.addNode(-4.397155156025429, 64.88095344103824, -15.0, 100)
-    femmesh.addNode(-14.059013205213652, 65.94986202704051, -15.0, 101)
-    femmesh.addNode(-23.779815066407895, 65.95867697425602, -15.0, 102)
-    femmesh.addNode(-33.443595823843, 64.90729312421887, -15.0, 103)
-    femmesh.addNode(-42.93507079858898, 62.80825302654044, -15.0, 104)
-    femmesh.addNode(-52.1410108443624, 59.686597311776836, -15.0, 105)
-    femmesh.addNode(-60.95159312173173, 55.57956596765534, -15.0, 106)
-    femmesh.addNode(-69.26171123657157, 50.53615408230421, -15.0, 107)
-    femmesh.addNode(-76.97222911338667, 44.61652735427431, -15.0, 108)
-    femmesh.addNode(-83.991163645345, 37.89130434206318, -15.0, 109)
-    femmesh.addNode(-90.23478201252257, 30.440714015590114, -15.0, 110)
-    femmesh.addNode(-95.62860057783284, 22.353638659665318, -15.0, 111)
-    femmesh.addNode(-100.10827344424894, 13.726553547196058, -15.0, 112)
-    femmesh.addNode(-103.62036007321983, 4.662376031365003, -15.0, 113)
-    femmesh.addNode(-105.0, 5.329070518200751e-15, -5.0, 114)
-    femmesh.addNode(-105.0, 5.329070518200751e-15, 5.0, 115)
-    femmesh.addNode(-105.0, 5.329070518200751e-15, -10.0, 116)
-    femmesh.addNode(-105.0, 5.329070518200751e-15, 0.0, 117)
-    femmesh.addNode(-105.0, 5.329070518200751e-15, 10.0, 118)
-    femmesh.addNode(35.32579297658627, 47.5832789911784, 15.0, 119)
-    femmesh.addNode(27.313472713524018, 53.08753103210219, 15.0, 120)
-    femmesh.addNode(18.748652971642247, 57.685131418930496, 15.0, 121)
-    femmesh.addNode(9.733508305478086, 61.321232789357865, 15.0, 122)
-    femmesh.addNode(0.3755854490099608, 63.95245804392724, 15.0, 123)
-    femmesh.addNode(-9.213479669853772, 65.54741781585977, 15.0, 124)
-    femmesh.addNode(-18.91929369708178, 66.08708493247548, 15.0, 125)
-    femmesh.addNode(-28.6260705152146, 65.56502140104357, 15.0, 126)
-    femmesh.addNode(-38.21801252111828, 63.98745521122078, 15.0, 127)
-    femmesh.addNode(-47.58069204075702, 61.37320603785794, 15.0, 128)
-    femmesh.addNode(-56.60241640131075, 57.75346073050791, 15.0, 129)
-    femmesh.addNode(-65.17556037592391, 53.17140126794695, 15.0, 130)
-    femmesh.addNode(-73.19785010560273, 47.6816896160493, 15.0, 131)
-    femmesh.addNode(-80.57358318163332, 41.34981563443539, 15.0, 132)
-    femmesh.addNode(-87.2147703334718, 34.251315811082094, 15.0, 133)
-    femmesh.addNode(-93.04218510226825, 26.470872145049665, 15.0, 134)
-    femmesh.addNode(-97.986308977879, 18.101301927260206, 15.0, 135)
-    femmesh.addNode(-101.98816072429543, 9.242450470801689, 15.0, 136)
-    femmesh.addNode(39.09460672499932, 44.51127646592185, 15.0, 137)
-    femmesh.addNode(31.39483750637218, 50.444877439005026, 15.0, 138)
-    femmesh.addNode(23.09387991153123, 55.50335245985313, 15.0, 139)
-    femmesh.addNode(14.290760734973684, 59.62635613329513, 15.0, 140)
-    femmesh.addNode(5.090497339295439, 62.764702828297985, 15.0, 141)
-    femmesh.addNode(-4.397155156025429, 64.88095344103824, 15.0, 142)
-    femmesh.addNode(-14.059013205213652, 65.94986202704051, 15.0, 143)
-    femmesh.addNode(-23.779815066407895, 65.95867697425602, 15.0, 144)
-    femmesh.addNode(-33.443595823843, 64.90729312421887, 15.0, 145)
-    femmesh.addNode(-42.93507079858898, 62.80825302654044, 15.0, 146)
-    femmesh.addNode(-52.1410108443624, 59.686597311776836, 15.0, 147)
-    femmesh.addNode(-60.95159312173173, 55.57956596765534, 15.0, 148)
-    femmesh.addNode(-69.26171123657157, 50.53615408230421, 15.0, 149)
-    femmesh.addNode(-76.97222911338667, 44.61652735427431, 15.0, 150)
-    femmesh.addNode(-83.991163645345, 37.89130434206318, 15.0, 151)
-    femmesh.addNode(-90.23478201252257, 30.440714015590114, 15.0, 152)
-    femmesh.addNode(-95.62860057783284, 22.353638659665318, 15.0, 153)
-    femmesh.addNode(-100.10827344424894, 13.726553547196058, 15.0, 154)
-    femmesh.addNode(-103.62036007321983, 4.662376031365003, 15.0, 155)
-    femmesh.addNode(27.63815953958637, 38.014893624267465, -15.0, 156)
-    femmesh.addNode(19.53703034039182, 42.74698171191283, -15.0, 157)
-    femmesh.addNode(10.657418565709262, 45.77575154506232, -15.0, 158)
-    femmesh.addNode(1.353145800664509, 46.980517200666746, -15.0, 159)
-    femmesh.addNode(-8.00504510902959, 46.31327296577517, -15.0, 160)
-    femmesh.addNode(-17.044262867492453, 43.80060619790345, -15.0, 161)
-    femmesh.addNode(-25.404326147347177, 39.54263791149008, -15.0, 162)
-    femmesh.addNode(-32.75211556043943, 33.70903330437735, -15.0, 163)
-    femmesh.addNode(-38.794847304585026, 26.5322411909347, -15.0, 164)
-    femmesh.addNode(-43.29173957778, 18.298231726854826, -15.0, 165)
-    femmesh.addNode(-46.06360689392255, 9.33510149501177, -15.0, 166)
-    femmesh.addNode(31.294343412504944, 35.066566275873214, -15.0, 167)
-    femmesh.addNode(23.70596548277053, 40.583582894191245, -15.0, 168)
-    femmesh.addNode(15.172987440228649, 44.483485161784074, -15.0, 169)
-    femmesh.addNode(6.035418723745092, 46.61087556385384, -15.0, 170)
-    femmesh.addNode(-3.342640396364229, 46.88098500650977, -15.0, 171)
-    femmesh.addNode(-12.587506945271354, 45.28305056975231, -15.0, 172)
-    femmesh.addNode(-21.33080520795491, 41.880744372328, -15.0, 173)
-    femmesh.addNode(-29.224145217710426, 36.809636459685024, -15.0, 174)
-    femmesh.addNode(-35.95300488223746, 30.271792810103097, -15.0, 175)
-    femmesh.addNode(-41.24926259295619, 22.527723709628212, -15.0, 176)
-    femmesh.addNode(-44.90188093674636, 13.886003325012343, -15.0, 177)
-    femmesh.addNode(-46.7653158014268, 4.6909740985024415, -15.0, 178)
-    femmesh.addNode(-56.66666666666666, 0.0, -15.0, 179)
-    femmesh.addNode(-66.33333333333329, 0.0, -15.0, 180)
-    femmesh.addNode(-75.99999999999993, 0.0, -15.0, 181)
-    femmesh.addNode(-85.66666666666656, 0.0, -15.0, 182)
-    femmesh.addNode(-95.33333333333327, 0.0, -15.0, 183)
-    femmesh.addNode(-51.83333333333333, 0.0, -15.0, 184)
-    femmesh.addNode(-61.49999999999997, 0.0, -15.0, 185)
-    femmesh.addNode(-71.1666666666666, 0.0, -15.0, 186)
-    femmesh.addNode(-80.83333333333324, 0.0, -15.0, 187)
-    femmesh.addNode(-90.49999999999991, 0.0, -15.0, 188)
-    femmesh.addNode(-100.16666666666663, 0.0, -15.0, 189)
-    femmesh.addNode(-47.0, 2.8779199844611363e-15, -5.0, 190)
-    femmesh.addNode(-47.0, 2.8779199844611363e-15, 5.0, 191)
-    femmesh.addNode(-47.0, 2.8779199844611363e-15, -10.0, 192)
-    femmesh.addNode(-47.0, 2.8779199844611363e-15, 0.0, 193)
-    femmesh.addNode(-47.0, 2.8779199844611363e-15, 10.0, 194)
-    femmesh.addNode(-56.66666666666666, 0.0, 15.0, 195)
-    femmesh.addNode(-66.33333333333329, 0.0, 15.0, 196)
-    femmesh.addNode(-75.99999999999993, 0.0, 15.0, 197)
-    femmesh.addNode(-85.66666666666656, 0.0, 15.0, 198)
-    femmesh.addNode(-95.33333333333327, 0.0, 15.0, 199)
-    femmesh.addNode(-51.83333333333333, 0.0, 15.0, 200)
-    femmesh.addNode(-61.49999999999997, 0.0, 15.0, 201)
-    femmesh.addNode(-71.1666666666666, 0.0, 15.0, 202)
-    femmesh.addNode(-80.83333333333324, 0.0, 15.0, 203)
-    femmesh.addNode(-90.49999999999991, 0.0, 15.0, 204)
-    femmesh.addNode(-100.16666666666663, 0.0, 15.0, 205)
-    femmesh.addNode(27.63815953958637, 38.014893624267465, 15.0, 206)
-    femmesh.addNode(19.53703034039182, 42.74698171191283, 15.0, 207)
-    femmesh.addNode(10.657418565709262, 45.77575154506232, 15.0, 208)
-    femmesh.addNode(1.353145800664509, 46.980517200666746, 15.0, 209)
-    femmesh.addNode(-8.00504510902959, 46.31327296577517, 15.0, 210)
-    femmesh.addNode(-17.044262867492453, 43.80060619790345, 15.0, 211)
-    femmesh.addNode(-25.404326147347177, 39.54263791149008, 15.0, 212)
-    femmesh.addNode(-32.75211556043943, 33.70903330437735, 15.0, 213)
-    femmesh.addNode(-38.794847304585026, 26.5322411909347, 15.0, 214)
-    femmesh.addNode(-43.29173957778, 18.298231726854826, 15.0, 215)
-    femmesh.addNode(-46.06360689392255, 9.33510149501177, 15.0, 216)
-    femmesh.addNode(31.294343412504944, 35.066566275873214, 15.0, 217)
-    femmesh.addNode(23.70596548277053, 40.583582894191245, 15.0, 218)
-    femmesh.addNode(15.172987440228649, 44.483485161784074, 15.0, 219)
-    femmesh.addNode(6.035418723745092, 46.61087556385384, 15.0, 220)
-    femmesh.addNode(-3.342640396364229, 46.88098500650977, 15.0, 221)
-    femmesh.addNode(-12.587506945271354, 45.28305056975231, 15.0, 222)
-    femmesh.addNode(-21.33080520795491, 41.880744372328, 15.0, 223)
-    femmesh.addNode(-29.224145217710426, 36.809636459685024, 15.0, 224)
-    femmesh.addNode(-35.95300488223746, 30.271792810103097, 15.0, 225)
-    femmesh.addNode(-41.24926259295619, 22.527723709628212, 15.0, 226)
-    femmesh.addNode(-44.90188093674636, 13.886003325012343, 15.0, 227)
-    femmesh.addNode(-46.7653158014268, 4.6909740985024415, 15.0, 228)
-    femmesh.addNode(57.46874999999999, 0.0, 0.0, 229)
-    femmesh.addNode(54.22895408163265, 0.0, 8.201530612244895, 230)
-    femmesh.addNode(54.22895408163265, 0.0, -8.201530612244898, 231)
-    femmesh.addNode(60.77824344023323, 0.0, -8.850218658892128, 232)
-    femmesh.addNode(60.778243440233226, 0.0, 8.850218658892128, 233)
-    femmesh.addNode(63.889121720116606, 0.0, -6.925109329446064, 234)
-    femmesh.addNode(63.88912172011662, 0.0, -11.925109329446064, 235)
-    femmesh.addNode(58.88912172011662, 0.0, -11.925109329446064, 236)
-    femmesh.addNode(63.88912172011661, 0.0, 11.925109329446066, 237)
-    femmesh.addNode(63.889121720116606, 0.0, 6.925109329446066, 238)
-    femmesh.addNode(58.88912172011661, 0.0, 11.925109329446066, 239)
-    femmesh.addNode(50.614477040816325, 0.0, -11.60076530612245, 240)
-    femmesh.addNode(50.614477040816325, 0.0, -6.600765306122449, 241)
-    femmesh.addNode(55.614477040816325, 0.0, -11.60076530612245, 242)
-    femmesh.addNode(50.614477040816325, 0.0, 6.600765306122447, 243)
-    femmesh.addNode(50.614477040816325, 0.0, 11.600765306122447, 244)
-    femmesh.addNode(55.614477040816325, 0.0, 11.600765306122447, 245)
-    femmesh.addNode(62.234374999999986, 0.0, 2.5, 246)
-    femmesh.addNode(62.234374999999986, 0.0, -2.5, 247)
-    femmesh.addNode(59.12349672011661, 0.0, -4.425109329446064, 248)
-    femmesh.addNode(59.123496720116606, 0.0, 4.425109329446066, 249)
-    femmesh.addNode(52.234375, 0.0, -2.5, 250)
-    femmesh.addNode(52.234375, 0.0, 2.5, 251)
-    femmesh.addNode(55.848852040816325, 0.0, -4.100765306122449, 252)
-    femmesh.addNode(55.848852040816325, 0.0, 4.100765306122447, 253)
-    femmesh.addNode(57.503598760932945, 0.0, -8.525874635568513, 254)
-    femmesh.addNode(57.50359876093294, 0.0, 8.525874635568513, 255)
-    femmesh.addNode(47.238442399874955, 36.530108903366994, 10.954526826644063, 256)
-    femmesh.addNode(52.63370773954415, 29.903898362562668, 9.835250882075648, 257)
-    femmesh.addNode(51.26132656273781, 31.71628946364279, 2.5404726113296086, 258)
-    femmesh.addNode(58.600222433327275, 20.666996218686005, 4.806276554303299, 259)
-    femmesh.addNode(58.15937659976932, 21.442849483794188, -8.517109076660983, 260)
-    femmesh.addNode(54.871931176078334, 26.725189419899625, -3.657723613563622, 261)
-    femmesh.addNode(62.20730072882297, 13.506543655981009, 7.803634845829052, 262)
-    femmesh.addNode(64.95941449022892, 6.613664134506017, 5.1900425696622285, 263)
-    femmesh.addNode(62.23576931545061, 13.442998405401948, -5.032717752504578, 264)
-    femmesh.addNode(51.94395641220635, 30.826818664141893, -9.859243873340123, 265)
-    femmesh.addNode(46.05702352792616, 37.82083283687095, -9.490962002469416, 266)
-    femmesh.addNode(65.82058781647822, 4.0401896709274325, -4.613808172020667, 267)
-    femmesh.addNode(48.69200311539217, 34.86940872662652, -3.603279166162233, 268)
-    femmesh.addNode(66.43417986166925, 2.027067623076448, -9.806904086010334, 269)
-    femmesh.addNode(66.43417986166925, 2.027067623076448, -4.806904086010334, 270)
-    femmesh.addNode(64.95004479620401, 6.640293583653666, -9.806904086010334, 271)
-    femmesh.addNode(66.04402261056548, 3.3266759843503735, 5.0950212848311125, 272)
-    femmesh.addNode(66.04402261056548, 3.3266759843503735, 10.095021284831112, 273)
-    femmesh.addNode(64.48972801035056, 7.916739050543466, 10.095021284831112, 274)
-    femmesh.addNode(44.39655539777662, 39.55212583720848, -12.245481001234708, 275)
-    femmesh.addNode(47.70255620965375, 36.00884073891976, -12.245481001234708, 276)
-    femmesh.addNode(44.39655539777661, 39.55212583720848, -7.245481001234708, 277)
-    femmesh.addNode(45.00753612911673, 38.92590643145756, 12.977263413322031, 278)
-    femmesh.addNode(45.007536129116716, 38.92590643145758, 7.9772634133220315, 279)
-    femmesh.addNode(48.27854597789556, 35.35029386504618, 12.977263413322031, 280)
-    femmesh.addNode(66.43417986166925, 2.027067623076448, 0.19309591398966575, 281)
-    femmesh.addNode(65.39981035148533, 5.330209398775072, 0.2881171988207818, 282)
-    femmesh.addNode(61.15892360718952, 15.759423837557367, -10.016358876252289, 283)
-    femmesh.addNode(63.1450345753623, 11.339030882401598, -10.016358876252289, 284)
-    femmesh.addNode(64.16117867734891, 8.792300297687095, -4.823262962262621, 285)
-    femmesh.addNode(59.106199489488446, 19.753520498045216, -11.758554538330491, 286)
-    femmesh.addNode(56.66807362285934, 23.941605133575035, -11.758554538330491, 287)
-    femmesh.addNode(60.29851806115337, 17.494361387712406, -6.77491341458278, 288)
-    femmesh.addNode(50.64064965325733, 32.50534881437423, -12.429621936670062, 289)
-    femmesh.addNode(53.55383677541431, 28.632642855075783, -12.429621936670062, 290)
-    femmesh.addNode(55.2001619385596, 26.233189204044596, -9.188176475000553, 291)
-    femmesh.addNode(49.09034949778979, 34.39946142919641, -9.67510293790477, 292)
-    femmesh.addNode(45.769340766101195, 38.127538436679245, 0.6983604169188844, 293)
-    femmesh.addNode(45.769340766101195, 38.127538436679245, -4.301639583081116, 294)
-    femmesh.addNode(49.29231249643867, 34.158656057671976, 6.7474997189868375, 295)
-    femmesh.addNode(47.1472302528358, 36.63159171245417, 3.7702363056648025, 296)
-    femmesh.addNode(49.9946797412116, 33.30752856223579, -0.5314032774163131, 297)
-    femmesh.addNode(47.39091613132585, 36.35976492201267, -6.547120584315824, 298)
-    femmesh.addNode(63.13162946689242, 11.371162143460172, 11.401817422914526, 299)
-    femmesh.addNode(61.143789460533384, 15.790777824150698, 11.401817422914526, 300)
-    femmesh.addNode(63.6552412197027, 10.088804799150306, 6.496838707745638, 301)
-    femmesh.addNode(59.31911392115899, 19.361420982509475, 9.903138277151648, 302)
-    femmesh.addNode(56.90201447142768, 23.56167584453817, 9.903138277151648, 303)
-    femmesh.addNode(60.48443478725824, 17.127409068520112, 6.304955700066174, 304)
-    femmesh.addNode(50.9979112211862, 32.053405960963175, 12.417625441037824, 305)
-    femmesh.addNode(53.885969402251845, 28.16192416109995, 12.417625441037824, 306)
-    femmesh.addNode(55.759759021911336, 25.377684070978585, 7.320763718189475, 307)
-    femmesh.addNode(50.01564396967834, 33.28179108960744, 10.394888854359856, 308)
-    femmesh.addNode(51.953304223885596, 30.814476007949022, 6.18786174670263, 309)
-    femmesh.addNode(55.13690807001733, 26.328555925711182, 3.6733745828164537, 310)
-    femmesh.addNode(53.109824341158, 29.25198741680855, -0.5586255011170067, 311)
-    femmesh.addNode(56.79662760297222, 23.73335657175321, 0.5742764703698384, 312)
-    femmesh.addNode(51.89900528250705, 30.88610896876882, -3.6305013898629284, 313)
-    femmesh.addNode(58.380771902931116, 21.055475368713115, -1.855416261178842, 314)
-    femmesh.addNode(56.561827405912084, 24.112755376123335, -6.0874163451123025, 315)
-    femmesh.addNode(60.50009185407299, 17.096312909126016, -0.11322059910063942, 316)
-    femmesh.addNode(62.221541236619686, 13.474773814810565, 1.3854585466622353, 317)
-    femmesh.addNode(53.43698064600693, 28.796732187940126, -6.7584837434518725, 318)
-    femmesh.addNode(50.34744373181904, 32.87181519527864, -6.731261519751179, 319)
-    femmesh.addNode(63.66814464952006, 10.056468807295214, 0.07866240857882545, 320)
-    femmesh.addNode(43.800606197903406, 17.044262867492556, -7.5, 321)
-    femmesh.addNode(46.668106566080546, 5.575646109371513, -8.606955786149133, 322)
-    femmesh.addNode(39.759195453394845, 25.06404550144982, -1.1491951039564743, 323)
-    femmesh.addNode(43.800606197903406, 17.04426286749256, 1.2456986723207422, 324)
-    femmesh.addNode(38.162073491775004, 27.434579399151783, -8.606955786149134, 325)
-    femmesh.addNode(46.7750359664769, 4.593039335210692, 10.254468986740992, 326)
-    femmesh.addNode(46.242870208040905, 8.402199409814243, -1.1491951039564743, 327)
-    femmesh.addNode(37.576718711171964, 28.23101505262357, 10.254468986740992, 328)
-    femmesh.addNode(45.74145189178891, 10.803683576963936, 5.0, 329)
-    femmesh.addNode(43.800606197903406, 17.044262867492556, 7.5, 330)
-    femmesh.addNode(41.01286196509451, 22.95528595840409, 5.0, 331)
-    femmesh.addNode(46.916953271742756, 2.7927577225937683, -6.803477893074566, 332)
-    femmesh.addNode(46.916953271742756, 2.7927577225937683, -11.803477893074566, 333)
-    femmesh.addNode(46.456453706313276, 7.1272651861125, -11.803477893074566, 334)
-    femmesh.addNode(46.943725301814375, 2.299272664951444, 7.627234493370494, 335)
-    femmesh.addNode(46.943725301814375, 2.299272664951444, 12.627234493370494, 336)
-    femmesh.addNode(46.52882843889834, 6.638382642147544, 12.627234493370494, 337)
-    femmesh.addNode(39.054853729918484, 26.14800948704647, -11.803477893074568, 338)
-    femmesh.addNode(36.464469899645266, 29.653708620303536, -11.803477893074568, 339)
-    femmesh.addNode(36.464469899645266, 29.653708620303536, -6.803477893074568, 340)
-    femmesh.addNode(36.1506459512016, 30.03549229346627, 7.627234493370494, 341)
-    femmesh.addNode(36.1506459512016, 30.03549229346627, 12.627234493370494, 342)
-    femmesh.addNode(38.77774891912265, 26.557224794121137, 12.627234493370494, 343)
-    femmesh.addNode(46.81033486196143, 4.21812163303036, 1.9254024480217637, 344)
-    femmesh.addNode(46.81033486196143, 4.21812163303036, -3.0745975519782363, 345)
-    femmesh.addNode(46.47698088484659, 6.992156164560759, -4.878075445052804, 346)
-    femmesh.addNode(46.68430270933732, 5.4383711295718395, 5.0, 347)
-    femmesh.addNode(46.36235711093179, 7.715688116975241, 7.627234493370494, 348)
-    femmesh.addNode(46.00783258959911, 9.60621363532074, 1.9254024480217637, 349)
-    femmesh.addNode(45.191265924133425, 12.913151597276988, -11.25, 350)
-    femmesh.addNode(43.800606197903406, 17.044262867492556, -11.25, 351)
-    femmesh.addNode(45.59637364834206, 11.400469732461813, -8.053477893074566, 352)
-    femmesh.addNode(42.03320941143999, 21.028773301693857, -11.25, 353)
-    femmesh.addNode(41.30931958874684, 22.41740652071012, -8.053477893074568, 354)
-    femmesh.addNode(37.34932043563115, 28.531180539833, -3.0745975519782363, 355)
-    femmesh.addNode(37.34932043563115, 28.531180539833, 1.9254024480217637, 356)
-    femmesh.addNode(38.08122337292529, 27.54669538114089, 5.0, 357)
-    femmesh.addNode(40.39978999458452, 24.017846872554337, 1.9254024480217637, 358)
-    femmesh.addNode(39.383230912239135, 25.650752872250205, 7.627234493370494, 359)
-    femmesh.addNode(38.97865949781254, 26.261456619037503, -4.878075445052804, 360)
-    femmesh.addNode(45.191265924133425, 12.913151597276988, 11.25, 361)
-    femmesh.addNode(43.800606197903406, 17.044262867492556, 11.25, 362)
-    femmesh.addNode(45.9797066421196, 9.739947489828817, 10.0, 363)
-    femmesh.addNode(44.87963067143938, 13.957748772463189, 6.25, 364)
-    femmesh.addNode(42.03320941143999, 21.028773301693857, 11.25, 365)
-    femmesh.addNode(40.46945459775425, 23.900277081245466, 10.0, 366)
-    femmesh.addNode(42.50960060920695, 20.048288107609395, 6.25, 367)
-    femmesh.addNode(45.22862175678801, 12.781696834982538, -4.324597551978236, 368)
-    femmesh.addNode(41.971887512656096, 21.150902075914946, -4.324597551978236, 369)
-    femmesh.addNode(43.800606197903406, 17.044262867492556, -3.127150663839629, 370)
-    femmesh.addNode(41.971887512656096, 21.150902075914946, 0.04825178418213483, 371)
-    femmesh.addNode(45.22862175678801, 12.781696834982538, 0.04825178418213483, 372)
-    femmesh.addNode(42.50960060920695, 20.048288107609398, 3.122849336160371, 373)
-    femmesh.addNode(44.87963067143938, 13.957748772463194, 3.122849336160371, 374)
-    femmesh.addNode(43.800606197903406, 17.044262867492556, 4.372849336160371, 375)
-    femmesh.addNode(55.04946863898643, 10.489346462527948, -15.000000000000002, 376)
-    femmesh.addNode(51.88132605064121, 17.982030494319886, -15.000000000000002, 377)
-    femmesh.addNode(41.902750973421526, 30.864054573489916, -15.000000000000002, 378)
-    femmesh.addNode(46.980412990766645, 25.210885710108613, -15.000000000000002, 379)
-    femmesh.addNode(51.31067397733552, 4.7900796001274735, -15.000000000000002, 380)
-    femmesh.addNode(60.49990940329642, 4.60617323749095, -15.000000000000002, 381)
-    femmesh.addNode(49.15533698866776, 2.395039800063735, -15.000000000000002, 382)
-    femmesh.addNode(54.15533698866776, 2.395039800063735, -15.000000000000002, 383)
-    femmesh.addNode(48.75195062384558, 6.730525769054701, -15.000000000000002, 384)
-    femmesh.addNode(43.98082768763332, 35.32766221214002, -15.000000000000002, 385)
-    femmesh.addNode(38.27037768466426, 31.31604953765111, -15.000000000000002, 386)
-    femmesh.addNode(40.90351412130104, 27.84823298357884, -15.000000000000002, 387)
-    femmesh.addNode(40.28338415656071, 33.68354806626374, -15.000000000000002, 388)
-    femmesh.addNode(56.02473431949321, 5.244673231263974, -15.000000000000002, 389)
-    femmesh.addNode(59.524643722789655, 9.850846468754924, -15.000000000000002, 390)
-    femmesh.addNode(53.18007130816097, 7.639713031327709, -15.000000000000002, 391)
-    femmesh.addNode(57.53275528380366, 14.266668491745682, -15.000000000000002, 392)
-    femmesh.addNode(55.94868398963104, 18.013010507641653, -15.000000000000002, 393)
-    femmesh.addNode(53.48860273426383, 22.18615128037949, -15.000000000000002, 394)
-    femmesh.addNode(53.46539734481383, 14.235688478423917, -15.000000000000002, 395)
-    femmesh.addNode(51.03814620432653, 25.800578888273854, -15.000000000000002, 396)
-    femmesh.addNode(48.13902551316671, 29.68158428767555, -15.000000000000002, 397)
-    femmesh.addNode(49.43086952070393, 21.59645810221425, -15.000000000000002, 398)
-    femmesh.addNode(45.60019450449414, 32.508168719366196, -15.000000000000002, 399)
-    femmesh.addNode(44.441581982094085, 28.037470141799265, -15.000000000000002, 400)
-    femmesh.addNode(47.84096612427232, 17.51314668090622, -15.000000000000002, 401)
-    femmesh.addNode(49.03727666049844, 13.326501216150909, -15.000000000000002, 402)
-    femmesh.addNode(50.62134795467106, 9.58015920025494, -15.000000000000002, 403)
-    femmesh.addNode(43.4423451299736, 25.021648551888184, -15.000000000000002, 404)
-    femmesh.addNode(45.39050959433503, 21.127574288800584, -15.000000000000002, 405)
-    femmesh.addNode(55.04946863898643, 10.489346462527948, 14.999999999999998, 406)
-    femmesh.addNode(51.88132605064121, 17.982030494319886, 14.999999999999998, 407)
-    femmesh.addNode(41.902750973421526, 30.864054573489916, 14.999999999999998, 408)
-    femmesh.addNode(46.980412990766645, 25.210885710108613, 14.999999999999998, 409)
-    femmesh.addNode(51.31067397733552, 4.7900796001274735, 14.999999999999998, 410)
-    femmesh.addNode(60.49990940329642, 4.60617323749095, 14.999999999999998, 411)
-    femmesh.addNode(54.15533698866776, 2.395039800063735, 14.999999999999998, 412)
-    femmesh.addNode(49.15533698866776, 2.395039800063735, 14.999999999999998, 413)
-    femmesh.addNode(48.75195062384558, 6.730525769054701, 14.999999999999998, 414)
-    femmesh.addNode(43.98082768763332, 35.32766221214002, 14.999999999999998, 415)
-    femmesh.addNode(40.90351412130104, 27.84823298357884, 14.999999999999998, 416)
-    femmesh.addNode(38.27037768466426, 31.31604953765111, 14.999999999999998, 417)
-    femmesh.addNode(40.28338415656071, 33.68354806626374, 14.999999999999998, 418)
-    femmesh.addNode(59.524643722789655, 9.850846468754924, 14.999999999999998, 419)
-    femmesh.addNode(56.02473431949321, 5.244673231263974, 14.999999999999998, 420)
-    femmesh.addNode(53.18007130816097, 7.639713031327709, 14.999999999999998, 421)
-    femmesh.addNode(57.53275528380366, 14.266668491745682, 14.999999999999998, 422)
-    femmesh.addNode(53.48860273426383, 22.18615128037949, 14.999999999999998, 423)
-    femmesh.addNode(55.94868398963104, 18.013010507641653, 14.999999999999998, 424)
-    femmesh.addNode(53.46539734481383, 14.235688478423917, 14.999999999999998, 425)
-    femmesh.addNode(48.13902551316671, 29.68158428767555, 14.999999999999998, 426)
-    femmesh.addNode(51.03814620432653, 25.800578888273854, 14.999999999999998, 427)
-    femmesh.addNode(49.43086952070393, 21.59645810221425, 14.999999999999998, 428)
-    femmesh.addNode(45.60019450449414, 32.508168719366196, 14.999999999999998, 429)
-    femmesh.addNode(44.441581982094085, 28.037470141799265, 14.999999999999998, 430)
-    femmesh.addNode(49.03727666049844, 13.326501216150909, 14.999999999999998, 431)
-    femmesh.addNode(47.84096612427232, 17.51314668090622, 14.999999999999998, 432)
-    femmesh.addNode(50.62134795467106, 9.58015920025494, 14.999999999999998, 433)
-    femmesh.addNode(45.39050959433503, 21.127574288800584, 14.999999999999998, 434)
-    femmesh.addNode(43.4423451299736, 25.021648551888184, 14.999999999999998, 435)
-    femmesh.addNode(38.66401733969989, 36.503041559037555, 1.0658141036401503e-14, 436)
-    femmesh.addNode(38.66401733969988, 36.503041559037555, 8.852919371111625, 437)
-    femmesh.addNode(38.66401733969988, 36.503041559037555, -8.852919371111625, 438)
-    femmesh.addNode(40.67702381159634, 38.8705400876502, -11.926459685555812, 439)
-    femmesh.addNode(40.67702381159633, 38.870540087650184, -6.9264596855558125, 440)
-    femmesh.addNode(38.66401733969988, 36.503041559037555, -11.926459685555812, 441)
-    femmesh.addNode(40.67702381159633, 38.870540087650184, 6.9264596855558125, 442)
-    femmesh.addNode(40.67702381159634, 38.8705400876502, 11.926459685555812, 443)
-    femmesh.addNode(38.66401733969988, 36.503041559037555, 11.926459685555812, 444)
-    femmesh.addNode(36.65101086780344, 34.13554303042493, -6.9264596855558125, 445)
-    femmesh.addNode(36.65101086780344, 34.13554303042493, -11.926459685555812, 446)
-    femmesh.addNode(36.65101086780344, 34.13554303042493, 11.926459685555812, 447)
-    femmesh.addNode(36.65101086780344, 34.13554303042493, 6.9264596855558125, 448)
-    femmesh.addNode(40.67702381159633, 38.870540087650184, -2.499999999999993, 449)
-    femmesh.addNode(40.67702381159633, 38.870540087650184, 2.500000000000007, 450)
-    femmesh.addNode(38.66401733969988, 36.503041559037555, 4.426459685555818, 451)
-    femmesh.addNode(38.66401733969988, 36.503041559037555, -4.426459685555805, 452)
-    femmesh.addNode(36.65101086780345, 34.13554303042494, 2.500000000000007, 453)
-    femmesh.addNode(36.65101086780345, 34.13554303042494, -2.499999999999993, 454)
-    femmesh.addNode(-103.57641646478717, 4.796863097001655, 8.705986139099526, 455)
-    femmesh.addNode(-102.16866372633604, 8.77266040300604, 1.1548122563089578, 456)
-    femmesh.addNode(-99.89928828855058, 14.185708484914901, -7.451232709825969, 457)
-    femmesh.addNode(-97.21100385623447, 19.561100333428517, -1.4059210950695924, 458)
-    femmesh.addNode(-103.62036007321987, 4.662376031364893, -10.0, 459)
-    femmesh.addNode(35.94973740074872, 47.09802324480128, -4.5103349930887635, 460)
-    femmesh.addNode(31.617989536272365, 50.2910772605895, 6.999552127945467, 461)
-    femmesh.addNode(37.85751887132943, 45.557717753064594, 5.268977156063286, 462)
-    femmesh.addNode(29.196234551473136, 51.90772680918913, -0.4257740867036244, 463)
-    femmesh.addNode(23.24084290802865, 55.424285058369264, 7.585450995822267, 464)
-    femmesh.addNode(-92.00017501707222, 27.99855882055579, 5.4522417670237004, 465)
-    femmesh.addNode(-96.19749522739315, 21.376473864317088, 8.658956879034033, 466)
-    femmesh.addNode(-99.95046985040794, 14.073895255815327, 6.928484366166728, 467)
-    femmesh.addNode(30.67093852829103, 50.9369547391065, -8.60659377827604, 468)
-    femmesh.addNode(24.359299684020538, 54.810806016573224, -7.679708384671319, 469)
-    femmesh.addNode(20.125426523106174, 57.025854310930015, -0.412667376899444, 470)
-    femmesh.addNode(13.18672094357299, 60.06311199776991, 7.5000000000000036, 471)
-    femmesh.addNode(9.733508305478086, 61.321232789357865, 0.0, 472)
-    femmesh.addNode(3.9454105084721895, 63.07844746335071, 7.5000000000000036, 473)
-    femmesh.addNode(0.3755854490099608, 63.95245804392724, 0.0, 474)
-    femmesh.addNode(-5.569628641070931, 65.0679440103582, 7.5000000000000036, 475)
-    femmesh.addNode(-9.213479669853772, 65.54741781585977, 0.0, 476)
-    femmesh.addNode(-15.24488624847093, 66.00786781489765, 7.500000000000007, 477)
-    femmesh.addNode(-18.91929369708178, 66.08708493247548, 0.0, 478)
-    femmesh.addNode(-24.96494072099618, 65.88700599696436, 7.500000000000007, 479)
-    femmesh.addNode(-28.6260705152146, 65.56502140104357, 0.0, 480)
-    femmesh.addNode(-34.613836058901406, 64.70680038519924, 7.5, 481)
-    femmesh.addNode(-38.21801252111828, 63.98745521122078, 0.0, 482)
-    femmesh.addNode(-44.07646515980304, 62.48133031650352, 7.5000000000000036, 483)
-    femmesh.addNode(-47.58069204075702, 61.37320603785794, 0.0, 484)
-    femmesh.addNode(-53.239942996081396, 59.23714467570505, 7.5000000000000036, 485)
-    femmesh.addNode(-56.60241640131075, 57.75346073050791, 0.0, 486)
-    femmesh.addNode(-61.99495328435705, 55.012945178718084, 7.500000000000007, 487)
-    femmesh.addNode(-65.17556037592391, 53.17140126794695, 0.0, 488)
-    femmesh.addNode(-70.23705270385689, 49.85912459111279, 7.5, 489)
-    femmesh.addNode(-73.19785010560273, 47.6816896160493, 0.0, 490)
-    femmesh.addNode(-77.86794937336033, 43.83713678046615, 7.500000000000007, 491)
-    femmesh.addNode(-80.57358318163332, 41.34981563443539, 0.0, 492)
-    femmesh.addNode(-84.80509369492998, 37.009484994976305, 7.500000000000007, 493)
-    femmesh.addNode(-87.2147703334718, 34.251315811082094, 0.0, 494)
-    femmesh.addNode(-92.10331953221774, 27.85034318589238, -1.7263660516444101, 495)
-    femmesh.addNode(15.994475447271821, 58.91857445238256, -7.68860919114993, 496)
-    femmesh.addNode(-94.6953109870948, 23.89758931360129, -8.40873143264464, 497)
-    femmesh.addNode(-89.29928183556441, 31.667438246580023, -7.8786301597683615, 498)
-    femmesh.addNode(-83.17424974824468, 38.75287919712426, -7.499999999999999, 499)
-    femmesh.addNode(-76.0662249682937, 45.383870846605745, -7.499999999999999, 500)
-    femmesh.addNode(-68.27742507678484, 51.20011213956492, -7.499999999999999, 501)
-    femmesh.addNode(-59.90076705075654, 56.1322178605391, -7.499999999999999, 502)
-    femmesh.addNode(-51.03618075774982, 60.1213501448496, -7.5, 503)
-    femmesh.addNode(-41.78941683618329, 63.119920388600164, -7.5, 504)
-    femmesh.addNode(-32.2707851364745, 65.09215695991357, -7.499999999999999, 505)
-    femmesh.addNode(-22.59383877223656, 66.0145319388788, -7.499999999999999, 506)
-    femmesh.addNode(-12.874019331149086, 65.876041784704, -7.5, 507)
-    femmesh.addNode(-3.227236985050391, 64.67833082657843, -7.499999999999998, 508)
-    femmesh.addNode(6.243519618326523, 62.43209628811569, -7.499999999999999, 509)
-    femmesh.addNode(39.393438897877346, 44.252635694918524, -9.75516749654438, 510)
-    femmesh.addNode(39.393438897877346, 44.252635694918524, -4.755167496544381, 511)
-    femmesh.addNode(35.63830390025676, 47.34134379622161, -9.75516749654438, 512)
-    femmesh.addNode(40.31311203785363, 43.44188578812073, 10.134488578031643, 513)
-    femmesh.addNode(40.31311203785363, 43.44188578812073, 5.134488578031643, 514)
-    femmesh.addNode(36.60088068502202, 46.58202829578886, 10.134488578031643, 515)
-    femmesh.addNode(-104.34202514261811, 2.340611275287845, -12.5, 516)
-    femmesh.addNode(-102.83554336586883, 6.963561549921348, -12.5, 517)
-    femmesh.addNode(-104.34202514261811, 2.340611275287845, -7.5, 518)
-    femmesh.addNode(-104.32192530284918, 2.408437893352783, 11.852993069549761, 519)
-    femmesh.addNode(-104.32192530284918, 2.408437893352783, 6.852993069549761, 520)
-    femmesh.addNode(-102.81176942359305, 7.030189271971043, 11.852993069549761, 521)
-    femmesh.addNode(40.31311203785363, 43.44188578812073, 0.13448857803164316, 522)
-    femmesh.addNode(36.908932864297356, 46.334440794456725, 0.3793210814872623, 523)
-    femmesh.addNode(33.02539597331236, 49.29763442895286, -11.80329688913802, 524)
-    femmesh.addNode(29.004250280131085, 52.03104692976933, -11.80329688913802, 525)
-    femmesh.addNode(33.345542376756214, 49.06589751705897, -6.558464385682402, 526)
-    femmesh.addNode(25.84466463843255, 53.96336007437536, -11.33985419233566, 527)
-    femmesh.addNode(21.579433616401904, 56.297661022007674, -11.33985419233566, 528)
-    femmesh.addNode(27.555429182747748, 52.939557304239514, -8.143151081473679, 529)
-    femmesh.addNode(17.376792443422612, 58.31352715496753, -11.344304595574965, 530)
-    femmesh.addNode(12.886629957848292, 60.178895064670854, -11.344304595574965, 531)
-    femmesh.addNode(20.230689003786832, 56.974248399881645, -7.684158787910625, 532)
-    femmesh.addNode(7.99422883321569, 61.894618892493625, -11.25, 533)
-    femmesh.addNode(3.3225000665166675, 63.24224900339452, -11.25, 534)
-    femmesh.addNode(11.170187624595687, 60.81740146442017, -7.594304595574965, 535)
-    femmesh.addNode(-1.4220785426680678, 64.33399354502373, -11.25, 536)
-    femmesh.addNode(-6.212972615675763, 65.16374686175685, -11.25, 537)
-    femmesh.addNode(1.5388717475825224, 63.68478169763168, -7.499999999999998, 538)
-    femmesh.addNode(-11.042053000993535, 65.73062709421895, -11.25, 539)
-    femmesh.addNode(-15.894863031372457, 66.03293719074868, -11.25, 540)
-    femmesh.addNode(-8.03426374487322, 65.4089910048859, -7.499999999999999, 541)
-    femmesh.addNode(-20.756940784706366, 66.06977803242471, -11.25, 542)
-    femmesh.addNode(-25.61377466527366, 65.84103966226411, -11.25, 543)
-    femmesh.addNode(-17.732036859034036, 66.07808887288566, -7.5, 544)
-    femmesh.addNode(-30.450868957353983, 65.34740477947683, -11.25, 545)
-    femmesh.addNode(-35.253786783312776, 64.59034669551158, -11.25, 546)
-    femmesh.addNode(-27.444914374700467, 65.68556068305236, -7.499999999999999, 547)
-    femmesh.addNode(-40.00819326999077, 63.57212493928512, -11.25, 548)
-    femmesh.addNode(-44.699898331762874, 62.295778513446194, -11.25, 549)
-    femmesh.addNode(-37.05704767813732, 64.23609185275524, -7.5, 550)
-    femmesh.addNode(-49.314899022787536, 60.76511682409371, -11.25, 551)
-    femmesh.addNode(-53.839421330442875, 58.984708311156595, -11.25, 552)
-    femmesh.addNode(-46.45376829798866, 61.746973912526286, -7.5, 553)
-    femmesh.addNode(-58.25996128548893, 56.959866813347176, -11.25, 554)
-    femmesh.addNode(-62.56332526625299, 54.696635708384235, -11.25, 555)
-    femmesh.addNode(-55.52297746625578, 58.247900950996254, -7.5, 556)
-    femmesh.addNode(-66.73666937654612, 52.201769875821014, -11.25, 557)
-    femmesh.addNode(-70.76753777978246, 49.482715536312384, -11.25, 558)
-    femmesh.addNode(-64.15648348309085, 53.78061537861977, -7.499999999999999, 559)
-    femmesh.addNode(-74.64389987488941, 46.54758802749305, -11.25, 560)
-    femmesh.addNode(-78.35418620305211, 43.4051475827975, -11.25, 561)
-    femmesh.addNode(-72.2512923967298, 48.39840995894629, -7.499999999999999, 562)
-    femmesh.addNode(-81.88732297812481, 40.064773185512294, -11.25, 563)
-    femmesh.addNode(-85.23276513764861, 36.53643457609702, -11.25, 564)
-    femmesh.addNode(-79.71083667630324, 42.1654920492531, -7.499999999999999, 565)
-    femmesh.addNode(-88.26907511933955, 32.96909743974352, -11.439315079884182, 566)
-    femmesh.addNode(-91.2174898778215, 29.102832187930677, -11.439315079884182, 567)
-    femmesh.addNode(-86.33003447586624, 35.2907851339548, -7.68931507988418, 568)
-    femmesh.addNode(-93.87980288375938, 25.19133256842721, -11.70436571632232, 569)
-    femmesh.addNode(-96.39509109506501, 21.03026518138851, -11.70436571632232, 570)
-    femmesh.addNode(-92.10060137559637, 27.8542573369461, -8.1436807962065, 571)
-    femmesh.addNode(-100.98099130855319, 11.729827309655857, -11.225616354912985, 572)
-    femmesh.addNode(-98.96676823101058, 16.155215651858708, -11.225616354912985, 573)
-    femmesh.addNode(-97.44773602776972, 19.122258162531278, -7.929982071235305, 574)
-    femmesh.addNode(-101.89669452822739, 9.477521897765723, -8.725616354912985, 575)
-    femmesh.addNode(-103.69798751667692, 4.423012047112419, -1.922593871845521, 576)
-    femmesh.addNode(-103.69798751667692, 4.423012047112419, 3.077406128154479, 577)
-    femmesh.addNode(-102.9196802681345, 6.726407341415506, -4.422593871845521, 578)
-    femmesh.addNode(-102.89609480265571, 6.793102015078503, 4.93039919770424, 579)
-    femmesh.addNode(33.489355253170146, 48.96109167510538, 10.999776063972732, 580)
-    femmesh.addNode(29.485896216270735, 51.720343806621884, 10.999776063972732, 581)
-    femmesh.addNode(34.789844765764016, 47.993063448835414, 6.134264642004375, 582)
-    femmesh.addNode(21.010720055223803, 56.58644404222413, 11.292725497911135, 583)
-    femmesh.addNode(25.292570580687798, 54.282770310335565, 11.292725497911135, 584)
-    femmesh.addNode(27.500302647439728, 52.97336437395137, 7.292501561883867, 585)
-    femmesh.addNode(15.987895465054425, 58.92138800892813, 11.25, 586)
-    femmesh.addNode(11.466609590185627, 60.709999376196535, 11.25, 587)
-    femmesh.addNode(18.285992598621892, 57.90020682664655, 7.542725497911135, 588)
-    femmesh.addNode(6.854392533906871, 62.24902842438941, 11.25, 589)
-    femmesh.addNode(2.165010000754666, 63.533881740210674, 11.25, 590)
-    femmesh.addNode(8.607264290470617, 61.69704386531107, 7.5000000000000036, 591)
-    femmesh.addNode(-2.587541995288557, 64.56072452774714, 11.25, 592)
-    femmesh.addNode(-7.389078903544991, 65.32649205386804, 11.25, 593)
-    femmesh.addNode(-0.7849265512370778, 64.20319983029702, 7.5000000000000036, 594)
-    femmesh.addNode(-12.225269972102147, 65.82889879528172, 11.250000000000004, 595)
-    femmesh.addNode(-17.081681019628295, 66.0664452599489, 11.250000000000004, 596)
-    femmesh.addNode(-10.394415254613465, 65.67009907277208, 7.500000000000007, 597)
-    femmesh.addNode(-21.943817515885144, 66.03842246249305, 11.250000000000004, 598)
-    femmesh.addNode(-26.79716784235886, 65.74491404025066, 11.250000000000004, 599)
-    femmesh.addNode(-20.106564821194223, 66.08024212617791, 7.500000000000007, 600)
-    femmesh.addNode(-31.627246603893326, 65.1867960036459, 11.25, 601)
-    femmesh.addNode(-36.41963786205633, 64.36573412163422, 11.25, 602)
-    femmesh.addNode(-29.80551355330566, 65.42873616322325, 7.5000000000000036, 603)
-    femmesh.addNode(-41.160038161204305, 63.28417895001907, 11.25, 604)
-    femmesh.addNode(-45.834299218828775, 61.94535851747965, 11.25, 605)
-    femmesh.addNode(-39.3755572334572, 63.72335336517395, 7.5, 606)
-    femmesh.addNode(-50.42847015277124, 60.353268691139135, 11.25, 607)
-    femmesh.addNode(-54.92883911926914, 58.51266125043034, 11.25, 608)
-    femmesh.addNode(-48.70252942506511, 60.984438203128576, 7.5000000000000036, 609)
-    femmesh.addNode(-59.32197423780798, 56.42902970472926, 11.250000000000004, 610)
-    femmesh.addNode(-63.594763679196845, 54.10859289779708, 11.250000000000004, 611)
-    femmesh.addNode(-57.67516342835681, 57.24466473725977, 7.500000000000007, 612)
-    femmesh.addNode(-67.73445486464117, 51.55827640445075, 11.25, 613)
-    femmesh.addNode(-71.72869226879901, 48.78569202437579, 11.25, 614)
-    femmesh.addNode(-66.18641970740101, 52.54864678940426, 7.5000000000000036, 615)
-    femmesh.addNode(-75.5655716808437, 45.79910083319399, 11.250000000000004, 616)
-    femmesh.addNode(-79.23360675461643, 42.607443695752195, 11.250000000000004, 617)
-    femmesh.addNode(-74.13477990256148, 46.952392190237944, 7.5000000000000036, 618)
-    femmesh.addNode(-82.72630107122912, 39.21568622600127, 11.250000000000004, 619)
-    femmesh.addNode(-86.02412150009556, 35.64279705834424, 11.250000000000004, 620)
-    femmesh.addNode(-81.42992971486449, 40.51821702101908, 7.500000000000007, 621)
-    femmesh.addNode(-89.67665413759292, 31.177883767169956, 10.22612088351185, 622)
-    femmesh.addNode(-92.52514790200073, 27.23742188313413, 10.22612088351185, 623)
-    femmesh.addNode(-88.54872287240792, 32.62067126604869, 6.476120883511854, 624)
-    femmesh.addNode(-97.109070291561, 19.74826471416952, 11.829478439517018, 625)
-    femmesh.addNode(-94.66272827499166, 23.95023655169742, 11.829478439517018, 626)
-    femmesh.addNode(-94.1717901809462, 24.73375793317516, 7.055599323028865, 627)
-    femmesh.addNode(-101.00490450793126, 11.673182830970521, 10.964242183083364, 628)
-    femmesh.addNode(-98.99373917136512, 16.0999616343901, 10.964242183083364, 629)
-    femmesh.addNode(-98.15823790450168, 17.768485463200054, 7.793720622600382, 630)
-    femmesh.addNode(-101.89332515178647, 9.48614381417585, 7.817235252633125, 631)
-    femmesh.addNode(-101.10236460806986, 11.441185706385173, 4.041648311237843, 632)
-    femmesh.addNode(-101.07861165964033, 11.497897570319747, -3.148210226758506, 633)
-    femmesh.addNode(-99.86993808763751, 14.249644497991103, -0.1255544193803182, 634)
-    femmesh.addNode(-98.60053376693513, 16.896103225573594, -4.42857690244778, 635)
-    femmesh.addNode(-98.62801663364786, 16.841102042792908, 2.761281635548567, 636)
-    femmesh.addNode(-95.98369776343746, 21.747061949136683, -4.907326263857115, 637)
-    femmesh.addNode(-94.72319876031577, 23.852463066855197, 2.023160335977053, 638)
-    femmesh.addNode(-96.7095508423555, 20.471746772874706, 3.626517891982221, 639)
-    femmesh.addNode(-92.05178486421252, 27.924477162122432, 1.8629378576896443, 640)
-    femmesh.addNode(-94.77060117481618, 23.775621154218815, -1.5661435733570013, 641)
-    femmesh.addNode(-93.42556131396961, 25.89117692126911, -5.067548742144524, 642)
-    femmesh.addNode(33.808002624122196, 48.72729781514002, 1.244608567428351, 643)
-    femmesh.addNode(32.62902473015015, 49.58156134934487, -2.468054539896194, 644)
-    femmesh.addNode(30.413723897886317, 51.10930664930005, 3.2868890206209223, 645)
-    femmesh.addNode(29.935993821104137, 51.425997685281615, -4.516183932489831, 646)
-    femmesh.addNode(26.25271030926159, 53.72387647782857, 3.5798384545593223, 647)
-    femmesh.addNode(24.73576260323973, 54.599591938136015, -0.4192207318015342, 648)
-    femmesh.addNode(21.691015056185233, 56.24039873910063, 3.5863918094614107, 649)
-    femmesh.addNode(26.80077433305851, 53.3975996425295, -4.052741235687472, 650)
-    femmesh.addNode(22.25723117348942, 55.94674919297772, -4.046187880785382, 651)
-    femmesh.addNode(16.688399062460288, 58.618331330782894, 3.543666311550279, 652)
-    femmesh.addNode(-89.67665413759292, 31.177883767169956, 2.7261208835118502, 653)
-    femmesh.addNode(-86.02412150009556, 35.64279705834424, 3.7500000000000036, 654)
-    femmesh.addNode(-89.73149046541351, 31.106157582347176, -0.863183025822206, 655)
-    femmesh.addNode(18.072032105187805, 57.99858199647868, -4.0506382840246875, 656)
-    femmesh.addNode(14.99737237031336, 59.3378277344337, -0.2063336884497211, 657)
-    femmesh.addNode(11.466609590185627, 60.709999376196535, 3.75, 658)
-    femmesh.addNode(12.886629957848292, 60.178895064670854, -3.8443045955749646, 659)
-    femmesh.addNode(6.854392533906871, 62.24902842438941, 3.75, 660)
-    femmesh.addNode(5.090497339295439, 62.764702828297985, 0.0, 661)
-    femmesh.addNode(2.165010000754666, 63.533881740210674, 3.75, 662)
-    femmesh.addNode(3.3225000665166675, 63.24224900339452, -3.75, 663)
-    femmesh.addNode(7.99422883321569, 61.894618892493625, -3.75, 664)
-    femmesh.addNode(-2.587541995288557, 64.56072452774714, 3.75, 665)
-    femmesh.addNode(-4.397155156025429, 64.88095344103824, 0.0, 666)
-    femmesh.addNode(-7.389078903544991, 65.32649205386804, 3.75, 667)
-    femmesh.addNode(-6.212972615675763, 65.16374686175685, -3.75, 668)
-    femmesh.addNode(-1.4220785426680678, 64.33399354502373, -3.75, 669)
-    femmesh.addNode(-12.225269972102147, 65.82889879528172, 3.7500000000000036, 670)
-    femmesh.addNode(-14.059013205213633, 65.94986202704051, 0.0, 671)
-    femmesh.addNode(-17.081681019628295, 66.0664452599489, 3.7500000000000036, 672)
-    femmesh.addNode(-15.894863031372457, 66.03293719074868, -3.75, 673)
-    femmesh.addNode(-11.042053000993535, 65.73062709421895, -3.75, 674)
-    femmesh.addNode(-21.943817515885144, 66.03842246249305, 3.7500000000000036, 675)
-    femmesh.addNode(-23.779815066407895, 65.95867697425602, 0.0, 676)
-    femmesh.addNode(-26.79716784235886, 65.74491404025066, 3.7500000000000036, 677)
-    femmesh.addNode(-25.61377466527366, 65.84103966226411, -3.75, 678)
-    femmesh.addNode(-20.756940784706366, 66.06977803242471, -3.75, 679)
-    femmesh.addNode(-31.627246603893326, 65.1867960036459, 3.75, 680)
-    femmesh.addNode(-33.443595823842976, 64.90729312421887, 0.0, 681)
-    femmesh.addNode(-36.41963786205633, 64.36573412163422, 3.75, 682)
-    femmesh.addNode(-35.253786783312776, 64.59034669551158, -3.75, 683)
-    femmesh.addNode(-30.450868957353983, 65.34740477947683, -3.75, 684)
-    femmesh.addNode(-41.160038161204305, 63.28417895001907, 3.75, 685)
-    femmesh.addNode(-42.93507079858898, 62.80825302654044, 0.0, 686)
-    femmesh.addNode(-45.834299218828775, 61.94535851747965, 3.75, 687)
-    femmesh.addNode(-44.699898331762874, 62.295778513446194, -3.75, 688)
-    femmesh.addNode(-40.00819326999077, 63.57212493928512, -3.75, 689)
-    femmesh.addNode(-50.42847015277124, 60.353268691139135, 3.75, 690)
-    femmesh.addNode(-52.1410108443624, 59.686597311776836, 0.0, 691)
-    femmesh.addNode(-54.92883911926914, 58.51266125043034, 3.75, 692)
-    femmesh.addNode(-53.839421330442875, 58.984708311156595, -3.75, 693)
-    femmesh.addNode(-49.314899022787536, 60.76511682409371, -3.75, 694)
-    femmesh.addNode(-59.32197423780798, 56.42902970472926, 3.7500000000000036, 695)
-    femmesh.addNode(-60.951593121731705, 55.579565967655356, 0.0, 696)
-    femmesh.addNode(-63.594763679196845, 54.10859289779708, 3.7500000000000036, 697)
-    femmesh.addNode(-62.56332526625299, 54.696635708384235, -3.75, 698)
-    femmesh.addNode(-58.25996128548893, 56.959866813347176, -3.75, 699)
-    femmesh.addNode(-67.73445486464117, 51.55827640445075, 3.75, 700)
-    femmesh.addNode(-69.26171123657157, 50.53615408230421, 0.0, 701)
-    femmesh.addNode(-71.72869226879901, 48.78569202437579, 3.75, 702)
-    femmesh.addNode(-70.76753777978246, 49.482715536312384, -3.75, 703)
-    femmesh.addNode(-66.73666937654612, 52.201769875821014, -3.75, 704)
-    femmesh.addNode(-75.5655716808437, 45.79910083319399, 3.7500000000000036, 705)
-    femmesh.addNode(-76.97222911338667, 44.61652735427431, 0.0, 706)
-    femmesh.addNode(-79.23360675461643, 42.607443695752195, 3.7500000000000036, 707)
-    femmesh.addNode(-78.35418620305211, 43.4051475827975, -3.75, 708)
-    femmesh.addNode(-74.64389987488941, 46.54758802749305, -3.75, 709)
-    femmesh.addNode(-82.72630107122912, 39.21568622600127, 3.7500000000000036, 710)
-    femmesh.addNode(-83.99116364534497, 37.89130434206321, 0.0, 711)
-    femmesh.addNode(-85.23276513764861, 36.53643457609702, -3.75, 712)
-    femmesh.addNode(-81.88732297812481, 40.064773185512294, -3.75, 713)
-    femmesh.addNode(-90.72669707603535, 29.77754690367703, -4.802498105706386, 714)
-    femmesh.addNode(-88.26907511933955, 32.96909743974352, -3.9393150798841816, 715)
-    femmesh.addNode(-66.00318934158093, 23.240667523075246, -15.000000000000002, 716)
-    femmesh.addNode(-51.900574418563224, 39.16428818391363, -15.000000000000002, 717)
-    femmesh.addNode(-80.68066002483943, 16.39207170014174, -15.000000000000002, 718)
-    femmesh.addNode(-37.46529735756524, 49.102388157784965, -15.000000000000002, 719)
-    femmesh.addNode(-66.91248613316507, 36.25245029837328, -15.000000000000002, 720)
-    femmesh.addNode(-26.15152806494727, 53.4526380531087, -15.000000000000002, 721)
-    femmesh.addNode(-58.505351326052825, 13.164345604494407, -15.000000000000002, 722)
-    femmesh.addNode(-53.649458155698326, 25.355481891520846, -15.000000000000002, 723)
-    femmesh.addNode(-77.33279316084474, 27.351593759800036, -15.000000000000002, 724)
-    femmesh.addNode(-72.18368987937473, 9.356142096581404, -15.000000000000002, 725)
-    femmesh.addNode(-15.90820087989702, 54.76097577611317, -15.000000000000002, 726)
-    femmesh.addNode(-49.80979160364804, 48.54437996516931, -15.000000000000002, 727)
-    femmesh.addNode(-41.711214985586935, 36.689405183690425, -15.000000000000002, 728)
-    femmesh.addNode(-90.21426464555825, 10.147920814317349, -15.000000000000002, 729)
-    femmesh.addNode(-5.210881166488335, 55.79619708747812, -15.000000000000002, 730)
-    femmesh.addNode(-61.38098868299822, 43.709952845998664, -15.000000000000002, 731)
-    femmesh.addNode(-45.8695668884427, 29.207929635382886, -15.000000000000002, 732)
-    femmesh.addNode(-34.38502347305247, 56.119983695043686, -15.000000000000002, 733)
-    femmesh.addNode(4.1307150183735715, 54.97267127360231, -15.000000000000002, 734)
-    femmesh.addNode(-88.8234172153995, 18.795324103551025, -15.000000000000002, 735)
-    femmesh.addNode(-60.53550166906519, 31.26174752226928, -15.000000000000002, 736)
-    femmesh.addNode(-80.94905624328777, 7.179226922208098, -15.000000000000002, 737)
-    femmesh.addNode(-52.340195472549716, 15.561302808588314, -15.000000000000002, 738)
-    femmesh.addNode(-33.26555312204802, 41.90004217166496, -15.000000000000002, 739)
-    femmesh.addNode(-72.18618268054104, 19.87866844613559, -15.000000000000002, 740)
-    femmesh.addNode(-74.8665809539381, 36.54135579113964, -15.000000000000002, 741)
-    femmesh.addNode(-43.9811947844932, 54.13969387805008, -15.000000000000002, 742)
-    femmesh.addNode(12.473980727523639, 53.90406741290324, -15.000000000000002, 743)
-    femmesh.addNode(-85.41876516736474, 24.652235503924913, -15.000000000000002, 744)
-    femmesh.addNode(-53.83902717153273, 7.365082126293558, -15.000000000000002, 745)
-    femmesh.addNode(34.05813664361287, 40.56633163007677, -15.000000000000002, 746)
-    femmesh.addNode(27.55979475421529, 45.50890761889813, -15.000000000000002, 747)
-    femmesh.addNode(-22.401273289285168, 59.966430040685225, -15.000000000000002, 748)
-    femmesh.addNode(-62.49541205340743, 7.497988474970548, -15.000000000000002, 749)
-    femmesh.addNode(20.28810179727946, 50.27649893575607, -15.000000000000002, 750)
-    femmesh.addNode(-59.13089520590416, 20.235714717632035, -15.000000000000002, 751)
-    femmesh.addNode(-70.14669899130146, 29.488771814157914, -15.000000000000002, 752)
-    femmesh.addNode(-57.02041336710261, 49.64265513159453, -15.000000000000002, 753)
-    femmesh.addNode(-23.937680545983763, 46.513670654371865, -15.000000000000002, 754)
-    femmesh.addNode(-65.08412008114351, 15.562254477148207, -15.000000000000002, 755)
-    femmesh.addNode(-31.182842204498176, 49.158854390120524, -15.000000000000002, 756)
-    femmesh.addNode(-68.12390793840558, 43.029141791174126, -15.000000000000002, 757)
-    femmesh.addNode(-43.34656759645168, 44.89971648186055, -15.000000000000002, 758)
-    femmesh.addNode(36.361076991656375, 38.53468659455716, -15.000000000000002, 759)
-    femmesh.addNode(38.374083463552836, 40.90218512316979, -15.000000000000002, 760)
-    femmesh.addNode(34.69196481009957, 44.07480531062758, -15.000000000000002, 761)
-    femmesh.addNode(34.34807051975993, 36.167188065944536, -15.000000000000002, 762)
-    femmesh.addNode(30.84814809159962, 39.290612627172116, -15.000000000000002, 763)
-    femmesh.addNode(-98.66074702881434, 4.621225235400843, -15.000000000000002, 764)
-    femmesh.addNode(-50.41951358576637, 3.682541063146779, -15.000000000000002, 765)
-    femmesh.addNode(-49.95131703272764, 8.350091810652664, -15.000000000000002, 766)
-    femmesh.addNode(-55.252846919099696, 3.682541063146779, -15.000000000000002, 767)
-    femmesh.addNode(31.44279386540078, 46.54609330503827, -15.000000000000002, 768)
-    femmesh.addNode(27.436633733869655, 49.298219325500156, -15.000000000000002, 769)
-    femmesh.addNode(30.80896569891408, 43.03761962448745, -15.000000000000002, 770)
-    femmesh.addNode(23.800787255401737, 51.68201498392913, -15.000000000000002, 771)
-    femmesh.addNode(19.518377384460855, 53.98081517734328, -15.000000000000002, 772)
-    femmesh.addNode(23.92394827574737, 47.8927032773271, -15.000000000000002, 773)
-    femmesh.addNode(15.611316849582941, 55.79459941591686, -15.000000000000002, 774)
-    femmesh.addNode(11.10374451650086, 57.612650101130555, -15.000000000000002, 775)
-    femmesh.addNode(16.381041262401546, 52.090283174329656, -15.000000000000002, 776)
-    femmesh.addNode(6.9321116619258305, 58.14695203148008, -15.000000000000002, 777)
-    femmesh.addNode(2.253150233691766, 59.46256465876478, -15.000000000000002, 778)
-    femmesh.addNode(8.302347872948605, 54.43836934325277, -15.000000000000002, 779)
-    femmesh.addNode(-2.417647858739187, 59.87432756570268, -15.000000000000002, 780)
-    femmesh.addNode(-7.212180418171053, 60.67180745166895, -15.000000000000002, 781)
-    femmesh.addNode(-0.5400830740573817, 55.38443418054021, -15.000000000000002, 782)
-    femmesh.addNode(-12.560840274875396, 60.15419679598647, -15.000000000000002, 783)
-    femmesh.addNode(-17.4137472884894, 60.424030354294324, -15.000000000000002, 784)
-    femmesh.addNode(-10.559541023192677, 55.278586431795645, -15.000000000000002, 785)
-    femmesh.addNode(-20.660283493183474, 63.02675748658035, -15.000000000000002, 786)
-    femmesh.addNode(-25.513671902249882, 62.765725720864395, -15.000000000000002, 787)
-    femmesh.addNode(-19.154737084591094, 57.3637029083992, -15.000000000000002, 788)
-    femmesh.addNode(-31.505546994133535, 60.842502548043626, -15.000000000000002, 789)
-    femmesh.addNode(-36.30151799708538, 60.05371945313223, -15.000000000000002, 790)
-    femmesh.addNode(-27.388799290080936, 59.50882972707613, -15.000000000000002, 791)
-    femmesh.addNode(-30.26827576899987, 54.78631087407619, -15.000000000000002, 792)
-    femmesh.addNode(-24.27640067711622, 56.70953404689696, -15.000000000000002, 793)
-    femmesh.addNode(-41.09960365280574, 59.06357454463543, -15.000000000000002, 794)
-    femmesh.addNode(-45.780943412625106, 57.75644995795401, -15.000000000000002, 795)
-    femmesh.addNode(-39.183109128772834, 55.129838786546884, -15.000000000000002, 796)
-    femmesh.addNode(-50.29180559290197, 55.946577304278996, -15.000000000000002, 797)
-    femmesh.addNode(-56.811414884206684, 53.698057931051224, -15.000000000000002, 798)
-    femmesh.addNode(-61.09798687151326, 51.407028199770735, -15.000000000000002, 799)
-    femmesh.addNode(-53.20610400247939, 53.14892034783861, -15.000000000000002, 800)
-    femmesh.addNode(-46.89549319407062, 51.3420369216097, -15.000000000000002, 801)
-    femmesh.addNode(-53.41510248537533, 49.093517548381925, -15.000000000000002, 802)
-    femmesh.addNode(-66.64973415716474, 48.10027152956054, -15.000000000000002, 803)
-    femmesh.addNode(-70.66087902200415, 45.35541570361171, -15.000000000000002, 804)
-    femmesh.addNode(-63.278274529461065, 48.4406770569728, -15.000000000000002, 805)
-    femmesh.addNode(-59.20070102505042, 46.6763039887966, -15.000000000000002, 806)
-    femmesh.addNode(-64.75244831070191, 43.3695473185864, -15.000000000000002, 807)
-    femmesh.addNode(-74.03221552977041, 42.11152270359447, -15.000000000000002, 808)
-    femmesh.addNode(-77.72008206778571, 38.94558571278751, -15.000000000000002, 809)
-    femmesh.addNode(-71.49524444617184, 39.78524879115688, -15.000000000000002, 810)
-    femmesh.addNode(-81.04067564370496, 35.396335801110865, -15.000000000000002, 811)
-    femmesh.addNode(-86.31676775041828, 29.451775657503504, -15.000000000000002, 812)
-    femmesh.addNode(-89.23047513481649, 25.56155382448729, -15.000000000000002, 813)
-    femmesh.addNode(-82.27378174715827, 30.801454785441067, -15.000000000000002, 814)
-    femmesh.addNode(-76.09968705739142, 31.946474775469838, -15.000000000000002, 815)
-    femmesh.addNode(-81.37577916410476, 26.001914631862476, -15.000000000000002, 816)
-    femmesh.addNode(-90.93280115883388, 22.633098124300346, -15.000000000000002, 817)
-    femmesh.addNode(-93.40486309663925, 18.448313015405617, -15.000000000000002, 818)
-    femmesh.addNode(-87.12109119138213, 21.72377980373797, -15.000000000000002, 819)
-    femmesh.addNode(-94.10028681171863, 14.124611370788777, -15.000000000000002, 820)
-    femmesh.addNode(-96.10121268492685, 9.695185642559519, -15.000000000000002, 821)
-    femmesh.addNode(-89.51884093047889, 14.471622458934187, -15.000000000000002, 822)
-    femmesh.addNode(-92.77379898944577, 5.073960407158673, -15.000000000000002, 823)
-    femmesh.addNode(23.548412547303556, 44.12794466540548, -15.000000000000002, 824)
-    femmesh.addNode(27.59897714690083, 41.7619006215828, -15.000000000000002, 825)
-    femmesh.addNode(15.472760181494358, 48.02612524040919, -15.000000000000002, 826)
-    femmesh.addNode(19.912566068835638, 46.511740323834445, -15.000000000000002, 827)
-    femmesh.addNode(2.741930409519039, 50.97659423713453, -15.000000000000002, 828)
-    femmesh.addNode(7.394066792041418, 50.37421140933232, -15.000000000000002, 829)
-    femmesh.addNode(11.565699646616451, 49.839909478982776, -15.000000000000002, 830)
-    femmesh.addNode(-6.607963137758961, 51.054735026626645, -15.000000000000002, 831)
-    femmesh.addNode(-1.9288676829119122, 51.38835714407243, -15.000000000000002, 832)
-    femmesh.addNode(-16.476231873694736, 49.28079098700831, -15.000000000000002, 833)
-    femmesh.addNode(-11.956622994463306, 50.53712437094417, -15.000000000000002, 834)
-    femmesh.addNode(-24.671003346665472, 43.02815428293097, -15.000000000000002, 835)
-    femmesh.addNode(-20.490971706738108, 45.15713842613766, -15.000000000000002, 836)
-    femmesh.addNode(-19.92294071294039, 50.63732321524252, -15.000000000000002, 837)
-    femmesh.addNode(-33.00883434124373, 37.80453773802115, -15.000000000000002, 838)
-    femmesh.addNode(-29.334939634697598, 40.72134004157752, -15.000000000000002, 839)
-    femmesh.addNode(-28.601616834015893, 44.206856413018414, -15.000000000000002, 840)
-    femmesh.addNode(-40.253031145085984, 31.610823187312562, -15.000000000000002, 841)
-    femmesh.addNode(-37.23166527301318, 35.199219244033884, -15.000000000000002, 842)
-    femmesh.addNode(-37.48838405381748, 39.294723677677695, -15.000000000000002, 843)
-    femmesh.addNode(-44.58065323311135, 23.753080681118856, -15.000000000000002, 844)
-    femmesh.addNode(-42.33220709651386, 27.87008541315879, -15.000000000000002, 845)
-    femmesh.addNode(-43.79039093701482, 32.948667409536654, -15.000000000000002, 846)
-    femmesh.addNode(-49.20190118323613, 12.448202151800043, -15.000000000000002, 847)
-    femmesh.addNode(-47.81596752516486, 16.92976726772157, -15.000000000000002, 848)
-    femmesh.addNode(-48.47059886673917, 21.826856809187838, -15.000000000000002, 849)
-    femmesh.addNode(-49.75951252207051, 27.281705763451868, -15.000000000000002, 850)
-    femmesh.addNode(-52.994826814124025, 20.45839235005458, -15.000000000000002, 851)
-    femmesh.addNode(-53.08961132204122, 11.463192467440937, -15.000000000000002, 852)
-    femmesh.addNode(-64.41437269337035, 3.748994237485274, -15.000000000000002, 853)
-    femmesh.addNode(-59.58103936003704, 3.748994237485274, -15.000000000000002, 854)
-    femmesh.addNode(-58.16721961247008, 7.431535300632053, -15.000000000000002, 855)
-    femmesh.addNode(-74.09184493968732, 4.678071048290704, -15.000000000000002, 856)
-    femmesh.addNode(-69.258511606354, 4.678071048290704, -15.000000000000002, 857)
-    femmesh.addNode(-67.33955096639107, 8.427065285775974, -15.000000000000002, 858)
-    femmesh.addNode(-83.30786145497717, 3.589613461104051, -15.000000000000002, 859)
-    femmesh.addNode(-78.47452812164386, 3.589613461104051, -15.000000000000002, 860)
-    femmesh.addNode(-76.56637306133125, 8.267684509394751, -15.000000000000002, 861)
-    femmesh.addNode(-87.9404656561124, 5.073960407158673, -15.000000000000002, 862)
-    femmesh.addNode(-85.58166044442302, 8.663573868262723, -15.000000000000002, 863)
-    femmesh.addNode(-63.26934550532306, 27.251207522672264, -15.000000000000002, 864)
-    femmesh.addNode(-59.833198437484675, 25.74873111995066, -15.000000000000002, 865)
-    femmesh.addNode(-62.567042273742544, 21.73819112035364, -15.000000000000002, 866)
-    femmesh.addNode(-68.0749441664412, 26.36471966861658, -15.000000000000002, 867)
-    femmesh.addNode(-65.34110033018332, 30.375259668213598, -15.000000000000002, 868)
-    femmesh.addNode(-69.09468601106099, 21.55966798460542, -15.000000000000002, 869)
-    femmesh.addNode(-71.16644083592125, 24.683720130146753, -15.000000000000002, 870)
-    femmesh.addNode(-65.54365471136222, 19.401461000111727, -15.000000000000002, 871)
-    femmesh.addNode(-68.63515138084227, 17.720461461641897, -15.000000000000002, 872)
-    femmesh.addNode(-62.10750764352383, 17.898984597390122, -15.000000000000002, 873)
-    femmesh.addNode(-52.775016287130775, 32.25988503771724, -15.000000000000002, 874)
-    femmesh.addNode(-48.885070653502964, 34.186108909648254, -15.000000000000002, 875)
-    femmesh.addNode(-57.09247991238176, 28.308614706895064, -15.000000000000002, 876)
-    femmesh.addNode(-56.218038043814204, 35.21301785309146, -15.000000000000002, 877)
-    femmesh.addNode(-50.85518301110563, 43.85433407454147, -15.000000000000002, 878)
-    femmesh.addNode(-54.460493892832915, 44.40347165775408, -15.000000000000002, 879)
-    femmesh.addNode(-46.57817960004986, 46.72204822351493, -15.000000000000002, 880)
-    femmesh.addNode(-47.62357100750745, 42.03200233288709, -15.000000000000002, 881)
-    femmesh.addNode(-46.80589470207508, 37.926846683802026, -15.000000000000002, 882)
-    femmesh.addNode(-42.528891291019306, 40.79456083277549, -15.000000000000002, 883)
-    femmesh.addNode(-56.64078155078072, 41.43712051495615, -15.000000000000002, 884)
-    femmesh.addNode(-60.95824517603171, 37.48585018413397, -15.000000000000002, 885)
-    femmesh.addNode(-79.00672659284209, 21.87183272997089, -15.000000000000002, 886)
-    femmesh.addNode(-74.75948792069289, 23.615131102967812, -15.000000000000002, 887)
-    femmesh.addNode(-76.43342135269023, 18.135370073138667, -15.000000000000002, 888)
-    femmesh.addNode(-83.0497125961021, 20.522153602033328, -15.000000000000002, 889)
-    femmesh.addNode(-76.43217495210708, 12.874106898361573, -15.000000000000002, 890)
-    femmesh.addNode(-80.8148581340636, 11.785649311174922, -15.000000000000002, 891)
-    femmesh.addNode(-72.18493627995788, 14.617405271358496, -15.000000000000002, 892)
-    femmesh.addNode(-85.44746233519885, 13.269996257229545, -15.000000000000002, 893)
-    femmesh.addNode(-84.75203862011946, 17.593697901846383, -15.000000000000002, 894)
-    femmesh.addNode(-35.92516041530885, 52.61118592641432, -15.000000000000002, 895)
-    femmesh.addNode(-40.72324607102922, 51.62104101791752, -15.000000000000002, 896)
-    femmesh.addNode(-32.78393283877532, 52.639419042582105, -15.000000000000002, 897)
-    femmesh.addNode(-34.32406978103171, 49.13062127395274, -15.000000000000002, 898)
-    femmesh.addNode(-35.365425239806626, 45.50121516472496, -15.000000000000002, 899)
-    femmesh.addNode(-32.224197663273095, 45.52944828089274, -15.000000000000002, 900)
-    femmesh.addNode(-38.30606035924985, 43.39987932676276, -15.000000000000002, 901)
-    femmesh.addNode(-40.40593247700846, 47.00105231982276, -15.000000000000002, 902)
-    femmesh.addNode(-43.66388119047244, 49.51970517995532, -15.000000000000002, 903)
-    femmesh.addNode(-64.14673740808165, 39.981201572185974, -15.000000000000002, 904)
-    femmesh.addNode(-63.723993901115136, 33.75709891032128, -15.000000000000002, 905)
-    femmesh.addNode(-67.51819703578533, 39.64079604477371, -15.000000000000002, 906)
-    femmesh.addNode(-68.52959256223326, 32.8706110562656, -15.000000000000002, 907)
-    femmesh.addNode(-70.88953354355158, 36.396903044756456, -15.000000000000002, 908)
-    femmesh.addNode(-72.50663997261978, 33.015063802648775, -15.000000000000002, 909)
-    femmesh.addNode(-21.029864472422148, 54.106806914610935, -15.000000000000002, 910)
-    femmesh.addNode(-25.04460430546552, 49.98315435374028, -15.000000000000002, 911)
-    femmesh.addNode(-28.667185134722722, 51.30574622161461, -15.000000000000002, 912)
-    femmesh.addNode(-27.56026137524097, 47.836262522246194, -15.000000000000002, 913)
-    femmesh.addNode(-55.42277339930127, 14.362824206541362, -15.000000000000002, 914)
-    femmesh.addNode(-56.172189248792776, 10.264713865393983, -15.000000000000002, 915)
-    femmesh.addNode(-58.81812326597849, 16.70003016106322, -15.000000000000002, 916)
-    femmesh.addNode(-55.73554533922694, 17.898508763110176, -15.000000000000002, 917)
-    femmesh.addNode(-60.500381689730126, 10.331167039732478, -15.000000000000002, 918)
-    femmesh.addNode(-63.789766067275465, 11.530121476059378, -15.000000000000002, 919)
-    femmesh.addNode(-61.794735703598164, 14.363300040821308, -15.000000000000002, 920)
-    femmesh.addNode(-56.39017668080125, 22.79559830457644, -15.000000000000002, 921)
-    femmesh.addNode(-73.7397460760731, 28.420182786978977, -15.000000000000002, 922)
-    femmesh.addNode(-68.63390498025912, 12.459198286864805, -15.000000000000002, 923)
-    femmesh.addNode(-79.24385689371181, 0.0, -0.04153784838559815, 924)
-    femmesh.addNode(-61.8390804597701, 0.0, 1.7763568394002505e-15, 925)
-    femmesh.addNode(-94.97167843228355, 0.0, 0.0, 926)
-    femmesh.addNode(-71.04989023625129, 0.0, 5.712858024077871, 927)
-    femmesh.addNode(-71.1666666666666, 0.0, -5.467745608832104, 928)
-    femmesh.addNode(-88.41512322075428, 0.0, -5.533517103058147, 929)
-    femmesh.addNode(-88.59819501091131, 0.0, 5.623805433241255, 930)
-    femmesh.addNode(-55.69035530438111, 0.0, 6.271545427987153, 931)
-    femmesh.addNode(-55.690355304381114, 0.0, -6.271545427987146, 932)
-    femmesh.addNode(-97.35868562388887, 0.0, 7.397876816819366, 933)
-    femmesh.addNode(-97.34915460607563, 0.0, -7.393176258188427, 934)
-    femmesh.addNode(-79.73016090358989, 0.0, -8.008261552425067, 935)
-    femmesh.addNode(-79.89309074675475, 0.0, 8.127765721126806, 936)
-    femmesh.addNode(-63.29300227920105, 0.0, -7.822109690014145, 937)
-    femmesh.addNode(-63.017479381103726, 0.0, 7.953757057935643, 938)
-    femmesh.addNode(-53.443958213706466, 0.0, 0.0, 939)
-    femmesh.addNode(-101.17457730303781, 0.0, -11.196588129094213, 940)
-    femmesh.addNode(-101.17457730303781, 0.0, -6.196588129094213, 941)
-    femmesh.addNode(-96.34124396970445, 0.0, -11.196588129094213, 942)
-    femmesh.addNode(-101.17934281194444, 0.0, 6.198938408409681, 943)
-    femmesh.addNode(-101.17934281194444, 0.0, 11.198938408409681, 944)
-    femmesh.addNode(-96.34600947861108, 0.0, 11.198938408409681, 945)
-    femmesh.addNode(-51.34517765219056, 0.0, -10.635772713993573, 946)
-    femmesh.addNode(-56.178510985523886, 0.0, -10.635772713993573, 947)
-    femmesh.addNode(-51.34517765219056, 0.0, -5.635772713993573, 948)
-    femmesh.addNode(-51.34517765219056, 0.0, 10.635772713993575, 949)
-    femmesh.addNode(-51.34517765219056, 0.0, 5.635772713993575, 950)
-    femmesh.addNode(-56.178510985523886, 0.0, 10.635772713993575, 951)
-    femmesh.addNode(-99.98583921614178, 0.0, -2.5, 952)
-    femmesh.addNode(-99.98583921614178, 0.0, 2.5, 953)
-    femmesh.addNode(-96.16041651917959, 0.0, -3.696588129094213, 954)
-    femmesh.addNode(-96.1651820280862, 0.0, 3.6989384084096812, 955)
-    femmesh.addNode(-59.97983447293385, 0.0, -11.411054845007072, 956)
-    femmesh.addNode(-64.81316780626716, 0.0, -11.411054845007072, 957)
-    femmesh.addNode(-59.49167879179108, 0.0, -7.046827559000645, 958)
-    femmesh.addNode(-68.74999999999994, 0.0, -10.233872804416052, 959)
-    femmesh.addNode(-73.58333333333326, 0.0, -10.233872804416052, 960)
-    femmesh.addNode(-67.22983447293382, 0.0, -6.644927649423124, 961)
-    femmesh.addNode(-77.86508045179491, 0.0, -11.504130776212534, 962)
-    femmesh.addNode(-82.69841378512822, 0.0, -11.504130776212534, 963)
-    femmesh.addNode(-75.44841378512825, 0.0, -6.738003580628586, 964)
-    femmesh.addNode(-87.04089494371041, 0.0, -10.266758551529072, 965)
-    femmesh.addNode(-91.87422827704378, 0.0, -10.266758551529072, 966)
-    femmesh.addNode(-84.0726420621721, 0.0, -6.770889327741607, 967)
-    femmesh.addNode(-92.88213891341496, 0.0, -6.463346680623287, 968)
-    femmesh.addNode(-50.22197910685323, 0.0, 2.5, 969)
-    femmesh.addNode(-50.22197910685323, 0.0, -2.5, 970)
-    femmesh.addNode(-54.56715675904379, 0.0, -3.135772713993573, 971)
-    femmesh.addNode(-54.56715675904378, 0.0, 3.1357727139935747, 972)
-    femmesh.addNode(-64.6754063572185, 0.0, 11.476878528967823, 973)
-    femmesh.addNode(-59.84207302388519, 0.0, 11.476878528967823, 974)
-    femmesh.addNode(-59.35391734274242, 0.0, 7.112651242961398, 975)
-    femmesh.addNode(-73.5249451181256, 0.0, 10.356429012038937, 976)
-    femmesh.addNode(-68.69161178479229, 0.0, 10.356429012038937, 977)
-    femmesh.addNode(-67.0336848086775, 0.0, 6.833307541006757, 978)
-    femmesh.addNode(-82.77987870671066, 0.0, 11.563882860563403, 979)
-    femmesh.addNode(-77.94654537337735, 0.0, 11.563882860563403, 980)
-    femmesh.addNode(-75.47149049150302, 0.0, 6.9203118726023405, 981)
-    femmesh.addNode(-91.96576417212229, 0.0, 10.31190271662063, 982)
-    femmesh.addNode(-87.13243083878893, 0.0, 10.31190271662063, 983)
-    femmesh.addNode(-84.24564287883302, 0.0, 6.875785577184033, 984)
-    femmesh.addNode(-92.9784403174001, 0.0, 6.510841125030311, 985)
-    femmesh.addNode(-75.2052617801892, 0.0, -2.754641728608851, 986)
-    femmesh.addNode(-71.10827845145894, 0.0, 0.12255620762288366, 987)
-    femmesh.addNode(-75.14687356498155, 0.0, 2.8356600878461364, 988)
-    femmesh.addNode(-79.56847382023328, 0.0, 4.043113936370602, 989)
-    femmesh.addNode(-79.48700889865086, 0.0, -4.0248997004053315, 990)
-    femmesh.addNode(-83.92102595231157, 0.0, 2.7911337924278286, 991)
-    femmesh.addNode(-88.5066591158328, 0.0, 0.04514416509155339, 992)
-    femmesh.addNode(-83.82949005723304, 0.0, -2.7875274757218733, 993)
-    femmesh.addNode(-66.50287356321834, 0.0, -2.733872804416052, 994)
-    femmesh.addNode(-66.44448534801069, 0.0, 2.8564290120389373, 995)
-    femmesh.addNode(-62.428279920436914, 0.0, 3.9768785289678235, 996)
-    femmesh.addNode(-62.566041369485575, 0.0, -3.9110548450070723, 997)
-    femmesh.addNode(-58.7647178820756, 0.0, 3.1357727139935783, 998)
-    femmesh.addNode(-57.641519336738284, 0.0, 0.0, 999)
-    femmesh.addNode(-58.76471788207561, 0.0, -3.135772713993571, 1000)
-    femmesh.addNode(-91.78493672159743, 0.0, 2.8119027166206294, 1001)
-    femmesh.addNode(-91.69340082651891, 0.0, -2.7667585515290725, 1002)
-    femmesh.addNode(-66.00318934158093, 23.240667523075246, 14.999999999999998, 1003)
-    femmesh.addNode(-51.900574418563224, 39.16428818391363, 14.999999999999998, 1004)
-    femmesh.addNode(-80.68066002483943, 16.39207170014174, 14.999999999999998, 1005)
-    femmesh.addNode(-37.46529735756524, 49.102388157784965, 14.999999999999998, 1006)
-    femmesh.addNode(-66.91248613316507, 36.25245029837328, 14.999999999999998, 1007)
-    femmesh.addNode(-26.15152806494727, 53.4526380531087, 14.999999999999998, 1008)
-    femmesh.addNode(-58.505351326052825, 13.164345604494407, 14.999999999999998, 1009)
-    femmesh.addNode(-53.649458155698326, 25.355481891520846, 14.999999999999998, 1010)
-    femmesh.addNode(-77.33279316084474, 27.351593759800036, 14.999999999999998, 1011)
-    femmesh.addNode(-72.18368987937473, 9.356142096581404, 14.999999999999998, 1012)
-    femmesh.addNode(-15.90820087989702, 54.76097577611317, 14.999999999999998, 1013)
-    femmesh.addNode(-49.80979160364804, 48.54437996516931, 14.999999999999998, 1014)
-    femmesh.addNode(-41.711214985586935, 36.689405183690425, 14.999999999999998, 1015)
-    femmesh.addNode(-90.21426464555825, 10.147920814317349, 14.999999999999998, 1016)
-    femmesh.addNode(-5.210881166488335, 55.79619708747812, 14.999999999999998, 1017)
-    femmesh.addNode(-61.38098868299822, 43.709952845998664, 14.999999999999998, 1018)
-    femmesh.addNode(-45.8695668884427, 29.207929635382886, 14.999999999999998, 1019)
-    femmesh.addNode(-34.38502347305247, 56.119983695043686, 14.999999999999998, 1020)
-    femmesh.addNode(4.1307150183735715, 54.97267127360231, 14.999999999999998, 1021)
-    femmesh.addNode(-88.8234172153995, 18.795324103551025, 14.999999999999998, 1022)
-    femmesh.addNode(-60.53550166906519, 31.26174752226928, 14.999999999999998, 1023)
-    femmesh.addNode(-80.94905624328777, 7.179226922208098, 14.999999999999998, 1024)
-    femmesh.addNode(-52.340195472549716, 15.561302808588314, 14.999999999999998, 1025)
-    femmesh.addNode(-33.26555312204802, 41.90004217166496, 14.999999999999998, 1026)
-    femmesh.addNode(-72.18618268054104, 19.87866844613559, 14.999999999999998, 1027)
-    femmesh.addNode(-74.8665809539381, 36.54135579113964, 14.999999999999998, 1028)
-    femmesh.addNode(-43.9811947844932, 54.13969387805008, 14.999999999999998, 1029)
-    femmesh.addNode(12.473980727523639, 53.90406741290324, 14.999999999999998, 1030)
-    femmesh.addNode(-85.41876516736474, 24.652235503924913, 14.999999999999998, 1031)
-    femmesh.addNode(-53.83902717153273, 7.365082126293537, 14.999999999999998, 1032)
-    femmesh.addNode(34.05813664361287, 40.56633163007677, 14.999999999999998, 1033)
-    femmesh.addNode(27.55979475421529, 45.50890761889813, 14.999999999999998, 1034)
-    femmesh.addNode(-22.401273289285168, 59.966430040685225, 14.999999999999998, 1035)
-    femmesh.addNode(-62.49541205340743, 7.497988474970544, 14.999999999999998, 1036)
-    femmesh.addNode(20.28810179727946, 50.27649893575607, 14.999999999999998, 1037)
-    femmesh.addNode(-59.13089520590416, 20.235714717632035, 14.999999999999998, 1038)
-    femmesh.addNode(-70.14669899130146, 29.488771814157914, 14.999999999999998, 1039)
-    femmesh.addNode(-57.02041336710261, 49.64265513159453, 14.999999999999998, 1040)
-    femmesh.addNode(-23.937680545983763, 46.513670654371865, 14.999999999999998, 1041)
-    femmesh.addNode(-65.08412008114351, 15.562254477148207, 14.999999999999998, 1042)
-    femmesh.addNode(-31.182842204498176, 49.158854390120524, 14.999999999999998, 1043)
-    femmesh.addNode(-68.12390793840558, 43.029141791174126, 14.999999999999998, 1044)
-    femmesh.addNode(-43.34656759645168, 44.89971648186055, 14.999999999999998, 1045)
-    femmesh.addNode(38.374083463552836, 40.90218512316979, 14.999999999999998, 1046)
-    femmesh.addNode(36.361076991656375, 38.53468659455716, 14.999999999999998, 1047)
-    femmesh.addNode(34.69196481009957, 44.07480531062758, 14.999999999999998, 1048)
-    femmesh.addNode(34.34807051975993, 36.167188065944536, 14.999999999999998, 1049)
-    femmesh.addNode(30.84814809159962, 39.290612627172116, 14.999999999999998, 1050)
-    femmesh.addNode(-98.66074702881434, 4.621225235400843, 14.999999999999998, 1051)
-    femmesh.addNode(-50.41951358576637, 3.6825410631467683, 14.999999999999998, 1052)
-    femmesh.addNode(-55.252846919099696, 3.6825410631467683, 14.999999999999998, 1053)
-    femmesh.addNode(-49.95131703272764, 8.350091810652653, 14.999999999999998, 1054)
-    femmesh.addNode(27.436633733869655, 49.298219325500156, 14.999999999999998, 1055)
-    femmesh.addNode(31.44279386540078, 46.54609330503827, 14.999999999999998, 1056)
-    femmesh.addNode(30.80896569891408, 43.03761962448745, 14.999999999999998, 1057)
-    femmesh.addNode(19.518377384460855, 53.98081517734328, 14.999999999999998, 1058)
-    femmesh.addNode(23.800787255401737, 51.68201498392913, 14.999999999999998, 1059)
-    femmesh.addNode(23.92394827574737, 47.8927032773271, 14.999999999999998, 1060)
-    femmesh.addNode(11.10374451650086, 57.612650101130555, 14.999999999999998, 1061)
-    femmesh.addNode(15.611316849582941, 55.79459941591686, 14.999999999999998, 1062)
-    femmesh.addNode(16.381041262401546, 52.090283174329656, 14.999999999999998, 1063)
-    femmesh.addNode(2.253150233691766, 59.46256465876478, 14.999999999999998, 1064)
-    femmesh.addNode(6.9321116619258305, 58.14695203148008, 14.999999999999998, 1065)
-    femmesh.addNode(8.302347872948605, 54.43836934325277, 14.999999999999998, 1066)
-    femmesh.addNode(-7.212180418171053, 60.67180745166895, 14.999999999999998, 1067)
-    femmesh.addNode(-2.417647858739187, 59.87432756570268, 14.999999999999998, 1068)
-    femmesh.addNode(-0.5400830740573817, 55.38443418054021, 14.999999999999998, 1069)
-    femmesh.addNode(-17.4137472884894, 60.424030354294324, 14.999999999999998, 1070)
-    femmesh.addNode(-12.560840274875396, 60.15419679598647, 14.999999999999998, 1071)
-    femmesh.addNode(-10.559541023192677, 55.278586431795645, 14.999999999999998, 1072)
-    femmesh.addNode(-25.513671902249882, 62.765725720864395, 14.999999999999998, 1073)
-    femmesh.addNode(-20.660283493183474, 63.02675748658035, 14.999999999999998, 1074)
-    femmesh.addNode(-19.154737084591094, 57.3637029083992, 14.999999999999998, 1075)
-    femmesh.addNode(-36.30151799708538, 60.05371945313223, 14.999999999999998, 1076)
-    femmesh.addNode(-31.505546994133535, 60.842502548043626, 14.999999999999998, 1077)
-    femmesh.addNode(-30.26827576899987, 54.78631087407619, 14.999999999999998, 1078)
-    femmesh.addNode(-27.388799290080936, 59.50882972707613, 14.999999999999998, 1079)
-    femmesh.addNode(-24.27640067711622, 56.70953404689696, 14.999999999999998, 1080)
-    femmesh.addNode(-45.780943412625106, 57.75644995795401, 14.999999999999998, 1081)
-    femmesh.addNode(-41.09960365280574, 59.06357454463543, 14.999999999999998, 1082)
-    femmesh.addNode(-39.183109128772834, 55.129838786546884, 14.999999999999998, 1083)
-    femmesh.addNode(-50.29180559290197, 55.946577304278996, 14.999999999999998, 1084)
-    femmesh.addNode(-61.09798687151326, 51.407028199770735, 14.999999999999998, 1085)
-    femmesh.addNode(-56.811414884206684, 53.698057931051224, 14.999999999999998, 1086)
-    femmesh.addNode(-46.89549319407062, 51.3420369216097, 14.999999999999998, 1087)
-    femmesh.addNode(-53.20610400247939, 53.14892034783861, 14.999999999999998, 1088)
-    femmesh.addNode(-53.41510248537533, 49.093517548381925, 14.999999999999998, 1089)
-    femmesh.addNode(-70.66087902200415, 45.35541570361171, 14.999999999999998, 1090)
-    femmesh.addNode(-66.64973415716474, 48.10027152956054, 14.999999999999998, 1091)
-    femmesh.addNode(-59.20070102505042, 46.6763039887966, 14.999999999999998, 1092)
-    femmesh.addNode(-63.278274529461065, 48.4406770569728, 14.999999999999998, 1093)
-    femmesh.addNode(-64.75244831070191, 43.3695473185864, 14.999999999999998, 1094)
-    femmesh.addNode(-77.72008206778571, 38.94558571278751, 14.999999999999998, 1095)
-    femmesh.addNode(-74.03221552977041, 42.11152270359447, 14.999999999999998, 1096)
-    femmesh.addNode(-71.49524444617184, 39.78524879115688, 14.999999999999998, 1097)
-    femmesh.addNode(-81.04067564370496, 35.396335801110865, 14.999999999999998, 1098)
-    femmesh.addNode(-89.23047513481649, 25.56155382448729, 14.999999999999998, 1099)
-    femmesh.addNode(-86.31676775041828, 29.451775657503504, 14.999999999999998, 1100)
-    femmesh.addNode(-76.09968705739142, 31.946474775469838, 14.999999999999998, 1101)
-    femmesh.addNode(-82.27378174715827, 30.801454785441067, 14.999999999999998, 1102)
-    femmesh.addNode(-81.37577916410476, 26.001914631862476, 14.999999999999998, 1103)
-    femmesh.addNode(-93.40486309663925, 18.448313015405617, 14.999999999999998, 1104)
-    femmesh.addNode(-90.93280115883388, 22.633098124300346, 14.999999999999998, 1105)
-    femmesh.addNode(-87.12109119138213, 21.72377980373797, 14.999999999999998, 1106)
-    femmesh.addNode(-96.10121268492685, 9.695185642559519, 14.999999999999998, 1107)
-    femmesh.addNode(-94.10028681171863, 14.124611370788777, 14.999999999999998, 1108)
-    femmesh.addNode(-89.51884093047889, 14.471622458934187, 14.999999999999998, 1109)
-    femmesh.addNode(-92.77379898944577, 5.073960407158673, 14.999999999999998, 1110)
-    femmesh.addNode(-59.58103936003704, 3.7489942374852703, 14.999999999999998, 1111)
-    femmesh.addNode(-64.41437269337035, 3.7489942374852703, 14.999999999999998, 1112)
-    femmesh.addNode(-58.16721961247008, 7.431535300632042, 14.999999999999998, 1113)
-    femmesh.addNode(-69.258511606354, 4.678071048290704, 14.999999999999998, 1114)
-    femmesh.addNode(-74.09184493968732, 4.678071048290704, 14.999999999999998, 1115)
-    femmesh.addNode(-67.33955096639107, 8.427065285775974, 14.999999999999998, 1116)
-    femmesh.addNode(-78.47452812164386, 3.589613461104051, 14.999999999999998, 1117)
-    femmesh.addNode(-83.30786145497717, 3.589613461104051, 14.999999999999998, 1118)
-    femmesh.addNode(-76.56637306133125, 8.267684509394751, 14.999999999999998, 1119)
-    femmesh.addNode(-87.9404656561124, 5.073960407158673, 14.999999999999998, 1120)
-    femmesh.addNode(-85.58166044442302, 8.663573868262723, 14.999999999999998, 1121)
-    femmesh.addNode(27.59897714690083, 41.7619006215828, 14.999999999999998, 1122)
-    femmesh.addNode(23.548412547303556, 44.12794466540548, 14.999999999999998, 1123)
-    femmesh.addNode(19.912566068835638, 46.511740323834445, 14.999999999999998, 1124)
-    femmesh.addNode(15.472760181494358, 48.02612524040919, 14.999999999999998, 1125)
-    femmesh.addNode(7.394066792041418, 50.37421140933232, 14.999999999999998, 1126)
-    femmesh.addNode(2.741930409519039, 50.97659423713453, 14.999999999999998, 1127)
-    femmesh.addNode(11.565699646616451, 49.839909478982776, 14.999999999999998, 1128)
-    femmesh.addNode(-1.9288676829119122, 51.38835714407243, 14.999999999999998, 1129)
-    femmesh.addNode(-6.607963137758961, 51.054735026626645, 14.999999999999998, 1130)
-    femmesh.addNode(-11.956622994463306, 50.53712437094417, 14.999999999999998, 1131)
-    femmesh.addNode(-16.476231873694736, 49.28079098700831, 14.999999999999998, 1132)
-    femmesh.addNode(-20.490971706738108, 45.15713842613766, 14.999999999999998, 1133)
-    femmesh.addNode(-24.671003346665472, 43.02815428293097, 14.999999999999998, 1134)
-    femmesh.addNode(-19.92294071294039, 50.63732321524252, 14.999999999999998, 1135)
-    femmesh.addNode(-29.334939634697598, 40.72134004157752, 14.999999999999998, 1136)
-    femmesh.addNode(-33.00883434124373, 37.80453773802115, 14.999999999999998, 1137)
-    femmesh.addNode(-28.601616834015893, 44.206856413018414, 14.999999999999998, 1138)
-    femmesh.addNode(-37.23166527301318, 35.199219244033884, 14.999999999999998, 1139)
-    femmesh.addNode(-40.253031145085984, 31.610823187312562, 14.999999999999998, 1140)
-    femmesh.addNode(-37.48838405381748, 39.294723677677695, 14.999999999999998, 1141)
-    femmesh.addNode(-42.33220709651386, 27.87008541315879, 14.999999999999998, 1142)
-    femmesh.addNode(-44.58065323311135, 23.753080681118856, 14.999999999999998, 1143)
-    femmesh.addNode(-43.79039093701482, 32.948667409536654, 14.999999999999998, 1144)
-    femmesh.addNode(-47.81596752516486, 16.92976726772157, 14.999999999999998, 1145)
-    femmesh.addNode(-49.20190118323613, 12.448202151800043, 14.999999999999998, 1146)
-    femmesh.addNode(-49.75951252207051, 27.281705763451868, 14.999999999999998, 1147)
-    femmesh.addNode(-48.47059886673917, 21.826856809187838, 14.999999999999998, 1148)
-    femmesh.addNode(-52.994826814124025, 20.45839235005458, 14.999999999999998, 1149)
-    femmesh.addNode(-53.08961132204122, 11.463192467440926, 14.999999999999998, 1150)
-    femmesh.addNode(-62.567042273742544, 21.73819112035364, 14.999999999999998, 1151)
-    femmesh.addNode(-59.833198437484675, 25.74873111995066, 14.999999999999998, 1152)
-    femmesh.addNode(-63.26934550532306, 27.251207522672264, 14.999999999999998, 1153)
-    femmesh.addNode(-65.34110033018332, 30.375259668213598, 14.999999999999998, 1154)
-    femmesh.addNode(-68.0749441664412, 26.36471966861658, 14.999999999999998, 1155)
-    femmesh.addNode(-71.16644083592125, 24.683720130146753, 14.999999999999998, 1156)
-    femmesh.addNode(-69.09468601106099, 21.55966798460542, 14.999999999999998, 1157)
-    femmesh.addNode(-68.63515138084227, 17.720461461641897, 14.999999999999998, 1158)
-    femmesh.addNode(-65.54365471136222, 19.401461000111727, 14.999999999999998, 1159)
-    femmesh.addNode(-62.10750764352383, 17.898984597390122, 14.999999999999998, 1160)
-    femmesh.addNode(-48.885070653502964, 34.186108909648254, 14.999999999999998, 1161)
-    femmesh.addNode(-52.775016287130775, 32.25988503771724, 14.999999999999998, 1162)
-    femmesh.addNode(-56.218038043814204, 35.21301785309146, 14.999999999999998, 1163)
-    femmesh.addNode(-57.09247991238176, 28.308614706895064, 14.999999999999998, 1164)
-    femmesh.addNode(-54.460493892832915, 44.40347165775408, 14.999999999999998, 1165)
-    femmesh.addNode(-50.85518301110563, 43.85433407454147, 14.999999999999998, 1166)
-    femmesh.addNode(-47.62357100750745, 42.03200233288709, 14.999999999999998, 1167)
-    femmesh.addNode(-46.57817960004986, 46.72204822351493, 14.999999999999998, 1168)
-    femmesh.addNode(-46.80589470207508, 37.926846683802026, 14.999999999999998, 1169)
-    femmesh.addNode(-42.528891291019306, 40.79456083277549, 14.999999999999998, 1170)
-    femmesh.addNode(-60.95824517603171, 37.48585018413397, 14.999999999999998, 1171)
-    femmesh.addNode(-56.64078155078072, 41.43712051495615, 14.999999999999998, 1172)
-    femmesh.addNode(-76.43342135269023, 18.135370073138667, 14.999999999999998, 1173)
-    femmesh.addNode(-74.75948792069289, 23.615131102967812, 14.999999999999998, 1174)
-    femmesh.addNode(-79.00672659284209, 21.87183272997089, 14.999999999999998, 1175)
-    femmesh.addNode(-83.0497125961021, 20.522153602033328, 14.999999999999998, 1176)
-    femmesh.addNode(-80.8148581340636, 11.785649311174922, 14.999999999999998, 1177)
-    femmesh.addNode(-76.43217495210708, 12.874106898361573, 14.999999999999998, 1178)
-    femmesh.addNode(-72.18493627995788, 14.617405271358496, 14.999999999999998, 1179)
-    femmesh.addNode(-84.75203862011946, 17.593697901846383, 14.999999999999998, 1180)
-    femmesh.addNode(-85.44746233519885, 13.269996257229545, 14.999999999999998, 1181)
-    femmesh.addNode(-40.72324607102922, 51.62104101791752, 14.999999999999998, 1182)
-    femmesh.addNode(-35.92516041530885, 52.61118592641432, 14.999999999999998, 1183)
-    femmesh.addNode(-34.32406978103171, 49.13062127395274, 14.999999999999998, 1184)
-    femmesh.addNode(-32.78393283877532, 52.639419042582105, 14.999999999999998, 1185)
-    femmesh.addNode(-32.224197663273095, 45.52944828089274, 14.999999999999998, 1186)
-    femmesh.addNode(-35.365425239806626, 45.50121516472496, 14.999999999999998, 1187)
-    femmesh.addNode(-40.40593247700846, 47.00105231982276, 14.999999999999998, 1188)
-    femmesh.addNode(-38.30606035924985, 43.39987932676276, 14.999999999999998, 1189)
-    femmesh.addNode(-43.66388119047244, 49.51970517995532, 14.999999999999998, 1190)
-    femmesh.addNode(-63.723993901115136, 33.75709891032128, 14.999999999999998, 1191)
-    femmesh.addNode(-64.14673740808165, 39.981201572185974, 14.999999999999998, 1192)
-    femmesh.addNode(-67.51819703578533, 39.64079604477371, 14.999999999999998, 1193)
-    femmesh.addNode(-68.52959256223326, 32.8706110562656, 14.999999999999998, 1194)
-    femmesh.addNode(-72.50663997261978, 33.015063802648775, 14.999999999999998, 1195)
-    femmesh.addNode(-70.88953354355158, 36.396903044756456, 14.999999999999998, 1196)
-    femmesh.addNode(-21.029864472422148, 54.106806914610935, 14.999999999999998, 1197)
-    femmesh.addNode(-25.04460430546552, 49.98315435374028, 14.999999999999998, 1198)
-    femmesh.addNode(-28.667185134722722, 51.30574622161461, 14.999999999999998, 1199)
-    femmesh.addNode(-27.56026137524097, 47.836262522246194, 14.999999999999998, 1200)
-    femmesh.addNode(-56.172189248792776, 10.264713865393972, 14.999999999999998, 1201)
-    femmesh.addNode(-55.42277339930127, 14.362824206541362, 14.999999999999998, 1202)
-    femmesh.addNode(-55.73554533922694, 17.898508763110176, 14.999999999999998, 1203)
-    femmesh.addNode(-58.81812326597849, 16.70003016106322, 14.999999999999998, 1204)
-    femmesh.addNode(-60.500381689730126, 10.331167039732478, 14.999999999999998, 1205)
-    femmesh.addNode(-61.794735703598164, 14.363300040821308, 14.999999999999998, 1206)
-    femmesh.addNode(-63.789766067275465, 11.530121476059374, 14.999999999999998, 1207)
-    femmesh.addNode(-56.39017668080125, 22.79559830457644, 14.999999999999998, 1208)
-    femmesh.addNode(-73.7397460760731, 28.420182786978977, 14.999999999999998, 1209)
-    femmesh.addNode(-68.63390498025912, 12.459198286864805, 14.999999999999998, 1210)
-    femmesh.addNode(10.657418565709262, 45.77575154506232, -7.5, 1211)
-    femmesh.addNode(16.990200100136697, 43.82160540826083, 1.0333986869581757, 1212)
-    femmesh.addNode(18.115897860010403, 43.368355338030405, -6.447043438690407, 1213)
-    femmesh.addNode(24.780729899880267, 39.9363922460352, -4.321572441719805, 1214)
-    femmesh.addNode(-46.166036855409864, 8.814592507027077, 2.34932213756894, 1215)
-    femmesh.addNode(-46.77635220818684, 4.579615059767965, -4.753338368950168, 1216)
-    femmesh.addNode(29.856218519521736, 36.29884592813616, 4.7118890634956045, 1217)
-    femmesh.addNode(22.534702887561245, 41.24545024326124, 6.772443494622323, 1218)
-    femmesh.addNode(-46.63306367000361, 5.861516250032021, 9.959162599130618, 1219)
-    femmesh.addNode(8.527644429364, 46.21990134656647, 1.7505912929663836, 1220)
-    femmesh.addNode(-44.90058539326772, 13.890191911628648, -3.2870659971249694, 1221)
-    femmesh.addNode(31.098207045422743, 35.240623129564824, -10.219494453966659, 1222)
-    femmesh.addNode(-44.51871681056517, 15.06930169386435, 6.649646320732934, 1223)
-    femmesh.addNode(-42.36017725078908, 20.36210655314747, 0.1283067692924451, 1224)
-    femmesh.addNode(-38.794847304585026, 26.5322411909347, 7.5, 1225)
-    femmesh.addNode(-37.78298314556083, 27.954358955666756, -1.7403376483525221, 1226)
-    femmesh.addNode(13.394492453336502, 45.0509441845286, 7.951005687070431, 1227)
-    femmesh.addNode(1.353145800664509, 46.980517200666746, 7.5, 1228)
-    femmesh.addNode(1.353145800664509, 46.980517200666746, 0.0, 1229)
-    femmesh.addNode(-8.00504510902959, 46.31327296577517, 7.5, 1230)
-    femmesh.addNode(-8.00504510902959, 46.31327296577517, 0.0, 1231)
-    femmesh.addNode(-17.044262867492453, 43.80060619790345, 7.5, 1232)
-    femmesh.addNode(-17.044262867492453, 43.80060619790345, 0.0, 1233)
-    femmesh.addNode(-25.404326147347177, 39.54263791149008, 7.5, 1234)
-    femmesh.addNode(-25.404326147347177, 39.54263791149008, 0.0, 1235)
-    femmesh.addNode(-32.75211556043943, 33.70903330437735, 7.5, 1236)
-    femmesh.addNode(-32.75211556043943, 33.70903330437735, 0.0, 1237)
-    femmesh.addNode(-40.403337338789804, 24.01187897453995, -8.380389188365164, 1238)
-    femmesh.addNode(-34.97264627287735, 31.399267709171152, -7.872320665602527, 1239)
-    femmesh.addNode(-25.404326147347177, 39.54263791149008, -7.5, 1240)
-    femmesh.addNode(-17.044262867492453, 43.80060619790345, -7.5, 1241)
-    femmesh.addNode(-8.00504510902959, 46.31327296577517, -7.5, 1242)
-    femmesh.addNode(1.353145800664509, 46.980517200666746, -7.5, 1243)
-    femmesh.addNode(32.91393434772397, 33.55104954772229, -7.6097472269833295, 1244)
-    femmesh.addNode(32.91393434772397, 33.55104954772229, -12.60974722698333, 1245)
-    femmesh.addNode(29.40092403474061, 36.668592363266576, -12.60974722698333, 1246)
-    femmesh.addNode(32.32658716532643, 34.11732349177691, 4.855944531747802, 1247)
-    femmesh.addNode(32.32658716532644, 34.1173234917769, 9.855944531747802, 1248)
-    femmesh.addNode(28.759990994865802, 37.17341681867889, 9.855944531747802, 1249)
-    femmesh.addNode(-46.48083652785611, 6.966479431586425, -9.876669184475084, 1250)
-    femmesh.addNode(-46.944054755553346, 2.292536391774223, -9.876669184475084, 1251)
-    femmesh.addNode(-46.944054755553346, 2.292536391774223, -4.876669184475084, 1252)
-    femmesh.addNode(-46.90817621955777, 2.9364951481170856, 7.479581299565311, 1253)
-    femmesh.addNode(-46.90817621955777, 2.9364951481170856, 12.47958129956531, 1254)
-    femmesh.addNode(-46.380864933966016, 7.603641757552841, 12.47958129956531, 1255)
-    femmesh.addNode(32.32658716532643, 34.11732349177691, -0.14405546825219773, 1256)
-    femmesh.addNode(27.37895120251713, 38.20200297170537, 0.1951583108878996, 1257)
-    femmesh.addNode(29.988780777917253, 36.18940490604979, -4.660786220859903, 1258)
-    femmesh.addNode(28.037946794176754, 37.72099600443914, -7.270533447843232, 1259)
-    femmesh.addNode(26.227047713288677, 39.001820063233964, -9.660786220859903, 1260)
-    femmesh.addNode(22.203396619999065, 41.4247411402294, -9.660786220859903, 1261)
-    femmesh.addNode(15.172987440228649, 44.483485161784074, -11.25, 1262)
-    femmesh.addNode(10.657418565709262, 45.77575154506232, -11.25, 1263)
-    femmesh.addNode(14.436925699679112, 44.727789754714514, -6.973521719345204, 1264)
-    femmesh.addNode(18.829027505741497, 43.0635312438266, -10.723521719345204, 1265)
-    femmesh.addNode(21.516848304499895, 41.785466840052656, -5.384307940205106, 1266)
-    femmesh.addNode(6.035418723745092, 46.61087556385384, -11.25, 1267)
-    femmesh.addNode(-3.342640396364229, 46.88098500650977, -11.25, 1268)
-    femmesh.addNode(1.353145800664509, 46.980517200666746, -11.25, 1269)
-    femmesh.addNode(6.035418723745092, 46.61087556385384, -7.5, 1270)
-    femmesh.addNode(-12.587506945271354, 45.28305056975231, -11.25, 1271)
-    femmesh.addNode(-8.00504510902959, 46.31327296577517, -11.25, 1272)
-    femmesh.addNode(-3.342640396364229, 46.88098500650977, -7.5, 1273)
-    femmesh.addNode(-21.33080520795491, 41.880744372328, -11.25, 1274)
-    femmesh.addNode(-17.044262867492453, 43.80060619790345, -11.25, 1275)
-    femmesh.addNode(-12.587506945271354, 45.28305056975231, -7.5, 1276)
-    femmesh.addNode(-29.224145217710426, 36.809636459685024, -11.25, 1277)
-    femmesh.addNode(-25.404326147347177, 39.54263791149008, -11.25, 1278)
-    femmesh.addNode(-21.33080520795491, 41.880744372328, -7.5, 1279)
-    femmesh.addNode(-36.96393869648555, 29.028731216545758, -11.436160332801263, 1280)
-    femmesh.addNode(-33.88206893950057, 32.5730779076668, -11.436160332801263, 1281)
-    femmesh.addNode(-30.46183381251271, 35.792131548412385, -7.686160332801263, 1282)
-    femmesh.addNode(-41.944939101581475, 21.204293993543416, -11.690194594182582, 1283)
-    femmesh.addNode(-39.619138924602844, 25.28485378389639, -11.690194594182582, 1284)
-    femmesh.addNode(-37.868563538055106, 27.838317039007283, -8.126354926983845, 1285)
-    femmesh.addNode(-44.15120892685586, 16.11430266245249, -9.143532998562485, 1286)
-    femmesh.addNode(-45.53908521030171, 11.6271973497004, -9.143532998562485, 1287)
-    femmesh.addNode(-42.9511576749578, 19.08397375760389, -5.833727592745067, 1288)
-    femmesh.addNode(-46.07425454984431, 9.28240635159605, -4.0202021830375685, 1289)
-    femmesh.addNode(-46.944054755553346, 2.292536391774223, 0.1233308155249162, 1290)
-    femmesh.addNode(-46.51941185899649, 6.704052527617632, -1.2020081156906137, 1291)
-    femmesh.addNode(-46.79104472120848, 4.426977964466072, 3.67466106878447, 1292)
-    femmesh.addNode(-46.423037701408084, 7.341768899498545, 6.154242368349777, 1293)
-    femmesh.addNode(25.138380119858585, 39.712237974577796, 10.886221747311161, 1294)
-    femmesh.addNode(21.049259687429625, 42.022954044321416, 10.886221747311161, 1295)
-    femmesh.addNode(26.311962774247572, 38.94458389772074, 5.742166279058964, 1296)
-    femmesh.addNode(16.50600978877897, 44.00626819957281, 11.475502843535217, 1297)
-    femmesh.addNode(12.031414810590425, 45.433963701789274, 11.475502843535217, 1298)
-    femmesh.addNode(18.065082770232543, 43.38954694975101, 7.361724590846379, 1299)
-    femmesh.addNode(1.353145800664509, 46.980517200666746, 11.25, 1300)
-    femmesh.addNode(6.035418723745092, 46.61087556385384, 11.25, 1301)
-    femmesh.addNode(7.436667366762527, 46.407930124884146, 7.725502843535217, 1302)
-    femmesh.addNode(-8.00504510902959, 46.31327296577517, 11.25, 1303)
-    femmesh.addNode(-3.342640396364229, 46.88098500650977, 11.25, 1304)
-    femmesh.addNode(-3.342640396364229, 46.88098500650977, 7.5, 1305)
-    femmesh.addNode(-17.044262867492453, 43.80060619790345, 11.25, 1306)
-    femmesh.addNode(-12.587506945271354, 45.28305056975231, 11.25, 1307)
-    femmesh.addNode(-12.587506945271354, 45.28305056975231, 7.5, 1308)
-    femmesh.addNode(-25.404326147347177, 39.54263791149008, 11.25, 1309)
-    femmesh.addNode(-21.33080520795491, 41.880744372328, 11.25, 1310)
-    femmesh.addNode(-21.33080520795491, 41.880744372328, 7.5, 1311)
-    femmesh.addNode(-32.75211556043943, 33.70903330437735, 11.25, 1312)
-    femmesh.addNode(-29.224145217710426, 36.809636459685024, 11.25, 1313)
-    femmesh.addNode(-29.224145217710426, 36.809636459685024, 7.5, 1314)
-    femmesh.addNode(-38.794847304585026, 26.5322411909347, 11.25, 1315)
-    femmesh.addNode(-35.95300488223746, 30.271792810103097, 11.25, 1316)
-    femmesh.addNode(-35.95300488223746, 30.271792810103097, 7.5, 1317)
-    femmesh.addNode(-41.24926259295619, 22.527723709628212, 11.25, 1318)
-    femmesh.addNode(-43.93490138912177, 16.695042375751733, 10.824823160366467, 1319)
-    femmesh.addNode(-45.38182020265691, 12.226626480502329, 10.824823160366467, 1320)
-    femmesh.addNode(-42.0492239746548, 20.99673220120969, 7.074823160366467, 1321)
-    femmesh.addNode(-45.807833384579126, 10.518669146362486, 8.304404459931774, 1322)
-    femmesh.addNode(17.554511881661703, 43.59861365452574, -2.706822375866116, 1323)
-    femmesh.addNode(13.858296296948, 44.91044003064318, -3.233300656520912, 1324)
-    femmesh.addNode(12.815149363541002, 45.21915464479776, 1.3919949899622779, 1325)
-    femmesh.addNode(9.595101760417991, 46.010151295200316, -2.874704353516808, 1326)
-    femmesh.addNode(4.955011403804625, 46.73807721749116, 0.8752956464831918, 1327)
-    femmesh.addNode(6.035418723745092, 46.61087556385384, -3.75, 1328)
-    femmesh.addNode(1.353145800664509, 46.980517200666746, -3.75, 1329)
-    femmesh.addNode(20.975613664337974, 42.05976261707189, -1.6440868773808148, 1330)
-    femmesh.addNode(23.666768963585817, 40.60645326575877, 1.2254355264512569, 1331)
-    femmesh.addNode(19.80438418394452, 42.62377701582449, 3.902921090790251, 1332)
-    femmesh.addNode(15.204775692162686, 44.47262974179758, 4.492202187014303, 1333)
-    femmesh.addNode(10.976640496419394, 45.70025561648825, 4.850798490018406, 1334)
-    femmesh.addNode(-45.60397843691746, 11.370011025727617, -0.4688719297780146, 1335)
-    femmesh.addNode(-45.45009882956933, 11.970318140399645, 4.499484229150937, 1336)
-    femmesh.addNode(-44.71353795691791, 14.481005606492294, 1.6812901618039824, 1337)
-    femmesh.addNode(4.955011403804625, 46.73807721749116, 4.625295646483192, 1338)
-    femmesh.addNode(1.353145800664509, 46.980517200666746, 3.75, 1339)
-    femmesh.addNode(-43.75021821759727, 17.17318857733238, -1.579379613916263, 1340)
-    femmesh.addNode(-43.519983963124524, 17.748549119558596, 3.3889765450126887, 1341)
-    femmesh.addNode(-41.421975405415516, 22.20855586284602, -4.1260412095363606, 1342)
-    femmesh.addNode(-40.69462056596607, 23.5148433333512, 3.8141533846462217, 1343)
-    femmesh.addNode(-38.29551715079733, 27.247997470511248, 2.879831175823739, 1344)
-    femmesh.addNode(-40.250988978094156, 24.266394175594833, -0.8060154395300394, 1345)
-    femmesh.addNode(-39.1428277570846, 26.016130288327023, -5.060363418358843, 1346)
-    femmesh.addNode(-35.95300488223746, 30.271792810103097, 3.75, 1347)
-    femmesh.addNode(-35.38472985033553, 30.934137993788895, -0.8701688241762611, 1348)
-    femmesh.addNode(-32.75211556043943, 33.70903330437735, 3.75, 1349)
-    femmesh.addNode(-33.88206893950057, 32.5730779076668, -3.936160332801263, 1350)
-    femmesh.addNode(-36.41857015450043, 29.71006139175297, -4.806329156977524, 1351)
-    femmesh.addNode(-3.342640396364229, 46.88098500650977, 3.75, 1352)
-    femmesh.addNode(-8.00504510902959, 46.31327296577517, 3.75, 1353)
-    femmesh.addNode(-3.342640396364229, 46.88098500650977, 0.0, 1354)
-    femmesh.addNode(-3.342640396364229, 46.88098500650977, -3.75, 1355)
-    femmesh.addNode(-12.587506945271354, 45.28305056975231, 3.75, 1356)
-    femmesh.addNode(-17.044262867492453, 43.80060619790345, 3.75, 1357)
-    femmesh.addNode(-12.587506945271354, 45.28305056975231, 0.0, 1358)
-    femmesh.addNode(-8.00504510902959, 46.31327296577517, -3.75, 1359)
-    femmesh.addNode(-12.587506945271354, 45.28305056975231, -3.75, 1360)
-    femmesh.addNode(-21.33080520795491, 41.880744372328, 3.75, 1361)
-    femmesh.addNode(-25.404326147347177, 39.54263791149008, 3.75, 1362)
-    femmesh.addNode(-21.33080520795491, 41.880744372328, 0.0, 1363)
-    femmesh.addNode(-17.044262867492453, 43.80060619790345, -3.75, 1364)
-    femmesh.addNode(-21.33080520795491, 41.880744372328, -3.75, 1365)
-    femmesh.addNode(-29.224145217710426, 36.809636459685024, 3.75, 1366)
-    femmesh.addNode(-29.224145217710426, 36.809636459685024, 0.0, 1367)
-    femmesh.addNode(-25.404326147347177, 39.54263791149008, -3.75, 1368)
-    femmesh.addNode(-29.224145217710426, 36.809636459685024, -3.75, 1369)
-    femmesh.addNode(50.50199502405478, 2.296519667605346, 9.227999799492943, 1370)
-    femmesh.addNode(49.98520298671078, 5.401841788481968, 6.600765306122447, 1371)
-    femmesh.addNode(50.912252302731666, 7.54119289886932, 12.627234493370494, 1372)
-    femmesh.addNode(50.39546026538767, 10.64651501974594, 10.0, 1373)
-    femmesh.addNode(54.639211360309545, 5.244673231263974, 11.600765306122447, 1374)
-    femmesh.addNode(51.20041431561534, 18.855629543089282, 3.0259876133120205, 1375)
-    femmesh.addNode(52.42154632068409, 14.534597814250123, 1.8285407251734123, 1376)
-    femmesh.addNode(53.01818775667701, 15.243630636447254, -1.8935095400919177, 1377)
-    femmesh.addNode(54.23931976174576, 10.922598907608094, -3.090956428230526, 1378)
-    femmesh.addNode(39.8384396523972, 29.729163758720823, 6.9264596855558125, 1379)
-    femmesh.addNode(38.12036802543592, 32.36702830583056, 9.553694178926309, 1380)
-    femmesh.addNode(52.170837162558094, 15.735339897824971, 4.903138277151649, 1381)
-    femmesh.addNode(39.8384396523972, 29.729163758720823, 2.5000000000000053, 1382)
-    femmesh.addNode(53.01818775667701, 15.243630636447252, -6.266358876252289, 1383)
-    femmesh.addNode(58.64261897721852, 11.966172433964948, -10.01635887625229, 1384)
-    femmesh.addNode(49.425037418444916, 13.766804665010252, -11.25, 1385)
-    femmesh.addNode(50.64616942351367, 9.445772936171096, -8.074597551978238, 1386)
-    femmesh.addNode(49.04285497190621, 4.691559467669083, 12.627234493370494, 1387)
-    femmesh.addNode(52.76981402948408, 2.3950398000637367, 11.600765306122447, 1388)
-    femmesh.addNode(58.21812740522781, 6.753271827990504, 8.002582729036973, 1389)
-    femmesh.addNode(53.97437631030594, 12.155113616472473, 6.401817422914526, 1390)
-    femmesh.addNode(58.6283846839047, 11.997945059254478, 11.401817422914526, 1391)
-    femmesh.addNode(54.22508546843194, 10.954371532897625, 3.327219870936289, 1392)
-    femmesh.addNode(59.83802536441148, 6.753271827990504, 3.901817422914526, 1393)
-    femmesh.addNode(51.85581010402045, 4.201099704907121, -0.5745975519782371, 1394)
-    femmesh.addNode(59.8522596577253, 6.721499202700974, -2.516358876252289, 1395)
-    femmesh.addNode(45.10521322535806, 29.067456707593117, 10.04485993440832, 1396)
-    femmesh.addNode(39.73973484229674, 29.547534813056743, 12.627234493370494, 1397)
-    femmesh.addNode(47.268229356482834, 30.38397646802629, 12.417625441037824, 1398)
-    femmesh.addNode(44.570596686648244, 33.69708173842845, 12.977263413322031, 1399)
-    femmesh.addNode(42.40758055552346, 32.380561977995285, 10.604497906692528, 1400)
-    femmesh.addNode(55.02035132520527, 19.71243998905704, -11.758554538330493, 1401)
-    femmesh.addNode(50.97999139883636, 19.24355617564337, -8.008554538330491, 1402)
-    femmesh.addNode(47.84096612427231, 17.51314668090622, -11.25, 1403)
-    femmesh.addNode(56.60442261937787, 15.966097973161068, -11.758554538330493, 1404)
-    femmesh.addNode(50.97999139883636, 19.243556175643374, -3.6357052021701204, 1405)
-    femmesh.addNode(58.23236169854163, 6.721499202700974, -6.617124182374738, 1406)
-    femmesh.addNode(50.235912144836774, 4.201099704907121, -4.675362858100686, 1407)
-    femmesh.addNode(50.85878760253349, 8.03249628594973, -11.803477893074568, 1408)
-    femmesh.addNode(44.419022636954885, 29.97365225813318, 6.3974707990353, 1409)
-    femmesh.addNode(46.137094263916154, 27.335787711023443, 3.7702363056648043, 1410)
-    femmesh.addNode(44.962671951218844, 34.109665511340175, 5.696695991220617, 1411)
-    femmesh.addNode(49.33626868699087, 21.884726143696092, -1.20601247062144, 1412)
-    femmesh.addNode(44.96267195121885, 34.109665511340175, 1.2702363056648096, 1413)
-    femmesh.addNode(42.95122986978742, 36.516575231202275, 9.903723098877844, 1414)
-    femmesh.addNode(49.33626868699087, 21.884726143696092, -5.578861806781811, 1415)
-    femmesh.addNode(51.20041431561534, 18.85562954308928, 6.153138277151649, 1416)
-    femmesh.addNode(49.806542199210895, 21.81114108854505, 4.903138277151649, 1417)
-    femmesh.addNode(43.369804222080745, 25.137465605779216, -8.074597551978238, 1418)
-    femmesh.addNode(49.46218470148649, 28.018852187125255, -12.429621936670063, 1419)
-    femmesh.addNode(45.8515759328006, 27.945432082795854, -5.504219488648299, 1420)
-    femmesh.addNode(47.87228130505488, 23.935540765817223, -8.679621936670062, 1421)
-    femmesh.addNode(45.39050959433503, 21.127574288800584, -11.25, 1422)
-    femmesh.addNode(40.2833841565607, 33.68354806626374, 11.926459685555812, 1423)
-    femmesh.addNode(45.053014951990676, 29.130699031646838, -9.233099829744628, 1424)
-    femmesh.addNode(42.57124324127082, 26.3227325546302, -11.803477893074568, 1425)
-    femmesh.addNode(59.59418428593079, 3.3068320672530085, 6.695786590953562, 1426)
-    femmesh.addNode(61.214082245114454, 3.3068320672530085, 2.5950212848311143, 1427)
-    femmesh.addNode(47.31556331473659, 25.894617460674723, -2.403459358760048, 1428)
-    femmesh.addNode(47.530966380320606, 24.380276165567675, 1.8930856418251754, 1429)
-    femmesh.addNode(39.21160639654737, 30.783543530243687, -0.5745975519782318, 1430)
-    femmesh.addNode(61.50700637784192, 6.721499202700974, -6.941468205698353, 1431)
-    femmesh.addNode(54.639211360309545, 5.244673231263974, -11.600765306122451, 1432)
-    femmesh.addNode(57.91385603960983, 5.244673231263974, -11.925109329446066, 1433)
-    femmesh.addNode(47.84096612427231, 17.51314668090622, 11.25, 1434)
-    femmesh.addNode(52.25751689509268, 23.94296442844128, 12.417625441037824, 1435)
-    femmesh.addNode(48.21715696872378, 23.47408061502761, 8.667625441037824, 1436)
-    femmesh.addNode(45.39050959433503, 21.127574288800584, 11.25, 1437)
-    femmesh.addNode(49.807060365155394, 27.557392036335642, 12.417625441037824, 1438)
-    femmesh.addNode(45.51026100806632, 28.390167482546303, 0.6956387536865671, 1439)
-    femmesh.addNode(46.82328485231933, 26.42959216048338, 7.417625441037824, 1440)
-    femmesh.addNode(61.4927720845281, 6.753271827990504, 8.32692675236059, 1441)
-    femmesh.addNode(57.913856039609826, 5.244673231263974, 11.925109329446062, 1442)
-    femmesh.addNode(43.99663747793058, 24.08308583425635, 10.0, 1443)
-    femmesh.addNode(50.4485303238566, 2.7878230546857563, -8.404243199197015, 1444)
-    femmesh.addNode(48.98939027170803, 5.182862854749493, -11.803477893074568, 1445)
-    femmesh.addNode(52.76981402948408, 2.3950398000637367, -11.600765306122451, 1446)
-    femmesh.addNode(50.235912144836774, 4.201099704907121, 3.5261677541442102, 1447)
-    femmesh.addNode(43.97988725067384, 34.34244370518043, -12.245481001234708, 1448)
-    femmesh.addNode(45.29737704440684, 32.86673165005821, -9.301639583081117, 1449)
-    femmesh.addNode(46.92335369281393, 30.845436618815903, -12.429621936670063, 1450)
-    femmesh.addNode(44.22559928439351, 29.966727114038168, -2.3762371350593536, 1451)
-    femmesh.addNode(48.81138897121507, 14.39285703564191, 10.0, 1452)
-    femmesh.addNode(55.24077424198424, 19.324513356502948, 9.903138277151648, 1453)
-    femmesh.addNode(52.569894795267984, 23.326867596951402, -11.758554538330493, 1454)
-    femmesh.addNode(40.03241223259826, 29.149316986320848, -11.803477893074568, 1455)
-    femmesh.addNode(42.10954850985058, 32.62770611801137, -9.048958894309276, 1456)
-    femmesh.addNode(43.427038303583586, 31.151994062889152, -6.105117476155684, 1457)
-    femmesh.addNode(42.36052043381302, 37.16193719795425, -9.17194068679052, 1458)
-    femmesh.addNode(40.2833841565607, 33.68354806626374, -11.926459685555812, 1459)
-    femmesh.addNode(38.41304541573744, 31.96881047909467, -8.72993757863038, 1460)
-    femmesh.addNode(61.64466890823911, 2.0200948354637163, -2.3069040860103334, 1461)
-    femmesh.addNode(63.29941562835573, 2.0200948354637163, -6.7320134154563975, 1462)
-    femmesh.addNode(62.868828965231074, 3.3068320672530085, 7.020130614277178, 1463)
-    femmesh.addNode(43.678010227546025, 35.686225142832036, -6.228099268636929, 1464)
-    femmesh.addNode(43.678010227546025, 35.686225142832036, -1.8016395830811112, 1465)
-    femmesh.addNode(38.41304541573744, 31.96881047909467, -4.303477893074562, 1466)
-    femmesh.addNode(62.38903112341305, 4.606173237490948, -11.925109329446064, 1467)
-    femmesh.addNode(62.38903112341304, 4.606173237490948, 11.925109329446064, 1468)
-    femmesh.addNode(42.2785658509693, 26.72095038136609, 12.627234493370494, 1469)
-    femmesh.addNode(57.044313389732096, 15.744287075150448, 11.401817422914526, 1470)
-    femmesh.addNode(42.36052043381302, 37.16193719795425, -12.245481001234708, 1471)
-    femmesh.addNode(42.951229869787426, 36.516575231202275, 12.977263413322031, 1472)
-    femmesh.addNode(38.12036802543592, 32.36702830583056, 12.627234493370494, 1473)
-    femmesh.addNode(-61.01381290811118, 16.50579617387999, -3.552713678800501e-15, 1474)
-    femmesh.addNode(-40.771908771765034, 47.51320403103544, -1.7763568394002505e-15, 1475)
-    femmesh.addNode(-65.75134396482667, 31.54212577154938, 0.0, 1476)
-    femmesh.addNode(-76.12053215357213, 20.010584507281614, -1.7763568394002505e-15, 1477)
-    femmesh.addNode(-51.362905047672655, 31.60606993956158, 1.7965525906960995, 1478)
-    femmesh.addNode(-55.067733249259604, 44.57072196959879, 2.475769956543991, 1479)
-    femmesh.addNode(-30.738204386403225, 53.5804722889428, -3.5753813275408954, 1480)
-    femmesh.addNode(-21.173763382207234, 54.92321966127151, 4.074207671608566, 1481)
-    femmesh.addNode(-82.30945167729838, 10.719547754956292, 3.8252819510482645, 1482)
-    femmesh.addNode(-76.71220769406646, 31.081286740401367, -2.4338941352281043, 1483)
-    femmesh.addNode(-64.26136221685844, 42.017201012889046, -2.9838247156201425, 1484)
-    femmesh.addNode(-86.36976508431322, 17.672389775877736, -4.058915333803292, 1485)
-    femmesh.addNode(-55.15257134397794, 11.085140058392998, 5.89421879718838, 1486)
-    femmesh.addNode(-70.48087166510612, 10.009556531201453, 0.1160032228884118, 1487)
-    femmesh.addNode(-34.349135221889824, 51.91941205331944, 6.0659800291737636, 1488)
-    femmesh.addNode(-43.53069065003451, 37.34254955103746, -3.7779879528953235, 1489)
-    femmesh.addNode(-12.935084359627393, 55.65856451293134, -3.267387308207352, 1490)
-    femmesh.addNode(-68.98267538907764, 39.35955950348185, 5.579534608041957, 1491)
-    femmesh.addNode(-59.121731762305934, 25.366435764560087, 5.641115913728322, 1492)
-    femmesh.addNode(-84.91379583148513, 20.44066791182662, 5.685903101695663, 1493)
-    femmesh.addNode(-67.53287860652918, 22.716316322959223, -4.884870510865055, 1494)
-    femmesh.addNode(-57.84329073554389, 26.56978787134097, -4.640641529779697, 1495)
-    femmesh.addNode(-49.946741522796486, 50.063641293449635, -2.8259054440869646, 1496)
-    femmesh.addNode(-46.00137892269361, 40.59884785912446, 5.846327158549393, 1497)
-    femmesh.addNode(-78.78496566542633, 9.681838588641837, -5.519564853153142, 1498)
-    femmesh.addNode(-54.392621242112135, 11.713194671626795, -5.9070393178672855, 1499)
-    femmesh.addNode(-70.09814413606493, 25.02300893414393, 6.118394653535253, 1500)
-    femmesh.addNode(-22.020271182861954, 56.58562178888097, -6.072780042950239, 1501)
-    femmesh.addNode(-3.8147298300098145, 55.1328655048512, 0.0, 1502)
-    femmesh.addNode(-6.7873368750502605, 55.69060848806669, 3.7500000000000018, 1503)
-    femmesh.addNode(-9.252356500349162, 60.36325426164477, 2.1163063458963256, 1504)
-    femmesh.addNode(-10.470064734328492, 50.98591873935325, -1.633693654103676, 1505)
-    femmesh.addNode(-6.279749455308716, 59.80551127842929, -1.633693654103676, 1506)
-    femmesh.addNode(-30.9605232954507, 51.36966333953166, -9.287690663770448, 1507)
-    femmesh.addNode(-32.00187875422562, 47.74025723030388, -9.287690663770448, 1508)
-    femmesh.addNode(-34.10175087198424, 51.341430223363886, -9.287690663770448, 1509)
-    femmesh.addNode(-57.8016174591624, 37.916234745934034, 8.737884978271994, 1510)
-    femmesh.addNode(-60.40953860704314, 38.056423870574086, 1.2378849782719954, 1511)
-    femmesh.addNode(-63.14342281694593, 31.40193664690933, 7.499999999999999, 1512)
-    femmesh.addNode(-64.75908852907142, 35.31065351287556, 10.289767304020977, 1513)
-    femmesh.addNode(-67.36700967695216, 35.45084263751561, 2.7897673040209785, 1514)
-    femmesh.addNode(-62.02520431916862, 41.96514073654032, 4.027652282292974, 1515)
-    femmesh.addNode(-51.68699507945013, 18.433951363513728, 0.06415338464622078, 1516)
-    femmesh.addNode(-60.06777233520856, 20.93611596922004, 2.8205579568641594, 1517)
-    femmesh.addNode(-50.74095450654751, 22.86427115885378, 2.8847113415103838, 1518)
-    femmesh.addNode(-50.101733993166484, 23.46594721224422, -2.256167380243626, 1519)
-    femmesh.addNode(-58.48251124892491, 25.96811181795053, 0.5002371919743127, 1520)
-    femmesh.addNode(-59.42855182182753, 21.537792022610482, -2.3203207648898503, 1521)
-    femmesh.addNode(-44.17630040626103, 54.44320503444669, -8.881784197001252e-16, 1522)
-    femmesh.addNode(-42.42418696578404, 54.99726717376948, 3.750000000000001, 1523)
-    femmesh.addNode(-48.76371678177675, 55.71842366565379, -1.4129527220434823, 1524)
-    femmesh.addNode(-47.01160334129976, 56.272485804976576, 2.3370472779565192, 1525)
-    femmesh.addNode(-45.35932514728076, 48.78842266224254, -1.4129527220434832, 1526)
-    femmesh.addNode(-0.937045592192941, 55.829424013622585, -7.499999999999999, 1527)
-    femmesh.addNode(0.8643656248372349, 55.466487622296995, -3.75, 1528)
-    femmesh.addNode(-5.790969279481442, 51.319540856799044, -5.383693654103676, 1529)
-    femmesh.addNode(-8.081160672338893, 60.16844766975488, -5.383693654103675, 1530)
-    femmesh.addNode(-2.1082414202032114, 56.02423060551247, 7.500000000000002, 1531)
-    femmesh.addNode(2.649278154568349, 55.029482332008726, 7.500000000000002, 1532)
-    femmesh.addNode(0.8643656248372349, 55.466487622296995, 3.75, 1533)
-    femmesh.addNode(-6.7873368750502605, 55.69060848806669, 7.500000000000002, 1534)
-    femmesh.addNode(-3.8147298300098145, 55.1328655048512, 3.75, 1535)
-    femmesh.addNode(-91.12996076385316, 12.396721505385809, 5.376883158607496, 1536)
-    femmesh.addNode(-92.23905770181722, 9.746104078981165, 2.490047103678611, 1537)
-    femmesh.addNode(-93.16011746736058, 15.873142515846531, 1.4347845161817179, 1538)
-    femmesh.addNode(-94.26921440532462, 13.222525089441888, -1.4520515387471673, 1539)
-    femmesh.addNode(-84.3396083808058, 14.195968765417014, -0.11681669137751394, 1540)
-    femmesh.addNode(-51.59334225943894, 54.650392984577344, 2.3370472779565192, 1541)
-    femmesh.addNode(-55.94920335836892, 31.43390873091543, 8.39827629534805, 1542)
-    femmesh.addNode(-58.557124506249664, 31.57409785555548, 0.8982762953480498, 1543)
-    femmesh.addNode(-53.21531914846613, 38.088395954580186, 2.1361612736200453, 1544)
-    femmesh.addNode(-98.5701710793098, 4.38633020150302, 0.5774061281544789, 1545)
-    femmesh.addNode(-88.64056505479097, 5.359773877478146, 1.9126409755241323, 1546)
-    femmesh.addNode(-90.67072175829838, 8.836194887938868, -2.029457666901646, 1547)
-    femmesh.addNode(-11.074282014740582, 60.60299116439556, -1.633693654103676, 1548)
-    femmesh.addNode(-61.754612480759306, 12.001892324425267, 7.499999999999997, 1549)
-    femmesh.addNode(-63.048966494627344, 16.034025325514097, 7.499999999999997, 1550)
-    femmesh.addNode(-60.118345712560725, 13.323697267770601, 10.44710939859419, 1551)
-    femmesh.addNode(-58.08319212604456, 13.795468116136494, 2.947109398594188, 1552)
-    femmesh.addNode(-58.82399169869268, 9.291564266681771, 10.44710939859419, 1553)
-    femmesh.addNode(-71.81234691361577, 33.66686851938732, -8.716947067614052, 1554)
-    femmesh.addNode(-71.23177582944658, 31.311706255975373, -1.2169470676140521, 1555)
-    femmesh.addNode(-66.33191504899588, 33.897288034961335, -7.500000000000001, 1556)
-    femmesh.addNode(-65.58692417501176, 39.13482565563116, -8.991912357810072, 1557)
-    femmesh.addNode(-65.00635309084257, 36.77966339221921, -1.4919123578100713, 1558)
-    femmesh.addNode(-70.48678495546245, 36.54924387664521, -2.7088594254241234, 1559)
-    femmesh.addNode(-39.11860306466514, 48.30779609441021, -7.500000000000002, 1560)
-    femmesh.addNode(-37.01873094690653, 44.7066231013502, -7.500000000000002, 1561)
-    femmesh.addNode(-35.755056579084126, 50.54683815998912, -1.7876906637704486, 1562)
-    femmesh.addNode(-15.576543564183975, 60.38442179550541, 11.250000000000004, 1563)
-    femmesh.addNode(-10.738914760483976, 59.91445989323569, 11.25, 1564)
-    femmesh.addNode(-14.421642619762206, 55.20977014452225, 5.866306345896323, 1565)
-    femmesh.addNode(-14.089985304049161, 60.8332161639145, 2.1163063458963274, 1566)
-    femmesh.addNode(-62.89420716630424, 3.748994237485274, -11.411054845007072, 1567)
-    femmesh.addNode(-66.48814185925677, 8.753772503086001, -7.441998388555795, 1568)
-    femmesh.addNode(-66.88693697215359, 5.004778265600726, -3.8530532335628664, 1569)
-    femmesh.addNode(-58.84281176065659, 5.856597335813397, -6.864574503940715, 1570)
-    femmesh.addNode(-62.43674645360913, 10.861375601414125, -2.895518047489437, 1571)
-    femmesh.addNode(-58.44401664775978, 9.605591573298671, -10.453519658933644, 1572)
-    femmesh.addNode(-61.754612480759306, 12.001892324425269, -7.500000000000003, 1573)
-    femmesh.addNode(-63.048966494627344, 16.034025325514097, -7.500000000000003, 1574)
-    femmesh.addNode(-67.78249587312482, 12.78590550417483, -7.441998388555795, 1575)
-    femmesh.addNode(-65.74734228660864, 13.25767635254072, 0.058001611444204126, 1576)
-    femmesh.addNode(-10.470064734328492, 50.98591873935325, 2.116306345896324, 1577)
-    femmesh.addNode(-55.24231840498929, 28.486252852060833, 3.718834252212211, 1578)
-    femmesh.addNode(-46.86154114923087, 25.984088246354524, 0.9624296799942723, 1579)
-    femmesh.addNode(-54.60309789160827, 29.087928905451275, -1.4220444695417989, 1580)
-    femmesh.addNode(-51.63173973311794, 35.3851790617376, -6.601723704651951, 1581)
-    femmesh.addNode(-57.81213363226555, 36.81163547622531, -0.5936360624620215, 1582)
-    femmesh.addNode(-58.080968317710834, 40.590744598401336, -8.991912357810072, 1583)
-    femmesh.addNode(-54.871932577053556, 32.8670380276273, -9.82032076488985, 1584)
-    femmesh.addNode(-61.052326476201166, 34.293494442115005, -3.8122331226999195, 1585)
-    femmesh.addNode(-66.48814185925677, 8.753772503085997, 7.558001611444205, 1586)
-    femmesh.addNode(-67.78249587312482, 12.78590550417483, 7.558001611444205, 1587)
-    femmesh.addNode(-85.36228744902633, 5.359773877478146, -0.8541175760049411, 1588)
-    femmesh.addNode(-87.39244415253376, 8.836194887938868, -4.79621621843072, 1589)
-    femmesh.addNode(-53.484153833911414, 41.86750507675621, -6.262115021728006, 1590)
-    femmesh.addNode(-59.664547733059024, 43.29396149124392, -0.25402737953807586, 1591)
-    femmesh.addNode(-57.70321707511165, 14.109495422753392, -2.9535196589336445, 1592)
-    femmesh.addNode(-0.6327353290080726, 59.43732227541442, 11.25, 1593)
-    femmesh.addNode(-5.390254903779633, 60.43207054891816, 11.25, 1594)
-    femmesh.addNode(-1.928867682911913, 51.38835714407243, 11.25, 1595)
-    femmesh.addNode(-65.55597852208805, 20.76440255401196, 3.0591973267676247, 1596)
-    femmesh.addNode(-67.59113210860423, 20.29263170564607, 10.559197326767626, 1597)
-    femmesh.addNode(-70.28950790058553, 17.516282732672693, 3.1171989382118324, 1598)
-    femmesh.addNode(-97.46107414134575, 7.036947627907663, 3.464242183083364, 1599)
-    femmesh.addNode(-94.27433243065963, 7.036947627907663, 6.276144899703992, 1600)
-    femmesh.addNode(-85.45382334410485, 5.359773877478146, 4.72454369214476, 1601)
-    femmesh.addNode(-97.43548336041707, 7.0928542424574506, -3.7256163549129844, 1602)
-    femmesh.addNode(-94.15720575465244, 7.0928542424574506, -6.492374906442057, 1603)
-    femmesh.addNode(-93.1345266864319, 15.929049130396319, -5.755074021814631, 1604)
-    femmesh.addNode(-62.81672150454203, 10.547348294797224, 3.0051110100383958, 1605)
-    femmesh.addNode(-56.44898628408248, 12.438770138060601, -10.453519658933644, 1606)
-    femmesh.addNode(-59.738370661627826, 13.637724574387502, -10.453519658933644, 1607)
-    femmesh.addNode(-36.76201216610223, 40.61111866770639, -8.881784197001252e-16, 1608)
-    femmesh.addNode(-33.00883434124373, 37.80453773802115, -7.500000000000001, 1609)
-    femmesh.addNode(-38.14140310523697, 35.525791427707404, -1.8889939764476618, 1610)
-    femmesh.addNode(-38.39812188604127, 39.62129586135121, -9.388993976447663, 1611)
-    femmesh.addNode(-42.15129971089977, 42.427876791036454, -1.8889939764476626, 1612)
-    femmesh.addNode(-42.05923818410835, 46.206460256448, -7.500000000000002, 1613)
-    femmesh.addNode(-18.540982131052125, 54.842097718692344, 9.537103835804281, 1614)
-    femmesh.addNode(-18.20932481533908, 60.46554373808458, 5.787103835804286, 1615)
-    femmesh.addNode(-17.05442387091731, 55.290892087101426, 0.40341018170060683, 1616)
-    femmesh.addNode(-81.0654864307156, 27.86676112216314, -8.716947067614052, 1617)
-    femmesh.addNode(-83.00574476481543, 31.374362493490693, -5.156262147498233, 1618)
-    femmesh.addNode(-87.35902350146458, 28.159836875252466, -11.439315079884182, 1619)
-    femmesh.addNode(-85.89426512583898, 21.162312639901323, -9.529457666901648, 1620)
-    femmesh.addNode(-87.83452345993882, 24.66991401122888, -5.968772746785827, 1621)
-    femmesh.addNode(-81.54098638918984, 24.37683825813955, -3.246404734515698, 1622)
-    femmesh.addNode(-71.33352717282358, 14.94411248866852, 7.558001611444205, 1623)
-    femmesh.addNode(-71.14216340830299, 22.45083869013976, 10.559197326767626, 1624)
-    femmesh.addNode(-62.75644571725557, 3.748994237485272, 11.47687852896782, 1625)
-    femmesh.addNode(-59.08502536254083, 5.542570029196499, 6.9239879275620115, 1626)
-    femmesh.addNode(-66.74917552310492, 5.004778265600726, 4.034880140412028, 1627)
-    femmesh.addNode(-66.62201880296804, 40.68838025818545, 1.2978549462109072, 1628)
-    femmesh.addNode(-77.24657077833655, 10.037844925768848, 9.41264097552413, 1629)
-    femmesh.addNode(-79.21499191543526, 15.365066131118953, 1.9126409755241314, 1630)
-    femmesh.addNode(-74.15211101647343, 14.683363301931509, 7.499999999999998, 1631)
-    femmesh.addNode(-71.33228077224042, 9.682849313891428, 7.558001611444205, 1632)
-    femmesh.addNode(-73.30070190933912, 15.010070519241534, 0.058001611444205015, 1633)
-    femmesh.addNode(-76.39516167120226, 10.364552143078871, 1.9706425869683382, 1634)
-    femmesh.addNode(-91.79038447027384, 18.616745054653126, -2.7324182144364424, 1635)
-    femmesh.addNode(-52.95719915068945, 15.197994042754319, -1.6435329985624865, 1636)
-    femmesh.addNode(-48.75637429738351, 15.723623305770234, 3.0112627832404124, 1637)
-    femmesh.addNode(-50.02657836862283, 12.487665985010823, 1.3035764000317052, 1638)
-    femmesh.addNode(0.8643656248372349, 55.466487622296995, 0.0, 1639)
-    femmesh.addNode(-62.08106463380749, 49.07470943671407, -5.241912357810071, 1640)
-    femmesh.addNode(-57.48425015000807, 50.35146991506895, -2.512115021728004, 1641)
-    femmesh.addNode(-52.507237386028045, 47.317181631524214, -0.17506774377148693, 1642)
-    femmesh.addNode(-54.923754286776514, 53.09792957699437, -5.162952722043482, 1643)
-    femmesh.addNode(-57.104051869827465, 46.04042115316934, -2.9048650798535536, 1644)
-    femmesh.addNode(-45.29085018770654, 48.02879199810238, 7.499999999999998, 1645)
-    femmesh.addNode(-49.87826656322226, 49.304010629309474, 6.087047277956517, 1646)
-    femmesh.addNode(-43.38664384722932, 44.05602594507995, 2.9231635792746955, 1647)
-    femmesh.addNode(-47.97406022274505, 45.33124457628705, 1.510210857231214, 1648)
-    femmesh.addNode(-47.90558526317082, 44.57161391214689, 10.423163579274696, 1649)
-    femmesh.addNode(-39.494960646441655, 55.75032962112811, -8.881784197001252e-16, 1650)
-    femmesh.addNode(-41.28066280397417, 55.3165622098178, -3.750000000000001, 1651)
-    femmesh.addNode(-62.4365378635663, 28.454280768054733, 2.820557956864161, 1652)
-    femmesh.addNode(-59.82861671568556, 28.314091643414685, 10.32055795686416, 1653)
-    femmesh.addNode(-6.607963137758962, 51.054735026626645, 11.25, 1654)
-    femmesh.addNode(-4.219059075769363, 60.237263957028276, -11.25, 1655)
-    femmesh.addNode(-1.928867682911913, 51.38835714407243, -11.25, 1656)
-    femmesh.addNode(-9.072982763057864, 55.72738080020473, -9.133693654103677, 1657)
-    femmesh.addNode(-47.71563253429886, 38.253418867475546, -9.388993976447663, 1658)
-    femmesh.addNode(-47.44679784885358, 34.47430974529952, -0.990717681099612, 1659)
-    femmesh.addNode(-49.29921194964706, 40.95663576031812, -0.6511089981756664, 1660)
-    femmesh.addNode(-74.15335741705658, 19.9446264767086, 7.499999999999998, 1661)
-    femmesh.addNode(-77.24781717891972, 15.29910810054594, 9.41264097552413, 1662)
-    femmesh.addNode(-78.64289543784989, 36.21555118741838, -1.2169470676140521, 1663)
-    femmesh.addNode(-72.41747269924588, 41.68350832366222, -1.4919123578100713, 1664)
-    femmesh.addNode(-74.77812928535548, 40.35468756895862, 2.7897673040209785, 1665)
-    femmesh.addNode(-72.84744154157205, 35.22042312194161, 1.5728202364069264, 1666)
-    femmesh.addNode(3.798332709495516, 54.70630674439121, -7.5, 1667)
-    femmesh.addNode(-67.94902147806407, 30.515448792853647, -7.500000000000001, 1668)
-    femmesh.addNode(-73.42945334268396, 30.28502927727964, -8.716947067614052, 1669)
-    femmesh.addNode(-76.38921633118008, 38.232578793503556, -4.9669470676140515, 1670)
-    femmesh.addNode(-70.16379359257607, 43.700535929747396, -5.241912357810071, 1671)
-    femmesh.addNode(-36.26381061129326, 58.35019633877148, -5.537690663770448, 1672)
-    femmesh.addNode(-34.478108453760754, 58.78396375008179, -1.7876906637704477, 1673)
-    femmesh.addNode(-51.3719380644058, 20.22998989148481, -3.963853763452333, 1674)
-    femmesh.addNode(-61.79731735018528, 29.055956821445175, -2.3203207648898485, 1675)
-    femmesh.addNode(-55.0917431040468, 21.065545339964643, -9.82032076488985, 1676)
-    femmesh.addNode(-48.62039043290872, 14.725747360108482, -9.143532998562485, 1677)
-    femmesh.addNode(-49.64660331768992, 12.801693291627721, -4.5970526574961275, 1678)
-    femmesh.addNode(-53.366408357330926, 13.637248740107555, -10.453519658933644, 1679)
-    femmesh.addNode(-56.117955988828015, 19.141491271483883, -5.273840423823492, 1680)
-    femmesh.addNode(-52.43876242645382, 46.55755096738405, 8.737884978271994, 1681)
-    femmesh.addNode(-50.534556085976604, 42.58478491436163, 4.161048557546692, 1682)
-    femmesh.addNode(-51.52486729986472, 53.89076232043718, 11.25, 1683)
-    femmesh.addNode(-54.1538381226705, 51.90393332265192, 4.987884978271997, 1684)
-    femmesh.addNode(-40.96491363132343, 56.646309045588694, 3.0329900145868818, 1685)
-    femmesh.addNode(-36.28357387150405, 57.953433632270105, 3.0329900145868818, 1686)
-    femmesh.addNode(-37.56052199682743, 49.716308042177445, 3.032990014586881, 1687)
-    femmesh.addNode(-71.33228077224042, 9.682849313891428, -7.441998388555795, 1688)
-    femmesh.addNode(-66.30849934383635, 19.139285400053716, -9.942435255432528, 1689)
-    femmesh.addNode(-69.00687513581765, 16.36293642708034, -2.384433643988322, 1690)
-    femmesh.addNode(-69.85828424295195, 16.036229209770312, -9.942435255432528, 1691)
-    femmesh.addNode(-39.21280019084644, 57.200371184911475, 6.7829900145868836, 1692)
-    femmesh.addNode(-33.0881174595561, 43.52792097126276, -3.750000000000001, 1693)
-    femmesh.addNode(-29.334939634697598, 40.72134004157752, -11.25, 1694)
-    femmesh.addNode(-28.0712652668752, 46.56155510021644, -5.537690663770448, 1695)
-    femmesh.addNode(-45.86807917948989, 56.5917808410249, -5.1629527220434825, 1696)
-    femmesh.addNode(-36.76201216610223, 40.61111866770639, 3.749999999999999, 1697)
-    femmesh.addNode(-37.01873094690653, 44.7066231013502, 7.499999999999998, 1698)
-    femmesh.addNode(-33.00883434124373, 37.80453773802115, 11.25, 1699)
-    femmesh.addNode(-33.55062539116463, 42.814222678848395, 6.782990014586882, 1700)
-    femmesh.addNode(-33.80734417196892, 46.9097271124922, 10.532990014586881, 1701)
-    femmesh.addNode(-73.10933814481854, 22.516796720712772, 3.0591973267676256, 1702)
-    femmesh.addNode(-66.15997606243812, 5.004778265600726, 0.05800161144420679, 1703)
-    femmesh.addNode(-58.115850850941115, 5.856597335813397, -2.953519658933642, 1704)
-    femmesh.addNode(-84.4077636131421, 29.465814963146876, -2.0801300934362574, 1705)
-    femmesh.addNode(-89.23654230826548, 22.76136648088506, -2.8926406927238513, 1706)
-    femmesh.addNode(-42.37655177812911, 50.82644895454276, -7.500000000000002, 1707)
-    femmesh.addNode(-37.35969958544821, 53.86008308349644, -9.287690663770448, 1708)
-    femmesh.addNode(-68.72960616123058, 44.84944531446917, -1.4919123578100713, 1709)
-    femmesh.addNode(-71.09026274734018, 43.52062455976557, 2.7897673040209785, 1710)
-    femmesh.addNode(-69.85953064353511, 21.297492384547404, -9.942435255432528, 1711)
-    femmesh.addNode(-58.460590208929574, 52.88743649606681, -11.25, 1712)
-    femmesh.addNode(-60.64088779198053, 45.829928072241785, -8.991912357810072, 1713)
-    femmesh.addNode(-53.483577444949546, 49.853148212522086, -8.912952722043483, 1714)
-    femmesh.addNode(-41.733338140129426, 44.85061800845472, 10.423163579274696, 1715)
-    femmesh.addNode(-44.67397325957265, 42.749282170492506, 10.423163579274696, 1716)
-    femmesh.addNode(-39.63346602237081, 41.24944501539471, 10.423163579274696, 1717)
-    femmesh.addNode(-88.50855768185144, 24.1455055488595, 1.9797685250256265, 1718)
-    femmesh.addNode(-80.8130017627758, 25.760977326113995, 1.6260044832337794, 1719)
-    femmesh.addNode(-85.64178045789917, 19.056528843852178, 0.8134938839461854, 1720)
-    femmesh.addNode(-64.27334575732019, 19.611056248419608, -2.4424352554325295, 1721)
-    femmesh.addNode(-80.51716399252862, 20.225626209554115, 2.8429515508478307, 1722)
-    femmesh.addNode(-76.4163699238193, 25.54593562384149, -1.216947067614053, 1723)
-    femmesh.addNode(-73.4051759150657, 28.05214783727265, 1.8422502591535743, 1724)
-    femmesh.addNode(-77.50596998377503, 22.731838422985277, 5.902148877615458, 1725)
-    femmesh.addNode(-47.94081092911891, 23.337685816712963, 4.223099455714517, 1726)
-    femmesh.addNode(-51.82022428643555, 20.21786872921222, 6.145381117230628, 1727)
-    femmesh.addNode(-75.78939432400227, 33.8113212657705, -8.716947067614052, 1728)
-    femmesh.addNode(-69.56397158539826, 39.27927840201434, -8.991912357810072, 1729)
-    femmesh.addNode(-89.40622982823479, 5.073960407158674, 10.311902716620626, 1730)
-    femmesh.addNode(-95.08236724798309, 12.110908035066338, 10.964242183083364, 1731)
-    femmesh.addNode(-86.26185816142831, 10.43373428463682, 9.41264097552413, 1732)
-    femmesh.addNode(-89.31469393315626, 5.073960407158674, -10.266758551529074, 1733)
-    femmesh.addNode(-95.05677646705442, 12.166814649616125, -11.225616354912985, 1734)
-    femmesh.addNode(-88.29201486493574, 13.910155295097542, -9.529457666901648, 1735)
-    femmesh.addNode(-42.37655177812911, 50.82644895454276, 7.499999999999998, 1736)
-    femmesh.addNode(-46.96396815364484, 52.10166758574986, 6.087047277956517, 1737)
-    femmesh.addNode(-29.657037971443003, 58.903209025141905, 6.782990014586885, 1738)
-    femmesh.addNode(-31.487602868552212, 58.7422167271815, 3.0329900145868818, 1739)
-    femmesh.addNode(-34.48148564039562, 58.31310621925934, 6.782990014586882, 1740)
-    femmesh.addNode(-61.42644668394064, 8.252898086939995, -8.881784197001252e-16, 1741)
-    femmesh.addNode(-81.12329449616493, 23.896130835813327, 10.34295155084783, 1742)
-    femmesh.addNode(-77.02250042745561, 29.216440250100703, 6.283052932385947, 1743)
-    femmesh.addNode(-73.71546864845484, 26.187301346971985, 10.559197326767626, 1744)
-    femmesh.addNode(-75.78939432400227, 33.8113212657705, 6.283052932385947, 1745)
-    femmesh.addNode(-71.92462817150786, 37.95045764731074, 10.289767304020977, 1746)
-    femmesh.addNode(-72.48236254500151, 30.782182362641784, 10.559197326767626, 1747)
-    femmesh.addNode(-69.54040976257129, 32.19128421881289, 5.848964630788605, 1748)
-    femmesh.addNode(-43.43862912324309, 41.12113301644901, -9.388993976447663, 1749)
-    femmesh.addNode(-48.6105688902873, 56.68841927687757, 11.25, 1750)
-    femmesh.addNode(-39.37674724156652, 37.1539405817509, 6.673163579274696, 1751)
-    femmesh.addNode(-78.40059608920578, 18.201328103711678, 7.499999999999998, 1752)
-    femmesh.addNode(-81.49505585106891, 13.555809727549017, 9.41264097552413, 1753)
-    femmesh.addNode(-71.82670538005065, 21.36345041512042, -2.4424352554325286, 1754)
-    femmesh.addNode(-77.45274890949923, 14.846211547961726, -2.759782426576572, 1755)
-    femmesh.addNode(-74.63291866526623, 9.845697559921645, -2.701780815132365, 1756)
-    femmesh.addNode(-73.15892213597775, 16.19907745580053, -5.202217682009099, 1757)
-    femmesh.addNode(-58.22436096612891, 44.140337407798725, 8.737884978271994, 1758)
-    femmesh.addNode(-65.18183203603793, 41.53475617474025, 10.289767304020977, 1759)
-    femmesh.addNode(-67.24920746035767, 45.93816280200092, 2.2580876421899285, 1760)
-    femmesh.addNode(-62.65239297655825, 47.21492328035579, 4.987884978271995, 1761)
-    femmesh.addNode(-69.60986404646727, 44.60934204729732, 6.5397673040209785, 1762)
-    femmesh.addNode(-75.4664029611159, 40.96261331887269, -11.25, 1763)
-    femmesh.addNode(-42.885305810338245, 58.62980713332512, -11.25, 1764)
-    femmesh.addNode(-33.0881174595561, 43.52792097126276, 3.749999999999999, 1765)
-    femmesh.addNode(-29.8767306846185, 45.73102498240476, 6.782990014586882, 1766)
-    femmesh.addNode(-77.02250042745561, 29.216440250100703, -8.716947067614052, 1767)
-    femmesh.addNode(-81.85127912257897, 22.511991767838886, -9.529457666901648, 1768)
-    femmesh.addNode(-81.96348901376913, 32.66630127574173, -1.2169470676140521, 1769)
-    femmesh.addNode(-80.75865069449821, 34.045385867688836, 2.533052932385951, 1770)
-    femmesh.addNode(-84.85944476320756, 28.725076453401464, 6.592951550847835, 1771)
-    femmesh.addNode(-86.06428308247847, 27.34599186145436, 2.8429515508478316, 1772)
-    femmesh.addNode(-24.899916948710917, 60.244120531157535, 2.037103835804283, 1773)
-    femmesh.addNode(-23.069352051601705, 60.40511282911794, 5.787103835804286, 1774)
-    femmesh.addNode(-27.76144930204853, 53.421315857295475, 5.070093850391165, 1775)
-    femmesh.addNode(-87.5640302385217, 15.294294363071984, 10.34295155084783, 1776)
-    femmesh.addNode(-92.43213284094654, 17.257281583820973, 6.307193733931196, 1777)
-    femmesh.addNode(-83.61162375439176, 15.580107833391455, 4.755592526371964, 1778)
-    femmesh.addNode(-56.82896133501538, 12.124742831443703, 10.44710939859419, 1779)
-    femmesh.addNode(-76.72666265720844, 23.681089133540823, -7.500000000000002, 1780)
-    femmesh.addNode(-81.24514861894266, 18.841487141579677, -2.029457666901647, 1781)
-    femmesh.addNode(-33.0881174595561, 43.52792097126276, -8.881784197001252e-16, 1782)
-    femmesh.addNode(-29.8767306846185, 45.73102498240476, 3.0329900145868818, 1783)
-    femmesh.addNode(-74.15335741705658, 19.9446264767086, -7.500000000000002, 1784)
-    femmesh.addNode(-75.48557417298369, 14.780253517388712, -10.259782426576571, 1785)
-    femmesh.addNode(-45.88312119323123, 27.808974457050766, -3.2919182988345326, 1786)
-    femmesh.addNode(-49.12331403716685, 25.29083342294046, -6.51051535907243, 1787)
-    femmesh.addNode(-28.293584175922675, 44.35074615080531, -11.25, 1788)
-    femmesh.addNode(-81.06894342788736, 32.18053937738817, 11.250000000000004, 1789)
-    femmesh.addNode(-60.121646812591756, 48.87106161877287, 1.2378849782719954, 1790)
-    femmesh.addNode(-64.71846129639118, 47.594301140418, -1.4919123578100713, 1791)
-    femmesh.addNode(-83.6000444430903, 4.840919294320918, -5.526540978105644, 1792)
-    femmesh.addNode(-80.54720867136236, 10.200693171799063, -0.8471414510524387, 1793)
-    femmesh.addNode(-82.57736537486977, 13.677114182259785, -4.789240093478217, 1794)
-    femmesh.addNode(-50.923657970679855, 44.61396473868163, -8.912952722043483, 1795)
-    femmesh.addNode(-46.738716086415494, 43.70309542224355, -3.301946698491144, 1796)
-    femmesh.addNode(-58.49582590187402, 5.542570029196499, 2.9471093985941907, 1797)
-    femmesh.addNode(-11.956622994463306, 50.53712437094417, 11.25, 1798)
-    femmesh.addNode(-14.589404245618411, 50.61824631352334, 5.787103835804283, 1799)
-    femmesh.addNode(-23.289044764777206, 47.232928786380796, 2.037103835804283, 1800)
-    femmesh.addNode(-25.95598388430523, 54.25184597510716, 0.24941317203383506, 1801)
-    femmesh.addNode(-28.0712652668752, 46.56155510021644, -1.7876906637704477, 1802)
-    femmesh.addNode(-32.543669804146525, 52.749942171131124, 1.245299350816434, 1803)
-    femmesh.addNode(-67.73834607928788, 4.678071048290702, -11.411054845007072, 1804)
-    femmesh.addNode(-46.96396815364484, 52.10166758574986, -8.912952722043483, 1805)
-    femmesh.addNode(-62.10292592172472, 20.464345120854148, 10.32055795686416, 1806)
-    femmesh.addNode(-64.60993794918544, 25.19472234935201, 5.879755283631788, 1807)
-    femmesh.addNode(-62.39843194296182, 36.63947426757916, -8.991912357810072, 1808)
-    femmesh.addNode(-59.189396202304536, 28.915767696805126, -9.82032076488985, 1809)
-    femmesh.addNode(-58.53134326680833, 49.79183357415844, 4.987884978271999, 1810)
-    femmesh.addNode(-72.09506645334963, 44.206506318889936, -11.25, 1811)
-    femmesh.addNode(-71.48935555072939, 40.81816057248952, -11.25, 1812)
-    femmesh.addNode(-66.19263507763202, 42.523171402031586, -8.991912357810072, 1813)
-    femmesh.addNode(-66.77265114482935, 3.748994237485272, 10.356429012038934, 1814)
-    femmesh.addNode(-70.7653809506787, 5.004778265600726, 2.9144306234831414, 1815)
-    femmesh.addNode(-32.56161392972785, 54.85022799199324, -9.287690663770448, 1816)
-    femmesh.addNode(-48.61623596805768, 30.40699978747223, -6.601723704651951, 1817)
-    femmesh.addNode(-43.13645211361625, 26.609904304961418, -11.690194594182582, 1818)
-    femmesh.addNode(-51.8564288119933, 27.88885875336193, -9.82032076488985, 1819)
-    femmesh.addNode(-44.02882997214812, 58.3105120972768, 11.25, 1820)
-    femmesh.addNode(-39.16516500319151, 53.02955296568476, 10.532990014586881, 1821)
-    femmesh.addNode(-67.94758076112136, 37.80600490092756, 10.289767304020977, 1822)
-    femmesh.addNode(-66.33191504899588, 33.897288034961335, 7.499999999999999, 1823)
-    femmesh.addNode(-68.505315134615, 30.637729616258607, 10.559197326767626, 1824)
-    femmesh.addNode(-67.92474405044581, 28.282567352846655, 3.0591973267676265, 1825)
-    femmesh.addNode(-54.77259629304504, 11.399167365009896, -0.006410260339452911, 1826)
-    femmesh.addNode(-98.6545777371484, 7.036947627907663, 7.163180591493047, 1827)
-    femmesh.addNode(-29.682137450808913, 59.57274684499318, -1.7876906637704477, 1828)
-    femmesh.addNode(-44.7001287692386, 33.27523959321017, -9.388993976447663, 1829)
-    femmesh.addNode(2.74193040951904, 50.97659423713453, -11.25, 1830)
-    femmesh.addNode(5.187117318350047, 58.702383780858995, -11.25, 1831)
-    femmesh.addNode(0.4517390166615902, 59.82550105009037, -11.25, 1832)
-    femmesh.addNode(-48.42945614155744, 15.315302251226331, 10.824823160366467, 1833)
-    femmesh.addNode(-49.83564407727155, 13.077220876128674, 6.271932558960657, 1834)
-    femmesh.addNode(-53.746383408263824, 13.323221433490655, 10.44710939859419, 1835)
-    femmesh.addNode(-55.730963617427825, 20.4638692865742, 10.32055795686416, 1836)
-    femmesh.addNode(-57.13715155314193, 18.225787911476544, 5.767667355458351, 1837)
-    femmesh.addNode(-98.6242214473131, 7.0928542424574506, -7.422204484007198, 1838)
-    femmesh.addNode(-45.078876176128844, 29.06915556524814, 4.64827629534805, 1839)
-    femmesh.addNode(-76.8938845420038, 38.184522249229076, 6.539767304020982, 1840)
-    femmesh.addNode(-63.14342281694593, 31.40193664690933, -7.500000000000001, 1841)
-    femmesh.addNode(-46.670241126841276, 42.94346475810339, -9.388993976447663, 1842)
-    femmesh.addNode(-46.64665455962408, 47.48167888765509, -8.912952722043483, 1843)
-    femmesh.addNode(-49.87826656322226, 49.304010629309474, -8.912952722043483, 1844)
-    femmesh.addNode(3.798332709495516, 54.70630674439121, -3.7499999999999996, 1845)
-    femmesh.addNode(-79.83583732443404, 36.77542039305797, 11.250000000000004, 1846)
-    femmesh.addNode(5.543327053071297, 54.1508749950123, 0.0, 1847)
-    femmesh.addNode(-73.42531238121899, 41.598348141974, 6.539767304020982, 1848)
-    femmesh.addNode(-6.607963137758962, 51.054735026626645, -11.25, 1849)
-    femmesh.addNode(-10.470064734328492, 50.98591873935325, -5.383693654103676, 1850)
-    femmesh.addNode(-51.63173973311794, 35.3851790617376, 8.39827629534805, 1851)
-    femmesh.addNode(-53.484153833911414, 41.86750507675621, 8.737884978271994, 1852)
-    femmesh.addNode(-66.64211128567793, 27.1292210472543, -2.4424352554325277, 1853)
-    femmesh.addNode(-68.83978879891532, 26.10254406855857, -9.942435255432528, 1854)
-    femmesh.addNode(-72.12254315029782, 26.898801531680295, -3.6593823230465796, 1855)
-    femmesh.addNode(-65.80902069342756, 46.78453871855572, 11.25, 1856)
-    femmesh.addNode(-93.2058799364757, 15.762197339317218, 11.829478439517015, 1857)
-    femmesh.addNode(-90.55564552943915, 20.908570888071853, 7.172429990364848, 1858)
-    femmesh.addNode(8.450469092017894, 54.103923916589004, -7.5, 1859)
-    femmesh.addNode(13.32594700649054, 52.34716299872244, -7.594304595574965, 1860)
-    femmesh.addNode(11.565699646616451, 49.839909478982776, -11.25, 1861)
-    femmesh.addNode(14.23422808739773, 56.411320932642894, -11.344304595574966, 1862)
-    femmesh.addNode(9.358750172925081, 58.168081850509466, -11.25, 1863)
-    femmesh.addNode(-84.49961515549228, 9.914879701479592, -10.259782426576571, 1864)
-    femmesh.addNode(-71.67517827302066, 4.678071048290702, -10.233872804416052, 1865)
-    femmesh.addNode(-70.82376916588636, 5.004778265600726, -2.675871192971846, 1866)
-    femmesh.addNode(-62.56246055194343, 24.303551643817666, 10.32055795686416, 1867)
-    femmesh.addNode(-68.05066673882294, 24.13183822860959, 10.559197326767626, 1868)
-    femmesh.addNode(-49.27502177448302, 19.622836901574747, -9.143532998562485, 1869)
-    femmesh.addNode(-55.74637444562111, 25.96263488143091, -9.82032076488985, 1870)
-    femmesh.addNode(-38.08722015461788, 59.619952041821925, -11.25, 1871)
-    femmesh.addNode(14.326535476235087, 51.622877828748244, 0.6689619580334698, 1872)
-    femmesh.addNode(9.130576367421043, 53.77056706796217, 0.8752956464831918, 1873)
-    femmesh.addNode(12.26105993831791, 52.569237899474516, -2.9690089490917733, 1874)
-    femmesh.addNode(-29.334939634697598, 40.72134004157752, 11.25, 1875)
-    femmesh.addNode(-92.51045622139632, 20.085898983934058, 11.829478439517015, 1876)
-    femmesh.addNode(-86.86860652344231, 19.617996007688824, 10.34295155084783, 1877)
-    femmesh.addNode(-41.967013994412156, 30.677214262788702, -6.079188570630244, 1878)
-    femmesh.addNode(-69.56468719018955, 34.42416565881988, 10.289767304020977, 1879)
-    femmesh.addNode(-70.12242156368319, 27.255890374150923, 10.559197326767626, 1880)
-    femmesh.addNode(-49.084087483131746, 20.2123917926926, 10.824823160366467, 1881)
-    femmesh.addNode(-52.50618160168549, 28.480775915541212, 8.39827629534805, 1882)
-    femmesh.addNode(-56.385594959002134, 25.360958828040467, 10.32055795686416, 1883)
-    femmesh.addNode(-78.40059608920578, 18.201328103711678, -7.500000000000002, 1884)
-    femmesh.addNode(-83.52521255457631, 17.032230738009737, -9.529457666901648, 1885)
-    femmesh.addNode(-93.78647513472356, 5.073960407158674, 11.198938408409681, 1886)
-    femmesh.addNode(-39.11860306466514, 48.30779609441021, 7.499999999999998, 1887)
-    femmesh.addNode(-35.90721628972753, 50.5109001055522, 10.532990014586881, 1888)
-    femmesh.addNode(-34.11909969746269, 36.64965494041805, -11.436160332801265, 1889)
-    femmesh.addNode(-39.25166846145593, 34.3709086301043, -5.8251543092489255, 1890)
-    femmesh.addNode(-76.03839031306474, 4.678071048290702, 11.563882860563403, 1891)
-    femmesh.addNode(-71.616790057813, 4.678071048290702, 10.356429012038934, 1892)
-    femmesh.addNode(-81.10127121202657, 5.359773877478146, 5.9765238360875355, 1893)
-    femmesh.addNode(-76.67967095677483, 5.359773877478146, 4.769069987563068, 1894)
-    femmesh.addNode(-61.68797098367764, 49.36144901235838, 11.250000000000004, 1895)
-    femmesh.addNode(-68.56717253084165, 18.258190340580803, -2.6645352591003757e-15, 1896)
-    femmesh.addNode(-23.662645723577253, 54.1879288571901, 9.537103835804281, 1897)
-    femmesh.addNode(-25.558234392971727, 59.66982202503653, 11.250000000000004, 1898)
-    femmesh.addNode(-30.250331643418548, 52.68602505321407, 10.532990014586881, 1899)
-    femmesh.addNode(-23.289044764777206, 47.232928786380796, 5.787103835804283, 1900)
-    femmesh.addNode(-78.54998925601308, 20.159668178981104, 10.34295155084783, 1901)
-    femmesh.addNode(-99.76367467511245, 4.38633020150302, 4.276344536564162, 1902)
-    femmesh.addNode(-44.57294409661674, 29.780214447614167, 0.02810747117178869, 1903)
-    femmesh.addNode(-40.65683689779767, 32.64845425335211, -2.7591628006239226, 1904)
-    femmesh.addNode(-93.78170962581694, 5.073960407158674, -11.196588129094215, 1905)
-    femmesh.addNode(-19.109013124849845, 49.361912929587476, 2.037103835804283, 1906)
-    femmesh.addNode(-23.891233626947837, 48.690539243423125, -1.7876906637704477, 1907)
-    femmesh.addNode(-26.37923778463259, 55.083047038911886, -4.824080685245567, 1908)
-    femmesh.addNode(-19.532267025177205, 50.19311399339221, -3.0363900214751194, 1909)
-    femmesh.addNode(-21.597017282534594, 55.754420725076244, -0.9992861856708366, 1910)
-    femmesh.addNode(-55.835074825285176, 51.16209135005335, 1.2378849782719954, 1911)
-    femmesh.addNode(-54.2982647788422, 5.542570029196499, 2.94710939859419, 1912)
-    femmesh.addNode(-53.9182897279093, 5.856597335813397, -2.9535196589336428, 1913)
-    femmesh.addNode(-80.42107349502126, 3.589613461104049, 11.563882860563403, 1914)
-    femmesh.addNode(-81.62925396029308, 8.949387338582195, 9.41264097552413, 1915)
-    femmesh.addNode(10.195463435593673, 53.54849216721009, -3.75, 1916)
-    femmesh.addNode(7.394066792041417, 50.37421140933232, -11.25, 1917)
-    femmesh.addNode(-62.64891922194373, 50.42138363557973, -11.25, 1918)
-    femmesh.addNode(-66.26939364682164, 46.608656576226984, -5.241912357810071, 1919)
-    femmesh.addNode(-91.0623998438598, 20.000884122627568, 2.1399910033130354, 1920)
-    femmesh.addNode(-58.48709297072402, 23.402751294486503, -9.82032076488985, 1921)
-    femmesh.addNode(-56.76175822400815, 15.974454694629415, -10.453519658933644, 1922)
-    femmesh.addNode(4.0380627634228805, 59.02555936847651, 11.25, 1923)
-    femmesh.addNode(8.65871798097328, 57.51789163568611, 11.25, 1924)
-    femmesh.addNode(2.74193040951904, 50.97659423713453, 11.25, 1925)
-    femmesh.addNode(7.269933372118749, 53.52181459921833, 7.500000000000002, 1926)
-    femmesh.addNode(15.391422544407718, 51.40080292799617, -3.956333688449722, 1927)
-    femmesh.addNode(-53.27457896205362, 53.90855101197877, -1.4129527220434823, 1928)
-    femmesh.addNode(5.543327053071297, 54.1508749950123, 3.75, 1929)
-    femmesh.addNode(13.290606698454745, 52.557028091149256, 7.725502843535217, 1930)
-    femmesh.addNode(12.934236590430071, 49.477505798715924, 11.475502843535214, 1931)
-    femmesh.addNode(12.830350835548314, 56.98358970533657, 11.25, 1932)
-    femmesh.addNode(10.857182686468494, 53.14150667216819, 4.625295646483194, 1933)
-    femmesh.addNode(10.50081257844382, 50.06198437973485, 8.375295646483192, 1934)
-    femmesh.addNode(-39.37674724156652, 37.1539405817509, 2.9231635792746964, 1935)
-    femmesh.addNode(-44.76603478636406, 38.97069870508096, 1.0341696028270346, 1936)
-    femmesh.addNode(23.65606620574177, 47.63804107360977, -3.436408762697016, 1937)
-    femmesh.addNode(23.093217325804915, 47.864666108724975, 0.30381230012727567, 1938)
-    femmesh.addNode(20.674749892078616, 49.31620571241703, -3.323154848856572, 1939)
-    femmesh.addNode(21.23759877201547, 49.08958067730181, -7.063375911680863, 1940)
-    femmesh.addNode(-22.555721964095497, 50.71844515782169, 9.537103835804281, 1941)
-    femmesh.addNode(-24.671003346665472, 43.02815428293097, 11.25, 1942)
-    femmesh.addNode(-29.143407883936796, 49.216541353845656, 10.532990014586881, 1943)
-    femmesh.addNode(-85.11192943114736, 30.83086024945061, 11.250000000000004, 1944)
-    femmesh.addNode(-85.16628049942494, 22.546451707875768, 10.34295155084783, 1945)
-    femmesh.addNode(-83.31603749820458, 29.50951600319003, -11.439315079884182, 1946)
-    femmesh.addNode(-60.07235405700767, 18.37075544575601, 7.499999999999997, 1947)
-    femmesh.addNode(-59.12631348410505, 22.80107524109606, 10.32055795686416, 1948)
-    femmesh.addNode(-60.07235405700767, 18.37075544575601, -7.500000000000003, 1949)
-    femmesh.addNode(-63.33188690621667, 21.47601552029563, -9.942435255432528, 1950)
-    femmesh.addNode(-65.31682290256506, 28.142378228206606, 10.559197326767626, 1951)
-    femmesh.addNode(-72.43283588368696, 25.033955041379627, -9.942435255432528, 1952)
-    femmesh.addNode(-64.03419013779718, 26.989031922614252, -9.942435255432528, 1953)
-    femmesh.addNode(19.12066219155829, 50.197104824480206, -3.4298554077949257, 1954)
-    femmesh.addNode(17.055186653641112, 51.14346489520648, -7.067826314920168, 1955)
-    femmesh.addNode(-41.16276897730977, 31.937395370986078, 1.8610060235523382, 1956)
-    femmesh.addNode(-79.73281284513288, 13.03695514439179, -10.259782426576571, 1957)
-    femmesh.addNode(19.20199982864493, 46.82242713689324, -10.723521719345204, 1958)
-    femmesh.addNode(22.323700740649997, 52.543652476164645, -11.339854192335661, 1959)
-    femmesh.addNode(18.14128862227564, 54.59753669406931, -11.344304595574966, 1960)
-    femmesh.addNode(-23.891233626947837, 48.690539243423125, -5.537690663770448, 1961)
-    femmesh.addNode(-19.532267025177205, 50.19311399339221, -6.786390021475119, 1962)
-    femmesh.addNode(-42.39811311363932, 33.56554452502958, 6.673163579274696, 1963)
-    femmesh.addNode(-48.68214198518314, 36.10245889934302, 3.821439874622746, 1964)
-    femmesh.addNode(-47.02639774724406, 24.683680433030396, -11.690194594182582, 1965)
-    femmesh.addNode(-27.337942466193496, 50.04707147165733, -9.287690663770448, 1966)
-    femmesh.addNode(-20.490971706738108, 45.15713842613766, -11.25, 1967)
-    femmesh.addNode(-22.978975864422857, 51.54964622162642, -10.536390021475121, 1968)
-    femmesh.addNode(-28.293584175922675, 44.35074615080531, 11.25, 1969)
-    femmesh.addNode(-32.765988713194, 50.53913322171998, 10.532990014586881, 1970)
-    femmesh.addNode(-55.130178181592, 54.43989990364979, 11.25, 1971)
-    femmesh.addNode(-59.50768332572983, 52.32780015515631, 11.250000000000004, 1972)
-    femmesh.addNode(-56.04407330818111, 47.10668855059666, 8.737884978271994, 1973)
-    femmesh.addNode(-68.81551137129705, 23.869662628551577, 0.6167620713350987, 1974)
-    femmesh.addNode(18.557813311621437, 50.423729859595426, 0.31036565502936586, 1975)
-    femmesh.addNode(-82.79722792816227, 18.416369805984182, 10.34295155084783, 1976)
-    femmesh.addNode(-23.683107005140673, 62.92671801882479, 11.250000000000004, 1977)
-    femmesh.addNode(-21.7875183357462, 57.444824850978364, 9.537103835804281, 1978)
-    femmesh.addNode(-57.141733274941046, 15.660427388012517, 10.44710939859419, 1979)
-    femmesh.addNode(6.913563264094074, 50.44229230678499, 11.25, 1980)
-    femmesh.addNode(22.837846307112848, 44.438631478464266, -10.723521719345204, 1981)
-    femmesh.addNode(25.959547219117916, 50.15985681773567, -11.339854192335661, 1982)
-    femmesh.addNode(-42.62095281781072, 37.015977367363945, -9.388993976447663, 1983)
-    femmesh.addNode(-20.046528539644505, 60.50515229687349, 2.037103835804283, 1984)
-    femmesh.addNode(-15.927189028354586, 60.87282472270341, -1.633693654103676, 1985)
-    femmesh.addNode(-49.80499753455817, 4.407296253513539, 1.17466106878447, 1986)
-    femmesh.addNode(-50.6593040996939, 9.949866282710037, 4.12177046737866, 1987)
-    femmesh.addNode(-50.279329048761, 10.263893589326937, -1.7788585901491727, 1988)
-    femmesh.addNode(-80.25352145454471, 33.05223647846215, -11.25, 1989)
-    femmesh.addNode(-79.94322872115558, 34.91708296876281, -4.9669470676140515, 1990)
-    femmesh.addNode(-76.36726516364922, 40.189246285802895, 11.250000000000004, 1991)
-    femmesh.addNode(-50.49146114027315, 55.09249571914962, -5.1629527220434825, 1992)
-    femmesh.addNode(-46.37176640566976, 19.78659089156413, -11.690194594182582, 1993)
-    femmesh.addNode(16.759959488221337, 51.03839924772931, 3.7691691550854935, 1994)
-    femmesh.addNode(-9.04245024881871, 60.83611943609106, -11.25, 1995)
-    femmesh.addNode(-12.904551845388239, 60.767303148817675, -5.383693654103676, 1996)
-    femmesh.addNode(-24.671003346665472, 43.02815428293097, -11.25, 1997)
-    femmesh.addNode(-88.45698542427868, 24.219613366191204, 5.569072434359682, 1998)
-    femmesh.addNode(-62.688084671036535, 24.643052097150097, -4.762756020322376, 1999)
-    femmesh.addNode(-37.23166527301318, 35.199219244033884, 11.25, 2000)
-    femmesh.addNode(-43.85629695414028, 38.64412652140744, 10.423163579274696, 2001)
-    femmesh.addNode(-31.504494761438863, 59.336314624428184, -5.537690663770447, 2002)
-    femmesh.addNode(-33.327904304763486, 60.606070327478626, -11.25, 2003)
-    femmesh.addNode(-88.70947009221848, 26.32539716224035, 10.22612088351185, 2004)
-    femmesh.addNode(-62.82117544992833, 42.86357692944385, -8.991912357810072, 2005)
-    femmesh.addNode(-99.75890916620583, 4.38633020150302, -3.1191820009397344, 2006)
-    femmesh.addNode(-27.336029212879836, 62.529293500299396, -11.25, 2007)
-    femmesh.addNode(-29.211156600710886, 59.27239750651113, -11.25, 2008)
-    femmesh.addNode(-24.085899623904613, 55.019129920994835, -10.536390021475121, 2009)
-    femmesh.addNode(-27.145528159668228, 60.83888937439727, -6.786390021475119, 2010)
-    femmesh.addNode(-22.21077223607356, 58.2760259147831, -10.536390021475121, 2011)
-    femmesh.addNode(-22.49755603076086, 62.990480989782014, -11.25, 2012)
-    femmesh.addNode(-22.307054977549257, 61.30007686387989, -6.786390021475119, 2013)
-    femmesh.addNode(-79.02041535109139, 37.64711749413195, -11.25, 2014)
-    femmesh.addNode(-80.77665428550509, 5.359773877478146, 1.8918720513313332, 2015)
-    femmesh.addNode(29.41943327174657, 40.25136193805598, -9.660786220859904, 2016)
-    femmesh.addNode(26.17026232704778, 42.722649932466666, -9.660786220859904, 2017)
-    femmesh.addNode(29.329000899819015, 40.37476537423147, -12.60974722698333, 2018)
-    femmesh.addNode(32.578171844517804, 37.9034773798208, -12.60974722698333, 2019)
-    femmesh.addNode(15.472760181494362, 48.02612524040919, -11.25, 2020)
-    femmesh.addNode(-18.82307976887805, 62.98714892779144, 11.250000000000004, 2021)
-    femmesh.addNode(-64.82920687989153, 47.4550324927818, -11.25, 2022)
-    femmesh.addNode(-14.589404245618411, 50.61824631352334, 2.037103835804283, 2023)
-    femmesh.addNode(-48.95097667062842, 39.881568021519044, 10.423163579274696, 2024)
-    femmesh.addNode(-84.68208973202103, 3.589613461104049, -10.266758551529074, 2025)
-    femmesh.addNode(-79.86701095435706, 8.430532755424966, -10.259782426576571, 2026)
-    femmesh.addNode(-48.61623596805768, 30.40699978747223, 8.39827629534805, 2027)
-    femmesh.addNode(-42.33220709651386, 27.87008541315879, 11.25, 2028)
-    femmesh.addNode(-45.935472905568155, 34.90338874725367, 10.423163579274696, 2029)
-    femmesh.addNode(-94.36135275197503, 16.49051629423296, -11.225616354912985, 2030)
-    femmesh.addNode(-87.59659114985635, 18.23385693971438, -9.529457666901648, 2031)
-    femmesh.addNode(-17.63764631021713, 62.92123591269461, -11.25, 2032)
-    femmesh.addNode(-17.44714525700552, 61.230831786792486, -6.786390021475119, 2033)
-    femmesh.addNode(-25.323170849038277, 61.07532159496227, -3.0363900214751194, 2034)
-    femmesh.addNode(-90.05703807722978, 24.2749124087631, -11.704365716322322, 2035)
-    femmesh.addNode(-90.53253803570401, 20.784989544739513, -6.233823383223966, 2036)
-    femmesh.addNode(-47.50868777112151, 57.13052201144984, -11.25, 2037)
-    femmesh.addNode(-34.49942976597694, 60.413392040121465, 11.25, 2038)
-    femmesh.addNode(-29.674982097024326, 61.003494846004024, 11.250000000000004, 2039)
-    femmesh.addNode(-91.75936410124714, 21.346456708576156, -11.704365716322322, 2040)
-    femmesh.addNode(-74.86236427940896, 5.004778265600726, 0.037232687251406826, 2041)
-    femmesh.addNode(-39.23074431642776, 59.3006570057736, 11.25, 2042)
-    femmesh.addNode(-34.36707934747115, 54.01969787418156, 10.532990014586881, 2043)
-    femmesh.addNode(-100.46755104433802, 2.3984315485008274, 8.051931477959446, 2044)
-    femmesh.addNode(-99.67342317409215, 4.6212252354008445, 11.198938408409683, 2045)
-    femmesh.addNode(-14.989673613559923, 49.7295853554174, -1.633693654103676, 2046)
-    femmesh.addNode(33.52397222308573, 41.16932318718305, -7.364914723527711, 2047)
-    femmesh.addNode(37.3068773702243, 41.80053240191942, -2.2551674965443764, 2048)
-    femmesh.addNode(34.88111219256132, 35.87183234430119, -5.109747226983324, 2049)
-    femmesh.addNode(34.88111219256131, 35.87183234430119, -9.536206912539143, 2050)
-    femmesh.addNode(37.3068773702243, 41.80053240191942, -6.681627182100194, 2051)
-    femmesh.addNode(-74.97581616604646, 4.840919294320918, -5.493655230992623, 2052)
-    femmesh.addNode(-75.48432777240052, 9.51899034261162, -10.259782426576571, 2053)
-    femmesh.addNode(-80.33960857343882, 3.589613461104049, -11.504130776212534, 2054)
-    femmesh.addNode(-79.25756328450811, 4.840919294320918, -6.763913202789104, 2055)
-    femmesh.addNode(-28.44486622567525, 53.51655517102575, -9.287690663770448, 2056)
-    femmesh.addNode(26.9884822256767, 45.92205952761216, -2.373673264211715, 2057)
-    femmesh.addNode(24.570014791950403, 47.37359913130421, -6.000640413195562, 2058)
-    femmesh.addNode(-84.77362562709953, 3.589613461104049, 10.311902716620626, 2059)
-    femmesh.addNode(27.725834214085648, 45.43667349257085, -6.464083109997922, 2060)
-    femmesh.addNode(-63.327305184417554, 24.041376043759655, 0.3781227014316335, 2061)
-    femmesh.addNode(-55.04148827324663, 5.856597335813397, -6.089292372927216, 2062)
-    femmesh.addNode(-38.34193062923214, 34.04433644643079, -11.436160332801265, 2063)
-    femmesh.addNode(17.857411817776146, 54.66417623563625, 11.292725497911132, 2064)
-    femmesh.addNode(18.317667680682575, 50.237614621448934, 7.768228341446349, 2065)
-    femmesh.addNode(-20.469782439971866, 61.336353360678224, -3.0363900214751194, 2066)
-    femmesh.addNode(-79.01441127956906, 4.840919294320918, -2.78055135076937, 2067)
-    femmesh.addNode(-50.11015521094666, 2.2898075298839826, -2.376669184475084, 2068)
-    femmesh.addNode(-50.58448672514949, 8.14640486569738, -5.330188843408727, 2069)
-    femmesh.addNode(-54.02829706242622, 54.88200263822206, -11.25, 2070)
-    femmesh.addNode(-66.76803397405506, 22.978491923017234, -9.942435255432528, 2071)
-    femmesh.addNode(-19.109013124849845, 49.361912929587476, 5.787103835804283, 2072)
-    femmesh.addNode(20.115521504082672, 49.62294523331505, 4.309424841390221, 2073)
-    femmesh.addNode(22.887772897794946, 48.334867650815255, 7.178947245222295, 2074)
-    femmesh.addNode(25.86546871951719, 46.57658852622518, 3.173334703959349, 2075)
-    femmesh.addNode(-14.391110105523053, 60.318508780408585, -11.25, 2076)
-    femmesh.addNode(-14.421642619762206, 55.20977014452225, -9.133693654103677, 2077)
-    femmesh.addNode(-20.490971706738108, 45.15713842613766, 11.25, 2078)
-    femmesh.addNode(-40.253031145085984, 31.610823187312562, 11.25, 2079)
-    femmesh.addNode(-17.47767777124467, 56.12209315090615, -4.670083675578796, 2080)
-    femmesh.addNode(-18.964236031379485, 55.67329878249707, -10.536390021475121, 2081)
-    femmesh.addNode(16.84129712530798, 47.663721560142335, 11.475502843535214, 2082)
-    femmesh.addNode(21.764472352654053, 52.850391997062665, 11.292725497911132, 2083)
-    femmesh.addNode(-59.09288367889427, 3.748994237485274, -10.635772713993575, 2084)
-    femmesh.addNode(-68.2006665075952, 47.114626965369524, -11.25, 2085)
-    femmesh.addNode(29.588892145243825, 47.89999243974381, 10.999776063972732, 2086)
-    femmesh.addNode(32.838063089942615, 45.42870444533314, 10.999776063972732, 2087)
-    femmesh.addNode(31.9571775815673, 38.43258877910647, 9.855944531747802, 2088)
-    femmesh.addNode(30.73710402789705, 43.29496159436283, 5.855720595720536, 2089)
-    femmesh.addNode(28.70800663686851, 40.90387677351714, 9.855944531747802, 2090)
-    femmesh.addNode(-61.92324003856241, 24.905227697208108, -9.82032076488985, 2091)
-    femmesh.addNode(-99.66865766518552, 4.6212252354008445, -11.196588129094213, 2092)
-    femmesh.addNode(-75.95692539148232, 4.678071048290702, -11.504130776212534, 2093)
-    femmesh.addNode(25.40031883112197, 50.46659633863369, 11.292725497911132, 2094)
-    femmesh.addNode(25.047248820888267, 43.37717893107968, 10.886221747311161, 2095)
-    femmesh.addNode(21.411402342420352, 45.76097458950865, 10.886221747311161, 2096)
-    femmesh.addNode(-16.476231873694736, 49.28079098700831, 11.25, 2097)
-    femmesh.addNode(-50.42298618069893, 54.33286505500946, -11.25, 2098)
-    femmesh.addNode(29.526226535497436, 44.103286368662644, 2.14305748839599, 2099)
-    femmesh.addNode(30.365233650314494, 43.51720774541824, -4.415953717404284, 2100)
-    femmesh.addNode(35.00393702218079, 43.83217743743903, -9.755167496544383, 2101)
-    femmesh.addNode(31.754766077482003, 46.3034654318497, -9.755167496544383, 2102)
-    femmesh.addNode(27.076346211916807, 45.768263751925375, 6.885997811283895, 2103)
-    femmesh.addNode(-69.18048032113123, 46.44413319114346, 11.25, 2104)
-    femmesh.addNode(-68.55329166374162, 41.19435064732799, 10.289767304020977, 2105)
-    femmesh.addNode(-90.80813019737894, 23.014354684121002, 11.829478439517015, 2106)
-    femmesh.addNode(-100.48475733964776, 2.3311880156824465, -8.696588129094213, 2107)
-    femmesh.addNode(31.722373619790076, 38.219716902536376, -2.1607862208598974, 2108)
-    femmesh.addNode(-55.42146332417953, 5.542570029196499, 6.082882112587766, 2109)
-    femmesh.addNode(-45.194141849503936, 22.138615664623618, 10.824823160366467, 2110)
-    femmesh.addNode(29.11536664125316, 48.222931179002316, -11.803296889138021, 2111)
-    femmesh.addNode(-54.11582420682243, 9.539138398960176, -10.453519658933644, 2112)
-    femmesh.addNode(-54.764691237956924, 3.682541063146779, -10.635772713993575, 2113)
-    femmesh.addNode(-50.928196079895486, 4.407296253513539, 4.310433782778047, 2114)
-    femmesh.addNode(-59.09288367889427, 3.748994237485272, 10.635772713993575, 2115)
-    femmesh.addNode(-14.989673613559923, 49.7295853554174, -5.383693654103676, 2116)
-    femmesh.addNode(36.361076991656375, 38.53468659455716, -11.926459685555812, 2117)
-    femmesh.addNode(-16.476231873694736, 49.28079098700831, -11.25, 2118)
-    femmesh.addNode(32.902977960135225, 41.69843458646872, 0.10077703520342052, 2119)
-    femmesh.addNode(-54.76469123795692, 3.6825410631467683, 10.635772713993575, 2120)
-    femmesh.addNode(-54.49579925775534, 9.225111092343267, 10.44710939859419, 2121)
-    femmesh.addNode(-40.42110658066002, 30.30359867227702, -11.436160332801265, 2122)
-    femmesh.addNode(-11.956622994463306, 50.53712437094417, -11.25, 2123)
-    femmesh.addNode(-51.161709487192354, 2.9307581250160104, 8.115354013558886, 2124)
-    femmesh.addNode(-50.892817506990774, 8.47332815421251, 7.926690698159499, 2125)
-    femmesh.addNode(34.260117929610814, 36.40094374358686, 2.3559445317478076, 2126)
-    femmesh.addNode(-72.99592865588295, 43.43313928582014, 11.250000000000004, 2127)
-    femmesh.addNode(35.95782775747115, 43.062024691570684, 10.134488578031643, 2128)
-    femmesh.addNode(33.85686869542558, 40.92828184060038, 4.990433109779445, 2129)
-    femmesh.addNode(38.26076810551466, 41.030379656051075, 2.6344885780316485, 2130)
-    femmesh.addNode(38.26076810551466, 41.030379656051075, 7.060948263587456, 2131)
-    femmesh.addNode(36.361076991656375, 38.53468659455716, 11.926459685555812, 2132)
-    femmesh.addNode(34.26011792961081, 36.40094374358686, 6.782404217303615, 2133)
-    femmesh.addNode(-50.60808911895025, 10.210120776702384, 10.44710939859419, 2134)
-    femmesh.addNode(-50.236045420768164, 6.613299188162779, 12.479581299565307, 2135)
-    femmesh.addNode(-50.22811406801734, 10.524148083319282, -10.453519658933644, 2136)
-    femmesh.addNode(-51.233353756283975, 2.2898075298839826, -5.512441898468657, 2137)
-    femmesh.addNode(-50.307689689859785, 5.972348593030762, -9.876669184475084, 2138)
-    femmesh.addNode(-99.47684670327658, 2.3311880156824465, -12.5, 2139)
-    femmesh.addNode(-99.45487489906023, 2.3984315485008274, 11.852993069549763, 2140)
-    femmesh.addNode(-51.64986516833513, 2.9307581250160104, 12.479581299565309, 2141)
-    femmesh.addNode(34.88111219256132, 35.87183234430119, -12.60974722698333, 2142)
-    femmesh.addNode(-55.663865102897354, 46.88679706972415, -8.912952722043483, 2143)
-    femmesh.addNode(-44.99128685359341, 47.36927086858727, 10.423163579274696, 2144)
-    femmesh.addNode(7.385582023845262, 54.32599881734108, -2.8747043535168078, 2145)
-    return True
-
-
-def create_elements(femmesh):
-    # elements
-    femmesh.addVolume([326, 329, 230, 406, 348, 1371, 1370, 1372, 1373, 1374], 807)
-    femmesh.addVolume([324, 327, 259, 264, 372, 1376, 1375, 1377, 1378, 316], 808)
-    femmesh.addVolume([331, 328, 59, 437, 359, 341, 357, 1379, 1380, 448], 809)
-    femmesh.addVolume([324, 329, 259, 327, 374, 1381, 1375, 372, 349, 1376], 810)
-    femmesh.addVolume([331, 437, 59, 436, 1379, 448, 357, 1382, 451, 453], 811)
-    femmesh.addVolume([264, 321, 327, 376, 1383, 368, 1378, 1384, 1385, 1386], 812)
-    femmesh.addVolume([230, 410, 326, 406, 1388, 1387, 1370, 1374, 421, 1372], 813)
-    femmesh.addVolume([230, 329, 262, 406, 1371, 1390, 1389, 1374, 1373, 1391], 814)
-    femmesh.addVolume([327, 229, 262, 264, 1394, 1393, 1392, 1378, 1395, 317], 815)
-    femmesh.addVolume([257, 408, 328, 256, 1398, 1397, 1396, 308, 1399, 1400], 816)
-    femmesh.addVolume([377, 321, 260, 376, 1403, 1402, 1401, 395, 1385, 1404], 817)
-    femmesh.addVolume([259, 260, 324, 264, 314, 1405, 1375, 316, 288, 1377], 818)
-    femmesh.addVolume([329, 262, 259, 327, 1390, 304, 1381, 349, 1392, 1376], 819)
-    femmesh.addVolume([229, 264, 327, 231, 1395, 1378, 1394, 252, 1406, 1407], 820)
-    femmesh.addVolume([321, 322, 327, 376, 352, 346, 368, 1385, 1408, 1386], 821)
-    femmesh.addVolume([328, 331, 258, 437, 359, 1410, 1409, 1380, 1379, 1411], 822)
-    femmesh.addVolume([260, 259, 324, 261, 314, 1375, 1405, 315, 312, 1412], 823)
-    femmesh.addVolume([437, 331, 258, 436, 1379, 1410, 1411, 451, 1382, 1413], 824)
-    femmesh.addVolume([258, 256, 328, 437, 295, 1400, 1409, 1411, 1414, 1380], 825)
-    femmesh.addVolume([261, 324, 260, 321, 1412, 1405, 315, 1415, 370, 1402], 826)
-    femmesh.addVolume([324, 330, 331, 259, 375, 367, 373, 1375, 1416, 1417], 827)
-    femmesh.addVolume([323, 265, 379, 321, 1420, 1419, 1418, 369, 1421, 1422], 828)
-    femmesh.addVolume([264, 260, 321, 376, 288, 1402, 1383, 1384, 1404, 1385], 829)
-    femmesh.addVolume([327, 262, 259, 264, 1392, 304, 1376, 1378, 317, 316], 830)
-    femmesh.addVolume([256, 408, 328, 437, 1399, 1397, 1400, 1414, 1423, 1380], 831)
-    femmesh.addVolume([265, 379, 325, 323, 1419, 1425, 1424, 1420, 1418, 360], 832)
-    femmesh.addVolume([230, 263, 262, 229, 1426, 301, 1389, 253, 1427, 1393], 833)
-    femmesh.addVolume([323, 324, 261, 321, 371, 1412, 1428, 369, 370, 1415], 834)
-    femmesh.addVolume([324, 259, 331, 258, 1375, 1417, 373, 1429, 310, 1410], 835)
-    femmesh.addVolume([265, 323, 261, 321, 1420, 1428, 318, 1421, 369, 1415], 836)
-    femmesh.addVolume([436, 59, 331, 323, 453, 357, 1382, 1430, 356, 358], 837)
-    femmesh.addVolume([264, 231, 232, 376, 1406, 254, 1431, 1384, 1432, 1433], 838)
-    femmesh.addVolume([330, 257, 407, 409, 1436, 1435, 1434, 1437, 1438, 428], 839)
-    femmesh.addVolume([323, 379, 325, 321, 1418, 1425, 360, 369, 1422, 354], 840)
-    femmesh.addVolume([262, 229, 263, 264, 1393, 1427, 301, 317, 1395, 320], 841)
-    femmesh.addVolume([324, 258, 331, 323, 1429, 1410, 373, 371, 1439, 358], 842)
-    femmesh.addVolume([258, 324, 259, 261, 1429, 1375, 310, 311, 1412, 312], 843)
-    femmesh.addVolume([261, 258, 324, 323, 311, 1429, 1412, 1428, 1439, 371], 844)
-    femmesh.addVolume([331, 259, 330, 257, 1417, 1416, 367, 1440, 307, 1436], 845)
-    femmesh.addVolume([232, 264, 229, 231, 1431, 1395, 248, 254, 1406, 252], 846)
-    femmesh.addVolume([436, 331, 258, 323, 1382, 1410, 1413, 1430, 358, 1439], 847)
-    femmesh.addVolume([230, 19, 329, 326, 243, 347, 1371, 1370, 335, 348], 848)
-    femmesh.addVolume([262, 233, 230, 406, 1441, 255, 1389, 1391, 1442, 1374], 849)
-    femmesh.addVolume([257, 328, 258, 256, 1396, 1409, 309, 308, 1400, 295], 850)
-    femmesh.addVolume([331, 257, 330, 409, 1440, 1436, 367, 1443, 1438, 1437], 851)
-    femmesh.addVolume([376, 322, 231, 380, 1408, 1444, 1432, 391, 1445, 1446], 852)
-    femmesh.addVolume([259, 324, 330, 329, 1375, 375, 1416, 1381, 374, 364], 853)
-    femmesh.addVolume([328, 258, 331, 257, 1409, 1410, 359, 1396, 309, 1440], 854)
-    femmesh.addVolume([19, 230, 329, 327, 243, 1371, 347, 344, 1447, 349], 855)
-    femmesh.addVolume([378, 268, 266, 265, 1449, 298, 1448, 1450, 319, 292], 856)
-    femmesh.addVolume([258, 259, 331, 257, 310, 1417, 1410, 309, 307, 1440], 857)
-    femmesh.addVolume([261, 265, 268, 323, 318, 319, 313, 1428, 1420, 1451], 858)
-    femmesh.addVolume([329, 330, 259, 407, 364, 1416, 1381, 1452, 1434, 1453], 859)
-    femmesh.addVolume([379, 260, 377, 321, 1454, 1401, 398, 1422, 1402, 1403], 860)
-    femmesh.addVolume([229, 230, 19, 327, 253, 243, 251, 1394, 1447, 344], 861)
-    femmesh.addVolume([378, 266, 268, 325, 1448, 298, 1449, 1455, 1456, 1457], 862)
-    femmesh.addVolume([266, 378, 438, 325, 1448, 1459, 1458, 1456, 1455, 1460], 863)
-    femmesh.addVolume([229, 267, 264, 232, 1461, 285, 1395, 248, 1462, 1431], 864)
-    femmesh.addVolume([407, 330, 259, 257, 1434, 1416, 1453, 1435, 1436, 307], 865)
-    femmesh.addVolume([379, 325, 378, 265, 1425, 1455, 400, 1419, 1424, 1450], 866)
-    femmesh.addVolume([263, 230, 262, 233, 1426, 1389, 301, 1463, 255, 1441], 867)
-    femmesh.addVolume([438, 436, 268, 325, 452, 1465, 1464, 1460, 1466, 1457], 868)
-    femmesh.addVolume([232, 29, 264, 376, 1467, 284, 1431, 1433, 390, 1384], 869)
-    femmesh.addVolume([321, 377, 52, 376, 1403, 402, 350, 1385, 395, 403], 870)
-    femmesh.addVolume([268, 265, 325, 323, 319, 1424, 1457, 1451, 1420, 360], 871)
-    femmesh.addVolume([38, 437, 258, 436, 442, 1411, 296, 450, 451, 1413], 872)
-    femmesh.addVolume([52, 322, 321, 376, 334, 352, 350, 403, 1408, 1385], 873)
-    femmesh.addVolume([325, 268, 378, 265, 1457, 1449, 1455, 1424, 319, 1450], 874)
-    femmesh.addVolume([327, 18, 229, 231, 345, 250, 1394, 1407, 241, 252], 875)
-    femmesh.addVolume([325, 436, 268, 323, 1466, 1465, 1457, 360, 1430, 1451], 876)
-    femmesh.addVolume([410, 230, 26, 406, 1388, 245, 412, 421, 1374, 420], 877)
-    femmesh.addVolume([23, 376, 231, 380, 389, 1432, 242, 383, 391, 1446], 878)
-    femmesh.addVolume([438, 268, 266, 325, 1464, 298, 1458, 1460, 1457, 1456], 879)
-    femmesh.addVolume([436, 438, 60, 325, 452, 445, 454, 1466, 1460, 340], 880)
-    femmesh.addVolume([258, 268, 436, 323, 297, 1465, 1413, 1439, 1451, 1430], 881)
-    femmesh.addVolume([329, 326, 64, 406, 348, 337, 363, 1373, 1372, 433], 882)
-    femmesh.addVolume([233, 263, 230, 229, 1463, 1426, 255, 249, 1427, 253], 883)
-    femmesh.addVolume([233, 262, 43, 406, 1441, 299, 1468, 1442, 1391, 419], 884)
-    femmesh.addVolume([31, 260, 379, 265, 287, 1454, 396, 290, 291, 1419], 885)
-    femmesh.addVolume([38, 256, 258, 437, 279, 295, 296, 442, 1414, 1411], 886)
-    femmesh.addVolume([231, 23, 232, 376, 242, 236, 254, 1432, 389, 1433], 887)
-    femmesh.addVolume([233, 26, 230, 406, 239, 245, 255, 1442, 420, 1374], 888)
-    femmesh.addVolume([258, 261, 268, 323, 311, 313, 297, 1439, 1428, 1451], 889)
-    femmesh.addVolume([406, 64, 329, 407, 433, 363, 1373, 425, 431, 1452], 890)
-    femmesh.addVolume([377, 379, 31, 260, 398, 396, 394, 1401, 1454, 287], 891)
-    femmesh.addVolume([410, 64, 326, 406, 414, 337, 1387, 421, 433, 1372], 892)
-    femmesh.addVolume([263, 264, 229, 267, 320, 1395, 1427, 282, 285, 1461], 893)
-    femmesh.addVolume([267, 29, 264, 232, 271, 284, 285, 1462, 1467, 1431], 894)
-    femmesh.addVolume([328, 66, 408, 409, 343, 416, 1397, 1469, 435, 430], 895)
-    femmesh.addVolume([322, 18, 327, 231, 332, 345, 346, 1444, 241, 1407], 896)
-    femmesh.addVolume([325, 60, 436, 323, 340, 454, 1466, 360, 355, 1430], 897)
-    femmesh.addVolume([257, 45, 407, 409, 306, 423, 1435, 1438, 427, 428], 898)
-    femmesh.addVolume([233, 43, 26, 406, 1468, 411, 239, 1442, 419, 420], 899)
-    femmesh.addVolume([262, 43, 263, 233, 299, 274, 301, 1441, 1468, 1463], 900)
-    femmesh.addVolume([232, 23, 29, 376, 236, 381, 1467, 1433, 389, 390], 901)
-    femmesh.addVolume([328, 331, 66, 409, 359, 366, 343, 1469, 1443, 435], 902)
-    femmesh.addVolume([229, 19, 18, 327, 251, 21, 250, 1394, 344, 345], 903)
-    femmesh.addVolume([330, 64, 65, 407, 361, 68, 362, 1434, 431, 432], 904)
-    femmesh.addVolume([329, 64, 330, 407, 363, 361, 364, 1452, 431, 1434], 905)
-    femmesh.addVolume([377, 52, 53, 321, 402, 56, 401, 1403, 350, 351], 906)
-    femmesh.addVolume([32, 378, 266, 265, 399, 1448, 276, 289, 1450, 292], 907)
-    femmesh.addVolume([407, 259, 45, 257, 1453, 303, 423, 1435, 307, 306], 908)
-    femmesh.addVolume([407, 65, 330, 409, 432, 362, 1434, 428, 434, 1437], 909)
-    femmesh.addVolume([44, 406, 262, 407, 422, 1391, 300, 424, 425, 1470], 910)
-    femmesh.addVolume([377, 53, 379, 321, 401, 405, 398, 1403, 351, 1422], 911)
-    femmesh.addVolume([257, 408, 46, 409, 1398, 429, 305, 1438, 430, 426], 912)
-    femmesh.addVolume([54, 325, 379, 321, 338, 1425, 404, 353, 354, 1422], 913)
-    femmesh.addVolume([257, 46, 408, 256, 305, 429, 1398, 308, 280, 1399], 914)
-    femmesh.addVolume([66, 330, 65, 409, 365, 362, 69, 435, 1437, 434], 915)
-    femmesh.addVolume([436, 258, 38, 268, 1413, 296, 450, 1465, 297, 293], 916)
-    femmesh.addVolume([262, 259, 44, 407, 304, 302, 300, 1470, 1453, 424], 917)
-    femmesh.addVolume([379, 53, 54, 321, 405, 57, 404, 1422, 351, 353], 918)
-    femmesh.addVolume([260, 30, 377, 376, 286, 393, 1401, 1404, 392, 395], 919)
-    femmesh.addVolume([264, 30, 260, 376, 283, 286, 288, 1384, 392, 1404], 920)
-    femmesh.addVolume([268, 39, 436, 438, 294, 449, 1465, 1464, 440, 452], 921)
-    femmesh.addVolume([378, 32, 379, 265, 399, 397, 400, 1450, 289, 1419], 922)
-    femmesh.addVolume([376, 52, 322, 380, 403, 334, 1408, 391, 384, 1445], 923)
-    femmesh.addVolume([267, 1, 29, 232, 269, 33, 271, 1462, 235, 1467], 924)
-    femmesh.addVolume([330, 66, 331, 409, 365, 366, 367, 1437, 435, 1443], 925)
-    femmesh.addVolume([4, 326, 230, 410, 336, 1370, 244, 413, 1387, 1388], 926)
-    femmesh.addVolume([30, 264, 29, 376, 283, 284, 34, 392, 1384, 390], 927)
-    femmesh.addVolume([266, 32, 71, 378, 276, 385, 1471, 1448, 399, 388], 928)
-    femmesh.addVolume([29, 1, 23, 232, 33, 24, 381, 1467, 235, 236], 929)
-    femmesh.addVolume([259, 45, 44, 407, 303, 49, 302, 1453, 423, 424], 930)
-    femmesh.addVolume([54, 378, 379, 325, 387, 400, 404, 338, 1455, 1425], 931)
-    femmesh.addVolume([71, 438, 266, 378, 441, 1458, 1471, 388, 1459, 1448], 932)
-    femmesh.addVolume([2, 43, 26, 233, 47, 411, 27, 237, 1468, 239], 933)
-    femmesh.addVolume([266, 39, 268, 438, 277, 294, 298, 1458, 440, 1464], 934)
-    femmesh.addVolume([263, 43, 2, 233, 274, 47, 273, 1463, 1468, 237], 935)
-    femmesh.addVolume([230, 26, 4, 410, 245, 28, 244, 1388, 412, 413], 936)
-    femmesh.addVolume([231, 3, 23, 380, 240, 25, 242, 1446, 382, 383], 937)
-    femmesh.addVolume([436, 60, 59, 323, 454, 62, 453, 1430, 355, 356], 938)
-    femmesh.addVolume([3, 231, 322, 380, 240, 1444, 333, 382, 1446, 1445], 939)
-    femmesh.addVolume([230, 4, 19, 326, 244, 22, 243, 1370, 336, 335], 940)
-    femmesh.addVolume([14, 229, 13, 267, 246, 247, 16, 281, 1461, 270], 941)
-    femmesh.addVolume([408, 46, 74, 256, 429, 415, 418, 1399, 280, 1472], 942)
-    femmesh.addVolume([328, 408, 74, 437, 1397, 418, 1473, 1380, 1423, 444], 943)
-    femmesh.addVolume([39, 436, 38, 268, 449, 450, 41, 294, 1465, 293], 944)
-    femmesh.addVolume([378, 7, 438, 325, 386, 446, 1459, 1455, 339, 1460], 945)
-    femmesh.addVolume([263, 2, 14, 233, 273, 17, 272, 1463, 237, 238], 946)
-    femmesh.addVolume([256, 74, 408, 437, 1472, 418, 1399, 1414, 444, 1423], 947)
-    femmesh.addVolume([229, 14, 263, 267, 246, 272, 1427, 1461, 281, 282], 948)
-    femmesh.addVolume([233, 14, 263, 229, 238, 272, 1463, 249, 246, 1427], 949)
-    femmesh.addVolume([438, 71, 7, 378, 441, 72, 446, 1459, 388, 386], 950)
-    femmesh.addVolume([267, 13, 1, 232, 270, 15, 269, 1462, 234, 235], 951)
-    femmesh.addVolume([328, 8, 59, 437, 342, 61, 341, 1380, 447, 448], 952)
-    femmesh.addVolume([379, 32, 31, 265, 397, 36, 396, 1419, 289, 290], 953)
-    femmesh.addVolume([18, 322, 3, 231, 332, 333, 20, 241, 1444, 240], 954)
-    femmesh.addVolume([267, 229, 13, 232, 1461, 247, 270, 1462, 248, 234], 955)
-    femmesh.addVolume([262, 44, 43, 406, 300, 48, 299, 1391, 422, 419], 956)
-    femmesh.addVolume([74, 46, 6, 256, 415, 51, 76, 1472, 280, 278], 957)
-    femmesh.addVolume([32, 71, 5, 266, 385, 73, 37, 276, 1471, 275], 958)
-    femmesh.addVolume([8, 408, 74, 328, 417, 418, 75, 342, 1397, 1473], 959)
-    femmesh.addVolume([8, 328, 74, 437, 342, 1473, 75, 447, 1380, 444], 960)
-    femmesh.addVolume([256, 38, 6, 437, 279, 40, 278, 1414, 442, 443], 961)
-    femmesh.addVolume([377, 31, 30, 260, 394, 35, 393, 1401, 287, 286], 962)
-    femmesh.addVolume([438, 7, 60, 325, 446, 63, 445, 1460, 339, 340], 963)
-    femmesh.addVolume([45, 257, 46, 409, 306, 305, 50, 427, 1438, 426], 964)
-    femmesh.addVolume([74, 256, 6, 437, 1472, 278, 76, 444, 1414, 443], 965)
-    femmesh.addVolume([326, 4, 64, 410, 336, 67, 337, 1387, 413, 414], 966)
-    femmesh.addVolume([266, 5, 39, 438, 275, 42, 277, 1458, 439, 440], 967)
-    femmesh.addVolume([322, 52, 3, 380, 334, 55, 333, 1445, 384, 382], 968)
-    femmesh.addVolume([7, 378, 54, 325, 386, 387, 58, 339, 1455, 338], 969)
-    femmesh.addVolume([66, 408, 8, 328, 416, 417, 70, 343, 1397, 342], 970)
-    femmesh.addVolume([266, 71, 5, 438, 1471, 73, 275, 1458, 441, 439], 971)
-    femmesh.addVolume([409, 257, 328, 331, 1438, 1396, 1469, 1443, 1440, 359], 972)
-    femmesh.addVolume([409, 328, 257, 408, 1469, 1396, 1438, 430, 1397, 1398], 973)
-    femmesh.addVolume([230, 262, 327, 229, 1389, 1392, 1447, 253, 1393, 1394], 974)
-    femmesh.addVolume([262, 230, 327, 329, 1389, 1447, 1392, 1390, 1371, 349], 975)
-    femmesh.addVolume([376, 231, 327, 264, 1432, 1407, 1386, 1384, 1406, 1378], 976)
-    femmesh.addVolume([376, 327, 231, 322, 1386, 1407, 1432, 1408, 346, 1444], 977)
-    femmesh.addVolume([321, 324, 264, 327, 370, 1377, 1383, 368, 372, 1378], 978)
-    femmesh.addVolume([324, 321, 264, 260, 370, 1383, 1377, 1405, 1402, 288], 979)
-    femmesh.addVolume([265, 260, 321, 261, 291, 1402, 1421, 318, 315, 1415], 980)
-    femmesh.addVolume([260, 265, 321, 379, 291, 1421, 1402, 1454, 1419, 1422], 981)
-    femmesh.addVolume([262, 329, 407, 406, 1390, 1452, 1470, 1391, 1373, 425], 982)
-    femmesh.addVolume([329, 262, 407, 259, 1390, 1470, 1452, 1381, 304, 1453], 983)
-    femmesh.addVolume([475, 1231, 474, 1490, 1503, 1502, 665, 1504, 1505, 1506], 984)
-    femmesh.addVolume([756, 739, 719, 1480, 900, 899, 898, 1507, 1508, 1509], 985)
-    femmesh.addVolume([1023, 1476, 1479, 1491, 1512, 1511, 1510, 1513, 1514, 1515], 986)
-    femmesh.addVolume([1224, 1492, 1474, 1495, 1518, 1517, 1516, 1519, 1520, 1521], 987)
-    femmesh.addVolume([484, 483, 1475, 1496, 687, 1523, 1522, 1524, 1525, 1526], 988)
-    femmesh.addVolume([474, 1243, 508, 1490, 1528, 1527, 669, 1506, 1529, 1530], 989)
-    femmesh.addVolume([1228, 473, 475, 474, 1532, 594, 1531, 1533, 662, 665], 990)
-    femmesh.addVolume([1231, 1230, 475, 474, 1353, 1534, 1503, 1502, 1535, 665], 991)
-    femmesh.addVolume([467, 456, 1482, 1485, 632, 1537, 1536, 1538, 1539, 1540], 992)
-    femmesh.addVolume([484, 485, 483, 1496, 690, 609, 687, 1524, 1541, 1525], 993)
-    femmesh.addVolume([1023, 1476, 1478, 1479, 1512, 1543, 1542, 1510, 1511, 1544], 994)
-    femmesh.addVolume([475, 1230, 1228, 474, 1534, 1305, 1531, 665, 1535, 1533], 995)
-    femmesh.addVolume([926, 1482, 456, 1485, 1546, 1537, 1545, 1547, 1540, 1539], 996)
-    femmesh.addVolume([475, 474, 476, 1490, 665, 666, 667, 1504, 1506, 1548], 997)
-    femmesh.addVolume([1042, 1474, 1036, 1486, 1550, 1549, 1207, 1551, 1552, 1553], 998)
-    femmesh.addVolume([720, 1476, 1483, 1484, 1556, 1555, 1554, 1557, 1558, 1559], 999)
-    femmesh.addVolume([719, 739, 1475, 1480, 899, 1561, 1560, 1509, 1508, 1562], 1000)
-    femmesh.addVolume([1013, 475, 477, 1490, 1564, 597, 1563, 1565, 1504, 1566], 1001)
-    femmesh.addVolume([937, 1487, 749, 1499, 1569, 1568, 1567, 1570, 1571, 1572], 1002)
-    femmesh.addVolume([749, 755, 1474, 1487, 919, 1574, 1573, 1568, 1575, 1576], 1003)
-    femmesh.addVolume([1231, 475, 1230, 1490, 1503, 1534, 1353, 1505, 1504, 1577], 1004)
-    femmesh.addVolume([1224, 1478, 1492, 1495, 1579, 1578, 1518, 1519, 1580, 1520], 1005)
-    femmesh.addVolume([717, 1484, 1478, 1495, 1583, 1582, 1581, 1584, 1585, 1580], 1006)
-    femmesh.addVolume([1036, 1474, 1042, 1487, 1549, 1550, 1207, 1586, 1576, 1587], 1007)
-    femmesh.addVolume([926, 929, 1482, 1485, 1002, 1588, 1546, 1547, 1589, 1540], 1008)
-    femmesh.addVolume([1478, 717, 1479, 1484, 1581, 1590, 1544, 1582, 1583, 1591], 1009)
-    femmesh.addVolume([1474, 749, 1487, 1499, 1573, 1568, 1576, 1592, 1572, 1571], 1010)
-    femmesh.addVolume([475, 1017, 473, 1228, 1594, 1593, 594, 1531, 1595, 1532], 1011)
-    femmesh.addVolume([1474, 1042, 1487, 1500, 1550, 1587, 1576, 1596, 1597, 1598], 1012)
-    femmesh.addVolume([930, 467, 926, 1482, 1600, 1599, 1001, 1601, 1536, 1546], 1013)
-    femmesh.addVolume([457, 929, 926, 1485, 1603, 1002, 1602, 1604, 1589, 1547], 1014)
-    femmesh.addVolume([1474, 1036, 1486, 1487, 1549, 1553, 1552, 1576, 1586, 1605], 1015)
-    femmesh.addVolume([722, 749, 755, 1499, 918, 919, 920, 1606, 1572, 1607], 1016)
-    femmesh.addVolume([1237, 739, 1475, 1489, 1609, 1561, 1608, 1610, 1611, 1612], 1017)
-    femmesh.addVolume([739, 758, 719, 1475, 901, 902, 899, 1561, 1613, 1560], 1018)
-    femmesh.addVolume([926, 467, 456, 1482, 1599, 632, 1545, 1546, 1536, 1537], 1019)
-    femmesh.addVolume([457, 926, 456, 1485, 1602, 1545, 633, 1604, 1547, 1539], 1020)
-    femmesh.addVolume([1013, 477, 1481, 1490, 1563, 1615, 1614, 1565, 1566, 1616], 1021)
-    femmesh.addVolume([744, 498, 1483, 1485, 1619, 1618, 1617, 1620, 1621, 1622], 1022)
-    femmesh.addVolume([477, 475, 476, 1490, 597, 667, 670, 1566, 1504, 1548], 1023)
-    femmesh.addVolume([1027, 1487, 1042, 1500, 1623, 1587, 1158, 1624, 1598, 1597], 1024)
-    femmesh.addVolume([938, 1486, 1036, 1487, 1626, 1553, 1625, 1627, 1605, 1586], 1025)
-    femmesh.addVolume([1479, 1476, 1484, 1491, 1511, 1558, 1591, 1515, 1514, 1628], 1026)
-    femmesh.addVolume([1012, 1477, 1482, 1487, 1631, 1630, 1629, 1632, 1633, 1634], 1027)
-    femmesh.addVolume([467, 458, 456, 1485, 636, 634, 632, 1538, 1635, 1539], 1028)
-    femmesh.addVolume([1224, 1221, 1474, 1486, 1340, 1636, 1516, 1637, 1638, 1552], 1029)
-    femmesh.addVolume([1230, 1231, 1229, 474, 1353, 1354, 1352, 1535, 1502, 1639], 1030)
-    femmesh.addVolume([1479, 502, 1484, 1496, 1641, 1640, 1591, 1642, 1643, 1644], 1031)
-    femmesh.addVolume([1475, 1496, 1014, 1497, 1526, 1646, 1645, 1647, 1648, 1649], 1032)
-    femmesh.addVolume([482, 504, 484, 1475, 689, 688, 686, 1650, 1651, 1522], 1033)
-    femmesh.addVolume([755, 749, 1474, 1499, 919, 1573, 1574, 1607, 1572, 1592], 1034)
-    femmesh.addVolume([1229, 1228, 1230, 474, 1339, 1305, 1352, 1639, 1533, 1535], 1035)
-    femmesh.addVolume([1476, 1023, 1478, 1492, 1512, 1542, 1543, 1652, 1653, 1578], 1036)
-    femmesh.addVolume([1228, 475, 1017, 1230, 1531, 1594, 1595, 1305, 1534, 1654], 1037)
-    femmesh.addVolume([508, 1243, 730, 1490, 1527, 1656, 1655, 1530, 1529, 1657], 1038)
-    femmesh.addVolume([717, 1478, 1479, 1489, 1581, 1544, 1590, 1658, 1659, 1660], 1039)
-    femmesh.addVolume([1027, 1012, 1477, 1482, 1179, 1631, 1661, 1662, 1629, 1630], 1040)
-    femmesh.addVolume([492, 1484, 1483, 1491, 1664, 1559, 1663, 1665, 1628, 1666], 1041)
-    femmesh.addVolume([508, 1243, 474, 509, 1527, 1528, 669, 538, 1667, 663], 1042)
-    femmesh.addVolume([720, 1476, 752, 1483, 1556, 1668, 907, 1554, 1555, 1669], 1043)
-    femmesh.addVolume([1027, 1477, 1012, 1487, 1661, 1631, 1179, 1623, 1633, 1632], 1044)
-    femmesh.addVolume([492, 500, 1483, 1484, 708, 1670, 1663, 1664, 1671, 1559], 1045)
-    femmesh.addVolume([504, 1475, 482, 1480, 1651, 1650, 689, 1672, 1562, 1673], 1046)
-    femmesh.addVolume([1221, 1224, 1474, 1495, 1340, 1516, 1636, 1674, 1519, 1521], 1047)
-    femmesh.addVolume([1476, 1478, 1484, 1495, 1543, 1582, 1558, 1675, 1580, 1585], 1048)
-    femmesh.addVolume([1221, 738, 1495, 1499, 1677, 1676, 1674, 1678, 1679, 1680], 1049)
-    femmesh.addVolume([1479, 1014, 1496, 1497, 1681, 1646, 1642, 1682, 1649, 1648], 1050)
-    femmesh.addVolume([485, 1479, 1014, 1496, 1684, 1681, 1683, 1541, 1642, 1646], 1051)
-    femmesh.addVolume([484, 482, 1475, 1488, 686, 1650, 1522, 1685, 1686, 1687], 1052)
-    femmesh.addVolume([755, 1487, 725, 1494, 1575, 1688, 923, 1689, 1690, 1691], 1053)
-    femmesh.addVolume([484, 1475, 483, 1488, 1522, 1523, 687, 1685, 1687, 1692], 1054)
-    femmesh.addVolume([739, 1240, 1475, 1480, 1694, 1693, 1561, 1508, 1695, 1562], 1055)
-    femmesh.addVolume([504, 484, 1475, 1496, 688, 1522, 1651, 1696, 1524, 1526], 1056)
-    femmesh.addVolume([1236, 1026, 1475, 1488, 1699, 1698, 1697, 1700, 1701, 1687], 1057)
-    femmesh.addVolume([1027, 1477, 1487, 1500, 1661, 1633, 1623, 1624, 1702, 1598], 1058)
-    femmesh.addVolume([925, 1487, 937, 1499, 1703, 1569, 997, 1704, 1571, 1570], 1059)
-    femmesh.addVolume([1476, 1478, 1479, 1484, 1543, 1544, 1511, 1558, 1582, 1591], 1060)
-    femmesh.addVolume([498, 495, 1483, 1485, 714, 1705, 1618, 1621, 1706, 1622], 1061)
-    femmesh.addVolume([742, 719, 1475, 1480, 896, 1560, 1707, 1708, 1509, 1562], 1062)
-    femmesh.addVolume([1221, 1495, 1474, 1499, 1674, 1521, 1636, 1678, 1680, 1592], 1063)
-    femmesh.addVolume([484, 483, 482, 1488, 687, 685, 686, 1685, 1692, 1686], 1064)
-    femmesh.addVolume([492, 490, 1484, 1491, 706, 1709, 1664, 1665, 1710, 1628], 1065)
-    femmesh.addVolume([755, 725, 740, 1494, 923, 892, 872, 1689, 1691, 1711], 1066)
-    femmesh.addVolume([753, 1484, 502, 1496, 1713, 1640, 1712, 1714, 1644, 1643], 1067)
-    femmesh.addVolume([1006, 1045, 1026, 1497, 1188, 1189, 1187, 1715, 1716, 1717], 1068)
-    femmesh.addVolume([495, 1483, 1485, 1493, 1705, 1622, 1706, 1718, 1719, 1720], 1069)
-    femmesh.addVolume([492, 490, 500, 1484, 706, 709, 708, 1664, 1709, 1671], 1070)
-    femmesh.addVolume([755, 1474, 1487, 1494, 1574, 1576, 1575, 1689, 1721, 1690], 1071)
-    femmesh.addVolume([1483, 1477, 1493, 1500, 1723, 1722, 1719, 1724, 1702, 1725], 1072)
-    femmesh.addVolume([1223, 1224, 1478, 1492, 1341, 1579, 1726, 1727, 1518, 1578], 1073)
-    femmesh.addVolume([720, 1483, 741, 1484, 1554, 1728, 908, 1557, 1559, 1729], 1074)
-    femmesh.addVolume([1016, 467, 930, 1482, 1731, 1600, 1730, 1732, 1536, 1601], 1075)
-    femmesh.addVolume([457, 729, 929, 1485, 1734, 1733, 1603, 1604, 1735, 1589], 1076)
-    femmesh.addVolume([1029, 1014, 1475, 1496, 1087, 1645, 1736, 1737, 1646, 1526], 1077)
-    femmesh.addVolume([479, 480, 481, 1488, 677, 680, 603, 1738, 1739, 1740], 1078)
-    femmesh.addVolume([925, 1474, 1487, 1499, 1741, 1576, 1703, 1704, 1592, 1571], 1079)
-    femmesh.addVolume([1237, 739, 1240, 1475, 1609, 1694, 1369, 1608, 1561, 1693], 1080)
-    femmesh.addVolume([1011, 1483, 1493, 1500, 1743, 1719, 1742, 1744, 1724, 1725], 1081)
-    femmesh.addVolume([1028, 1491, 1483, 1500, 1746, 1666, 1745, 1747, 1748, 1724], 1082)
-    femmesh.addVolume([1027, 1012, 1042, 1487, 1179, 1210, 1158, 1623, 1632, 1587], 1083)
-    femmesh.addVolume([739, 758, 1475, 1489, 901, 1613, 1561, 1611, 1749, 1612], 1084)
-    femmesh.addVolume([485, 1014, 1029, 1496, 1683, 1087, 1750, 1541, 1646, 1737], 1085)
-    femmesh.addVolume([1026, 1236, 1475, 1497, 1699, 1697, 1698, 1717, 1751, 1647], 1086)
-    femmesh.addVolume([1027, 1477, 1005, 1482, 1661, 1752, 1173, 1662, 1630, 1753], 1087)
-    femmesh.addVolume([1477, 1487, 1494, 1498, 1633, 1690, 1754, 1755, 1756, 1757], 1088)
-    femmesh.addVolume([1018, 1023, 1479, 1491, 1171, 1510, 1758, 1759, 1513, 1515], 1089)
-    femmesh.addVolume([489, 1479, 1484, 1491, 1761, 1591, 1760, 1762, 1515, 1628], 1090)
-    femmesh.addVolume([500, 741, 1483, 1484, 1763, 1728, 1670, 1671, 1729, 1559], 1091)
-    femmesh.addVolume([504, 742, 1475, 1480, 1764, 1707, 1651, 1672, 1708, 1562], 1092)
-    femmesh.addVolume([1236, 1475, 1234, 1488, 1697, 1765, 1314, 1700, 1687, 1766], 1093)
-    femmesh.addVolume([725, 755, 749, 1487, 923, 919, 858, 1688, 1575, 1568], 1094)
-    femmesh.addVolume([744, 1483, 724, 1485, 1617, 1767, 816, 1620, 1622, 1768], 1095)
-    femmesh.addVolume([493, 1483, 494, 1493, 1770, 1769, 654, 1771, 1719, 1772], 1096)
-    femmesh.addVolume([479, 1481, 480, 1488, 1774, 1773, 677, 1738, 1775, 1739], 1097)
-    femmesh.addVolume([494, 1483, 495, 1493, 1769, 1705, 655, 1772, 1719, 1718], 1098)
-    femmesh.addVolume([1016, 467, 1482, 1493, 1731, 1536, 1732, 1776, 1777, 1778], 1099)
-    femmesh.addVolume([1042, 1036, 1009, 1486, 1207, 1205, 1206, 1551, 1553, 1779], 1100)
-    femmesh.addVolume([1477, 724, 1483, 1485, 1780, 1767, 1723, 1781, 1768, 1622], 1101)
-    femmesh.addVolume([1234, 1475, 1235, 1488, 1765, 1782, 1362, 1766, 1687, 1783], 1102)
-    femmesh.addVolume([1477, 1494, 740, 1498, 1754, 1711, 1784, 1755, 1757, 1785], 1103)
-    femmesh.addVolume([1224, 1238, 1478, 1495, 1342, 1786, 1579, 1519, 1787, 1580], 1104)
-    femmesh.addVolume([756, 1240, 739, 1480, 1788, 1694, 900, 1507, 1695, 1508], 1105)
-    femmesh.addVolume([458, 457, 456, 1485, 635, 633, 634, 1635, 1604, 1539], 1106)
-    femmesh.addVolume([1011, 1483, 493, 1493, 1743, 1770, 1789, 1742, 1719, 1771], 1107)
-    femmesh.addVolume([1476, 1483, 1484, 1491, 1555, 1559, 1558, 1514, 1666, 1628], 1108)
-    femmesh.addVolume([489, 1479, 488, 1484, 1761, 1790, 700, 1760, 1591, 1791], 1109)
-    femmesh.addVolume([1483, 1477, 1485, 1493, 1723, 1781, 1622, 1719, 1722, 1720], 1110)
-    femmesh.addVolume([929, 1482, 1485, 1498, 1588, 1540, 1589, 1792, 1793, 1794], 1111)
-    femmesh.addVolume([1036, 1042, 1012, 1487, 1207, 1210, 1116, 1586, 1587, 1632], 1112)
-    femmesh.addVolume([717, 1489, 1479, 1496, 1658, 1660, 1590, 1795, 1796, 1642], 1113)
-    femmesh.addVolume([925, 1486, 938, 1487, 1797, 1626, 996, 1703, 1605, 1627], 1114)
-    femmesh.addVolume([1013, 1481, 1230, 1490, 1614, 1799, 1798, 1565, 1616, 1577], 1115)
-    femmesh.addVolume([1235, 1480, 1481, 1488, 1802, 1801, 1800, 1783, 1803, 1775], 1116)
-    femmesh.addVolume([749, 937, 725, 1487, 1567, 1804, 858, 1568, 1569, 1688], 1117)
-    femmesh.addVolume([504, 1475, 742, 1496, 1651, 1707, 1764, 1696, 1526, 1805], 1118)
-    femmesh.addVolume([1042, 1474, 1492, 1500, 1550, 1517, 1806, 1597, 1596, 1807], 1119)
-    femmesh.addVolume([717, 736, 1484, 1495, 877, 1808, 1583, 1584, 1809, 1585], 1120)
-    femmesh.addVolume([1027, 1005, 1012, 1482, 1173, 1178, 1179, 1662, 1753, 1629], 1121)
-    femmesh.addVolume([488, 489, 487, 1479, 700, 615, 697, 1790, 1761, 1810], 1122)
-    femmesh.addVolume([488, 1479, 502, 1484, 1790, 1641, 698, 1791, 1591, 1640], 1123)
-    femmesh.addVolume([1221, 1238, 1224, 1495, 1288, 1342, 1340, 1674, 1787, 1519], 1124)
-    femmesh.addVolume([757, 720, 500, 1484, 906, 1812, 1811, 1813, 1557, 1671], 1125)
-    femmesh.addVolume([938, 1036, 927, 1487, 1625, 1814, 978, 1627, 1586, 1815], 1126)
-    femmesh.addVolume([733, 719, 742, 1480, 895, 896, 796, 1816, 1509, 1708], 1127)
-    femmesh.addVolume([1235, 1475, 1480, 1488, 1782, 1562, 1802, 1783, 1687, 1803], 1128)
-    femmesh.addVolume([1238, 732, 1478, 1495, 1818, 1817, 1786, 1787, 1819, 1580], 1129)
-    femmesh.addVolume([1240, 1235, 1475, 1480, 1368, 1782, 1693, 1695, 1802, 1562], 1130)
-    femmesh.addVolume([483, 1475, 1029, 1488, 1523, 1736, 1820, 1692, 1687, 1821], 1131)
-    femmesh.addVolume([1007, 1476, 1491, 1500, 1823, 1514, 1822, 1824, 1825, 1748], 1132)
-    femmesh.addVolume([1221, 1474, 1486, 1499, 1636, 1552, 1638, 1678, 1592, 1826], 1133)
-    femmesh.addVolume([1475, 482, 1480, 1488, 1650, 1673, 1562, 1687, 1686, 1803], 1134)
-    femmesh.addVolume([930, 467, 933, 926, 1600, 1827, 985, 1001, 1599, 955], 1135)
-    femmesh.addVolume([1480, 480, 1481, 1488, 1828, 1773, 1801, 1803, 1739, 1775], 1136)
-    femmesh.addVolume([732, 717, 1478, 1495, 875, 1581, 1817, 1819, 1584, 1580], 1137)
-    femmesh.addVolume([717, 732, 1478, 1489, 875, 1817, 1581, 1658, 1829, 1659], 1138)
-    femmesh.addVolume([1243, 509, 508, 734, 1667, 538, 1527, 1830, 1831, 1832], 1139)
-    femmesh.addVolume([1025, 1486, 1223, 1492, 1835, 1834, 1833, 1836, 1837, 1727], 1140)
-    femmesh.addVolume([720, 741, 500, 1484, 908, 1763, 1812, 1557, 1729, 1671], 1141)
-    femmesh.addVolume([498, 495, 494, 1483, 714, 655, 715, 1618, 1705, 1769], 1142)
-    femmesh.addVolume([934, 457, 929, 926, 1838, 1603, 968, 954, 1602, 1002], 1143)
-    femmesh.addVolume([1223, 1224, 1225, 1478, 1341, 1343, 1321, 1726, 1579, 1839], 1144)
-    femmesh.addVolume([493, 492, 1483, 1491, 710, 1663, 1770, 1840, 1665, 1666], 1145)
-    femmesh.addVolume([720, 736, 1476, 1484, 905, 1841, 1556, 1557, 1808, 1558], 1146)
-    femmesh.addVolume([758, 1489, 727, 1496, 1749, 1842, 880, 1843, 1796, 1844], 1147)
-    femmesh.addVolume([1229, 474, 1243, 509, 1639, 1528, 1329, 1845, 663, 1667], 1148)
-    femmesh.addVolume([925, 1474, 1486, 1487, 1741, 1552, 1797, 1703, 1576, 1605], 1149)
-    femmesh.addVolume([1028, 1483, 1011, 1500, 1745, 1743, 1101, 1747, 1724, 1744], 1150)
-    femmesh.addVolume([1028, 493, 1483, 1491, 1846, 1770, 1745, 1746, 1840, 1666], 1151)
-    femmesh.addVolume([1476, 1484, 736, 1495, 1558, 1808, 1841, 1675, 1585, 1809], 1152)
-    femmesh.addVolume([474, 1229, 472, 509, 1639, 1847, 661, 663, 1845, 664], 1153)
-    femmesh.addVolume([491, 492, 493, 1491, 707, 710, 621, 1848, 1665, 1840], 1154)
-    femmesh.addVolume([1243, 1242, 730, 1490, 1273, 1849, 1656, 1529, 1850, 1657], 1155)
-    femmesh.addVolume([1004, 1023, 1478, 1479, 1163, 1542, 1851, 1852, 1510, 1544], 1156)
-    femmesh.addVolume([1476, 752, 1483, 1494, 1668, 1669, 1555, 1853, 1854, 1855], 1157)
-    femmesh.addVolume([1018, 1479, 489, 1491, 1758, 1761, 1856, 1759, 1515, 1762], 1158)
-    femmesh.addVolume([1236, 1235, 1234, 1475, 1366, 1362, 1314, 1697, 1782, 1765], 1159)
-    femmesh.addVolume([1237, 1235, 1236, 1475, 1367, 1366, 1349, 1608, 1782, 1697], 1160)
-    femmesh.addVolume([925, 1486, 1474, 1499, 1797, 1552, 1741, 1704, 1826, 1592], 1161)
-    femmesh.addVolume([466, 467, 1016, 1493, 630, 1731, 1857, 1858, 1777, 1776], 1162)
-    femmesh.addVolume([1211, 496, 509, 743, 1860, 535, 1859, 1861, 1862, 1863], 1163)
-    femmesh.addVolume([1223, 1221, 1224, 1486, 1337, 1340, 1341, 1834, 1638, 1637], 1164)
-    femmesh.addVolume([474, 508, 476, 1490, 669, 668, 666, 1506, 1530, 1548], 1165)
-    femmesh.addVolume([929, 1485, 729, 1498, 1589, 1735, 1733, 1792, 1794, 1864], 1166)
-    femmesh.addVolume([725, 937, 928, 1487, 1804, 961, 1865, 1688, 1569, 1866], 1167)
-    femmesh.addVolume([1003, 1042, 1492, 1500, 1159, 1806, 1867, 1868, 1597, 1807], 1168)
-    femmesh.addVolume([1221, 738, 723, 1495, 1677, 851, 1869, 1674, 1676, 1870], 1169)
-    femmesh.addVolume([733, 742, 504, 1480, 796, 1764, 1871, 1816, 1708, 1672], 1170)
-    femmesh.addVolume([508, 730, 1243, 734, 1655, 1656, 1527, 1832, 782, 1830], 1171)
-    femmesh.addVolume([470, 472, 1220, 496, 657, 1873, 1872, 656, 659, 1874], 1172)
-    femmesh.addVolume([758, 1475, 1489, 1496, 1613, 1612, 1749, 1843, 1526, 1796], 1173)
-    femmesh.addVolume([1236, 1234, 1026, 1488, 1314, 1875, 1699, 1700, 1766, 1701], 1174)
-    femmesh.addVolume([1022, 466, 1016, 1493, 1876, 1857, 1109, 1877, 1858, 1776], 1175)
-    femmesh.addVolume([732, 1238, 1478, 1489, 1818, 1786, 1817, 1829, 1878, 1659], 1176)
-    femmesh.addVolume([1007, 1491, 1039, 1500, 1822, 1879, 1194, 1824, 1748, 1880], 1177)
-    femmesh.addVolume([1223, 1478, 1010, 1492, 1726, 1882, 1881, 1727, 1578, 1883], 1178)
-    femmesh.addVolume([718, 724, 1477, 1485, 886, 1780, 1884, 1885, 1768, 1781], 1179)
-    femmesh.addVolume([933, 1016, 467, 930, 1886, 1731, 1827, 985, 1730, 1600], 1180)
-    femmesh.addVolume([1006, 1029, 1475, 1488, 1182, 1736, 1887, 1888, 1821, 1687], 1181)
-    femmesh.addVolume([481, 480, 482, 1488, 680, 681, 682, 1740, 1739, 1686], 1182)
-    femmesh.addVolume([1239, 739, 1237, 1489, 1889, 1609, 1350, 1890, 1611, 1610], 1183)
-    femmesh.addVolume([936, 927, 1012, 1482, 981, 1892, 1891, 1893, 1894, 1629], 1184)
-    femmesh.addVolume([1237, 1240, 1235, 1475, 1369, 1368, 1367, 1608, 1693, 1782], 1185)
-    femmesh.addVolume([487, 489, 1018, 1479, 615, 1856, 1895, 1810, 1761, 1758], 1186)
-    femmesh.addVolume([1036, 1012, 927, 1487, 1116, 1892, 1814, 1586, 1632, 1815], 1187)
-    femmesh.addVolume([1477, 1474, 1487, 1500, 1896, 1576, 1633, 1702, 1596, 1598], 1188)
-    femmesh.addVolume([479, 1008, 1481, 1488, 1898, 1897, 1774, 1738, 1899, 1775], 1189)
-    femmesh.addVolume([1235, 1481, 1234, 1488, 1800, 1900, 1362, 1783, 1775, 1766], 1190)
-    femmesh.addVolume([1477, 1027, 1493, 1500, 1661, 1901, 1722, 1702, 1624, 1725], 1191)
-    femmesh.addVolume([926, 467, 933, 456, 1599, 1827, 955, 1545, 632, 1902], 1192)
-    femmesh.addVolume([1226, 1478, 1238, 1489, 1903, 1786, 1346, 1904, 1659, 1878], 1193)
-    femmesh.addVolume([729, 929, 934, 457, 1733, 968, 1905, 1734, 1603, 1838], 1194)
-    femmesh.addVolume([1480, 1233, 1481, 1501, 1907, 1906, 1801, 1908, 1909, 1910], 1195)
-    femmesh.addVolume([502, 488, 486, 1479, 698, 696, 699, 1641, 1790, 1911], 1196)
-    femmesh.addVolume([482, 480, 1480, 1488, 681, 1828, 1673, 1686, 1739, 1803], 1197)
-    femmesh.addVolume([1476, 1483, 1491, 1500, 1555, 1666, 1514, 1825, 1724, 1748], 1198)
-    femmesh.addVolume([925, 939, 1486, 1499, 999, 1912, 1797, 1704, 1913, 1826], 1199)
-    femmesh.addVolume([1012, 1024, 936, 1482, 1119, 1914, 1891, 1629, 1915, 1893], 1200)
-    femmesh.addVolume([718, 744, 724, 1485, 889, 816, 886, 1885, 1620, 1768], 1201)
-    femmesh.addVolume([742, 719, 758, 1475, 896, 902, 903, 1707, 1560, 1613], 1202)
-    femmesh.addVolume([1012, 1482, 927, 1487, 1629, 1894, 1892, 1632, 1634, 1815], 1203)
-    femmesh.addVolume([1211, 1220, 472, 496, 1326, 1873, 1916, 1860, 1874, 659], 1204)
-    femmesh.addVolume([1211, 743, 509, 734, 1861, 1863, 1859, 1917, 779, 1831], 1205)
-    femmesh.addVolume([1018, 1007, 1023, 1491, 1192, 1191, 1171, 1759, 1822, 1513], 1206)
-    femmesh.addVolume([753, 501, 502, 1484, 1918, 559, 1712, 1713, 1919, 1640], 1207)
-    femmesh.addVolume([466, 458, 467, 1493, 639, 636, 630, 1858, 1920, 1777], 1208)
-    femmesh.addVolume([751, 1495, 738, 1499, 1921, 1676, 917, 1922, 1680, 1679], 1209)
-    femmesh.addVolume([720, 736, 752, 1476, 905, 868, 907, 1556, 1841, 1668], 1210)
-    femmesh.addVolume([1021, 471, 473, 1228, 1924, 591, 1923, 1925, 1926, 1532], 1211)
-    femmesh.addVolume([470, 1220, 1211, 496, 1872, 1326, 1927, 656, 1874, 1860], 1212)
-    femmesh.addVolume([720, 752, 741, 1483, 907, 909, 908, 1554, 1669, 1728], 1213)
-    femmesh.addVolume([1028, 493, 1011, 1483, 1846, 1789, 1101, 1745, 1770, 1743], 1214)
-    femmesh.addVolume([502, 1479, 486, 1496, 1641, 1911, 699, 1643, 1642, 1928], 1215)
-    femmesh.addVolume([1228, 1220, 472, 1229, 1338, 1873, 1929, 1339, 1327, 1847], 1216)
-    femmesh.addVolume([471, 1030, 1227, 1220, 1932, 1931, 1930, 1933, 1934, 1334], 1217)
-    femmesh.addVolume([1237, 1489, 1475, 1497, 1610, 1612, 1608, 1935, 1936, 1647], 1218)
-    femmesh.addVolume([463, 1212, 1213, 469, 1938, 1323, 1937, 650, 1939, 1940], 1219)
-    femmesh.addVolume([1041, 1234, 1481, 1488, 1942, 1900, 1941, 1943, 1766, 1775], 1220)
-    femmesh.addVolume([493, 1031, 1011, 1493, 1944, 1103, 1789, 1771, 1945, 1742], 1221)
-    femmesh.addVolume([744, 498, 724, 1483, 1619, 1946, 816, 1617, 1618, 1767], 1222)
-    femmesh.addVolume([509, 1211, 472, 496, 1859, 1916, 664, 535, 1860, 659], 1223)
-    femmesh.addVolume([485, 486, 1479, 1496, 692, 1911, 1684, 1541, 1928, 1642], 1224)
-    femmesh.addVolume([1243, 1231, 1242, 1490, 1355, 1359, 1273, 1529, 1505, 1850], 1225)
-    femmesh.addVolume([1038, 1042, 1474, 1492, 1160, 1550, 1947, 1948, 1806, 1517], 1226)
-    femmesh.addVolume([755, 751, 1474, 1494, 873, 1949, 1574, 1689, 1950, 1721], 1227)
-    femmesh.addVolume([1007, 1023, 1476, 1500, 1191, 1512, 1823, 1824, 1951, 1825], 1228)
-    femmesh.addVolume([1023, 1007, 1476, 1491, 1191, 1823, 1512, 1513, 1822, 1514], 1229)
-    femmesh.addVolume([1237, 1475, 1236, 1497, 1608, 1697, 1349, 1935, 1647, 1751], 1230)
-    femmesh.addVolume([724, 1477, 1483, 1494, 1780, 1723, 1767, 1952, 1754, 1855], 1231)
-    femmesh.addVolume([752, 1476, 736, 1494, 1668, 1841, 868, 1854, 1853, 1953], 1232)
-    femmesh.addVolume([470, 496, 1213, 469, 656, 1955, 1954, 651, 532, 1940], 1233)
-    femmesh.addVolume([1226, 1224, 1238, 1478, 1345, 1342, 1346, 1903, 1579, 1786], 1234)
-    femmesh.addVolume([1226, 1225, 1478, 1489, 1344, 1839, 1903, 1904, 1956, 1659], 1235)
-    femmesh.addVolume([718, 1477, 740, 1498, 1884, 1784, 888, 1957, 1755, 1785], 1236)
-    femmesh.addVolume([485, 486, 487, 1479, 692, 695, 612, 1684, 1911, 1810], 1237)
-    femmesh.addVolume([1213, 469, 496, 750, 1940, 532, 1955, 1958, 1959, 1960], 1238)
-    femmesh.addVolume([1241, 1233, 1480, 1501, 1364, 1907, 1961, 1962, 1909, 1908], 1239)
-    femmesh.addVolume([1225, 1478, 1489, 1497, 1839, 1659, 1956, 1963, 1964, 1936], 1240)
-    femmesh.addVolume([1221, 723, 1238, 1495, 1869, 1965, 1288, 1674, 1870, 1787], 1241)
-    femmesh.addVolume([754, 1241, 1480, 1501, 1967, 1961, 1966, 1968, 1962, 1908], 1242)
-    femmesh.addVolume([1489, 1479, 1496, 1497, 1660, 1642, 1796, 1936, 1682, 1648], 1243)
-    femmesh.addVolume([488, 502, 501, 1484, 698, 559, 704, 1791, 1640, 1919], 1244)
-    femmesh.addVolume([930, 926, 929, 1482, 1001, 1002, 992, 1601, 1546, 1588], 1245)
-    femmesh.addVolume([724, 740, 1477, 1494, 887, 1784, 1780, 1952, 1711, 1754], 1246)
-    femmesh.addVolume([1041, 1043, 1234, 1488, 1200, 1969, 1942, 1943, 1970, 1766], 1247)
-    femmesh.addVolume([485, 487, 1040, 1479, 612, 1972, 1971, 1684, 1810, 1973], 1248)
-    femmesh.addVolume([740, 718, 724, 1477, 888, 886, 887, 1784, 1884, 1780], 1249)
-    femmesh.addVolume([1477, 1494, 1474, 1500, 1754, 1721, 1896, 1702, 1974, 1596], 1250)
-    femmesh.addVolume([1233, 1235, 1480, 1481, 1363, 1802, 1907, 1906, 1800, 1801], 1251)
-    femmesh.addVolume([470, 1213, 1212, 469, 1954, 1323, 1975, 651, 1940, 1939], 1252)
-    femmesh.addVolume([1028, 1039, 1491, 1500, 1195, 1879, 1746, 1747, 1880, 1748], 1253)
-    femmesh.addVolume([1021, 473, 1017, 1228, 1923, 1593, 1069, 1925, 1532, 1595], 1254)
-    femmesh.addVolume([1477, 1005, 1482, 1493, 1752, 1753, 1630, 1722, 1976, 1778], 1255)
-    femmesh.addVolume([1027, 1005, 1477, 1493, 1173, 1752, 1661, 1901, 1976, 1722], 1256)
-    femmesh.addVolume([1475, 1489, 1496, 1497, 1612, 1796, 1526, 1647, 1936, 1648], 1257)
-    femmesh.addVolume([1007, 1039, 1023, 1500, 1194, 1154, 1191, 1824, 1880, 1951], 1258)
-    femmesh.addVolume([479, 1008, 1035, 1481, 1898, 1080, 1977, 1774, 1897, 1978], 1259)
-    femmesh.addVolume([1220, 471, 472, 470, 1933, 658, 1873, 1872, 652, 657], 1260)
-    femmesh.addVolume([1038, 1486, 1025, 1492, 1979, 1835, 1203, 1948, 1837, 1836], 1261)
-    femmesh.addVolume([717, 727, 1489, 1496, 878, 1842, 1658, 1795, 1844, 1796], 1262)
-    femmesh.addVolume([1220, 1030, 1227, 1228, 1934, 1931, 1334, 1338, 1980, 1302], 1263)
-    femmesh.addVolume([750, 1213, 469, 747, 1958, 1940, 1959, 773, 1981, 1982], 1264)
-    femmesh.addVolume([742, 1475, 758, 1496, 1707, 1613, 903, 1805, 1526, 1843], 1265)
-    femmesh.addVolume([751, 1474, 1495, 1499, 1949, 1521, 1921, 1922, 1592, 1680], 1266)
-    femmesh.addVolume([739, 728, 758, 1489, 843, 883, 901, 1611, 1983, 1749], 1267)
-    femmesh.addVolume([478, 1481, 477, 1490, 1984, 1615, 672, 1985, 1616, 1566], 1268)
-    femmesh.addVolume([1043, 1026, 1234, 1488, 1186, 1875, 1969, 1970, 1701, 1766], 1269)
-    femmesh.addVolume([757, 720, 741, 500, 906, 908, 810, 1811, 1812, 1763], 1270)
-    femmesh.addVolume([1215, 1486, 939, 1499, 1987, 1912, 1986, 1988, 1826, 1913], 1271)
-    femmesh.addVolume([1004, 1018, 1023, 1479, 1172, 1171, 1163, 1852, 1758, 1510], 1272)
-    femmesh.addVolume([1474, 1477, 1487, 1494, 1896, 1633, 1576, 1721, 1754, 1690], 1273)
-    femmesh.addVolume([1040, 1014, 485, 1479, 1089, 1683, 1971, 1973, 1681, 1684], 1274)
-    femmesh.addVolume([1226, 1237, 1225, 1489, 1348, 1347, 1344, 1904, 1610, 1956], 1275)
-    femmesh.addVolume([499, 724, 498, 1483, 1989, 1946, 568, 1990, 1767, 1618], 1276)
-    femmesh.addVolume([1478, 1479, 1489, 1497, 1544, 1660, 1659, 1964, 1682, 1936], 1277)
-    femmesh.addVolume([491, 493, 1028, 1491, 621, 1846, 1991, 1848, 1840, 1746], 1278)
-    femmesh.addVolume([1011, 1493, 1027, 1500, 1742, 1901, 1174, 1744, 1725, 1624], 1279)
-    femmesh.addVolume([504, 503, 484, 1496, 553, 694, 688, 1696, 1992, 1524], 1280)
-    femmesh.addVolume([1477, 718, 1485, 1498, 1884, 1885, 1781, 1755, 1957, 1794], 1281)
-    femmesh.addVolume([1238, 1221, 738, 723, 1288, 1677, 1993, 1965, 1869, 851], 1282)
-    femmesh.addVolume([1220, 1227, 471, 470, 1334, 1930, 1933, 1872, 1994, 652], 1283)
-    femmesh.addVolume([717, 753, 727, 1496, 879, 802, 878, 1795, 1714, 1844], 1284)
-    femmesh.addVolume([507, 508, 730, 1490, 541, 1655, 1995, 1996, 1530, 1657], 1285)
-    femmesh.addVolume([470, 1211, 1213, 496, 1927, 1264, 1954, 656, 1860, 1955], 1286)
-    femmesh.addVolume([756, 754, 1240, 1480, 913, 1997, 1788, 1507, 1966, 1695], 1287)
-    femmesh.addVolume([492, 500, 499, 1483, 708, 565, 713, 1663, 1670, 1990], 1288)
-    femmesh.addVolume([1038, 1474, 1486, 1492, 1947, 1552, 1979, 1948, 1517, 1837], 1289)
-    femmesh.addVolume([493, 494, 465, 1493, 654, 653, 624, 1771, 1772, 1998], 1290)
-    femmesh.addVolume([1025, 1223, 1010, 1492, 1833, 1881, 1149, 1836, 1727, 1883], 1291)
-    femmesh.addVolume([1476, 736, 1494, 1495, 1841, 1953, 1853, 1675, 1809, 1999], 1292)
-    femmesh.addVolume([1211, 1212, 1220, 470, 1324, 1325, 1326, 1927, 1975, 1872], 1293)
-    femmesh.addVolume([1026, 1015, 1236, 1497, 1141, 2000, 1699, 1717, 2001, 1751], 1294)
-    femmesh.addVolume([1238, 738, 1221, 165, 1993, 1677, 1288, 1283, 848, 1286], 1295)
-    femmesh.addVolume([483, 481, 482, 1488, 606, 682, 685, 1692, 1740, 1686], 1296)
-    femmesh.addVolume([1041, 1008, 1043, 1488, 1198, 1199, 1200, 1943, 1899, 1970], 1297)
-    femmesh.addVolume([505, 504, 482, 1480, 550, 689, 683, 2002, 1672, 1673], 1298)
-    femmesh.addVolume([1237, 1225, 1489, 1497, 1347, 1956, 1610, 1935, 1963, 1936], 1299)
-    femmesh.addVolume([505, 733, 504, 1480, 2003, 1871, 550, 2002, 1816, 1672], 1300)
-    femmesh.addVolume([1233, 1235, 1241, 1480, 1363, 1365, 1364, 1907, 1802, 1961], 1301)
-    femmesh.addVolume([478, 477, 476, 1490, 672, 670, 671, 1985, 1566, 1548], 1302)
-    femmesh.addVolume([1476, 1023, 1492, 1500, 1512, 1653, 1652, 1825, 1951, 1807], 1303)
-    femmesh.addVolume([1003, 1042, 1038, 1492, 1159, 1160, 1151, 1867, 1806, 1948], 1304)
-    femmesh.addVolume([493, 465, 1031, 1493, 624, 2004, 1944, 1771, 1998, 1945], 1305)
-    femmesh.addVolume([717, 727, 758, 1489, 878, 880, 881, 1658, 1842, 1749], 1306)
-    femmesh.addVolume([731, 736, 720, 1484, 885, 905, 904, 2005, 1808, 1557], 1307)
-    femmesh.addVolume([751, 1474, 1494, 1495, 1949, 1721, 1950, 1921, 1521, 1999], 1308)
-    femmesh.addVolume([1213, 1212, 1211, 470, 1323, 1324, 1264, 1954, 1975, 1927], 1309)
-    femmesh.addVolume([509, 1243, 1211, 734, 1667, 1270, 1859, 1831, 1830, 1917], 1310)
-    femmesh.addVolume([926, 934, 457, 456, 954, 1838, 1602, 1545, 2006, 633], 1311)
-    femmesh.addVolume([1026, 1045, 1015, 1497, 1189, 1170, 1141, 1717, 1716, 2001], 1312)
-    femmesh.addVolume([1240, 1239, 739, 1237, 1282, 1889, 1694, 1369, 1350, 1609], 1313)
-    femmesh.addVolume([721, 505, 748, 1501, 2008, 2007, 793, 2009, 2010, 2011], 1314)
-    femmesh.addVolume([1235, 1240, 1241, 1480, 1368, 1279, 1365, 1802, 1695, 1961], 1315)
-    femmesh.addVolume([748, 505, 506, 1501, 2007, 547, 2012, 2011, 2010, 2013], 1316)
-    femmesh.addVolume([1041, 1481, 1008, 1488, 1941, 1897, 1198, 1943, 1775, 1899], 1317)
-    femmesh.addVolume([741, 499, 500, 1483, 2014, 565, 1763, 1728, 1990, 1670], 1318)
-    femmesh.addVolume([936, 924, 927, 1482, 989, 988, 981, 1893, 2015, 1894], 1319)
-    femmesh.addVolume([1227, 1220, 1212, 470, 1334, 1325, 1333, 1994, 1872, 1975], 1320)
-    femmesh.addVolume([1212, 463, 470, 469, 1938, 648, 1975, 1939, 650, 651], 1321)
-    femmesh.addVolume([747, 1214, 746, 1222, 2017, 2016, 770, 2018, 1259, 2019], 1322)
-    femmesh.addVolume([496, 1211, 1213, 750, 1860, 1264, 1955, 1960, 2020, 1958], 1323)
-    femmesh.addVolume([477, 479, 1035, 1481, 600, 1977, 2021, 1615, 1774, 1978], 1324)
-    femmesh.addVolume([731, 501, 753, 1484, 2022, 1918, 806, 2005, 1919, 1713], 1325)
-    femmesh.addVolume([1230, 1481, 1231, 1490, 1799, 2023, 1353, 1577, 1616, 1505], 1326)
-    femmesh.addVolume([1004, 1479, 1478, 1497, 1852, 1544, 1851, 2024, 1682, 1964], 1327)
-    femmesh.addVolume([929, 729, 737, 1498, 1733, 863, 2025, 1792, 1864, 2026], 1328)
-    femmesh.addVolume([1225, 1019, 1478, 1497, 2028, 2027, 1839, 1963, 2029, 1964], 1329)
-    femmesh.addVolume([723, 732, 1238, 1495, 850, 1818, 1965, 1870, 1819, 1787], 1330)
-    femmesh.addVolume([736, 731, 717, 1484, 885, 884, 877, 1808, 2005, 1583], 1331)
-    femmesh.addVolume([729, 457, 735, 1485, 1734, 2030, 822, 1735, 1604, 2031], 1332)
-    femmesh.addVolume([752, 724, 1483, 1494, 922, 1767, 1669, 1854, 1952, 1855], 1333)
-    femmesh.addVolume([506, 507, 748, 1501, 544, 2032, 2012, 2013, 2033, 2011], 1334)
-    femmesh.addVolume([1240, 754, 1241, 1480, 1997, 1967, 1279, 1695, 1966, 1961], 1335)
-    femmesh.addVolume([719, 733, 756, 1480, 895, 897, 898, 1509, 1816, 1507], 1336)
-    femmesh.addVolume([480, 1480, 1481, 1501, 1828, 1801, 1773, 2034, 1908, 1910], 1337)
-    femmesh.addVolume([497, 498, 744, 1485, 571, 1619, 2035, 2036, 1621, 1620], 1338)
-    femmesh.addVolume([738, 165, 1238, 723, 848, 1283, 1993, 851, 849, 1965], 1339)
-    femmesh.addVolume([504, 742, 503, 1496, 1764, 2037, 553, 1696, 1805, 1992], 1340)
-    femmesh.addVolume([481, 126, 479, 1020, 601, 599, 603, 2038, 1077, 2039], 1341)
-    femmesh.addVolume([497, 735, 457, 1485, 2040, 2030, 574, 2036, 2031, 1604], 1342)
-    femmesh.addVolume([924, 927, 1482, 1487, 988, 1894, 2015, 2041, 1815, 1634], 1343)
-    femmesh.addVolume([488, 487, 486, 1479, 697, 695, 696, 1790, 1810, 1911], 1344)
-    femmesh.addVolume([483, 1020, 481, 1488, 2042, 2038, 606, 1692, 2043, 1740], 1345)
-    femmesh.addVolume([1043, 1006, 1026, 1488, 1184, 1187, 1186, 1970, 1888, 1701], 1346)
-    femmesh.addVolume([1035, 479, 126, 1008, 1977, 599, 1073, 1080, 1898, 1079], 1347)
-    femmesh.addVolume([467, 455, 136, 933, 631, 521, 628, 1827, 2044, 2045], 1348)
-    femmesh.addVolume([1233, 1231, 1481, 1490, 1358, 2023, 1906, 2046, 1505, 1616], 1349)
-    femmesh.addVolume([1222, 436, 460, 438, 2049, 2048, 2047, 2050, 452, 2051], 1350)
-    femmesh.addVolume([928, 725, 1487, 1498, 1865, 1688, 1866, 2052, 2053, 1756], 1351)
-    femmesh.addVolume([1028, 1011, 1039, 1500, 1101, 1209, 1195, 1747, 1744, 1880], 1352)
-    femmesh.addVolume([489, 1484, 490, 1491, 1760, 1709, 702, 1762, 1628, 1710], 1353)
-    femmesh.addVolume([477, 1013, 124, 475, 1563, 1071, 595, 597, 1564, 593], 1354)
-    femmesh.addVolume([489, 488, 490, 1484, 700, 701, 702, 1760, 1791, 1709], 1355)
-    femmesh.addVolume([929, 737, 935, 1498, 2025, 2054, 967, 1792, 2026, 2055], 1356)
-    femmesh.addVolume([721, 1480, 505, 1501, 2056, 2002, 2008, 2009, 1908, 2010], 1357)
-    femmesh.addVolume([743, 1211, 496, 750, 1861, 1860, 1862, 776, 2020, 1960], 1358)
-    femmesh.addVolume([463, 1213, 1214, 469, 1937, 1266, 2057, 650, 1940, 2058], 1359)
-    femmesh.addVolume([1226, 1225, 1224, 1478, 1344, 1343, 1345, 1903, 1839, 1579], 1360)
-    femmesh.addVolume([936, 1024, 930, 1482, 1914, 2059, 984, 1893, 1915, 1601], 1361)
-    femmesh.addVolume([1237, 1236, 1225, 1497, 1349, 1317, 1347, 1935, 1751, 1963], 1362)
-    femmesh.addVolume([1214, 468, 463, 469, 2060, 646, 2057, 2058, 529, 650], 1363)
-    femmesh.addVolume([1492, 1474, 1494, 1500, 1517, 1721, 2061, 1807, 1596, 1974], 1364)
-    femmesh.addVolume([937, 932, 925, 1499, 958, 1000, 997, 1570, 2062, 1704], 1365)
-    femmesh.addVolume([732, 723, 717, 1495, 850, 874, 875, 1819, 1870, 1584], 1366)
-    femmesh.addVolume([739, 1239, 728, 1489, 1889, 2063, 843, 1611, 1890, 1983], 1367)
-    femmesh.addVolume([1227, 464, 1030, 471, 2065, 2064, 1931, 1930, 588, 1932], 1368)
-    femmesh.addVolume([478, 480, 1481, 1501, 676, 1773, 1984, 2066, 2034, 1910], 1369)
-    femmesh.addVolume([929, 924, 1482, 1498, 993, 2015, 1588, 1792, 2067, 1793], 1370)
-    femmesh.addVolume([1215, 939, 1216, 1499, 1986, 2068, 1291, 1988, 1913, 2069], 1371)
-    femmesh.addVolume([497, 495, 498, 1485, 642, 714, 571, 2036, 1706, 1621], 1372)
-    femmesh.addVolume([503, 753, 502, 1496, 2070, 1712, 556, 1992, 1714, 1643], 1373)
-    femmesh.addVolume([752, 736, 716, 1494, 868, 864, 867, 1854, 1953, 2071], 1374)
-    femmesh.addVolume([1011, 1005, 1027, 1493, 1175, 1173, 1174, 1742, 1976, 1901], 1375)
-    femmesh.addVolume([1005, 1024, 1012, 1482, 1177, 1119, 1178, 1753, 1915, 1629], 1376)
-    femmesh.addVolume([751, 723, 738, 1495, 921, 851, 917, 1921, 1870, 1676], 1377)
-    femmesh.addVolume([477, 1035, 1013, 1481, 2021, 1075, 1563, 1615, 1978, 1614], 1378)
-    femmesh.addVolume([494, 495, 465, 1493, 655, 640, 653, 1772, 1718, 1998], 1379)
-    femmesh.addVolume([925, 932, 939, 1499, 1000, 971, 999, 1704, 2062, 1913], 1380)
-    femmesh.addVolume([1234, 1233, 1232, 1481, 1361, 1357, 1311, 1900, 1906, 2072], 1381)
-    femmesh.addVolume([1233, 1234, 1235, 1481, 1361, 1362, 1363, 1906, 1900, 1800], 1382)
-    femmesh.addVolume([1218, 464, 1212, 463, 2074, 2073, 1332, 2075, 647, 1938], 1383)
-    femmesh.addVolume([471, 1227, 464, 470, 1930, 2065, 588, 652, 1994, 649], 1384)
-    femmesh.addVolume([507, 730, 726, 1490, 1995, 785, 2076, 1996, 1657, 2077], 1385)
-    femmesh.addVolume([1009, 1025, 1038, 1486, 1202, 1203, 1204, 1779, 1835, 1979], 1386)
-    femmesh.addVolume([756, 721, 754, 1480, 912, 911, 913, 1507, 2056, 1966], 1387)
-    femmesh.addVolume([1024, 1016, 930, 1482, 1121, 1730, 2059, 1915, 1732, 1601], 1388)
-    femmesh.addVolume([1041, 1234, 1232, 1481, 1942, 1311, 2078, 1941, 1900, 2072], 1389)
-    femmesh.addVolume([1015, 1019, 1225, 1497, 1144, 2028, 2079, 2001, 2029, 1963], 1390)
-    femmesh.addVolume([1481, 1233, 1490, 1501, 1906, 2046, 1616, 1910, 1909, 2080], 1391)
-    femmesh.addVolume([1478, 1476, 1492, 1495, 1543, 1652, 1578, 1580, 1675, 1520], 1392)
-    femmesh.addVolume([748, 507, 726, 1501, 2032, 2076, 788, 2011, 2033, 2081], 1393)
-    femmesh.addVolume([718, 729, 1485, 1498, 893, 1735, 1885, 1957, 1864, 1794], 1394)
-    femmesh.addVolume([1016, 467, 136, 933, 1731, 628, 1107, 1886, 1827, 2045], 1395)
-    femmesh.addVolume([487, 1018, 1040, 1479, 1895, 1092, 1972, 1810, 1758, 1973], 1396)
-    femmesh.addVolume([1017, 124, 1013, 475, 1067, 1071, 1072, 1594, 593, 1564], 1397)
-    femmesh.addVolume([480, 505, 1480, 1501, 684, 2002, 1828, 2034, 2010, 1908], 1398)
-    femmesh.addVolume([1483, 1476, 1494, 1500, 1555, 1853, 1855, 1724, 1825, 1974], 1399)
-    femmesh.addVolume([180, 725, 749, 937, 857, 858, 853, 957, 1804, 1567], 1400)
-    femmesh.addVolume([721, 733, 505, 1480, 792, 2003, 2008, 2056, 1816, 2002], 1401)
-    femmesh.addVolume([1212, 1213, 1214, 463, 1323, 1266, 1330, 1938, 1937, 2057], 1402)
-    femmesh.addVolume([1030, 1227, 1037, 464, 1931, 2082, 1063, 2064, 2065, 2083], 1403)
-    femmesh.addVolume([470, 1212, 464, 463, 1975, 2073, 649, 648, 1938, 647], 1404)
-    femmesh.addVolume([1232, 1233, 1231, 1481, 1357, 1358, 1356, 2072, 1906, 2023], 1405)
-    femmesh.addVolume([1232, 1231, 1230, 1481, 1356, 1353, 1308, 2072, 2023, 1799], 1406)
-    femmesh.addVolume([749, 932, 937, 1499, 2084, 958, 1567, 1572, 2062, 1570], 1407)
-    femmesh.addVolume([505, 482, 480, 1480, 683, 681, 684, 2002, 1673, 1828], 1408)
-    femmesh.addVolume([501, 757, 500, 1484, 2085, 1811, 562, 1919, 1813, 1671], 1409)
-    femmesh.addVolume([484, 486, 485, 1496, 691, 692, 690, 1524, 1928, 1541], 1410)
-    femmesh.addVolume([1476, 1492, 1494, 1500, 1652, 2061, 1853, 1825, 1807, 1974], 1411)
-    femmesh.addVolume([1033, 461, 1034, 1217, 2087, 2086, 1057, 2088, 2089, 2090], 1412)
-    femmesh.addVolume([1003, 1027, 1042, 1500, 1157, 1158, 1159, 1868, 1624, 1597], 1413)
-    femmesh.addVolume([478, 480, 479, 1481, 676, 677, 675, 1984, 1773, 1774], 1414)
-    femmesh.addVolume([718, 740, 725, 1498, 888, 892, 890, 1957, 1785, 2053], 1415)
-    femmesh.addVolume([1236, 1015, 1225, 1497, 2000, 2079, 1317, 1751, 2001, 1963], 1416)
-    femmesh.addVolume([1222, 60, 436, 438, 1244, 454, 2049, 2050, 445, 452], 1417)
-    femmesh.addVolume([507, 476, 508, 1490, 674, 668, 541, 1996, 1548, 1530], 1418)
-    femmesh.addVolume([736, 716, 1494, 1495, 864, 2071, 1953, 1809, 2091, 1999], 1419)
-    femmesh.addVolume([1019, 1004, 1478, 1497, 1161, 1851, 2027, 2029, 2024, 1964], 1420)
-    femmesh.addVolume([938, 927, 925, 1487, 978, 995, 996, 1627, 1815, 1703], 1421)
-    femmesh.addVolume([754, 1480, 721, 1501, 1966, 2056, 911, 1968, 1908, 2009], 1422)
-    femmesh.addVolume([81, 508, 509, 734, 536, 538, 534, 778, 1832, 1831], 1423)
-    femmesh.addVolume([737, 729, 718, 1498, 863, 893, 891, 2026, 1864, 1957], 1424)
-    femmesh.addVolume([507, 506, 748, 83, 544, 2012, 2032, 540, 542, 786], 1425)
-    femmesh.addVolume([91, 724, 498, 499, 814, 1946, 566, 564, 1989, 568], 1426)
-    femmesh.addVolume([473, 123, 1017, 475, 590, 1068, 1593, 594, 592, 1594], 1427)
-    femmesh.addVolume([1212, 464, 1227, 470, 2073, 2065, 1333, 1975, 649, 1994], 1428)
-    femmesh.addVolume([1008, 479, 126, 1020, 1898, 599, 1079, 1078, 2039, 1077], 1429)
-    femmesh.addVolume([729, 934, 94, 457, 1905, 2092, 821, 1734, 1838, 572], 1430)
-    femmesh.addVolume([935, 725, 928, 1498, 2093, 1865, 964, 2055, 2053, 2052], 1431)
-    femmesh.addVolume([1034, 464, 1037, 1218, 2094, 2083, 1060, 2095, 2074, 2096], 1432)
-    femmesh.addVolume([499, 498, 494, 1483, 568, 715, 712, 1990, 1618, 1769], 1433)
-    femmesh.addVolume([721, 84, 748, 505, 791, 787, 793, 2008, 545, 2007], 1434)
-    femmesh.addVolume([1232, 1230, 1013, 1481, 1308, 1798, 2097, 2072, 1799, 1614], 1435)
-    femmesh.addVolume([1477, 1483, 1494, 1500, 1723, 1855, 1754, 1702, 1724, 1974], 1436)
-    femmesh.addVolume([1034, 206, 1033, 1217, 1122, 1050, 1057, 2090, 1249, 2088], 1437)
-    femmesh.addVolume([725, 935, 737, 1498, 2093, 2054, 861, 2053, 2055, 2026], 1438)
-    femmesh.addVolume([929, 924, 930, 1482, 993, 991, 992, 1588, 2015, 1601], 1439)
-    femmesh.addVolume([924, 1487, 1482, 1498, 2041, 1634, 2015, 2067, 1756, 1793], 1440)
-    femmesh.addVolume([730, 508, 81, 734, 1655, 536, 780, 782, 1832, 778], 1441)
-    femmesh.addVolume([503, 727, 753, 1496, 2098, 802, 2070, 1992, 1844, 1714], 1442)
-    femmesh.addVolume([1010, 1478, 1023, 1492, 1882, 1542, 1164, 1883, 1578, 1653], 1443)
-    femmesh.addVolume([928, 937, 925, 1487, 961, 997, 994, 1866, 1569, 1703], 1444)
-    femmesh.addVolume([506, 505, 480, 1501, 547, 684, 678, 2013, 2010, 2034], 1445)
-    femmesh.addVolume([507, 478, 1490, 1501, 673, 1985, 1996, 2033, 2066, 2080], 1446)
-    femmesh.addVolume([738, 722, 751, 1499, 914, 916, 917, 1679, 1606, 1922], 1447)
-    femmesh.addVolume([477, 478, 479, 1481, 672, 675, 600, 1615, 1984, 1774], 1448)
-    femmesh.addVolume([1218, 1214, 1217, 463, 1331, 1257, 1296, 2075, 2057, 2099], 1449)
-    femmesh.addVolume([746, 460, 1214, 747, 2101, 2100, 2016, 770, 2102, 2017], 1450)
-    femmesh.addVolume([1021, 208, 1030, 1228, 1126, 1128, 1066, 1925, 1301, 1980], 1451)
-    femmesh.addVolume([1217, 461, 1218, 463, 2089, 2103, 1296, 2099, 645, 2075], 1452)
-    femmesh.addVolume([937, 180, 725, 928, 957, 857, 1804, 961, 959, 1865], 1453)
-    femmesh.addVolume([197, 1012, 1024, 936, 1115, 1119, 1117, 980, 1891, 1914], 1454)
-    femmesh.addVolume([752, 740, 724, 1494, 870, 887, 922, 1854, 1711, 1952], 1455)
-    femmesh.addVolume([478, 1481, 1490, 1501, 1984, 1616, 1985, 2066, 1910, 2080], 1456)
-    femmesh.addVolume([1018, 489, 1044, 1491, 1856, 2104, 1094, 1759, 1762, 2105], 1457)
-    femmesh.addVolume([1038, 1025, 1010, 1492, 1203, 1149, 1208, 1948, 1836, 1883], 1458)
-    femmesh.addVolume([495, 1485, 458, 1493, 1706, 1635, 641, 1718, 1720, 1920], 1459)
-    femmesh.addVolume([466, 1022, 1031, 1493, 1876, 1106, 2106, 1858, 1877, 1945], 1460)
-    femmesh.addVolume([934, 459, 94, 457, 2107, 517, 2092, 1838, 575, 572], 1461)
-    femmesh.addVolume([436, 460, 1214, 1222, 2048, 2100, 2108, 2049, 2047, 1259], 1462)
-    femmesh.addVolume([1474, 1492, 1494, 1495, 1517, 2061, 1721, 1521, 1520, 1999], 1463)
-    femmesh.addVolume([483, 1029, 1020, 1488, 1820, 1083, 2042, 1692, 1821, 2043], 1464)
-    femmesh.addVolume([925, 939, 931, 1486, 999, 972, 998, 1797, 1912, 2109], 1465)
-    femmesh.addVolume([1012, 936, 197, 927, 1891, 980, 1115, 1892, 981, 976], 1466)
-    femmesh.addVolume([134, 1031, 466, 1022, 1099, 2106, 626, 1105, 1106, 1876], 1467)
-    femmesh.addVolume([1225, 215, 1223, 1019, 1318, 1319, 1321, 2028, 1143, 2110], 1468)
-    femmesh.addVolume([726, 507, 1490, 1501, 2076, 1996, 2077, 2081, 2033, 2080], 1469)
-    femmesh.addVolume([468, 1214, 460, 747, 2060, 2100, 526, 2111, 2017, 2102], 1470)
-    femmesh.addVolume([1482, 1487, 1477, 1498, 1634, 1633, 1630, 1793, 1756, 1755], 1471)
-    femmesh.addVolume([931, 938, 925, 1486, 975, 996, 998, 2109, 1626, 1797], 1472)
-    femmesh.addVolume([82, 507, 508, 730, 539, 541, 537, 781, 1995, 1655], 1473)
-    femmesh.addVolume([717, 723, 736, 1495, 874, 876, 877, 1584, 1870, 1809], 1474)
-    femmesh.addVolume([745, 749, 722, 1499, 855, 918, 915, 2112, 1572, 1606], 1475)
-    femmesh.addVolume([1492, 1476, 1494, 1495, 1652, 1853, 2061, 1520, 1675, 1999], 1476)
-    femmesh.addVolume([1227, 1030, 208, 1228, 1931, 1128, 1298, 1302, 1980, 1301], 1477)
-    femmesh.addVolume([724, 499, 741, 1483, 1989, 2014, 815, 1767, 1990, 1728], 1478)
-    femmesh.addVolume([748, 505, 84, 506, 2007, 545, 787, 2012, 547, 543], 1479)
-    femmesh.addVolume([745, 932, 749, 1499, 2113, 2084, 855, 2112, 2062, 1572], 1480)
-    femmesh.addVolume([725, 181, 737, 935, 856, 860, 861, 2093, 962, 2054], 1481)
-    femmesh.addVolume([93, 457, 497, 735, 573, 574, 570, 818, 2030, 2040], 1482)
-    femmesh.addVolume([1215, 1221, 1486, 1499, 1335, 1638, 1987, 1988, 1678, 1826], 1483)
-    femmesh.addVolume([1215, 931, 939, 1486, 2114, 972, 1986, 1987, 2109, 1912], 1484)
-    femmesh.addVolume([735, 718, 729, 1485, 894, 893, 822, 2031, 1885, 1735], 1485)
-    femmesh.addVolume([935, 725, 181, 928, 2093, 856, 962, 964, 1865, 960], 1486)
-    femmesh.addVolume([1010, 1223, 215, 1019, 1881, 1319, 1148, 1147, 2110, 1143], 1487)
-    femmesh.addVolume([931, 1036, 938, 1486, 2115, 1625, 975, 2109, 1553, 1626], 1488)
-    femmesh.addVolume([1023, 1003, 1492, 1500, 1153, 1867, 1653, 1951, 1868, 1807], 1489)
-    femmesh.addVolume([507, 506, 478, 1501, 544, 679, 673, 2033, 2013, 2066], 1490)
-    femmesh.addVolume([497, 744, 735, 1485, 2035, 819, 2040, 2036, 1620, 2031], 1491)
-    femmesh.addVolume([1241, 1490, 1233, 1501, 2116, 2046, 1364, 1962, 2080, 1909], 1492)
-    femmesh.addVolume([1214, 60, 436, 1222, 1258, 454, 2108, 1259, 1244, 2049], 1493)
-    femmesh.addVolume([716, 751, 755, 1494, 866, 873, 871, 2071, 1950, 1689], 1494)
-    femmesh.addVolume([1030, 464, 121, 471, 2064, 583, 1062, 1932, 588, 586], 1495)
-    femmesh.addVolume([1039, 1003, 1023, 1500, 1155, 1153, 1154, 1880, 1868, 1951], 1496)
-    femmesh.addVolume([1482, 1477, 1485, 1498, 1630, 1781, 1540, 1793, 1755, 1794], 1497)
-    femmesh.addVolume([751, 1494, 716, 1495, 1950, 2071, 866, 1921, 1999, 2091], 1498)
-    femmesh.addVolume([156, 747, 746, 1222, 825, 770, 763, 1246, 2018, 2019], 1499)
-    femmesh.addVolume([78, 469, 468, 747, 527, 529, 525, 769, 1982, 2111], 1500)
-    femmesh.addVolume([493, 492, 494, 1483, 710, 711, 654, 1770, 1663, 1769], 1501)
-    femmesh.addVolume([936, 1024, 198, 930, 1914, 1118, 979, 984, 2059, 983], 1502)
-    femmesh.addVolume([1037, 121, 1030, 464, 1058, 1062, 1063, 2083, 583, 2064], 1503)
-    femmesh.addVolume([490, 501, 500, 1484, 703, 562, 709, 1709, 1919, 1671], 1504)
-    femmesh.addVolume([496, 80, 509, 743, 531, 533, 535, 1862, 775, 1863], 1505)
-    femmesh.addVolume([492, 491, 490, 1491, 707, 705, 706, 1665, 1848, 1710], 1506)
-    femmesh.addVolume([466, 135, 1022, 1016, 625, 1104, 1876, 1857, 1108, 1109], 1507)
-    femmesh.addVolume([746, 1214, 460, 1222, 2016, 2100, 2101, 2019, 1259, 2047], 1508)
-    femmesh.addVolume([1010, 1019, 1004, 1478, 1147, 1161, 1162, 1882, 2027, 1851], 1509)
-    femmesh.addVolume([457, 93, 729, 735, 573, 820, 1734, 2030, 818, 822], 1510)
-    femmesh.addVolume([1016, 198, 1024, 930, 1120, 1118, 1121, 1730, 983, 2059], 1511)
-    femmesh.addVolume([1222, 460, 746, 438, 2047, 2101, 2019, 2050, 2051, 2117], 1512)
-    femmesh.addVolume([1212, 1214, 1218, 463, 1330, 1331, 1332, 1938, 2057, 2075], 1513)
-    femmesh.addVolume([130, 487, 489, 1018, 611, 615, 613, 1093, 1895, 1856], 1514)
-    femmesh.addVolume([735, 744, 718, 1485, 819, 889, 894, 2031, 1620, 1885], 1515)
-    femmesh.addVolume([935, 182, 737, 929, 963, 859, 2054, 967, 965, 2025], 1516)
-    femmesh.addVolume([1241, 726, 1490, 1501, 2118, 2077, 2116, 1962, 2081, 2080], 1517)
-    femmesh.addVolume([1010, 1004, 1023, 1478, 1162, 1163, 1164, 1882, 1851, 1542], 1518)
-    femmesh.addVolume([478, 506, 480, 1501, 679, 678, 676, 2066, 2013, 2034], 1519)
-    femmesh.addVolume([1028, 1039, 1007, 1491, 1195, 1194, 1196, 1746, 1879, 1822], 1520)
-    femmesh.addVolume([455, 933, 467, 456, 2044, 1827, 631, 579, 1902, 632], 1521)
-    femmesh.addVolume([1024, 1005, 1016, 1482, 1177, 1181, 1121, 1915, 1753, 1732], 1522)
-    femmesh.addVolume([461, 464, 1034, 1218, 585, 2094, 2086, 2103, 2074, 2095], 1523)
-    femmesh.addVolume([729, 737, 182, 929, 863, 859, 862, 1733, 2025, 965], 1524)
-    femmesh.addVolume([464, 1034, 1037, 120, 2094, 1060, 2083, 584, 1055, 1059], 1525)
-    femmesh.addVolume([742, 758, 727, 1496, 903, 880, 801, 1805, 1843, 1844], 1526)
-    femmesh.addVolume([460, 1217, 1214, 463, 2119, 1257, 2100, 644, 2099, 2057], 1527)
-    femmesh.addVolume([1032, 1036, 931, 1486, 1113, 2115, 2120, 2121, 1553, 2109], 1528)
-    femmesh.addVolume([127, 481, 483, 1020, 602, 606, 604, 1076, 2038, 2042], 1529)
-    femmesh.addVolume([507, 83, 748, 726, 540, 786, 2032, 2076, 784, 788], 1530)
-    femmesh.addVolume([1212, 1227, 464, 1218, 1333, 2065, 2073, 1332, 1299, 2074], 1531)
-    femmesh.addVolume([717, 728, 732, 1489, 882, 846, 875, 1658, 1983, 1829], 1532)
-    femmesh.addVolume([1223, 1215, 1221, 1486, 1336, 1335, 1337, 1834, 1987, 1638], 1533)
-    femmesh.addVolume([507, 730, 82, 726, 1995, 781, 539, 2076, 785, 783], 1534)
-    femmesh.addVolume([1218, 461, 464, 463, 2103, 585, 2074, 2075, 645, 647], 1535)
-    femmesh.addVolume([929, 935, 924, 1498, 967, 990, 993, 1792, 2055, 2067], 1536)
-    femmesh.addVolume([501, 88, 753, 502, 557, 799, 1918, 559, 555, 1712], 1537)
-    femmesh.addVolume([1016, 466, 135, 467, 1857, 625, 1108, 1731, 630, 629], 1538)
-    femmesh.addVolume([509, 743, 80, 734, 1863, 775, 533, 1831, 779, 777], 1539)
-    femmesh.addVolume([1021, 123, 1017, 473, 1064, 1068, 1069, 1923, 590, 1593], 1540)
-    femmesh.addVolume([1218, 1034, 461, 1217, 2095, 2086, 2103, 1296, 2090, 2089], 1541)
-    femmesh.addVolume([136, 199, 1016, 933, 1051, 1110, 1107, 2045, 945, 1886], 1542)
-    femmesh.addVolume([478, 476, 507, 1490, 671, 674, 673, 1985, 1548, 1996], 1543)
-    femmesh.addVolume([464, 1227, 1037, 1218, 2065, 2082, 2083, 2074, 1299, 2096], 1544)
-    femmesh.addVolume([1477, 1482, 1485, 1493, 1630, 1540, 1781, 1722, 1778, 1720], 1545)
-    femmesh.addVolume([1215, 191, 939, 931, 1292, 969, 1986, 2114, 950, 972], 1546)
-    femmesh.addVolume([740, 752, 716, 1494, 870, 867, 869, 1711, 1854, 2071], 1547)
-    femmesh.addVolume([1239, 732, 728, 1489, 2122, 846, 2063, 1890, 1829, 1983], 1548)
-    femmesh.addVolume([729, 183, 94, 934, 823, 764, 821, 1905, 942, 2092], 1549)
-    femmesh.addVolume([724, 498, 744, 91, 1946, 1619, 816, 814, 566, 812], 1550)
-    femmesh.addVolume([1242, 726, 730, 1490, 2123, 785, 1849, 1850, 2077, 1657], 1551)
-    femmesh.addVolume([1011, 493, 133, 1031, 1789, 620, 1102, 1103, 1944, 1100], 1552)
-    femmesh.addVolume([87, 503, 753, 502, 552, 2070, 798, 554, 556, 1712], 1553)
-    femmesh.addVolume([1215, 1219, 931, 1486, 1293, 2124, 2114, 1987, 2125, 2109], 1554)
-    femmesh.addVolume([1032, 1009, 1036, 1486, 1201, 1205, 1113, 2121, 1779, 1553], 1555)
-    femmesh.addVolume([1214, 436, 1217, 460, 2108, 2126, 1257, 2100, 2048, 2119], 1556)
-    femmesh.addVolume([157, 1213, 750, 747, 1265, 1958, 827, 824, 1981, 773], 1557)
-    femmesh.addVolume([724, 741, 752, 1483, 815, 909, 922, 1767, 1728, 1669], 1558)
-    femmesh.addVolume([733, 84, 721, 505, 789, 791, 792, 2003, 545, 2008], 1559)
-    femmesh.addVolume([1011, 1031, 1005, 1493, 1103, 1176, 1175, 1742, 1945, 1976], 1560)
-    femmesh.addVolume([757, 731, 720, 1484, 807, 904, 906, 1813, 2005, 1557], 1561)
-    femmesh.addVolume([1004, 1014, 1479, 1497, 1166, 1681, 1852, 2024, 1649, 1682], 1562)
-    femmesh.addVolume([924, 928, 1487, 1498, 986, 1866, 2041, 2067, 2052, 1756], 1563)
-    femmesh.addVolume([497, 457, 458, 1485, 574, 635, 637, 2036, 1604, 1635], 1564)
-    femmesh.addVolume([728, 717, 758, 1489, 882, 881, 883, 1983, 1658, 1749], 1565)
-    femmesh.addVolume([215, 1025, 1223, 1010, 1145, 1833, 1319, 1148, 1149, 1881], 1566)
-    femmesh.addVolume([1218, 206, 1034, 1217, 1294, 1122, 2095, 1296, 1249, 2090], 1567)
-    femmesh.addVolume([489, 491, 1044, 1491, 618, 2127, 2104, 1762, 1848, 2105], 1568)
-    femmesh.addVolume([462, 461, 1033, 1217, 582, 2087, 2128, 2129, 2089, 2088], 1569)
-    femmesh.addVolume([495, 458, 465, 1493, 641, 638, 640, 1718, 1920, 1998], 1570)
-    femmesh.addVolume([1241, 754, 726, 1501, 1967, 837, 2118, 1962, 1968, 2081], 1571)
-    femmesh.addVolume([501, 731, 757, 1484, 2022, 807, 2085, 1919, 2005, 1813], 1572)
-    femmesh.addVolume([1239, 1238, 732, 1489, 1285, 1818, 2122, 1890, 1878, 1829], 1573)
-    femmesh.addVolume([927, 928, 925, 1487, 987, 994, 995, 1815, 1866, 1703], 1574)
-    femmesh.addVolume([933, 199, 1016, 930, 945, 1110, 1886, 985, 982, 1730], 1575)
-    femmesh.addVolume([1217, 436, 462, 460, 2126, 2130, 2129, 2119, 2048, 523], 1576)
-    femmesh.addVolume([1031, 493, 133, 465, 1944, 620, 1100, 2004, 624, 622], 1577)
-    femmesh.addVolume([1013, 1041, 1232, 1481, 1135, 2078, 2097, 1614, 1941, 2072], 1578)
-    femmesh.addVolume([1239, 1226, 1238, 1489, 1351, 1346, 1285, 1890, 1904, 1878], 1579)
-    femmesh.addVolume([457, 934, 459, 456, 1838, 2107, 575, 633, 2006, 578], 1580)
-    femmesh.addVolume([936, 930, 924, 1482, 984, 991, 989, 1893, 1601, 2015], 1581)
-    femmesh.addVolume([716, 755, 740, 1494, 871, 872, 869, 2071, 1689, 1711], 1582)
-    femmesh.addVolume([462, 1033, 437, 1217, 2128, 2132, 2131, 2129, 2088, 2133], 1583)
-    femmesh.addVolume([750, 469, 78, 747, 1959, 527, 771, 773, 1982, 769], 1584)
-    femmesh.addVolume([1032, 216, 1025, 1486, 1054, 1146, 1150, 2121, 2134, 1835], 1585)
-    femmesh.addVolume([183, 934, 729, 929, 942, 1905, 823, 966, 968, 1733], 1586)
-    femmesh.addVolume([488, 501, 490, 1484, 704, 703, 701, 1791, 1919, 1709], 1587)
-    femmesh.addVolume([492, 499, 494, 1483, 713, 712, 711, 1663, 1990, 1769], 1588)
-    femmesh.addVolume([1219, 216, 1032, 1486, 1255, 1054, 2135, 2125, 2134, 2121], 1589)
-    femmesh.addVolume([931, 938, 1036, 195, 975, 1625, 2115, 951, 974, 1111], 1590)
-    femmesh.addVolume([727, 503, 742, 1496, 2098, 2037, 801, 1844, 1992, 1805], 1591)
-    femmesh.addVolume([931, 195, 1036, 1032, 951, 1111, 2115, 2120, 1053, 1113], 1592)
-    femmesh.addVolume([120, 464, 1034, 461, 584, 2094, 1055, 581, 585, 2086], 1593)
-    femmesh.addVolume([931, 1215, 191, 1219, 2114, 1292, 950, 2124, 1293, 1253], 1594)
-    femmesh.addVolume([1043, 1041, 1234, 1026, 1200, 1942, 1969, 1186, 1138, 1875], 1595)
-    femmesh.addVolume([1014, 1040, 1004, 1479, 1089, 1165, 1166, 1681, 1973, 1852], 1596)
-    femmesh.addVolume([745, 749, 932, 179, 855, 2084, 2113, 767, 854, 947], 1597)
-    femmesh.addVolume([1242, 1241, 726, 1490, 1276, 2118, 2123, 1850, 2116, 2077], 1598)
-    femmesh.addVolume([1033, 119, 1034, 461, 1048, 1056, 1057, 2087, 580, 2086], 1599)
-    femmesh.addVolume([458, 466, 465, 1493, 639, 627, 638, 1920, 1858, 1998], 1600)
-    femmesh.addVolume([1031, 134, 466, 465, 1099, 626, 2106, 2004, 623, 627], 1601)
-    femmesh.addVolume([1015, 1004, 1019, 1497, 1169, 1161, 1144, 2001, 2024, 2029], 1602)
-    femmesh.addVolume([466, 1031, 465, 1493, 2106, 2004, 627, 1858, 1945, 1998], 1603)
-    femmesh.addVolume([747, 156, 1214, 1222, 825, 1260, 2017, 2018, 1246, 1259], 1604)
-    femmesh.addVolume([751, 716, 736, 1495, 866, 864, 865, 1921, 2091, 1809], 1605)
-    femmesh.addVolume([502, 486, 503, 1496, 699, 693, 556, 1643, 1928, 1992], 1606)
-    femmesh.addVolume([504, 85, 733, 505, 548, 790, 1871, 550, 546, 2003], 1607)
-    femmesh.addVolume([924, 928, 927, 1487, 986, 987, 988, 2041, 1866, 1815], 1608)
-    femmesh.addVolume([87, 727, 753, 503, 800, 802, 798, 552, 2098, 2070], 1609)
-    femmesh.addVolume([932, 749, 937, 179, 2084, 1567, 958, 947, 854, 956], 1610)
-    femmesh.addVolume([125, 1035, 1013, 477, 1074, 1075, 1070, 596, 2021, 1563], 1611)
-    femmesh.addVolume([754, 739, 756, 1240, 840, 900, 913, 1997, 1694, 1788], 1612)
-    femmesh.addVolume([721, 756, 733, 1480, 912, 897, 792, 2056, 1507, 1816], 1613)
-    femmesh.addVolume([473, 1021, 122, 471, 1923, 1065, 589, 591, 1924, 587], 1614)
-    femmesh.addVolume([743, 496, 79, 750, 1862, 530, 774, 776, 1960, 772], 1615)
-    femmesh.addVolume([485, 128, 483, 1029, 607, 605, 609, 1750, 1081, 1820], 1616)
-    femmesh.addVolume([1217, 60, 436, 1214, 1256, 454, 2126, 1257, 1258, 2108], 1617)
-    femmesh.addVolume([1018, 1004, 1040, 1479, 1172, 1165, 1092, 1758, 1852, 1973], 1618)
-    femmesh.addVolume([216, 1223, 1025, 1486, 1320, 1833, 1146, 2134, 1834, 1835], 1619)
-    femmesh.addVolume([1030, 122, 1021, 471, 1061, 1065, 1066, 1932, 587, 1924], 1620)
-    femmesh.addVolume([125, 479, 1035, 477, 598, 1977, 1074, 596, 600, 2021], 1621)
-    femmesh.addVolume([216, 1219, 1223, 1486, 1255, 1322, 1320, 2134, 2125, 1834], 1622)
-    femmesh.addVolume([731, 88, 753, 501, 805, 799, 806, 2022, 557, 1918], 1623)
-    femmesh.addVolume([741, 724, 91, 499, 815, 814, 811, 2014, 1989, 564], 1624)
-    femmesh.addVolume([1020, 1029, 1006, 1488, 1083, 1182, 1183, 2043, 1821, 1888], 1625)
-    femmesh.addVolume([1221, 166, 738, 1499, 1287, 847, 1677, 1678, 2136, 1679], 1626)
-    femmesh.addVolume([489, 490, 491, 1491, 702, 705, 618, 1762, 1710, 1848], 1627)
-    femmesh.addVolume([1037, 207, 1034, 1218, 1124, 1123, 1060, 2096, 1295, 2095], 1628)
-    femmesh.addVolume([1013, 1008, 1041, 1481, 1197, 1198, 1135, 1614, 1897, 1941], 1629)
-    femmesh.addVolume([932, 1216, 939, 1499, 2137, 2068, 971, 2062, 2069, 1913], 1630)
-    femmesh.addVolume([1007, 1018, 1044, 1491, 1192, 1094, 1193, 1822, 1759, 2105], 1631)
-    femmesh.addVolume([181, 725, 180, 928, 856, 857, 186, 960, 1865, 959], 1632)
-    femmesh.addVolume([745, 1216, 932, 1499, 2138, 2137, 2113, 2112, 2069, 2062], 1633)
-    femmesh.addVolume([734, 1211, 743, 158, 1917, 1861, 779, 829, 1263, 830], 1634)
-    femmesh.addVolume([157, 1214, 1213, 747, 1261, 1266, 1265, 824, 2017, 1981], 1635)
-    femmesh.addVolume([924, 935, 928, 1498, 990, 964, 986, 2067, 2055, 2052], 1636)
-    femmesh.addVolume([725, 737, 718, 1498, 861, 891, 890, 2053, 2026, 1957], 1637)
-    femmesh.addVolume([459, 94, 183, 934, 517, 764, 2139, 2107, 2092, 942], 1638)
-    femmesh.addVolume([1016, 199, 198, 930, 1110, 204, 1120, 1730, 982, 983], 1639)
-    femmesh.addVolume([455, 199, 136, 933, 2140, 1051, 521, 2044, 945, 2045], 1640)
-    femmesh.addVolume([197, 196, 1012, 927, 202, 1114, 1115, 976, 977, 1892], 1641)
-    femmesh.addVolume([729, 182, 183, 929, 862, 188, 823, 1733, 965, 966], 1642)
-    femmesh.addVolume([491, 131, 489, 1044, 616, 614, 618, 2127, 1090, 2104], 1643)
-    femmesh.addVolume([931, 1219, 1032, 1486, 2124, 2135, 2120, 2109, 2125, 2121], 1644)
-    femmesh.addVolume([463, 1214, 460, 468, 2057, 2100, 644, 646, 2060, 526], 1645)
-    femmesh.addVolume([1028, 1044, 491, 1491, 1097, 2127, 1991, 1746, 2105, 1848], 1646)
-    femmesh.addVolume([503, 486, 484, 1496, 693, 691, 694, 1992, 1928, 1524], 1647)
-    femmesh.addVolume([503, 86, 742, 504, 551, 795, 2037, 553, 549, 1764], 1648)
-    femmesh.addVolume([5, 746, 460, 438, 760, 2101, 510, 439, 2117, 2051], 1649)
-    femmesh.addVolume([750, 743, 1211, 158, 776, 1861, 2020, 826, 830, 1263], 1650)
-    femmesh.addVolume([195, 931, 1219, 1032, 951, 2124, 2141, 1053, 2120, 2135], 1651)
-    femmesh.addVolume([469, 79, 496, 750, 528, 530, 532, 1959, 772, 1960], 1652)
-    femmesh.addVolume([1013, 1035, 1008, 1481, 1075, 1080, 1197, 1614, 1978, 1897], 1653)
-    femmesh.addVolume([1040, 487, 130, 1018, 1972, 611, 1085, 1092, 1895, 1093], 1654)
-    femmesh.addVolume([1020, 483, 127, 1029, 2042, 604, 1076, 1083, 1820, 1082], 1655)
-    femmesh.addVolume([744, 498, 497, 92, 1619, 571, 2035, 813, 567, 569], 1656)
-    femmesh.addVolume([754, 721, 726, 1501, 911, 910, 837, 1968, 2009, 2081], 1657)
-    femmesh.addVolume([1033, 8, 437, 1217, 1049, 447, 2132, 2088, 1248, 2133], 1658)
-    femmesh.addVolume([500, 741, 90, 499, 1763, 809, 561, 565, 2014, 563], 1659)
-    femmesh.addVolume([745, 166, 1216, 1499, 766, 1250, 2138, 2112, 2136, 2069], 1660)
-    femmesh.addVolume([1018, 489, 130, 1044, 1856, 613, 1093, 1094, 2104, 1091], 1661)
-    femmesh.addVolume([1233, 1242, 1231, 1490, 1360, 1359, 1358, 2046, 1850, 1505], 1662)
-    femmesh.addVolume([1242, 1233, 1241, 1490, 1360, 1364, 1276, 1850, 2046, 2116], 1663)
-    femmesh.addVolume([12, 195, 1219, 1032, 200, 2141, 1254, 1052, 1053, 2135], 1664)
-    femmesh.addVolume([87, 86, 742, 503, 105, 795, 797, 552, 551, 2037], 1665)
-    femmesh.addVolume([1029, 485, 128, 129, 1750, 607, 1081, 1084, 608, 147], 1666)
-    femmesh.addVolume([462, 437, 436, 1217, 2131, 451, 2130, 2129, 2133, 2126], 1667)
-    femmesh.addVolume([1238, 723, 165, 732, 1965, 849, 1283, 1818, 850, 844], 1668)
-    femmesh.addVolume([726, 1242, 730, 160, 2123, 1849, 785, 834, 1272, 831], 1669)
-    femmesh.addVolume([1013, 210, 1017, 1230, 1131, 1130, 1072, 1798, 1303, 1654], 1670)
-    femmesh.addVolume([1016, 135, 136, 467, 1108, 154, 1107, 1731, 629, 628], 1671)
-    femmesh.addVolume([1009, 1032, 1025, 1486, 1201, 1150, 1202, 1779, 2121, 1835], 1672)
-    femmesh.addVolume([11, 1216, 932, 745, 1251, 2137, 946, 765, 2138, 2113], 1673)
-    femmesh.addVolume([728, 163, 1239, 739, 842, 1281, 2063, 843, 838, 1889], 1674)
-    femmesh.addVolume([1033, 437, 6, 462, 2132, 443, 1046, 2128, 2131, 513], 1675)
-    femmesh.addVolume([1037, 1227, 207, 1218, 2082, 1297, 1124, 2096, 1299, 1295], 1676)
-    femmesh.addVolume([501, 757, 89, 500, 2085, 804, 558, 562, 1811, 560], 1677)
-    femmesh.addVolume([166, 1221, 738, 165, 1287, 1677, 847, 177, 1286, 848], 1678)
-    femmesh.addVolume([119, 461, 1033, 462, 580, 2087, 1048, 515, 582, 2128], 1679)
-    femmesh.addVolume([1013, 124, 125, 477, 1071, 143, 1070, 1563, 595, 596], 1680)
-    femmesh.addVolume([82, 83, 507, 726, 101, 540, 539, 783, 784, 2076], 1681)
-    femmesh.addVolume([1008, 1020, 1043, 1488, 1078, 1185, 1199, 1899, 2043, 1970], 1682)
-    femmesh.addVolume([741, 91, 90, 499, 811, 109, 809, 2014, 564, 563], 1683)
-    femmesh.addVolume([1239, 739, 163, 1240, 1889, 838, 1281, 1282, 1694, 1277], 1684)
-    femmesh.addVolume([497, 458, 495, 1485, 637, 641, 642, 2036, 1635, 1706], 1685)
-    femmesh.addVolume([1031, 133, 134, 465, 1100, 152, 1099, 2004, 622, 623], 1686)
-    femmesh.addVolume([1028, 493, 491, 132, 1846, 621, 1991, 1095, 619, 617], 1687)
-    femmesh.addVolume([1216, 939, 1215, 191, 2068, 1986, 1291, 1290, 969, 1292], 1688)
-    femmesh.addVolume([460, 5, 77, 746, 510, 95, 512, 2101, 760, 761], 1689)
-    femmesh.addVolume([487, 129, 485, 1040, 610, 608, 612, 1972, 1086, 1971], 1690)
-    femmesh.addVolume([745, 722, 738, 1499, 915, 914, 852, 2112, 1606, 1679], 1691)
-    femmesh.addVolume([485, 1040, 129, 1014, 1971, 1086, 608, 1683, 1089, 1088], 1692)
-    femmesh.addVolume([1221, 1216, 166, 1499, 1289, 1250, 1287, 1678, 2069, 2136], 1693)
-    femmesh.addVolume([1003, 1038, 1023, 1492, 1151, 1152, 1153, 1867, 1948, 1653], 1694)
-    femmesh.addVolume([742, 727, 87, 503, 801, 800, 797, 2037, 2098, 552], 1695)
-    femmesh.addVolume([11, 745, 932, 179, 765, 2113, 946, 184, 767, 947], 1696)
-    femmesh.addVolume([493, 133, 1028, 1011, 620, 1098, 1846, 1789, 1102, 1101], 1697)
-    femmesh.addVolume([460, 436, 39, 438, 2048, 449, 511, 2051, 452, 440], 1698)
-    femmesh.addVolume([1013, 211, 210, 1232, 1132, 222, 1131, 2097, 1306, 1307], 1699)
-    femmesh.addVolume([161, 160, 1242, 726, 172, 1272, 1271, 833, 834, 2123], 1700)
-    femmesh.addVolume([161, 726, 1242, 1241, 833, 2123, 1271, 1275, 2118, 1276], 1701)
-    femmesh.addVolume([210, 1230, 1013, 1232, 1303, 1798, 1131, 1307, 1308, 2097], 1702)
-    femmesh.addVolume([129, 1029, 485, 1014, 1084, 1750, 608, 1088, 1087, 1683], 1703)
-    femmesh.addVolume([745, 738, 166, 1499, 852, 847, 766, 2112, 1679, 2136], 1704)
-    femmesh.addVolume([1219, 1215, 1223, 1486, 1293, 1336, 1322, 2125, 1987, 1834], 1705)
-    femmesh.addVolume([1239, 732, 164, 728, 2122, 845, 1280, 2063, 846, 841], 1706)
-    femmesh.addVolume([1225, 1015, 213, 214, 2079, 1139, 1316, 1315, 1140, 225], 1707)
-    femmesh.addVolume([11, 190, 932, 1216, 192, 948, 946, 1251, 1252, 2137], 1708)
-    femmesh.addVolume([742, 85, 733, 504, 794, 790, 796, 1764, 548, 1871], 1709)
-    femmesh.addVolume([160, 730, 1243, 1242, 831, 1656, 1268, 1272, 1849, 1273], 1710)
-    femmesh.addVolume([1230, 1017, 209, 210, 1654, 1129, 1304, 1303, 1130, 221], 1711)
-    femmesh.addVolume([1243, 730, 160, 159, 1656, 831, 1268, 1269, 832, 171], 1712)
-    femmesh.addVolume([1022, 1005, 1031, 1493, 1180, 1176, 1106, 1877, 1976, 1945], 1713)
-    femmesh.addVolume([206, 8, 1033, 1217, 217, 1049, 1050, 1249, 1248, 2088], 1714)
-    femmesh.addVolume([1211, 734, 159, 158, 1917, 828, 1267, 1263, 829, 170], 1715)
-    femmesh.addVolume([1219, 12, 931, 195, 1254, 949, 2124, 2141, 200, 951], 1716)
-    femmesh.addVolume([209, 1017, 1230, 1228, 1129, 1654, 1304, 1300, 1595, 1305], 1717)
-    femmesh.addVolume([1006, 1043, 1020, 1488, 1184, 1185, 1183, 1888, 1970, 2043], 1718)
-    femmesh.addVolume([457, 94, 729, 93, 572, 821, 1734, 573, 112, 820], 1719)
-    femmesh.addVolume([934, 926, 114, 456, 954, 952, 941, 2006, 1545, 576], 1720)
-    femmesh.addVolume([1033, 6, 119, 462, 1046, 137, 1048, 2128, 513, 515], 1721)
-    femmesh.addVolume([757, 88, 731, 501, 803, 805, 807, 2085, 557, 2022], 1722)
-    femmesh.addVolume([1243, 734, 730, 159, 1830, 782, 1656, 1269, 828, 832], 1723)
-    femmesh.addVolume([156, 1214, 157, 747, 1260, 1261, 168, 825, 2017, 824], 1724)
-    femmesh.addVolume([726, 754, 1241, 161, 837, 1967, 2118, 833, 836, 1275], 1725)
-    femmesh.addVolume([1013, 1041, 211, 1232, 1135, 1133, 1132, 2097, 2078, 1306], 1726)
-    femmesh.addVolume([1017, 209, 1021, 1228, 1129, 1127, 1069, 1595, 1300, 1925], 1727)
-    femmesh.addVolume([735, 744, 497, 92, 819, 2035, 2040, 817, 813, 569], 1728)
-    femmesh.addVolume([926, 115, 114, 456, 953, 117, 952, 1545, 577, 576], 1729)
-    femmesh.addVolume([1003, 1039, 1027, 1500, 1155, 1156, 1157, 1868, 1880, 1624], 1730)
-    femmesh.addVolume([114, 459, 934, 456, 518, 2107, 941, 576, 578, 2006], 1731)
-    femmesh.addVolume([159, 734, 1211, 1243, 828, 1917, 1267, 1269, 1830, 1270], 1732)
-    femmesh.addVolume([131, 491, 1028, 1044, 616, 1991, 1096, 1090, 2127, 1097], 1733)
-    femmesh.addVolume([1039, 1011, 1027, 1500, 1209, 1174, 1156, 1880, 1744, 1624], 1734)
-    femmesh.addVolume([213, 1236, 1026, 1015, 1312, 1699, 1137, 1139, 2000, 1141], 1735)
-    femmesh.addVolume([164, 1238, 732, 1239, 1284, 1818, 845, 1280, 1285, 2122], 1736)
-    femmesh.addVolume([1021, 209, 208, 1228, 1127, 220, 1126, 1925, 1300, 1301], 1737)
-    femmesh.addVolume([1021, 122, 123, 473, 1065, 141, 1064, 1923, 589, 590], 1738)
-    femmesh.addVolume([124, 1017, 123, 475, 1067, 1068, 142, 593, 1594, 592], 1739)
-    femmesh.addVolume([508, 81, 82, 730, 536, 100, 537, 1655, 780, 781], 1740)
-    femmesh.addVolume([460, 39, 5, 438, 511, 42, 510, 2051, 440, 439], 1741)
-    femmesh.addVolume([493, 132, 1028, 133, 619, 1095, 1846, 620, 151, 1098], 1742)
-    femmesh.addVolume([1216, 745, 11, 166, 2138, 765, 1251, 1250, 766, 178], 1743)
-    femmesh.addVolume([1028, 1007, 1044, 1491, 1196, 1193, 1097, 1746, 1822, 2105], 1744)
-    femmesh.addVolume([213, 1015, 1225, 1236, 1139, 2079, 1316, 1312, 2000, 1317], 1745)
-    femmesh.addVolume([1226, 1239, 1237, 1489, 1351, 1350, 1348, 1904, 1890, 1610], 1746)
-    femmesh.addVolume([1019, 1015, 1225, 214, 1144, 2079, 2028, 1142, 1140, 1315], 1747)
-    femmesh.addVolume([1045, 1014, 1004, 1497, 1168, 1166, 1167, 1716, 1649, 2024], 1748)
-    femmesh.addVolume([1216, 1221, 1215, 1499, 1289, 1335, 1291, 2069, 1678, 1988], 1749)
-    femmesh.addVolume([1019, 1225, 215, 214, 2028, 1318, 1143, 1142, 1315, 226], 1750)
-    femmesh.addVolume([180, 937, 749, 179, 957, 1567, 853, 185, 956, 854], 1751)
-    femmesh.addVolume([1036, 938, 196, 195, 1625, 973, 1112, 1111, 974, 201], 1752)
-    femmesh.addVolume([89, 741, 90, 500, 808, 809, 108, 560, 1763, 561], 1753)
-    femmesh.addVolume([132, 491, 1028, 131, 617, 1991, 1095, 150, 616, 1096], 1754)
-    femmesh.addVolume([741, 89, 757, 500, 808, 804, 810, 1763, 560, 1811], 1755)
-    femmesh.addVolume([742, 86, 85, 504, 795, 104, 794, 1764, 549, 548], 1756)
-    femmesh.addVolume([127, 483, 128, 1029, 604, 605, 146, 1082, 1820, 1081], 1757)
-    femmesh.addVolume([751, 736, 723, 1495, 865, 876, 921, 1921, 1809, 1870], 1758)
-    femmesh.addVolume([80, 81, 509, 734, 99, 534, 533, 777, 778, 1831], 1759)
-    femmesh.addVolume([1034, 207, 206, 1218, 1123, 218, 1122, 2095, 1295, 1294], 1760)
-    femmesh.addVolume([496, 79, 80, 743, 530, 98, 531, 1862, 774, 775], 1761)
-    femmesh.addVolume([1004, 1015, 1045, 1497, 1169, 1170, 1167, 2024, 2001, 1716], 1762)
-    femmesh.addVolume([59, 437, 8, 1217, 448, 447, 61, 1247, 2133, 1248], 1763)
-    femmesh.addVolume([721, 748, 726, 1501, 793, 788, 910, 2009, 2011, 2081], 1764)
-    femmesh.addVolume([1227, 1037, 208, 1030, 2082, 1125, 1298, 1931, 1063, 1128], 1765)
-    femmesh.addVolume([89, 88, 757, 501, 107, 803, 804, 558, 557, 2085], 1766)
-    femmesh.addVolume([131, 130, 489, 1044, 149, 613, 614, 1090, 1091, 2104], 1767)
-    femmesh.addVolume([926, 933, 115, 456, 955, 943, 953, 1545, 1902, 577], 1768)
-    femmesh.addVolume([481, 127, 126, 1020, 602, 145, 601, 2038, 1076, 1077], 1769)
-    femmesh.addVolume([84, 733, 85, 505, 789, 790, 103, 545, 2003, 546], 1770)
-    femmesh.addVolume([1026, 1041, 1234, 212, 1138, 1942, 1875, 1136, 1134, 1309], 1771)
-    femmesh.addVolume([121, 122, 1030, 471, 140, 1061, 1062, 586, 587, 1932], 1772)
-    femmesh.addVolume([931, 191, 12, 1219, 950, 194, 949, 2124, 1253, 1254], 1773)
-    femmesh.addVolume([199, 136, 10, 455, 1051, 155, 205, 2140, 521, 519], 1774)
-    femmesh.addVolume([468, 77, 78, 747, 524, 96, 525, 2111, 768, 769], 1775)
-    femmesh.addVolume([754, 162, 739, 1240, 835, 839, 840, 1997, 1278, 1694], 1776)
-    femmesh.addVolume([939, 1216, 190, 191, 2068, 1252, 970, 969, 1290, 193], 1777)
-    femmesh.addVolume([92, 744, 498, 91, 813, 1619, 567, 110, 812, 566], 1778)
-    femmesh.addVolume([134, 1022, 466, 135, 1105, 1876, 626, 153, 1104, 625], 1779)
-    femmesh.addVolume([735, 497, 93, 92, 2040, 570, 818, 817, 569, 111], 1780)
-    femmesh.addVolume([436, 437, 59, 1217, 451, 448, 453, 2126, 2133, 1247], 1781)
-    femmesh.addVolume([182, 737, 181, 935, 859, 860, 187, 963, 2054, 962], 1782)
-    femmesh.addVolume([1024, 198, 197, 936, 1118, 203, 1117, 1914, 979, 980], 1783)
-    femmesh.addVolume([79, 469, 78, 750, 528, 527, 97, 772, 1959, 771], 1784)
-    femmesh.addVolume([39, 462, 436, 460, 522, 2130, 449, 511, 523, 2048], 1785)
-    femmesh.addVolume([455, 115, 933, 456, 520, 943, 2044, 579, 577, 1902], 1786)
-    femmesh.addVolume([119, 120, 1034, 461, 138, 1055, 1056, 580, 581, 2086], 1787)
-    femmesh.addVolume([437, 436, 38, 462, 451, 450, 442, 2131, 2130, 514], 1788)
-    femmesh.addVolume([455, 10, 199, 933, 519, 205, 2140, 2044, 944, 945], 1789)
-    femmesh.addVolume([212, 1236, 1026, 213, 1313, 1699, 1136, 224, 1312, 1137], 1790)
-    femmesh.addVolume([1236, 1026, 1234, 212, 1699, 1875, 1314, 1313, 1136, 1309], 1791)
-    femmesh.addVolume([436, 39, 38, 462, 449, 41, 450, 2130, 522, 514], 1792)
-    femmesh.addVolume([1038, 1010, 1023, 1492, 1208, 1164, 1152, 1948, 1883, 1653], 1793)
-    femmesh.addVolume([1025, 1223, 216, 215, 1833, 1320, 1146, 1145, 1319, 227], 1794)
-    femmesh.addVolume([60, 436, 59, 1217, 454, 453, 62, 1256, 2126, 1247], 1795)
-    femmesh.addVolume([739, 162, 163, 1240, 839, 174, 838, 1694, 1278, 1277], 1796)
-    femmesh.addVolume([728, 164, 1239, 163, 841, 1280, 2063, 842, 175, 1281], 1797)
-    femmesh.addVolume([933, 455, 10, 115, 2044, 519, 944, 943, 520, 118], 1798)
-    femmesh.addVolume([437, 6, 74, 1033, 443, 76, 444, 2132, 1046, 1047], 1799)
-    femmesh.addVolume([437, 74, 8, 1033, 444, 75, 447, 2132, 1047, 1049], 1800)
-    femmesh.addVolume([208, 1227, 207, 1037, 1298, 1297, 219, 1125, 2082, 1124], 1801)
-    femmesh.addVolume([437, 38, 6, 462, 442, 40, 443, 2131, 514, 513], 1802)
-    femmesh.addVolume([464, 1037, 121, 120, 2083, 1058, 583, 584, 1059, 139], 1803)
-    femmesh.addVolume([479, 1035, 126, 125, 1977, 1073, 599, 598, 1074, 144], 1804)
-    femmesh.addVolume([748, 506, 84, 83, 2012, 543, 787, 786, 542, 102], 1805)
-    femmesh.addVolume([9, 94, 183, 459, 113, 764, 189, 516, 517, 2139], 1806)
-    femmesh.addVolume([934, 9, 459, 114, 940, 516, 2107, 941, 116, 518], 1807)
-    femmesh.addVolume([211, 1041, 1234, 1232, 1133, 1942, 1310, 1306, 2078, 1311], 1808)
-    femmesh.addVolume([1241, 754, 162, 161, 1967, 835, 1274, 1275, 836, 173], 1809)
-    femmesh.addVolume([1234, 1041, 211, 212, 1942, 1133, 1310, 1309, 1134, 223], 1810)
-    femmesh.addVolume([1238, 732, 165, 164, 1818, 844, 1283, 1284, 845, 176], 1811)
-    femmesh.addVolume([162, 754, 1241, 1240, 835, 1967, 1274, 1278, 1997, 1279], 1812)
-    femmesh.addVolume([753, 88, 87, 502, 799, 106, 798, 1712, 555, 554], 1813)
-    femmesh.addVolume([129, 487, 130, 1040, 610, 611, 148, 1086, 1972, 1085], 1814)
-    femmesh.addVolume([1032, 1219, 12, 216, 2135, 1254, 1052, 1054, 1255, 228], 1815)
-    femmesh.addVolume([71, 746, 5, 438, 759, 760, 73, 441, 2117, 439], 1816)
-    femmesh.addVolume([932, 1216, 190, 939, 2137, 1252, 948, 971, 2068, 970], 1817)
-    femmesh.addVolume([9, 459, 183, 934, 516, 2139, 189, 940, 2107, 942], 1818)
-    femmesh.addVolume([1222, 7, 60, 438, 1245, 63, 1244, 2050, 446, 445], 1819)
-    femmesh.addVolume([746, 7, 156, 1222, 762, 167, 763, 2019, 1245, 1246], 1820)
-    femmesh.addVolume([71, 1222, 746, 438, 2142, 2019, 759, 441, 2050, 2117], 1821)
-    femmesh.addVolume([746, 71, 7, 1222, 759, 72, 762, 2019, 2142, 1245], 1822)
-    femmesh.addVolume([1222, 71, 7, 438, 2142, 72, 1245, 2050, 441, 446], 1823)
-    femmesh.addVolume([1230, 1013, 475, 1017, 1798, 1564, 1534, 1654, 1072, 1594], 1824)
-    femmesh.addVolume([1230, 475, 1013, 1490, 1534, 1564, 1798, 1577, 1504, 1565], 1825)
-    femmesh.addVolume([1485, 1493, 467, 458, 1720, 1777, 1538, 1635, 1920, 636], 1826)
-    femmesh.addVolume([1485, 467, 1493, 1482, 1538, 1777, 1720, 1540, 1536, 1778], 1827)
-    femmesh.addVolume([1486, 1492, 1224, 1223, 1837, 1518, 1637, 1834, 1727, 1341], 1828)
-    femmesh.addVolume([1486, 1224, 1492, 1474, 1637, 1518, 1837, 1552, 1516, 1517], 1829)
-    femmesh.addVolume([1475, 1026, 1006, 1488, 1698, 1187, 1887, 1687, 1701, 1888], 1830)
-    femmesh.addVolume([1026, 1475, 1006, 1497, 1698, 1887, 1187, 1717, 1647, 1715], 1831)
-    femmesh.addVolume([1496, 483, 1029, 485, 1525, 1820, 1737, 1541, 609, 1750], 1832)
-    femmesh.addVolume([1496, 1029, 483, 1475, 1737, 1820, 1525, 1526, 1736, 1523], 1833)
-    femmesh.addVolume([474, 1243, 1231, 1229, 1528, 1355, 1502, 1639, 1329, 1354], 1834)
-    femmesh.addVolume([1243, 474, 1231, 1490, 1528, 1502, 1355, 1529, 1506, 1505], 1835)
-    femmesh.addVolume([1496, 731, 717, 753, 2143, 884, 1795, 1714, 806, 879], 1836)
-    femmesh.addVolume([731, 1496, 1484, 753, 2143, 1644, 2005, 806, 1714, 1713], 1837)
-    femmesh.addVolume([1486, 1038, 1042, 1474, 1979, 1160, 1551, 1552, 1947, 1550], 1838)
-    femmesh.addVolume([1486, 1042, 1038, 1009, 1551, 1160, 1979, 1779, 1206, 1204], 1839)
-    femmesh.addVolume([460, 1217, 461, 462, 2119, 2089, 643, 523, 2129, 582], 1840)
-    femmesh.addVolume([1217, 460, 461, 463, 2119, 643, 2089, 2099, 644, 645], 1841)
-    femmesh.addVolume([1014, 1029, 1497, 1045, 1087, 2144, 1649, 1168, 1190, 1716], 1842)
-    femmesh.addVolume([1014, 1497, 1029, 1475, 1649, 2144, 1087, 1645, 1647, 1736], 1843)
-    femmesh.addVolume([1006, 1497, 1029, 1045, 1715, 2144, 1182, 1188, 1716, 1190], 1844)
-    femmesh.addVolume([1006, 1029, 1497, 1475, 1182, 2144, 1715, 1887, 1736, 1647], 1845)
-    femmesh.addVolume([1499, 751, 755, 722, 1922, 873, 1607, 1606, 916, 920], 1846)
-    femmesh.addVolume([1499, 755, 751, 1474, 1607, 873, 1922, 1592, 1574, 1949], 1847)
-    femmesh.addVolume([1494, 1498, 725, 740, 1757, 2053, 1691, 1711, 1785, 892], 1848)
-    femmesh.addVolume([1494, 725, 1498, 1487, 1691, 2053, 1757, 1690, 1688, 1756], 1849)
-    femmesh.addVolume([472, 471, 1228, 473, 658, 1926, 1929, 660, 591, 1532], 1850)
-    femmesh.addVolume([471, 472, 1228, 1220, 658, 1929, 1926, 1933, 1873, 1338], 1851)
-    femmesh.addVolume([1228, 472, 474, 1229, 1929, 661, 1533, 1339, 1847, 1639], 1852)
-    femmesh.addVolume([472, 1228, 474, 473, 1929, 1533, 661, 660, 1532, 662], 1853)
-    femmesh.addVolume([1228, 1030, 471, 1220, 1980, 1932, 1926, 1338, 1934, 1933], 1854)
-    femmesh.addVolume([1228, 471, 1030, 1021, 1926, 1932, 1980, 1925, 1924, 1066], 1855)
-    femmesh.addVolume([1220, 509, 1211, 472, 2145, 1859, 1326, 1873, 664, 1916], 1856)
-    femmesh.addVolume([509, 1220, 1229, 472, 2145, 1327, 1845, 664, 1873, 1847], 1857)
-    femmesh.addVolume([1020, 1488, 479, 481, 2043, 1738, 2039, 2038, 1740, 603], 1858)
-    femmesh.addVolume([1020, 479, 1488, 1008, 2039, 1738, 2043, 1078, 1898, 1899], 1859)
-    femmesh.addVolume([469, 747, 1214, 468, 1982, 2017, 2058, 529, 2111, 2060], 1860)
-    femmesh.addVolume([469, 1214, 747, 1213, 2058, 2017, 1982, 1940, 1266, 1981], 1861)
-    femmesh.addVolume([1019, 1478, 1223, 1225, 2027, 1726, 2110, 2028, 1839, 1321], 1862)
-    femmesh.addVolume([1019, 1223, 1478, 1010, 2110, 1726, 2027, 1147, 1881, 1882], 1863)
-    femmesh.addVolume([1493, 1005, 1016, 1022, 1976, 1181, 1776, 1877, 1180, 1109], 1864)
-    femmesh.addVolume([1493, 1016, 1005, 1482, 1776, 1181, 1976, 1778, 1732, 1753], 1865)
-    femmesh.addVolume([1036, 196, 927, 1012, 1112, 977, 1814, 1116, 1114, 1892], 1866)
-    femmesh.addVolume([196, 1036, 927, 938, 1112, 1814, 977, 973, 1625, 978], 1867)
-    femmesh.addVolume([747, 77, 460, 468, 768, 512, 2102, 2111, 524, 526], 1868)
-    femmesh.addVolume([747, 460, 77, 746, 2102, 512, 768, 770, 2101, 761], 1869)
-    femmesh.addVolume([1229, 509, 1211, 1220, 1845, 1859, 1328, 1327, 2145, 1326], 1870)
-    femmesh.addVolume([509, 1229, 1211, 1243, 1845, 1328, 1859, 1667, 1329, 1270], 1871)
-    femmesh.addVolume([157, 750, 1211, 158, 827, 2020, 1262, 169, 826, 1263], 1872)
-    femmesh.addVolume([157, 1211, 750, 1213, 1262, 2020, 827, 1265, 1264, 1958], 1873)
-    femmesh.addVolume([1484, 717, 1496, 731, 1583, 1795, 1644, 2005, 884, 2143], 1874)
-    femmesh.addVolume([1484, 1496, 717, 1479, 1644, 1795, 1583, 1591, 1642, 1590], 1875)
-    return True
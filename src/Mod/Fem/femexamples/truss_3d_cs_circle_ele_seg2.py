@@ -57,12 +57,12 @@ def setup(doc=None, solvertype="z88"):
     femmesh_obj = doc.getObject(get_meshname())
 
     # mesh
-    from .meshes.mesh_truss_crane_seg2 import create_nodes, create_elements
+    from .meshes import create_nodes, create_elements
     fem_mesh = Fem.FemMesh()
-    control = create_nodes(fem_mesh)
+    control = create_nodes(fem_mesh, "mesh_truss_crane_seg2")
     if not control:
         FreeCAD.Console.PrintError("Error on creating nodes.\n")
-    control = create_elements(fem_mesh)
+    control = create_elements(fem_mesh, "mesh_truss_crane_seg2")
     if not control:
         FreeCAD.Console.PrintError("Error on creating elements.\n")
 
@@ -33,6 +33,8 @@ __url__ = "https://www.freecadweb.org"
 
 import os
 
+import numpy as np
+
 import FreeCAD
 from FreeCAD import Console
 
@@ -75,7 +77,9 @@ def importFrd(
     else:
         doc = FreeCAD.ActiveDocument
 
-    m = read_frd_result(filename)
+    # only the file offsets are read here, the result sets are read one by one
+    frd = FrdReader(filename)
+    m = frd.read_mesh()
     result_mesh_object = None
     res_obj = None
 
@@ -84,12 +88,13 @@ def importFrd(
         res_mesh_is_compacted = False
         nodenumbers_for_compacted_mesh = []
 
-        number_of_increments = len(m["Results"])
+        number_of_increments = len(frd.steps)
         Console.PrintLog(
             "Increments: " + str(number_of_increments) + "\n"
         )
-        if len(m["Results"]) > 0:
-            for result_set in m["Results"]:
+        if len(frd.steps) > 0:
+            for step_index in range(len(frd.steps)):
+                result_set = frd.read_step(step_index)
                 if "number" in result_set:
                     eigenmode_number = result_set["number"]
                 else:
@@ -260,10 +265,35 @@ def importFrd(
 def read_frd_result(
     frd_input
 ):
-    Console.PrintMessage(
-        "Read ccx results from frd file: {}\n"
-        .format(frd_input)
-    )
+    """ reads the whole frd file
+    returns a dict with the mesh and a list of result sets,
+    the values are dicts with the node or element numbers as keys
+    """
+    reader = FrdReader(frd_input)
+    frd_content = reader.read_mesh()
+    results = []
+    for step_index in range(len(reader.steps)):
+        result_set = reader.read_step(step_index)
+        for key in FRD_RESULT_COMPONENTS:
+            if key in result_set:
+                node_numbers, values = result_set[key]
+                if key == "disp":
+                    values = map(lambda v: FreeCAD.Vector(*v), values.tolist())
+                elif values.ndim > 1:
+                    values = map(tuple, values.tolist())
+                else:
+                    values = values.tolist()
+                result_set[key] = dict(zip(node_numbers.tolist(), values))
+        results.append(result_set)
+    frd_content["Results"] = results
+    return frd_content
+
+
+def read_inout_nodes(
+    frd_input
+):
+    """ reads the special 1DFlow nodes data file written beside the frd file
+    """
     inout_nodes = []
     inout_nodes_file = frd_input.rsplit(".", 1)[0] + "_inout_nodes.txt"
     if os.path.exists(inout_nodes_file):
@@ -277,529 +307,569 @@ def read_frd_result(
             inout_nodes.append(a)
         f.close()
         Console.PrintMessage("{}\n".format(inout_nodes))
-    frd_file = pyopen(frd_input, "r")
-    nodes = {}
-    elements_hexa8 = {}
-    elements_penta6 = {}
-    elements_tetra4 = {}
-    elements_tetra10 = {}
-    elements_penta15 = {}
-    elements_hexa20 = {}
-    elements_tria3 = {}
-    elements_tria6 = {}
-    elements_quad4 = {}
-    elements_quad8 = {}
-    elements_seg2 = {}
-    elements_seg3 = {}
-    results = []
-    mode_results = {}
-    mode_results["number"] = float("NaN")
-    mode_results["time"] = float("NaN")
-    mode_disp = {}
-    mode_stress = {}
-    mode_strain = {}
-    mode_peeq = {}
-    mode_temp = {}
-    mode_massflow = {}
-    mode_networkpressure = {}
-
-    nodes_found = False
-    elements_found = False
-    mode_time_found = False
-    mode_disp_found = False
-    mode_stress_found = False
-    mode_strain_found = False
-    mode_peeq_found = False
-    mode_temp_found = False
-    mode_massflow_found = False
-    mode_networkpressure_found = False
-    end_of_section_found = False
-    end_of_frd_data_found = False
-    input_continues = False
-    mode_eigen_changed = False
-    mode_time_changed = False
-
-    eigenmode = 0
-    eigentemp = 0
-    elem = -1
-    elemType = 0
-    timestep = 0
-    timetemp = 0
-
-    for line in frd_file:
-
-        # Check if we found nodes section
-        if line[4:6] == "2C":
-            nodes_found = True
-        if nodes_found and (line[1:3] == "-1"):
-            # we found a nodes line, lets extract the node and coordinate data
-            elem = int(line[4:13])
-            nodes_x = float(line[13:25])
-            nodes_y = float(line[25:37])
-            nodes_z = float(line[37:49])
-            nodes[elem] = FreeCAD.Vector(nodes_x, nodes_y, nodes_z)
-
-        # Check if we found elements section
-        if line[4:6] == "3C":
-            elements_found = True
-        if elements_found and (line[1:3] == "-1"):
-            # we found a first element line, lets extract element number
-            elem = int(line[4:13])
-            elemType = int(line[14:18])
-        if elements_found and (line[1:3] == "-2"):
-            # we found a second element line, lets extract the elements
-            # node order fits with node order in writeAbaqus() in FemMesh.cpp
-            if elemType == 1:
-                # C3D8 CalculiX --> hexa8 FreeCAD
-                # N6, N7, N8, N5, N2, N3, N4, N1
-                nd1 = int(line[3:13])
-                nd2 = int(line[13:23])
-                nd3 = int(line[23:33])
-                nd4 = int(line[33:43])
-                nd5 = int(line[43:53])
-                nd6 = int(line[53:63])
-                nd7 = int(line[63:73])
-                nd8 = int(line[73:83])
-                elements_hexa8[elem] = (nd6, nd7, nd8, nd5, nd2, nd3, nd4, nd1)
-            elif elemType == 2:
-                # C3D6 Calculix --> penta6 FreeCAD
-                # N5, N6, N4, N2, N3, N1
-                nd1 = int(line[3:13])
-                nd2 = int(line[13:23])
-                nd3 = int(line[23:33])
-                nd4 = int(line[33:43])
-                nd5 = int(line[43:53])
-                nd6 = int(line[53:63])
-                elements_penta6[elem] = (nd5, nd6, nd4, nd2, nd3, nd1)
-            elif elemType == 3:
-                # C3D4 Calculix --> tetra4 FreeCAD
-                # N2, N1, N3, N4
-                nd1 = int(line[3:13])
-                nd2 = int(line[13:23])
-                nd3 = int(line[23:33])
-                nd4 = int(line[33:43])
-                elements_tetra4[elem] = (nd2, nd1, nd3, nd4)
-            elif elemType == 4 and input_continues is False:
-                # first line
-                # C3D20 Calculix --> hexa20 FreeCAD
-                # N6, N7, N8, N5, N2, N3, N4, N1, N14, N15
-                # N16, N13, N10, N11, N12, N9, N18, N19, N20, N17
-                nd1 = int(line[3:13])
-                nd2 = int(line[13:23])
-                nd3 = int(line[23:33])
-                nd4 = int(line[33:43])
-                nd5 = int(line[43:53])
-                nd6 = int(line[53:63])
-                nd7 = int(line[63:73])
-                nd8 = int(line[73:83])
-                nd9 = int(line[83:93])
-                nd10 = int(line[93:103])
-                input_continues = True
-            elif elemType == 4 and input_continues is True:
-                # second line
-                nd11 = int(line[3:13])
-                nd12 = int(line[13:23])
-                nd13 = int(line[23:33])
-                nd14 = int(line[33:43])
-                nd15 = int(line[43:53])
-                nd16 = int(line[53:63])
-                nd17 = int(line[63:73])
-                nd18 = int(line[73:83])
-                nd19 = int(line[83:93])
-                nd20 = int(line[93:103])
-                input_continues = False
-                """
-                CalculiX uses a different node order in
-                input file *.inp and result file *.frd for hexa20 (C3D20)
-                according to Guido (the developer of ccx):
-                see note in the first line of cgx manual part element types
-                ccx (and thus the *.inp) follows the ABAQUS convention
-                documented in the ccx-documentation
-                cgx (and thus the *.frd) follows the FAM2 convention
-                documented in the cgx-documentation
-                FAM32 is from the company FEGS limited
-                maybe this company does not exist any more
-                elements_hexa20[elem] = (
-                    nd6, nd7, nd8, nd5, nd2, nd3, nd4, nd1, nd14, nd15,
-                    nd16, nd13, nd10, nd11, nd12, nd9, nd18, nd19, nd20, nd17
-                )
-                elements_hexa20[elem] = (
-                    nd6, nd7, nd8, nd5, nd2, nd3, nd4, nd1, nd14, nd15,
-                    nd16, nd13, nd18, nd19, nd20, nd17, nd10, nd11, nd12, nd9
-                )
-                hexa20 import works with the following frd file node assignment
-                """
-                elements_hexa20[elem] = (
-                    nd8, nd5, nd6, nd7, nd4, nd1, nd2, nd3, nd20, nd17,
-                    nd18, nd19, nd12, nd9, nd10, nd11, nd16, nd13, nd14, nd15
-                )
-            elif elemType == 5 and input_continues is False:
-                # first line
-                # C3D15 Calculix --> penta15 FreeCAD
-                # N5, N6, N4, N2, N3, N1, N11, N12, N10, N8, N9, N7, N14, N15, N13
-                nd1 = int(line[3:13])
-                nd2 = int(line[13:23])
-                nd3 = int(line[23:33])
-                nd4 = int(line[33:43])
-                nd5 = int(line[43:53])
-                nd6 = int(line[53:63])
-                nd7 = int(line[63:73])
-                nd8 = int(line[73:83])
-                nd9 = int(line[83:93])
-                nd10 = int(line[93:103])
-                input_continues = True
-            elif elemType == 5 and input_continues is True:
-                # second line
-                nd11 = int(line[3:13])
-                nd12 = int(line[13:23])
-                nd13 = int(line[23:33])
-                nd14 = int(line[33:43])
-                nd15 = int(line[43:53])
-                input_continues = False
-                """
-                CalculiX uses a different node order in
-                input file *.inp and result file *.frd for penta15 (C3D15)
-                see notes at hexa20
-                elements_penta15[elem] = (
-                    nd5, nd6, nd4, nd2, nd3, nd1, nd11, nd12, nd10, nd8,
-                    nd9, nd7, nd14, nd15, nd13
-                )  # order of the *.inp file
-                """
-                elements_penta15[elem] = (
-                    nd5, nd6, nd4, nd2, nd3, nd1, nd14, nd15, nd13, nd8,
-                    nd9, nd7, nd11, nd12, nd10
-                )
-            elif elemType == 6:
-                # C3D10 Calculix --> tetra10 FreeCAD
-                # N2, N1, N3, N4, N5, N7, N6, N9, N8, N10
-                nd1 = int(line[3:13])
-                nd2 = int(line[13:23])
-                nd3 = int(line[23:33])
-                nd4 = int(line[33:43])
-                nd5 = int(line[43:53])
-                nd6 = int(line[53:63])
-                nd7 = int(line[63:73])
-                nd8 = int(line[73:83])
-                nd9 = int(line[83:93])
-                nd10 = int(line[93:103])
-                elements_tetra10[elem] = (nd2, nd1, nd3, nd4, nd5, nd7, nd6, nd9, nd8, nd10)
-            elif elemType == 7:
-                # S3 Calculix --> tria3 FreeCAD
-                # N1, N2, N3
-                nd1 = int(line[3:13])
-                nd2 = int(line[13:23])
-                nd3 = int(line[23:33])
-                elements_tria3[elem] = (nd1, nd2, nd3)
-            elif elemType == 8:
-                # S6 CalculiX --> tria6 FreeCAD
-                # N1, N2, N3, N4, N5, N6
-                nd1 = int(line[3:13])
-                nd2 = int(line[13:23])
-                nd3 = int(line[23:33])
-                nd4 = int(line[33:43])
-                nd5 = int(line[43:53])
-                nd6 = int(line[53:63])
-                elements_tria6[elem] = (nd1, nd2, nd3, nd4, nd5, nd6)
-            elif elemType == 9:
-                # S4 CalculiX --> quad4 FreeCAD
-                # N1, N2, N3, N4
-                nd1 = int(line[3:13])
-                nd2 = int(line[13:23])
-                nd3 = int(line[23:33])
-                nd4 = int(line[33:43])
-                elements_quad4[elem] = (nd1, nd2, nd3, nd4)
-            elif elemType == 10:
-                # S8 CalculiX --> quad8 FreeCAD
-                # N1, N2, N3, N4, N5, N6, N7, N8
-                nd1 = int(line[3:13])
-                nd2 = int(line[13:23])
-                nd3 = int(line[23:33])
-                nd4 = int(line[33:43])
-                nd5 = int(line[43:53])
-                nd6 = int(line[53:63])
-                nd7 = int(line[63:73])
-                nd8 = int(line[73:83])
-                elements_quad8[elem] = (nd1, nd2, nd3, nd4, nd5, nd6, nd7, nd8)
-            elif elemType == 11:
-                # B31 CalculiX --> seg2 FreeCAD
-                # N1, N2
-                nd1 = int(line[3:13])
-                nd2 = int(line[13:23])
-                elements_seg2[elem] = (nd1, nd2)
-            elif elemType == 12:
-                # B32 CalculiX --> seg3 FreeCAD
-                # Also D element element number
-                # CalculiX uses a different node order in
-                # input file *.inp and result file *.frd for seg3 (B32)
-                # see notes at hexa20
-                # N1, N2 ,N3
-                nd1 = int(line[3:13])
-                nd2 = int(line[13:23])
-                nd3 = int(line[23:33])
-                if inout_nodes:
-                    for i in range(len(inout_nodes)):
-                        if nd1 == int(inout_nodes[i][1]):
-                            # fluid inlet node numbering
-                            elements_seg3[elem] = (int(inout_nodes[i][2]), nd3, nd1)
-                        elif nd3 == int(inout_nodes[i][1]):
-                            # fluid outlet node numbering
-                            elements_seg3[elem] = (nd1, int(inout_nodes[i][2]), nd3)
-                else:
-                    # normal node numbering for D, B32 elements
-                    elements_seg3[elem] = (nd1, nd2, nd3)
-
-        # Check if we found new eigenmode line
-        if line[5:10] == "PMODE":
-            eigentemp = int(line[30:36])
-            if eigentemp > eigenmode:
-                eigenmode = eigentemp
-                mode_eigen_changed = True
-
-        # Check if we found new time step
-        if line[4:10] == "1PSTEP":
-            mode_time_found = True
-        if mode_time_found and (line[2:7] == "100CL"):
-            # we found the new time step line
-            # !!! be careful here, there is timetemp and timestep!
-            # TODO: use more differ names
-            timetemp = float(line[13:25])
-            if timetemp > timestep:
-                timestep = timetemp
-                mode_time_changed = True
-
-        # Check if we found displacement section
-        if line[5:9] == "DISP":
-            mode_disp_found = True
-        if mode_disp_found and (line[1:3] == "-1"):
-            # we found a displacement line
-            elem = int(line[4:13])
-            mode_disp_x = float(line[13:25])
-            mode_disp_y = float(line[25:37])
-            mode_disp_z = float(line[37:49])
-            mode_disp[elem] = FreeCAD.Vector(mode_disp_x, mode_disp_y, mode_disp_z)
-
-        # Check if we found stress section
-        if line[5:11] == "STRESS":
-            mode_stress_found = True
-        if mode_stress_found and (line[1:3] == "-1"):
-            # we found a stress line
-            elem = int(line[4:13])
-            stress_1 = float(line[13:25])
-            stress_2 = float(line[25:37])
-            stress_3 = float(line[37:49])
-            stress_4 = float(line[49:61])
-            stress_5 = float(line[61:73])
-            stress_6 = float(line[73:85])
-            # CalculiX frd files: (Sxx, Syy, Szz, Sxy, Syz, Szx)
-            # FreeCAD:            (Sxx, Syy, Szz, Sxy, Sxz, Syz)
-            # thus exchange the last two entries
-            mode_stress[elem] = (stress_1, stress_2, stress_3, stress_4, stress_6, stress_5)
-
-        # Check if we found strain section
-        if line[5:13] == "TOSTRAIN":
-            mode_strain_found = True
-        if mode_strain_found and (line[1:3] == "-1"):
-            # we found a strain line in the frd file
-            elem = int(line[4:13])
-            strain_1 = float(line[13:25])
-            strain_2 = float(line[25:37])
-            strain_3 = float(line[37:49])
-            strain_4 = float(line[49:61])
-            strain_5 = float(line[61:73])
-            strain_6 = float(line[73:85])
-            # CalculiX frd files: (Exx, Eyy, Ezz, Exy, Eyz, Ezx)
-            # FreeCAD:            (Exx, Eyy, Ezz, Exy, Exz, Eyz)
-            # thus exchange the last two entries
-            mode_strain[elem] = (strain_1, strain_2, strain_3, strain_4, strain_6, strain_5)
-
-        # Check if we found an equivalent plastic strain section
-        if line[5:7] == "PE":
-            mode_peeq_found = True
-        if mode_peeq_found and (line[1:3] == "-1"):
-            # we found an equivalent plastic strain line
-            elem = int(line[4:13])
-            peeq = float(line[13:25])
-            mode_peeq[elem] = (peeq)
-
-        # Check if we found a temperature section
-        if line[5:11] == "NDTEMP":
-            mode_temp_found = True
-        if mode_temp_found and (line[1:3] == "-1"):
-            # we found a temperature line
-            elem = int(line[4:13])
-            temperature = float(line[13:25])
-            mode_temp[elem] = (temperature)
-
-        # Check if we found a mass flow section
-        if line[5:11] == "MAFLOW":
-            mode_massflow_found = True
-        if mode_massflow_found and (line[1:3] == "-1"):
-            # we found a mass flow line
-            elem = int(line[4:13])
-            massflow = float(line[13:25])
-            mode_massflow[elem] = (massflow * 1000)  # convert units to kg/s from t/s
-            if inout_nodes:
-                for i in range(len(inout_nodes)):
-                    if elem == int(inout_nodes[i][1]):
-                        node = int(inout_nodes[i][2])
-                        # convert units to kg/s from t/s
-                        mode_massflow[node] = (massflow * 1000)
-
-        # Check if we found a network pressure section
-        if line[5:11] == "STPRES":
-            mode_networkpressure_found = True
-        if mode_networkpressure_found and (line[1:3] == "-1"):
-            # we found a network pressure line
-            elem = int(line[4:13])
-            networkpressure = float(line[13:25])
-            mode_networkpressure[elem] = (networkpressure)
-            if inout_nodes:
-                for i in range(len(inout_nodes)):
-                    if elem == int(inout_nodes[i][1]):
-                        node = int(inout_nodes[i][2])
-                        mode_networkpressure[node] = (networkpressure)
-
-        # Check if we found the end of a section
-        if line[1:3] == "-3":
-            end_of_section_found = True
-
-            if nodes_found:
-                nodes_found = False
-                node_element_section = True
-
-            if elements_found:
-                elements_found = False
-                node_element_section = True
-
-            if mode_disp_found:
-                mode_results["disp"] = mode_disp
-                mode_disp = {}
-                mode_disp_found = False
-                node_element_section = False
-
-            if mode_stress_found:
-                mode_results["stress"] = mode_stress
-                mode_stress = {}
-                mode_stress_found = False
-                node_element_section = False
-
-            if mode_strain_found:
-                mode_results["strain"] = mode_strain
-
-                mode_strain = {}
-                mode_strain_found = False
-                node_element_section = False
-
-            if mode_peeq_found:
-                mode_results["peeq"] = mode_peeq
-                mode_peeq = {}
-                mode_peeq_found = False
-                node_element_section = False
-
-            if mode_temp_found:
-                mode_results["temp"] = mode_temp
-                mode_temp = {}
-                mode_temp_found = False
-                node_element_section = False
-
-            if mode_massflow_found:
-                mode_results["mflow"] = mode_massflow
-                mode_massflow = {}
-                mode_massflow_found = False
-                node_element_section = False
-
-            if mode_networkpressure_found:
-                mode_results["npressure"] = mode_networkpressure
-                mode_networkpressure_found = False
-                mode_networkpressure = {}
-                node_element_section = False
-
-            """
-            print("---- End of Section --> Mode_Results may be changed ----")
-            for key in sorted(mode_results.keys()):
-                if key is "number" or key is "time":
-                    print(key + " --> " + str(mode_results[key]))
-                else:
-                    print(key + " --> " + str(len(mode_results[key])))
-            print("----Mode_Results----\n")
-            """
-
-        # Check if we found the end of frd data
-        if line[1:5] == "9999":
-            end_of_frd_data_found = True
-
-        if (mode_eigen_changed or mode_time_changed or end_of_frd_data_found) \
-                and end_of_section_found \
-                and not node_element_section:
-
-            """
-            print("\n\n----Append mode_results to results")
-            print(line)
-            for key in sorted(mode_results.keys()):
-                if key is "number" or key is "time":
-                    print(key + " --> " + str(mode_results[key]))
-                else:
-                    print(key + " --> " + str(len(mode_results[key])))
-            print("----Append Mode_Results----\n")
-            """
-
-            # append mode_results to results and reset mode_result
-            results.append(mode_results)
-            mode_results = {}
-            # https://forum.freecadweb.org/viewtopic.php?f=18&t=32649&start=10#p274686
-            mode_results["number"] = float("NaN")
-            mode_results["time"] = float("NaN")
-            end_of_section_found = False
-
-        # on changed --> write changed values in mode_result
-        # will be the first to do on an empty mode_result
-        if mode_eigen_changed:
-            mode_results["number"] = eigenmode
-            mode_eigen_changed = False
-
-        if mode_time_changed:
-            mode_results["time"] = timestep
-            # mode_results["time"] = 0  # Don't return time if static  # Why?
-            mode_time_found = False
-            mode_time_changed = False
-
-        # here we are in the indent of loop for every line in frd file
-        # do not add a print here :-)
-
-    # close frd file if loop over all lines is finished
-    frd_file.close()
+    return inout_nodes
+
+
+# result blocks in frd files
+# key in result set --> number of values per node
+FRD_RESULT_COMPONENTS = {
+    "disp": 3,
+    "stress": 6,
+    "strain": 6,
+    "peeq": 1,
+    "temp": 1,
+    "mflow": 1,
+    "npressure": 1,
+}
 
+# size in bytes of the parts of the frd file read at once
+FRD_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def get_frd_result_key(
+    line
+):
+    """ returns the result set key of a block header line of a frd file
+    None is returned for blocks which are not imported
     """
-    # debug prints and checks with the read data
-    print("\n\n----RESULTS values begin----")
-    print(len(results))
-    # print("\n")
-    # print(results)
-    print("----RESULTS values end----\n\n")
+    if line[5:9] == b"DISP":
+        return "disp"
+    if line[5:11] == b"STRESS":
+        return "stress"
+    if line[5:13] == b"TOSTRAIN":
+        return "strain"
+    if line[5:7] == b"PE":
+        return "peeq"
+    if line[5:11] == b"NDTEMP":
+        return "temp"
+    if line[5:11] == b"MAFLOW":
+        return "mflow"
+    if line[5:11] == b"STPRES":
+        return "npressure"
+    return None
+
+
+class FrdReader(object):
+    """ index of the sections of a CalculiX frd file
+
+    On creation the file is scanned once and only the file offsets of
+    the mesh sections and of the result blocks of every result set are
+    stored. The values are parsed on request, one result set at a time,
+    into NumPy arrays. Thus a single step of a transient or modal
+    analysis can be read without parsing the whole file.
     """
 
-    if not inout_nodes:
-        if results:
-            if "mflow" in results[0] or "npressure" in results[0]:
-                Console.PrintError(
-                    "We have mflow or npressure, but no inout_nodes file.\n"
-                )
-    if not nodes:
-        Console.PrintError("FEM: No nodes found in Frd file.\n")
-
-    return {
-        "Nodes": nodes,
-        "Seg2Elem": elements_seg2,
-        "Seg3Elem": elements_seg3,
-        "Tria3Elem": elements_tria3,
-        "Tria6Elem": elements_tria6,
-        "Quad4Elem": elements_quad4,
-        "Quad8Elem": elements_quad8,
-        "Tetra4Elem": elements_tetra4,
-        "Tetra10Elem": elements_tetra10,
-        "Hexa8Elem": elements_hexa8,
-        "Hexa20Elem": elements_hexa20,
-        "Penta6Elem": elements_penta6,
-        "Penta15Elem": elements_penta15,
-        "Results": results
-    }
+    def __init__(
+        self,
+        frd_input
+    ):
+        Console.PrintMessage(
+            "Read ccx results from frd file: {}\n"
+            .format(frd_input)
+        )
+        self.frd_input = frd_input
+        self.inout_nodes = read_inout_nodes(frd_input)
+        # file offsets (start, end) of the mesh sections
+        # node sections additionally with the number of node lines
+        self.node_sections = []
+        self.element_sections = []
+        # list of dicts with number, time and blocks
+        # blocks: result key --> (start, end, number of value lines)
+        self.steps = []
+        self._read_index()
+
+        if not self.inout_nodes:
+            if self.steps:
+                if "mflow" in self.steps[0]["blocks"] or "npressure" in self.steps[0]["blocks"]:
+                    Console.PrintError(
+                        "We have mflow or npressure, but no inout_nodes file.\n"
+                    )
+        if not self.node_sections:
+            Console.PrintError("FEM: No nodes found in Frd file.\n")
+
+    def _read_index(
+        self
+    ):
+        step = {"number": float("NaN"), "time": float("NaN"), "blocks": {}}
+        section = None
+        section_start = 0
+        section_count = 0
+        offset = 0
+
+        time_found = False
+        end_of_section_found = False
+        end_of_frd_data_found = False
+        node_element_section = False
+
+        eigenmode = 0
+        timestep = 0
+
+        with pyopen(self.frd_input, "rb") as frd_file:
+            for line in frd_file:
+                line_start = offset
+                offset += len(line)
+                flag = line[1:3]
+
+                # value lines, only counted here
+                if flag == b"-1":
+                    section_count += 1
+                    continue
+                if flag == b"-2":
+                    continue
+
+                # Check if we found the begin of a section
+                if line[4:6] == b"2C":
+                    section = "nodes"
+                    section_start = offset
+                    section_count = 0
+                elif line[4:6] == b"3C":
+                    section = "elements"
+                    section_start = offset
+                    section_count = 0
+                elif flag == b"-4":
+                    section = get_frd_result_key(line)
+                    section_start = offset
+                    section_count = 0
+
+                # Check if we found the end of a section
+                if flag == b"-3":
+                    end_of_section_found = True
+                    if section == "nodes":
+                        self.node_sections.append((section_start, line_start, section_count))
+                        node_element_section = True
+                    elif section == "elements":
+                        self.element_sections.append((section_start, line_start))
+                        node_element_section = True
+                    elif section is not None:
+                        step["blocks"][section] = (section_start, line_start, section_count)
+                        node_element_section = False
+                    section = None
+
+                # Check if we found new eigenmode line
+                mode_eigen_changed = False
+                if line[5:10] == b"PMODE":
+                    eigentemp = int(line[30:36])
+                    if eigentemp > eigenmode:
+                        eigenmode = eigentemp
+                        mode_eigen_changed = True
+
+                # Check if we found new time step
+                mode_time_changed = False
+                if line[4:10] == b"1PSTEP":
+                    time_found = True
+                if time_found and (line[2:7] == b"100CL"):
+                    timetemp = float(line[13:25])
+                    if timetemp > timestep:
+                        timestep = timetemp
+                        mode_time_changed = True
+
+                # Check if we found the end of frd data
+                if line[1:5] == b"9999":
+                    end_of_frd_data_found = True
+
+                if (mode_eigen_changed or mode_time_changed or end_of_frd_data_found) \
+                        and end_of_section_found \
+                        and not node_element_section:
+                    # append step to steps and start a new one
+                    # https://forum.freecadweb.org/viewtopic.php?f=18&t=32649&start=10#p274686
+                    self.steps.append(step)
+                    step = {"number": float("NaN"), "time": float("NaN"), "blocks": {}}
+                    end_of_section_found = False
+
+                # on changed --> write changed values in step
+                # will be the first to do on an empty step
+                if mode_eigen_changed:
+                    step["number"] = eigenmode
+                if mode_time_changed:
+                    step["time"] = timestep
+                    time_found = False
+
+    def _read_chunks(
+        self,
+        start,
+        end
+    ):
+        """ yields the lines between two file offsets in lists of lines
+        """
+        with pyopen(self.frd_input, "rb") as frd_file:
+            frd_file.seek(start)
+            remaining = end - start
+            rest = b""
+            while remaining > 0:
+                data = frd_file.read(min(FRD_CHUNK_SIZE, remaining))
+                if not data:
+                    break
+                remaining -= len(data)
+                lines = (rest + data).split(b"\n")
+                rest = lines.pop()
+                yield lines
+            if rest:
+                yield [rest]
+
+    def _read_lines(
+        self,
+        sections
+    ):
+        """ yields the lines of the given sections of the file
+        """
+        for section in sections:
+            for lines in self._read_chunks(section[0], section[1]):
+                for line in lines:
+                    yield line
+
+    def _read_values(
+        self,
+        start,
+        end,
+        count,
+        components
+    ):
+        """ returns the numbers and the values of the value lines between two file offsets
+        the lines have fixed columns, thus they are converted a chunk at once
+        """
+        record = np.dtype(
+            [("flag", "S3"), ("number", "S10")]
+            + [("value{}".format(i), "S12") for i in range(components)]
+        )
+        width = record.itemsize
+        numbers = np.empty((count,), dtype=np.int64)
+        values = np.empty((count, components))
+        filled = 0
+        for lines in self._read_chunks(start, end):
+            records = [
+                line[:width].rstrip().ljust(width)
+                for line in lines
+                if line[1:3] == b"-1"
+            ]
+            if not records:
+                continue
+            data = np.frombuffer(b"".join(records), dtype=record)
+            size = len(data)
+            numbers[filled:filled + size] = data["number"].astype(np.int64)
+            for i in range(components):
+                values[filled:filled + size, i] = data["value{}".format(i)].astype(float)
+            filled += size
+        return numbers[:filled], values[:filled]
+
+    def read_nodes(
+        self
+    ):
+        """ returns the node numbers and a (n, 3) array of the node coordinates
+        """
+        numbers = [np.empty((0,), dtype=np.int64)]
+        coords = [np.empty((0, 3))]
+        for start, end, count in self.node_sections:
+            section_numbers, section_coords = self._read_values(start, end, count, 3)
+            numbers.append(section_numbers)
+            coords.append(section_coords)
+        return np.concatenate(numbers), np.concatenate(coords)
+
+    def read_elements(
+        self
+    ):
+        """ returns a dict with a dict element number --> node numbers per element type
+        the node order is the one of FreeCAD
+        """
+        elements_hexa8 = {}
+        elements_penta6 = {}
+        elements_tetra4 = {}
+        elements_tetra10 = {}
+        elements_penta15 = {}
+        elements_hexa20 = {}
+        elements_tria3 = {}
+        elements_tria6 = {}
+        elements_quad4 = {}
+        elements_quad8 = {}
+        elements_seg2 = {}
+        elements_seg3 = {}
+        inout_nodes = self.inout_nodes
+
+        input_continues = False
+        elem = -1
+        elemType = 0
+
+        for line in self._read_lines(self.element_sections):
+            if line[1:3] == b"-1":
+                # we found a first element line, lets extract element number
+                elem = int(line[4:13])
+                elemType = int(line[14:18])
+            if line[1:3] == b"-2":
+                # we found a second element line, lets extract the elements
+                # node order fits with node order in writeAbaqus() in FemMesh.cpp
+                if elemType == 1:
+                    # C3D8 CalculiX --> hexa8 FreeCAD
+                    # N6, N7, N8, N5, N2, N3, N4, N1
+                    nd1 = int(line[3:13])
+                    nd2 = int(line[13:23])
+                    nd3 = int(line[23:33])
+                    nd4 = int(line[33:43])
+                    nd5 = int(line[43:53])
+                    nd6 = int(line[53:63])
+                    nd7 = int(line[63:73])
+                    nd8 = int(line[73:83])
+                    elements_hexa8[elem] = (nd6, nd7, nd8, nd5, nd2, nd3, nd4, nd1)
+                elif elemType == 2:
+                    # C3D6 Calculix --> penta6 FreeCAD
+                    # N5, N6, N4, N2, N3, N1
+                    nd1 = int(line[3:13])
+                    nd2 = int(line[13:23])
+                    nd3 = int(line[23:33])
+                    nd4 = int(line[33:43])
+                    nd5 = int(line[43:53])
+                    nd6 = int(line[53:63])
+                    elements_penta6[elem] = (nd5, nd6, nd4, nd2, nd3, nd1)
+                elif elemType == 3:
+                    # C3D4 Calculix --> tetra4 FreeCAD
+                    # N2, N1, N3, N4
+                    nd1 = int(line[3:13])
+                    nd2 = int(line[13:23])
+                    nd3 = int(line[23:33])
+                    nd4 = int(line[33:43])
+                    elements_tetra4[elem] = (nd2, nd1, nd3, nd4)
+                elif elemType == 4 and input_continues is False:
+                    # first line
+                    # C3D20 Calculix --> hexa20 FreeCAD
+                    # N6, N7, N8, N5, N2, N3, N4, N1, N14, N15
+                    # N16, N13, N10, N11, N12, N9, N18, N19, N20, N17
+                    nd1 = int(line[3:13])
+                    nd2 = int(line[13:23])
+                    nd3 = int(line[23:33])
+                    nd4 = int(line[33:43])
+                    nd5 = int(line[43:53])
+                    nd6 = int(line[53:63])
+                    nd7 = int(line[63:73])
+                    nd8 = int(line[73:83])
+                    nd9 = int(line[83:93])
+                    nd10 = int(line[93:103])
+                    input_continues = True
+                elif elemType == 4 and input_continues is True:
+                    # second line
+                    nd11 = int(line[3:13])
+                    nd12 = int(line[13:23])
+                    nd13 = int(line[23:33])
+                    nd14 = int(line[33:43])
+                    nd15 = int(line[43:53])
+                    nd16 = int(line[53:63])
+                    nd17 = int(line[63:73])
+                    nd18 = int(line[73:83])
+                    nd19 = int(line[83:93])
+                    nd20 = int(line[93:103])
+                    input_continues = False
+                    """
+                    CalculiX uses a different node order in
+                    input file *.inp and result file *.frd for hexa20 (C3D20)
+                    according to Guido (the developer of ccx):
+                    see note in the first line of cgx manual part element types
+                    ccx (and thus the *.inp) follows the ABAQUS convention
+                    documented in the ccx-documentation
+                    cgx (and thus the *.frd) follows the FAM2 convention
+                    documented in the cgx-documentation
+                    FAM32 is from the company FEGS limited
+                    maybe this company does not exist any more
+                    elements_hexa20[elem] = (
+                        nd6, nd7, nd8, nd5, nd2, nd3, nd4, nd1, nd14, nd15,
+                        nd16, nd13, nd10, nd11, nd12, nd9, nd18, nd19, nd20, nd17
+                    )
+                    elements_hexa20[elem] = (
+                        nd6, nd7, nd8, nd5, nd2, nd3, nd4, nd1, nd14, nd15,
+                        nd16, nd13, nd18, nd19, nd20, nd17, nd10, nd11, nd12, nd9
+                    )
+                    hexa20 import works with the following frd file node assignment
+                    """
+                    elements_hexa20[elem] = (
+                        nd8, nd5, nd6, nd7, nd4, nd1, nd2, nd3, nd20, nd17,
+                        nd18, nd19, nd12, nd9, nd10, nd11, nd16, nd13, nd14, nd15
+                    )
+                elif elemType == 5 and input_continues is False:
+                    # first line
+                    # C3D15 Calculix --> penta15 FreeCAD
+                    # N5, N6, N4, N2, N3, N1, N11, N12, N10, N8, N9, N7, N14, N15, N13
+                    nd1 = int(line[3:13])
+                    nd2 = int(line[13:23])
+                    nd3 = int(line[23:33])
+                    nd4 = int(line[33:43])
+                    nd5 = int(line[43:53])
+                    nd6 = int(line[53:63])
+                    nd7 = int(line[63:73])
+                    nd8 = int(line[73:83])
+                    nd9 = int(line[83:93])
+                    nd10 = int(line[93:103])
+                    input_continues = True
+                elif elemType == 5 and input_continues is True:
+                    # second line
+                    nd11 = int(line[3:13])
+                    nd12 = int(line[13:23])
+                    nd13 = int(line[23:33])
+                    nd14 = int(line[33:43])
+                    nd15 = int(line[43:53])
+                    input_continues = False
+                    """
+                    CalculiX uses a different node order in
+                    input file *.inp and result file *.frd for penta15 (C3D15)
+                    see notes at hexa20
+                    elements_penta15[elem] = (
+                        nd5, nd6, nd4, nd2, nd3, nd1, nd11, nd12, nd10, nd8,
+                        nd9, nd7, nd14, nd15, nd13
+                    )  # order of the *.inp file
+                    """
+                    elements_penta15[elem] = (
+                        nd5, nd6, nd4, nd2, nd3, nd1, nd14, nd15, nd13, nd8,
+                        nd9, nd7, nd11, nd12, nd10
+                    )
+                elif elemType == 6:
+                    # C3D10 Calculix --> tetra10 FreeCAD
+                    # N2, N1, N3, N4, N5, N7, N6, N9, N8, N10
+                    nd1 = int(line[3:13])
+                    nd2 = int(line[13:23])
+                    nd3 = int(line[23:33])
+                    nd4 = int(line[33:43])
+                    nd5 = int(line[43:53])
+                    nd6 = int(line[53:63])
+                    nd7 = int(line[63:73])
+                    nd8 = int(line[73:83])
+                    nd9 = int(line[83:93])
+                    nd10 = int(line[93:103])
+                    elements_tetra10[elem] = (nd2, nd1, nd3, nd4, nd5, nd7, nd6, nd9, nd8, nd10)
+                elif elemType == 7:
+                    # S3 Calculix --> tria3 FreeCAD
+                    # N1, N2, N3
+                    nd1 = int(line[3:13])
+                    nd2 = int(line[13:23])
+                    nd3 = int(line[23:33])
+                    elements_tria3[elem] = (nd1, nd2, nd3)
+                elif elemType == 8:
+                    # S6 CalculiX --> tria6 FreeCAD
+                    # N1, N2, N3, N4, N5, N6
+                    nd1 = int(line[3:13])
+                    nd2 = int(line[13:23])
+                    nd3 = int(line[23:33])
+                    nd4 = int(line[33:43])
+                    nd5 = int(line[43:53])
+                    nd6 = int(line[53:63])
+                    elements_tria6[elem] = (nd1, nd2, nd3, nd4, nd5, nd6)
+                elif elemType == 9:
+                    # S4 CalculiX --> quad4 FreeCAD
+                    # N1, N2, N3, N4
+                    nd1 = int(line[3:13])
+                    nd2 = int(line[13:23])
+                    nd3 = int(line[23:33])
+                    nd4 = int(line[33:43])
+                    elements_quad4[elem] = (nd1, nd2, nd3, nd4)
+                elif elemType == 10:
+                    # S8 CalculiX --> quad8 FreeCAD
+                    # N1, N2, N3, N4, N5, N6, N7, N8
+                    nd1 = int(line[3:13])
+                    nd2 = int(line[13:23])
+                    nd3 = int(line[23:33])
+                    nd4 = int(line[33:43])
+                    nd5 = int(line[43:53])
+                    nd6 = int(line[53:63])
+                    nd7 = int(line[63:73])
+                    nd8 = int(line[73:83])
+                    elements_quad8[elem] = (nd1, nd2, nd3, nd4, nd5, nd6, nd7, nd8)
+                elif elemType == 11:
+                    # B31 CalculiX --> seg2 FreeCAD
+                    # N1, N2
+                    nd1 = int(line[3:13])
+                    nd2 = int(line[13:23])
+                    elements_seg2[elem] = (nd1, nd2)
+                elif elemType == 12:
+                    # B32 CalculiX --> seg3 FreeCAD
+                    # Also D element element number
+                    # CalculiX uses a different node order in
+                    # input file *.inp and result file *.frd for seg3 (B32)
+                    # see notes at hexa20
+                    # N1, N2 ,N3
+                    nd1 = int(line[3:13])
+                    nd2 = int(line[13:23])
+                    nd3 = int(line[23:33])
+                    if inout_nodes:
+                        for i in range(len(inout_nodes)):
+                            if nd1 == int(inout_nodes[i][1]):
+                                # fluid inlet node numbering
+                                elements_seg3[elem] = (int(inout_nodes[i][2]), nd3, nd1)
+                            elif nd3 == int(inout_nodes[i][1]):
+                                # fluid outlet node numbering
+                                elements_seg3[elem] = (nd1, int(inout_nodes[i][2]), nd3)
+                    else:
+                        # normal node numbering for D, B32 elements
+                        elements_seg3[elem] = (nd1, nd2, nd3)
+
+        return {
+            "Seg2Elem": elements_seg2,
+            "Seg3Elem": elements_seg3,
+            "Tria3Elem": elements_tria3,
+            "Tria6Elem": elements_tria6,
+            "Quad4Elem": elements_quad4,
+            "Quad8Elem": elements_quad8,
+            "Tetra4Elem": elements_tetra4,
+            "Tetra10Elem": elements_tetra10,
+            "Hexa8Elem": elements_hexa8,
+            "Hexa20Elem": elements_hexa20,
+            "Penta6Elem": elements_penta6,
+            "Penta15Elem": elements_penta15
+        }
+
+    def read_mesh(
+        self
+    ):
+        """ returns the mesh in the format used by importToolsFem.make_femmesh
+        """
+        nodes = {}
+        numbers, coords = self.read_nodes()
+        for number, coord in zip(numbers.tolist(), coords.tolist()):
+            nodes[number] = FreeCAD.Vector(*coord)
+        mesh = self.read_elements()
+        mesh["Nodes"] = nodes
+        return mesh
+
+    def read_step(
+        self,
+        step_index
+    ):
+        """ returns a result set of the frd file
+        number and time as well as for every result found
+        a tuple of the node numbers and the values as NumPy arrays
+        """
+        step = self.steps[step_index]
+        result_set = {"number": step["number"], "time": step["time"]}
+        for key, (start, end, count) in step["blocks"].items():
+            numbers, values = self._read_values(
+                start,
+                end,
+                count,
+                FRD_RESULT_COMPONENTS[key]
+            )
+            if key in ("stress", "strain"):
+                # CalculiX frd files: (Sxx, Syy, Szz, Sxy, Syz, Szx)
+                # FreeCAD:            (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+                # thus exchange the last two entries
+                values = values[:, [0, 1, 2, 3, 5, 4]]
+            elif values.shape[1] == 1:
+                values = values[:, 0]
+            if key == "mflow":
+                # convert units to kg/s from t/s
+                values = values * 1000
+            if key in ("mflow", "npressure") and self.inout_nodes:
+                numbers, values = self._add_inout_nodes(numbers, values)
+            result_set[key] = (numbers, values)
+        return result_set
+
+    def _add_inout_nodes(
+        self,
+        numbers,
+        values
+    ):
+        """ the special 1DFlow nodes get the values of their inout nodes
+        """
+        result = {}
+        for elem, value in zip(numbers.tolist(), values.tolist()):
+            result[elem] = value
+            for i in range(len(self.inout_nodes)):
+                if elem == int(self.inout_nodes[i][1]):
+                    node = int(self.inout_nodes[i][2])
+                    result[node] = value
+        return (
+            np.fromiter(result.keys(), dtype=np.int64, count=len(result)),
+            np.fromiter(result.values(), dtype=float, count=len(result))
+        )
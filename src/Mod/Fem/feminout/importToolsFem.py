@@ -29,6 +29,8 @@ __url__ = "https://www.freecadweb.org"
 #  \ingroup FEM
 #  \brief FreeCAD FEM import tools
 
+import numpy as np
+
 import FreeCAD
 from FreeCAD import Console
 
@@ -132,110 +134,69 @@ def get_MaxDimElementFromList(
     return elem_list[-1]
 
 
+# element types of the FEM mesh data with the FemMesh element type and node count
+# in the order the elements are added to the FemMesh
+FEMMESH_DATA_ELEMENT_TYPES = (
+    ("Hexa8Elem", "Volume", 8),
+    ("Penta6Elem", "Volume", 6),
+    ("Tetra4Elem", "Volume", 4),
+    ("Tetra10Elem", "Volume", 10),
+    ("Penta15Elem", "Volume", 15),
+    ("Hexa20Elem", "Volume", 20),
+    ("Tria3Elem", "Face", 3),
+    ("Tria6Elem", "Face", 6),
+    ("Quad4Elem", "Face", 4),
+    ("Quad8Elem", "Face", 8),
+    ("Seg2Elem", "Edge", 2),
+    ("Seg3Elem", "Edge", 3),
+)
+
+
 def make_femmesh(
     mesh_data
 ):
     """ makes an FreeCAD FEM Mesh object from FEM Mesh data
+    the nodes and the elements of each type are added with one call each
     """
     import Fem
     mesh = Fem.FemMesh()
     m = mesh_data
     if ("Nodes" in m) and (len(m["Nodes"]) > 0):
         FreeCAD.Console.PrintLog("Found: nodes\n")
-        if (
-            ("Seg2Elem" in m)
-            or ("Seg3Elem" in m)
-            or ("Tria3Elem" in m)
-            or ("Tria6Elem" in m)
-            or ("Quad4Elem" in m)
-            or ("Quad8Elem" in m)
-            or ("Tetra4Elem" in m)
-            or ("Tetra10Elem" in m)
-            or ("Penta6Elem" in m)
-            or ("Penta15Elem" in m)
-            or ("Hexa8Elem" in m)
-            or ("Hexa20Elem" in m)
-        ):
+        if any(ele_data[0] in m for ele_data in FEMMESH_DATA_ELEMENT_TYPES):
 
             nds = m["Nodes"]
             FreeCAD.Console.PrintLog("Found: elements\n")
-            for i in nds:
-                n = nds[i]
-                mesh.addNode(n[0], n[1], n[2], i)
-            elms_hexa8 = m["Hexa8Elem"]
-            for i in elms_hexa8:
-                e = elms_hexa8[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7]], i)
-            elms_penta6 = m["Penta6Elem"]
-            for i in elms_penta6:
-                e = elms_penta6[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3], e[4], e[5]], i)
-            elms_tetra4 = m["Tetra4Elem"]
-            for i in elms_tetra4:
-                e = elms_tetra4[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3]], i)
-            elms_tetra10 = m["Tetra10Elem"]
-            for i in elms_tetra10:
-                e = elms_tetra10[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7], e[8], e[9]], i)
-            elms_penta15 = m["Penta15Elem"]
-            for i in elms_penta15:
-                e = elms_penta15[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7], e[8], e[9],
-                                e[10], e[11], e[12], e[13], e[14]], i)
-            elms_hexa20 = m["Hexa20Elem"]
-            for i in elms_hexa20:
-                e = elms_hexa20[i]
-                mesh.addVolume([
-                    e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7], e[8], e[9],
-                    e[10], e[11], e[12], e[13], e[14], e[15], e[16], e[17], e[18], e[19]
-                ], i)
-            elms_tria3 = m["Tria3Elem"]
-            for i in elms_tria3:
-                e = elms_tria3[i]
-                mesh.addFace([e[0], e[1], e[2]], i)
-            elms_tria6 = m["Tria6Elem"]
-            for i in elms_tria6:
-                e = elms_tria6[i]
-                mesh.addFace([e[0], e[1], e[2], e[3], e[4], e[5]], i)
-            elms_quad4 = m["Quad4Elem"]
-            for i in elms_quad4:
-                e = elms_quad4[i]
-                mesh.addFace([e[0], e[1], e[2], e[3]], i)
-            elms_quad8 = m["Quad8Elem"]
-            for i in elms_quad8:
-                e = elms_quad8[i]
-                mesh.addFace([e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7]], i)
-            elms_seg2 = m["Seg2Elem"]
-            for i in elms_seg2:
-                e = elms_seg2[i]
-                mesh.addEdge([e[0], e[1]], i)
-            elms_seg3 = m["Seg3Elem"]
-            for i in elms_seg3:
-                e = elms_seg3[i]
-                mesh.addEdge([e[0], e[1], e[2]], i)
+            mesh.addNodes(list(nds.values()), list(nds))
+            for key, ele_type, number_of_nodes in FEMMESH_DATA_ELEMENT_TYPES:
+                elms = m[key]
+                mesh.addElements(
+                    ele_type,
+                    [e[:number_of_nodes] for e in elms.values()],
+                    list(elms)
+                )
             Console.PrintLog(
                 "imported mesh: {} nodes, {} HEXA8, {} PENTA6, {} TETRA4, {} TETRA10, {} PENTA15\n"
                 .format(
                     len(nds),
-                    len(elms_hexa8),
-                    len(elms_penta6),
-                    len(elms_tetra4),
-                    len(elms_tetra10),
-                    len(elms_penta15)
+                    len(m["Hexa8Elem"]),
+                    len(m["Penta6Elem"]),
+                    len(m["Tetra4Elem"]),
+                    len(m["Tetra10Elem"]),
+                    len(m["Penta15Elem"])
                 )
             )
             Console.PrintLog(
                 "imported mesh: {} "
                 "HEXA20, {} TRIA3, {} TRIA6, {} QUAD4, {} QUAD8, {} SEG2, {} SEG3\n"
                 .format(
-                    len(elms_hexa20),
-                    len(elms_tria3),
-                    len(elms_tria6),
-                    len(elms_quad4),
-                    len(elms_quad8),
-                    len(elms_seg2),
-                    len(elms_seg3)
+                    len(m["Hexa20Elem"]),
+                    len(m["Tria3Elem"]),
+                    len(m["Tria6Elem"]),
+                    len(m["Quad4Elem"]),
+                    len(m["Quad8Elem"]),
+                    len(m["Seg2Elem"]),
+                    len(m["Seg3Elem"])
                 )
             )
         else:
@@ -350,81 +311,50 @@ def fill_femresult_mechanical(
         step_time = result_set["time"]
         step_time = round(step_time, 2)
 
+    # the results are dicts node number --> value(s)
+    # or tuples of NumPy arrays (node numbers, values), see get_result_arrays
     # if disp exists, fill res_obj.NodeNumbers and
     # res_obj.DisplacementVectors as well as stress and strain
     # furthermore the eigenmode number
     if "disp" in result_set:
-        disp = result_set["disp"]
-        res_obj.DisplacementVectors = list(map((lambda x: x), disp.values()))
-        res_obj.NodeNumbers = list(disp.keys())
+        node_numbers, disp = get_result_arrays(result_set["disp"], 3)
+        res_obj.DisplacementVectors = [FreeCAD.Vector(*v) for v in disp.tolist()]
+        res_obj.NodeNumbers = node_numbers.tolist()
+        nodes = len(node_numbers)
 
         # fill res_obj.NodeStressXX etc if they exist in result_set
         # list values are just added
         # Should we check if the key in stress and strain dict
         # is the same as the number in NodeNumbers?
         if "stress" in result_set:
-            stress = result_set["stress"]
-            Sxx = []
-            Syy = []
-            Szz = []
-            Sxy = []
-            Sxz = []
-            Syz = []
-            # values_S .. stress_tensor .. (Sxx, Syy, Szz, Sxy, Sxz, Syz)
-            for i, values_S in enumerate(stress.values()):
-                Sxx.append(values_S[0])
-                Syy.append(values_S[1])
-                Szz.append(values_S[2])
-                Sxy.append(values_S[3])
-                Sxz.append(values_S[4])
-                Syz.append(values_S[5])
-            res_obj.NodeStressXX = Sxx
-            res_obj.NodeStressYY = Syy
-            res_obj.NodeStressZZ = Szz
-            res_obj.NodeStressXY = Sxy
-            res_obj.NodeStressXZ = Sxz
-            res_obj.NodeStressYZ = Syz
+            # stress tensor .. (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+            stress = get_result_arrays(result_set["stress"], 6)[1]
+            res_obj.NodeStressXX = stress[:, 0].tolist()
+            res_obj.NodeStressYY = stress[:, 1].tolist()
+            res_obj.NodeStressZZ = stress[:, 2].tolist()
+            res_obj.NodeStressXY = stress[:, 3].tolist()
+            res_obj.NodeStressXZ = stress[:, 4].tolist()
+            res_obj.NodeStressYZ = stress[:, 5].tolist()
 
         # fill res_obj.NodeStrainXX etc if they exist in result_set
         if "strain" in result_set:
-            strain = result_set["strain"]
-            Exx = []
-            Eyy = []
-            Ezz = []
-            Exy = []
-            Exz = []
-            Eyz = []
-            # values_E .. straintuple .. (Exx, Eyy, Ezz, Exy, Exz, Eyz)
-            for i, values_E in enumerate(strain.values()):
-                Exx.append(values_E[0])
-                Eyy.append(values_E[1])
-                Ezz.append(values_E[2])
-                Exy.append(values_E[3])
-                Exz.append(values_E[4])
-                Eyz.append(values_E[5])
-            res_obj.NodeStrainXX = Exx
-            res_obj.NodeStrainYY = Eyy
-            res_obj.NodeStrainZZ = Ezz
-            res_obj.NodeStrainXY = Exy
-            res_obj.NodeStrainXZ = Exz
-            res_obj.NodeStrainYZ = Eyz
+            # strain tensor .. (Exx, Eyy, Ezz, Exy, Exz, Eyz)
+            strain = get_result_arrays(result_set["strain"], 6)[1]
+            res_obj.NodeStrainXX = strain[:, 0].tolist()
+            res_obj.NodeStrainYY = strain[:, 1].tolist()
+            res_obj.NodeStrainZZ = strain[:, 2].tolist()
+            res_obj.NodeStrainXY = strain[:, 3].tolist()
+            res_obj.NodeStrainXZ = strain[:, 4].tolist()
+            res_obj.NodeStrainYZ = strain[:, 5].tolist()
 
         # fill Equivalent Plastic strain if they exist
         if "peeq" in result_set:
-            Peeq = result_set["peeq"]
+            Peeq = get_result_arrays(result_set["peeq"])[1]
             if len(Peeq) > 0:
-                if len(Peeq.values()) != len(disp.values()):
+                if len(Peeq) != nodes:
                     # how is this possible? An example is needed!
                     Console.PrintError("PEEQ seems to have extra nodes.\n")
-                    Pe = []
-                    Pe_extra_nodes = list(Peeq.values())
-                    nodes = len(disp.values())
-                    for i in range(nodes):
-                        Pe_value = Pe_extra_nodes[i]
-                        Pe.append(Pe_value)
-                    res_obj.Peeq = Pe
-                else:
-                    res_obj.Peeq = list(Peeq.values())
+                res_obj.Peeq = Peeq[:nodes].tolist()
 
         # fill eigenmode number if they exist
         if eigenmode_number > 0:
@@ -435,36 +365,47 @@ def fill_femresult_mechanical(
         # if temperature can exist without disp:
         # move them out of disp if conditiona and set NodeNumbers
         if "temp" in result_set:
-            Temperature = result_set["temp"]
+            Temperature = get_result_arrays(result_set["temp"])[1]
             if len(Temperature) > 0:
-                if len(Temperature.values()) != len(disp.values()):
-                    Temp = []
-                    Temp_extra_nodes = list(Temperature.values())
-                    nodes = len(disp.values())
-                    for i in range(nodes):
-                        # how is this possible? An example is needed!
-                        Console.PrintError("Temperature seams to have exptra nodes.\n")
-                        Temp_value = Temp_extra_nodes[i]
-                        Temp.append(Temp_value)
-                    res_obj.Temperature = list(map((lambda x: x), Temp))
-                else:
-                    res_obj.Temperature = list(map((lambda x: x), Temperature.values()))
+                if len(Temperature) != nodes:
+                    # how is this possible? An example is needed!
+                    Console.PrintError("Temperature seams to have exptra nodes.\n")
+                res_obj.Temperature = Temperature[:nodes].tolist()
                 res_obj.Time = step_time
 
     # fill res_obj.MassFlow
     if "mflow" in result_set:
-        MassFlow = result_set["mflow"]
+        node_numbers, MassFlow = get_result_arrays(result_set["mflow"])
         if len(MassFlow) > 0:
-            res_obj.MassFlowRate = list(map((lambda x: x), MassFlow.values()))
+            res_obj.MassFlowRate = MassFlow.tolist()
             res_obj.Time = step_time
             # disp does not exist, res_obj.NodeNumbers needs to be set
-            res_obj.NodeNumbers = list(MassFlow.keys())
+            res_obj.NodeNumbers = node_numbers.tolist()
 
     # fill res_obj.NetworkPressure, disp does not exist, see MassFlow
     if "npressure" in result_set:
-        NetworkPressure = result_set["npressure"]
+        NetworkPressure = get_result_arrays(result_set["npressure"])[1]
         if len(NetworkPressure) > 0:
-            res_obj.NetworkPressure = list(map((lambda x: x), NetworkPressure.values()))
+            res_obj.NetworkPressure = NetworkPressure.tolist()
             res_obj.Time = step_time
 
     return res_obj
+
+
+def get_result_arrays(
+    result,
+    components=1
+):
+    """ returns the node numbers and the values of a result as NumPy arrays
+    result is a dict node number --> value(s) or already a tuple of arrays
+    the values have the shape (n, components) or (n,) for one component
+    """
+    if isinstance(result, tuple):
+        return result
+    node_numbers = np.fromiter(result.keys(), dtype=np.int64, count=len(result))
+    if components == 1:
+        values = np.fromiter(result.values(), dtype=float, count=len(result))
+    else:
+        values = np.array([tuple(v) for v in result.values()], dtype=float)
+        values = values.reshape((len(result), components))
+    return node_numbers, values
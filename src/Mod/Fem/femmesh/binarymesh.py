@@ -0,0 +1,173 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 FreeCAD Developers                                 *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "FEM binary mesh container"
+__author__ = "FreeCAD Developers"
+__url__ = "https://www.freecadweb.org"
+
+## @package binarymesh
+#  \ingroup FEM
+#  \brief read and write FEM meshes as compact binary files
+
+"""
+A binary mesh is a NumPy npz file with the arrays
+- node_ids: node numbers, shape (n,)
+- node_coords: node coordinates, shape (n, 3)
+and for every element type the arrays
+- <type>_ids: element numbers, shape (m,)
+- <type>_nodes: node numbers of the elements, shape (m, nodes per element)
+The element type is the kind of the FemMesh add method followed by the
+number of nodes, for example Edge3, Face6 or Volume10.
+
+Such a file is small and is read without compiling any Python code,
+in contrast to Python modules with one addNode or addVolume call per line.
+The nodes and the elements of each type are added with one addNodes
+or addElements call.
+
+from femmesh import binarymesh
+binarymesh.write_femmesh(fem_mesh, "/tmp/mymesh.npz")
+fem_mesh = binarymesh.read_femmesh("/tmp/mymesh.npz")
+"""
+
+import numpy as np
+
+
+# element kinds, the element types of FemMesh.addElements
+ELEMENT_KINDS = ("Edge", "Face", "Volume")
+
+
+def write_femmesh(
+    femmesh,
+    filename
+):
+    """ writes the nodes and the elements of a FemMesh into a binary mesh file
+    """
+    nodes = femmesh.Nodes
+    data = {
+        "node_ids": np.fromiter(nodes.keys(), dtype=np.int32, count=len(nodes)),
+        "node_coords": np.array(
+            [tuple(vec) for vec in nodes.values()],
+            dtype=float
+        ).reshape((-1, 3))
+    }
+    element_tables = {}
+    for kind, element_ids in (
+        ("Edge", femmesh.Edges),
+        ("Face", femmesh.Faces),
+        ("Volume", femmesh.Volumes)
+    ):
+        for ele_id in element_ids:
+            ele_nodes = femmesh.getElementNodes(ele_id)
+            ele_type = "{}{}".format(kind, len(ele_nodes))
+            element_tables.setdefault(ele_type, []).append((ele_id,) + tuple(ele_nodes))
+    for ele_type, table in element_tables.items():
+        table = np.array(table, dtype=np.int32)
+        data[ele_type + "_ids"] = table[:, 0]
+        data[ele_type + "_nodes"] = table[:, 1:]
+    np.savez_compressed(filename, **data)
+
+
+def read_femmesh(
+    filename,
+    femmesh=None
+):
+    """ returns a FemMesh with the nodes and the elements of a binary mesh file
+    if a FemMesh is given, they are added to this one
+    """
+    if femmesh is None:
+        import Fem
+        femmesh = Fem.FemMesh()
+    read_nodes(femmesh, filename)
+    read_elements(femmesh, filename)
+    return femmesh
+
+
+def read_nodes(
+    femmesh,
+    filename
+):
+    """ adds the nodes of a binary mesh file to a FemMesh
+    returns True like the generated mesh modules create_nodes methods
+    """
+    with np.load(filename) as data:
+        add_nodes(femmesh, data["node_ids"], data["node_coords"])
+    return True
+
+
+def read_elements(
+    femmesh,
+    filename
+):
+    """ adds the elements of a binary mesh file to a FemMesh
+    returns True like the generated mesh modules create_elements methods
+    """
+    with np.load(filename) as data:
+        for ele_type in get_element_types(data.files):
+            add_elements(
+                femmesh,
+                split_element_type(ele_type)[0],
+                data[ele_type + "_ids"],
+                data[ele_type + "_nodes"]
+            )
+    return True
+
+
+def get_element_types(
+    names
+):
+    """ returns the element types of the array names of a binary mesh file
+    sorted by kind (edges, faces, volumes) and number of nodes
+    """
+    ele_types = [name[:-4] for name in names if name.endswith("_ids") and name != "node_ids"]
+
+    def sort_key(ele_type):
+        kind, number_of_nodes = split_element_type(ele_type)
+        return (ELEMENT_KINDS.index(kind), number_of_nodes)
+
+    return sorted(ele_types, key=sort_key)
+
+
+def split_element_type(
+    ele_type
+):
+    """ returns kind and number of nodes of an element type, ("Face", 6) for Face6
+    """
+    kind = ele_type.rstrip("0123456789")
+    return kind, int(ele_type[len(kind):])
+
+
+def add_nodes(
+    femmesh,
+    node_ids,
+    node_coords
+):
+    femmesh.addNodes(node_coords.tolist(), node_ids.tolist())
+
+
+def add_elements(
+    femmesh,
+    kind,
+    element_ids,
+    element_nodes
+):
+    femmesh.addElements(kind, element_nodes.tolist(), element_ids.tolist())
@@ -101,6 +101,7 @@ class MeshSetsGetter():
         self.femelements_edges_only = []
         self.femelements_faces_only = []
         self.femelement_volumes_table = {}
+        self.femnodes_solid = None
         self.femelement_faces_table = {}
         self.femelement_edges_table = {}
         self.femelement_count_test = True
@@ -158,6 +159,65 @@ class MeshSetsGetter():
             "Getting mesh data time: {} seconds.\n".format(setstime)
         )
 
+    # ********************************************************************************************
+    # ********************************************************************************************
+    # mesh topology
+    # built on first use and shared by all get_constraints_* and element set methods
+    def get_femnodes_mesh(self):
+        if not self.femnodes_mesh:
+            self.femnodes_mesh = self.femmesh.Nodes
+        return self.femnodes_mesh
+
+    def get_femelement_table(self):
+        if not self.femelement_table:
+            self.femelement_table = meshtools.get_femelement_table(self.femmesh)
+        return self.femelement_table
+
+    def get_femnodes_ele_table(self):
+        if not self.femnodes_ele_table:
+            self.femnodes_ele_table = meshtools.get_femnodes_ele_table(
+                self.get_femnodes_mesh(),
+                self.get_femelement_table()
+            )
+        return self.femnodes_ele_table
+
+    def get_femelement_volumes_table(self):
+        if not self.femelement_volumes_table:
+            self.femelement_volumes_table = meshtools.get_femelement_volumes_table(
+                self.femmesh
+            )
+        return self.femelement_volumes_table
+
+    def get_femelement_faces_table(self):
+        if not self.femelement_faces_table:
+            self.femelement_faces_table = meshtools.get_femelement_faces_table(
+                self.femmesh
+            )
+        return self.femelement_faces_table
+
+    def get_femelement_edges_table(self):
+        if not self.femelement_edges_table:
+            self.femelement_edges_table = meshtools.get_femelement_edges_table(
+                self.femmesh
+            )
+        return self.femelement_edges_table
+
+    def get_femnodes_solid(self):
+        # set of all nodes which belong to at least one volume element
+        if self.femnodes_solid is None:
+            arrays = meshtools.get_femelement_table_arrays(
+                self.get_femelement_volumes_table()
+            )
+            self.femnodes_solid = set(arrays.node_ids.tolist())
+        return self.femnodes_solid
+
+    def split_femnodes_solid(self, nodes):
+        # split nodes into a set of nodes which belong to at least one volume element
+        # and a set of the other nodes, which only belong to face or edge elements
+        nodes = set(nodes)
+        femnodes_solid = self.get_femnodes_solid()
+        return nodes & femnodes_solid, nodes - femnodes_solid
+
     # ********************************************************************************************
     # ********************************************************************************************
     # node sets
@@ -185,25 +245,11 @@ class MeshSetsGetter():
             )
         ):
             FreeCAD.Console.PrintMessage("We need to find the solid nodes.\n")
-            if not self.femelement_volumes_table:
-                self.femelement_volumes_table = meshtools.get_femelement_volumes_table(
-                    self.femmesh
-                )
             for femobj in self.member.cons_fixed:
                 # femobj --> dict, FreeCAD document object is femobj["Object"]
-                nds_solid = []
-                nds_faceedge = []
-                for n in femobj["Nodes"]:
-                    solid_node = False
-                    for ve in self.femelement_volumes_table:
-                        if n in self.femelement_volumes_table[ve]:
-                            solid_node = True
-                            nds_solid.append(n)
-                            break
-                    if not solid_node:
-                        nds_faceedge.append(n)
-                femobj["NodesSolid"] = set(nds_solid)
-                femobj["NodesFaceEdge"] = set(nds_faceedge)
+                femobj["NodesSolid"], femobj["NodesFaceEdge"] = self.split_femnodes_solid(
+                    femobj["Nodes"]
+                )
 
     def get_constraints_displacement_nodes(self):
         if not self.member.cons_displacement:
@@ -287,19 +333,14 @@ class MeshSetsGetter():
                     "    solid_mesh with face data --> The femelement_table is not "
                     "needed but the femnodes_mesh is needed for node load calculation.\n"
                 )
-                if not self.femnodes_mesh:
-                    self.femnodes_mesh = self.femmesh.Nodes
+                self.get_femnodes_mesh()
             else:
                 FreeCAD.Console.PrintLog(
                     "    mesh without needed data --> The femelement_table "
                     "and femnodes_mesh are not needed for node load calculation.\n"
                 )
-                if not self.femnodes_mesh:
-                    self.femnodes_mesh = self.femmesh.Nodes
-                if not self.femelement_table:
-                    self.femelement_table = meshtools.get_femelement_table(
-                        self.femmesh
-                    )
+                self.get_femnodes_mesh()
+                self.get_femelement_table()
         # get node loads
         FreeCAD.Console.PrintLog(
             "    Finite element mesh nodes will be retrieved by searching "
@@ -354,15 +395,7 @@ class MeshSetsGetter():
             # print(femobj["PressureFaces"])
         """
 
-        if not self.femnodes_mesh:
-            self.femnodes_mesh = self.femmesh.Nodes
-        if not self.femelement_table:
-            self.femelement_table = meshtools.get_femelement_table(self.femmesh)
-        if not self.femnodes_ele_table:
-            self.femnodes_ele_table = meshtools.get_femnodes_ele_table(
-                self.femnodes_mesh,
-                self.femelement_table
-            )
+        self.get_femnodes_ele_table()
 
         for femobj in self.member.cons_pressure:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
@@ -383,15 +416,7 @@ class MeshSetsGetter():
     def get_constraints_contact_faces(self):
         if not self.member.cons_contact:
             return
-        if not self.femnodes_mesh:
-            self.femnodes_mesh = self.femmesh.Nodes
-        if not self.femelement_table:
-            self.femelement_table = meshtools.get_femelement_table(self.femmesh)
-        if not self.femnodes_ele_table:
-            self.femnodes_ele_table = meshtools.get_femnodes_ele_table(
-                self.femnodes_mesh,
-                self.femelement_table
-            )
+        self.get_femnodes_ele_table()
 
         for femobj in self.member.cons_contact:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
@@ -418,15 +443,7 @@ class MeshSetsGetter():
     def get_constraints_tie_faces(self):
         if not self.member.cons_tie:
             return
-        if not self.femnodes_mesh:
-            self.femnodes_mesh = self.femmesh.Nodes
-        if not self.femelement_table:
-            self.femelement_table = meshtools.get_femelement_table(self.femmesh)
-        if not self.femnodes_ele_table:
-            self.femnodes_ele_table = meshtools.get_femnodes_ele_table(
-                self.femnodes_mesh,
-                self.femelement_table
-            )
+        self.get_femnodes_ele_table()
 
         for femobj in self.member.cons_tie:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
@@ -538,17 +555,9 @@ class MeshSetsGetter():
             FreeCAD.Console.PrintMessage(all_found)
             FreeCAD.Console.PrintMessage("\n")
         if all_found is False:
-            if not self.femelement_table:
-                self.femelement_table = meshtools.get_femelement_table(self.femmesh)
             # we're going to use the binary search for get_femelements_by_femnodes()
             # thus we need the parameter values self.femnodes_ele_table
-            if not self.femnodes_mesh:
-                self.femnodes_mesh = self.femmesh.Nodes
-            if not self.femnodes_ele_table:
-                self.femnodes_ele_table = meshtools.get_femnodes_ele_table(
-                    self.femnodes_mesh,
-                    self.femelement_table
-                )
+            self.get_femnodes_ele_table()
             control = meshtools.get_femelement_sets(
                 self.femmesh,
                 self.femelement_table,
@@ -562,10 +571,7 @@ class MeshSetsGetter():
     def get_element_geometry2D_elements(self):
         # get element ids and write them into the objects
         FreeCAD.Console.PrintMessage("Shell thicknesses\n")
-        if not self.femelement_faces_table:
-            self.femelement_faces_table = meshtools.get_femelement_faces_table(
-                self.femmesh
-            )
+        self.get_femelement_faces_table()
         meshtools.get_femelement_sets(
             self.femmesh,
             self.femelement_faces_table,
@@ -575,10 +581,7 @@ class MeshSetsGetter():
     def get_element_geometry1D_elements(self):
         # get element ids and write them into the objects
         FreeCAD.Console.PrintMessage("Beam sections\n")
-        if not self.femelement_edges_table:
-            self.femelement_edges_table = meshtools.get_femelement_edges_table(
-                self.femmesh
-            )
+        self.get_femelement_edges_table()
         meshtools.get_femelement_sets(
             self.femmesh,
             self.femelement_edges_table,
@@ -594,10 +597,7 @@ class MeshSetsGetter():
                 "because the mesh does not know the Geometry it is made from\n"
             )
             return
-        if not self.femelement_edges_table:
-            self.femelement_edges_table = meshtools.get_femelement_edges_table(
-                self.femmesh
-            )
+        self.get_femelement_edges_table()
         meshtools.get_femelement_direction1D_set(
             self.femmesh,
             self.femelement_edges_table,
@@ -608,10 +608,7 @@ class MeshSetsGetter():
     def get_element_fluid1D_elements(self):
         # get element ids and write them into the objects
         FreeCAD.Console.PrintMessage("Fluid sections\n")
-        if not self.femelement_edges_table:
-            self.femelement_edges_table = meshtools.get_femelement_edges_table(
-                self.femmesh
-            )
+        self.get_femelement_edges_table()
         meshtools.get_femelement_sets(
             self.femmesh,
             self.femelement_edges_table,
@@ -635,20 +632,14 @@ class MeshSetsGetter():
             # get element ids and write them into the femobj
             self.get_solid_element_sets(self.member.mats_linear)
         if self.member.geos_shellthickness:
-            if not self.femelement_faces_table:
-                self.femelement_faces_table = meshtools.get_femelement_faces_table(
-                    self.femmesh
-                )
+            self.get_femelement_faces_table()
             meshtools.get_femelement_sets(
                 self.femmesh,
                 self.femelement_faces_table,
                 self.member.mats_linear
             )
         if self.member.geos_beamsection or self.member.geos_fluidsection:
-            if not self.femelement_edges_table:
-                self.femelement_edges_table = meshtools.get_femelement_edges_table(
-                    self.femmesh
-                )
+            self.get_femelement_edges_table()
             meshtools.get_femelement_sets(
                 self.femmesh,
                 self.femelement_edges_table,
@@ -27,6 +27,8 @@ __url__ = "https://www.freecadweb.org"
 ## \addtogroup FEM
 #  @{
 
+from collections.abc import Mapping
+
 import numpy as np
 
 import FreeCAD
@@ -67,7 +69,8 @@ def get_femelements_by_references(
     femmesh,
     femelement_table,
     references,
-    femnodes_ele_table=None
+    femnodes_ele_table=None,
+    femelement_table_arrays=None
 ):
     """get the femelements for a list of references
     """
@@ -88,7 +91,8 @@ def get_femelements_by_references(
             # femelements for all references
             references_femelements += get_femelements_by_femnodes_std(
                 femelement_table,
-                ref_femnodes
+                ref_femnodes,
+                femelement_table_arrays
             )
     return references_femelements
 
@@ -201,6 +205,113 @@ def get_femelement_edges_table(
     return table
 
 
+# ************************************************************************************************
+class FemElementTableArrays(object):
+    """CSR style arrays of a femelement_table
+    ele_ids: element ids in the order of the femelement_table
+    ele_lens: number of nodes of each element
+    ele_ptr: offsets of the nodes of each element in ele_nodes, ele_ptr[-1] == len(ele_nodes)
+    ele_nodes: node ids of all elements, one element after the other
+    node_pos: position of each entry of ele_nodes in its element
+    The node to element adjacency is stored the same way, sorted by node id:
+    node_ids, node_ptr, node_ele (index in ele_ids), node_bits (1 << node position)
+    """
+
+    def __init__(self, femelement_table):
+        self.ele_ids = np.fromiter(femelement_table.keys(), dtype=np.int64, count=len(femelement_table))
+        self.ele_lens = np.fromiter(
+            (len(nodes) for nodes in femelement_table.values()),
+            dtype=np.int64,
+            count=len(femelement_table)
+        )
+        self.ele_ptr = np.zeros((len(self.ele_lens) + 1,), dtype=np.int64)
+        np.cumsum(self.ele_lens, out=self.ele_ptr[1:])
+        self.ele_nodes = np.fromiter(
+            (n for nodes in femelement_table.values() for n in nodes),
+            dtype=np.int64,
+            count=self.ele_ptr[-1]
+        )
+        ele_index = np.repeat(np.arange(len(self.ele_ids)), self.ele_lens)
+        self.node_pos = np.arange(len(self.ele_nodes)) - self.ele_ptr[ele_index]
+        # node to element adjacency
+        order = np.argsort(self.ele_nodes, kind="stable")
+        self.node_ids, counts = np.unique(self.ele_nodes[order], return_counts=True)
+        self.node_ptr = np.zeros((len(counts) + 1,), dtype=np.int64)
+        np.cumsum(counts, out=self.node_ptr[1:])
+        self.node_ele = ele_index[order]
+        self.node_bits = np.left_shift(1, self.node_pos[order])
+
+    def get_node_mask(self, node_set):
+        """True for each entry of ele_nodes which is in node_set"""
+        nodes = np.fromiter(node_set, dtype=np.int64)
+        return np.isin(self.ele_nodes, nodes)
+
+    def get_bit_patterns(self, node_set):
+        """bit array (integer) of each element
+        a bit is set if the node at that position of the element is in node_set"""
+        if not len(self.ele_ids):
+            return np.zeros((0,), dtype=np.int64)
+        bits = np.where(self.get_node_mask(node_set), np.left_shift(1, self.node_pos), 0)
+        return np.add.reduceat(bits, self.ele_ptr[:-1])
+
+    def get_node_counts(self, node_set):
+        """number of nodes of each element which are in node_set"""
+        if not len(self.ele_ids):
+            return np.zeros((0,), dtype=np.int64)
+        return np.add.reduceat(self.get_node_mask(node_set).astype(np.int64), self.ele_ptr[:-1])
+
+
+def get_femelement_table_arrays(
+    femelement_table,
+    femnodes_ele_table=None
+):
+    """get the FemElementTableArrays of a femelement_table
+    if femnodes_ele_table is a FemNodesEleTable of this femelement_table
+    its arrays are reused, otherwise they are built
+    """
+    if (
+        isinstance(femnodes_ele_table, FemNodesEleTable)
+        and femnodes_ele_table.femelement_table is femelement_table
+    ):
+        return femnodes_ele_table.arrays
+    return FemElementTableArrays(femelement_table)
+
+
+class FemNodesEleTable(Mapping):
+    """read only mapping with the contents of the femnodes_ele_table
+    {nodeID : [[eleID, NodePosition], [], ...], nodeID : [[], [], ...], ...}
+    backed by the FemElementTableArrays of the femelement_table,
+    which are built once and reused by the searches getting this table
+    """
+
+    def __init__(self, femnodes_mesh, femelement_table):
+        self.femnodes_mesh = femnodes_mesh
+        self.femelement_table = femelement_table
+        self.arrays = FemElementTableArrays(femelement_table)
+
+    def __getitem__(self, node):
+        if node not in self.femnodes_mesh:
+            raise KeyError(node)
+        a = self.arrays
+        i = np.searchsorted(a.node_ids, node)
+        if i == len(a.node_ids) or a.node_ids[i] != node:
+            return []
+        start, end = a.node_ptr[i], a.node_ptr[i + 1]
+        return [
+            [ele, bit]
+            for ele, bit in zip(
+                a.ele_ids[a.node_ele[start:end]].tolist(),
+                a.node_bits[start:end].tolist()
+            )
+        ]
+
+    def __iter__(self):
+        return iter(self.femnodes_mesh)
+
+    def __len__(self):
+        return len(self.femnodes_mesh)
+
+
 # ************************************************************************************************
 def get_femnodes_ele_table(
     femnodes_mesh,
@@ -220,22 +331,14 @@ def get_femnodes_ele_table(
     volume or face or edgemesh the femnodes_ele_table only
     has either volume or face or edge elements
     see get_femelement_table()
+    The table is a FemNodesEleTable, the node to element adjacency
+    is stored in arrays and not in a dict of lists.
     """
-    femnodes_ele_table = {}  # node_dict in ulrichs class
-    for n in femnodes_mesh:  # initialize it with sorted node keys and empty lists
-        femnodes_ele_table[n] = []
-    for ele in femelement_table:
-        ele_list = femelement_table[ele]
-        # FreeCAD.Console.PrintMessage("{}\n".format(ele_list))
-        pos = int(1)
-        for ele_node in ele_list:
-            femnodes_ele_table[ele_node].append([ele, pos])
-            pos = pos << 1
+    femnodes_ele_table = FemNodesEleTable(femnodes_mesh, femelement_table)
     FreeCAD.Console.PrintLog(
         "len femnodes_ele_table: {}\n"
         .format(len(femnodes_ele_table))
     )
-    FreeCAD.Console.PrintLog("femnodes_ele_table: {}\n".format(femnodes_ele_table))
     return femnodes_ele_table
 
 
@@ -267,18 +370,21 @@ def get_bit_pattern_dict(
     or has this element a face we are searching for?
     The number in the ele_dict is organized as a bit array.
     The corresponding bit is set, if the node of the node_set is contained in the element.
+    Elements without any node of the node_set are not added to the bit_pattern_dict.
     """
     FreeCAD.Console.PrintLog("len femnodes_ele_table: " + str(len(femnodes_ele_table)) + "\n")
     FreeCAD.Console.PrintLog("len node_set: " + str(len(node_set)) + "\n")
-    FreeCAD.Console.PrintLog("node_set: {}\n".format(node_set))
-    bit_pattern_dict = get_copy_of_empty_femelement_table(femelement_table)
-    # # initializing the bit_pattern_dict
-    for ele in femelement_table:
-        len_ele = len(femelement_table[ele])
-        bit_pattern_dict[ele] = [len_ele, 0]
-    for node in node_set:
-        for nList in femnodes_ele_table[node]:
-            bit_pattern_dict[nList[0]][1] += nList[1]
+    arrays = get_femelement_table_arrays(femelement_table, femnodes_ele_table)
+    patterns = arrays.get_bit_patterns(node_set)
+    found = patterns.nonzero()[0]
+    bit_pattern_dict = {
+        ele: [len_ele, pattern]
+        for ele, len_ele, pattern in zip(
+            arrays.ele_ids[found].tolist(),
+            arrays.ele_lens[found].tolist(),
+            patterns[found].tolist()
+        )
+    }
     FreeCAD.Console.PrintLog("len bit_pattern_dict: " + str(len(bit_pattern_dict)) + "\n")
     # FreeCAD.Console.PrintMessage("bit_pattern_dict: {}\n".format(bit_pattern_dict))
     return bit_pattern_dict
@@ -339,11 +445,36 @@ def get_ccxelement_faces_from_binary_search(
         15: pent15_mask,
         20: hex20_mask}
     faces = []
-    for ele in bit_pattern_dict:
-        mask_dict = vol_dict[bit_pattern_dict[ele][0]]
-        for key in mask_dict:
-            if (key & bit_pattern_dict[ele][1]) == key:
-                faces.append([ele, mask_dict[key]])
+    if bit_pattern_dict:
+        eles = np.fromiter(bit_pattern_dict.keys(), dtype=np.int64, count=len(bit_pattern_dict))
+        lens = np.array([p[0] for p in bit_pattern_dict.values()], dtype=np.int64)
+        patterns = np.array([p[1] for p in bit_pattern_dict.values()], dtype=np.int64)
+        # test each face mask on all elements of its element type at once
+        found_ele = []
+        found_order = []
+        found_face = []
+        for len_ele, mask_dict in vol_dict.items():
+            of_type = (lens == len_ele).nonzero()[0]
+            if not len(of_type):
+                continue
+            for mask_order, (key, face) in enumerate(mask_dict.items()):
+                hits = of_type[(patterns[of_type] & key) == key]
+                found_ele.append(hits)
+                found_order.append(np.full(len(hits), mask_order))
+                found_face.append(np.full(len(hits), face))
+        if found_ele:
+            found_ele = np.concatenate(found_ele)
+            found_order = np.concatenate(found_order)
+            found_face = np.concatenate(found_face)
+            # same order as the bit_pattern_dict and the masks of each element
+            order = np.lexsort((found_order, found_ele))
+            faces = [
+                [ele, face]
+                for ele, face in zip(
+                    eles[found_ele[order]].tolist(),
+                    found_face[order].tolist()
+                )
+            ]
     FreeCAD.Console.PrintLog("found Faces: {}\n".format(len(faces)))
     # FreeCAD.Console.PrintMessage("faces: {}\n".format(faces))
     return faces
@@ -373,15 +504,13 @@ def get_femelements_by_femnodes_bin(
         "len femnodes_ele_table: {}\n"
         .format(len(femnodes_ele_table))
     )
-    bit_pattern_dict = get_bit_pattern_dict(femelement_table, femnodes_ele_table, node_list)
+    arrays = get_femelement_table_arrays(femelement_table, femnodes_ele_table)
+    patterns = arrays.get_bit_patterns(node_list)
     # search
-    ele_list = []  # The ele_list contains the result of the search.
-    for ele in bit_pattern_dict:
-        FreeCAD.Console.PrintLog(
-            "bit_pattern_dict[ele][0]: {}\n".format(bit_pattern_dict[ele][0])
-        )
-        if bit_pattern_dict[ele][1] == vol_masks[bit_pattern_dict[ele][0]]:
-            ele_list.append(ele)
+    # all the nodes of the element are in the node_list
+    full = np.array([vol_masks.get(n, -1) for n in arrays.ele_lens.tolist()], dtype=np.int64)
+    # The ele_list contains the result of the search.
+    ele_list = arrays.ele_ids[patterns == full].tolist()
     FreeCAD.Console.PrintMessage("found Volumes: {}\n".format(len(ele_list)))
     # FreeCAD.Console.PrintMessage("   volumes: {}\n".format(ele_list))
     return ele_list
@@ -390,23 +519,23 @@ def get_femelements_by_femnodes_bin(
 # ************************************************************************************************
 def get_femelements_by_femnodes_std(
     femelement_table,
-    node_list
+    node_list,
+    femelement_table_arrays=None
 ):
     """for every femelement of femelement_table
     if all nodes of the femelement are in node_list,
     the femelement is added to the list which is returned
     e: elementlist
-    nodes: nodelist """
+    nodes: nodelist
+    femelement_table_arrays: FemElementTableArrays of the femelement_table,
+    built if not given, pass them when searching the same table several times """
     FreeCAD.Console.PrintMessage("std search: get_femelements_by_femnodes_std\n")
-    e = []  # elementlist
-    for elementID in sorted(femelement_table):
-        nodecount = 0
-        for nodeID in femelement_table[elementID]:
-            if nodeID in node_list:
-                nodecount = nodecount + 1
-        # all nodes of the element are in the node_list!
-        if nodecount == len(femelement_table[elementID]):
-            e.append(elementID)
+    arrays = femelement_table_arrays
+    if arrays is None:
+        arrays = get_femelement_table_arrays(femelement_table)
+    # all nodes of the element are in the node_list!
+    found = arrays.get_node_counts(node_list) == arrays.ele_lens
+    e = sorted(arrays.ele_ids[found].tolist())  # elementlist
     return e
 
 
@@ -428,6 +557,7 @@ def get_femvolumeelements_by_femfacenodes(
     e: elementlist
     nodes: nodelist """
     e = []  # elementlist
+    node_list = set(node_list)
     for elementID in sorted(femelement_table):
         nodecount = 0
         el_nd_ct = len(femelement_table[elementID])
@@ -492,6 +622,10 @@ def get_femelement_sets(
         dtype=int
     )
     has_remaining_femelements = None
+    # built once for the standard search of all references
+    femelement_table_arrays = None
+    if not femnodes_ele_table:
+        femelement_table_arrays = get_femelement_table_arrays(femelement_table)
     for fem_object_i, fem_object in enumerate(fem_objects):
         obj = fem_object["Object"]
         FreeCAD.Console.PrintMessage(
@@ -506,7 +640,8 @@ def get_femelement_sets(
             ref_shape_femelements = get_femelements_by_references(
                 femmesh, femelement_table,
                 obj.References,
-                femnodes_ele_table
+                femnodes_ele_table,
+                femelement_table_arrays
             )
             ref_shape_femelements_array = np.zeros_like(referenced_femelements)
             ref_shape_femelements_array[ref_shape_femelements] = 1
@@ -601,13 +736,18 @@ def get_femelement_direction1D_set(
 def get_femelement_directions_theshape(femmesh, femelement_table, theshape):
     # see get_femelement_direction1D_set
     rotations_ids = []
+    femelement_table_arrays = get_femelement_table_arrays(femelement_table)
     # add directions and all ids for each direction
     for e in theshape.Shape.Edges:
         the_edge = {}
         the_edge["direction"] = e.Vertexes[1].Point - e.Vertexes[0].Point
         edge_femnodes = femmesh.getNodesByEdge(e)  # femnodes for the current edge
         # femelements for this edge
-        the_edge["ids"] = get_femelements_by_femnodes_std(femelement_table, edge_femnodes)
+        the_edge["ids"] = get_femelements_by_femnodes_std(
+            femelement_table,
+            edge_femnodes,
+            femelement_table_arrays
+        )
         for rot in rotations_ids:
             # tolerance will be managed by FreeCAD
             # see https://forum.freecadweb.org/viewtopic.php?f=22&t=14179
@@ -864,13 +1004,22 @@ def get_force_obj_edge_nodeload_table(
             sum_ref_edge_length += ref_edge.Length
     if sum_ref_edge_length != 0:
         force_per_sum_ref_edge_length = frc_obj.Force / sum_ref_edge_length
+    # the standard search on edge meshes uses them for every reference edge
+    femelement_table_arrays = None
+    if is_edge_femmesh(femmesh):
+        femelement_table_arrays = get_femelement_table_arrays(femelement_table)
     for o, elem_tup in frc_obj.References:
         for elem in elem_tup:
             ref_edge = o.Shape.getElement(elem)
 
             # edge_table:
             #     { meshedgeID : ( nodeID, ... , nodeID ) }
-            edge_table = get_ref_edgenodes_table(femmesh, femelement_table, ref_edge)
+            edge_table = get_ref_edgenodes_table(
+                femmesh,
+                femelement_table,
+                ref_edge,
+                femelement_table_arrays
+            )
 
             # node_length_table:
             #     [ (nodeID, length), ... , (nodeID, length) ]
@@ -986,7 +1135,8 @@ def get_force_obj_edge_nodeload_table(
 def get_ref_edgenodes_table(
     femmesh,
     femelement_table,
-    refedge
+    refedge,
+    femelement_table_arrays=None
 ):
     edge_table = {}  # { meshedgeID : ( nodeID, ... , nodeID ) }
     refedge_nodes = femmesh.getNodesByEdge(refedge)
@@ -1039,7 +1189,8 @@ def get_ref_edgenodes_table(
     elif is_edge_femmesh(femmesh):
         refedge_fem_edgeelements = get_femelements_by_femnodes_std(
             femelement_table,
-            refedge_nodes
+            refedge_nodes,
+            femelement_table_arrays
         )
         for elem in refedge_fem_edgeelements:
             # { edgeID : ( nodeID, ... , nodeID  )} # all nodes off this femedgeelement
@@ -1136,13 +1287,22 @@ def get_force_obj_face_nodeload_table(
             sum_ref_face_area += ref_face.Area
     if sum_ref_face_area != 0:
         force_per_sum_ref_face_area = frc_obj.Force / sum_ref_face_area
+    # the standard search on face meshes uses them for every reference face
+    femelement_table_arrays = None
+    if is_face_femmesh(femmesh):
+        femelement_table_arrays = get_femelement_table_arrays(femelement_table)
     for o, elem_tup in frc_obj.References:
         for elem in elem_tup:
             ref_face = o.Shape.getElement(elem)
 
             # face_table:
             #    { meshfaceID : ( nodeID, ... , nodeID ) }
-            face_table = get_ref_facenodes_table(femmesh, femelement_table, ref_face)
+            face_table = get_ref_facenodes_table(
+                femmesh,
+                femelement_table,
+                ref_face,
+                femelement_table_arrays
+            )
 
             # node_area_table:
             #    [ (nodeID, Area), ... , (nodeID, Area) ]
@@ -1216,7 +1376,8 @@ def get_force_obj_face_nodeload_table(
 def get_ref_facenodes_table(
     femmesh,
     femelement_table,
-    ref_face
+    ref_face,
+    femelement_table_arrays=None
 ):
     face_table = {}  # { meshfaceID : ( nodeID, ... , nodeID ) }
     if is_solid_femmesh(femmesh):
@@ -1276,7 +1437,11 @@ def get_ref_facenodes_table(
                 face_table[mf] = femmesh.getElementNodes(mf)
     elif is_face_femmesh(femmesh):
         ref_face_nodes = femmesh.getNodesByFace(ref_face)
-        ref_face_elements = get_femelements_by_femnodes_std(femelement_table, ref_face_nodes)
+        ref_face_elements = get_femelements_by_femnodes_std(
+            femelement_table,
+            ref_face_nodes,
+            femelement_table_arrays
+        )
         for mf in ref_face_elements:
             face_table[mf] = femelement_table[mf]
     # FreeCAD.Console.PrintMessage("{}\n".format(face_table))
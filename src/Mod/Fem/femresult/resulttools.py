@@ -27,6 +27,7 @@ __url__ = "https://www.freecadweb.org"
 #  @{
 
 import numpy as np
+from itertools import chain
 from math import isnan
 
 import FreeCAD
@@ -281,39 +282,31 @@ def fill_femresult_stats(res_obj):
     mflow_min = mflow_max = npress_min = npress_max = 0
 
     if res_obj.DisplacementVectors:
-        x_max, y_max, z_max = map(max, zip(*res_obj.DisplacementVectors))
-        x_min, y_min, z_min = map(min, zip(*res_obj.DisplacementVectors))
+        disp = get_vector_array(res_obj.DisplacementVectors)
+        x_min, x_max = get_min_max(disp[:, 0])
+        y_min, y_max = get_min_max(disp[:, 1])
+        z_min, z_max = get_min_max(disp[:, 2])
     if res_obj.DisplacementLengths:
-        a_min = min(res_obj.DisplacementLengths)
-        a_max = max(res_obj.DisplacementLengths)
+        a_min, a_max = get_min_max(res_obj.DisplacementLengths)
     if res_obj.vonMises:
-        s_min = min(res_obj.vonMises)
-        s_max = max(res_obj.vonMises)
+        s_min, s_max = get_min_max(res_obj.vonMises)
     if res_obj.PrincipalMax:
-        p1_min = min(res_obj.PrincipalMax)
-        p1_max = max(res_obj.PrincipalMax)
+        p1_min, p1_max = get_min_max(res_obj.PrincipalMax)
     if res_obj.PrincipalMed:
-        p2_min = min(res_obj.PrincipalMed)
-        p2_max = max(res_obj.PrincipalMed)
+        p2_min, p2_max = get_min_max(res_obj.PrincipalMed)
     if res_obj.PrincipalMin:
-        p3_min = min(res_obj.PrincipalMin)
-        p3_max = max(res_obj.PrincipalMin)
+        p3_min, p3_max = get_min_max(res_obj.PrincipalMin)
     if res_obj.MaxShear:
-        ms_min = min(res_obj.MaxShear)
-        ms_max = max(res_obj.MaxShear)
+        ms_min, ms_max = get_min_max(res_obj.MaxShear)
     if res_obj.Peeq:
-        peeq_min = min(res_obj.Peeq)
-        peeq_max = max(res_obj.Peeq)
+        peeq_min, peeq_max = get_min_max(res_obj.Peeq)
     if res_obj.Temperature:
-        temp_min = min(res_obj.Temperature)
-        temp_max = max(res_obj.Temperature)
+        temp_min, temp_max = get_min_max(res_obj.Temperature)
     if res_obj.MassFlowRate:
         # DisplacementVectors is empty, no_of_values needs to be set
-        mflow_min = min(res_obj.MassFlowRate)
-        mflow_max = max(res_obj.MassFlowRate)
+        mflow_min, mflow_max = get_min_max(res_obj.MassFlowRate)
     if res_obj.NetworkPressure:
-        npress_min = min(res_obj.NetworkPressure)
-        npress_max = max(res_obj.NetworkPressure)
+        npress_min, npress_max = get_min_max(res_obj.NetworkPressure)
 
     res_obj.Stats = [x_min, x_max,
                      y_min, y_max,
@@ -358,25 +351,44 @@ def fill_femresult_stats(res_obj):
     return res_obj
 
 
+def get_min_max(values):
+    """Returns minimum and maximum of a list of values.
+
+    NaN values, which can happen on Calculix frd result files, are ignored.
+    If there are only NaN values, NaN is returned for both.
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+    if not len(values):
+        return (float("NaN"), float("NaN"))
+    return (float(values.min()), float(values.max()))
+
+
 def add_disp_apps(res_obj):
     res_obj.DisplacementLengths = calculate_disp_abs(res_obj.DisplacementVectors)
     FreeCAD.Console.PrintLog("Added DisplacementLengths.\n")
     return res_obj
 
 
+def get_stress_tensors(res_obj):
+    """Returns the stress tensors of all nodes of a result object.
+
+    The array has the shape (number of nodes, 6),
+    a row is (Sxx, Syy, Szz, Sxy, Sxz, Syz).
+    """
+    return np.column_stack((
+        np.array(res_obj.NodeStressXX, dtype=float),
+        np.array(res_obj.NodeStressYY, dtype=float),
+        np.array(res_obj.NodeStressZZ, dtype=float),
+        np.array(res_obj.NodeStressXY, dtype=float),
+        np.array(res_obj.NodeStressXZ, dtype=float),
+        np.array(res_obj.NodeStressYZ, dtype=float)
+    ))
+
+
 def add_von_mises(res_obj):
-    mstress = []
-    iterator = zip(
-        res_obj.NodeStressXX,
-        res_obj.NodeStressYY,
-        res_obj.NodeStressZZ,
-        res_obj.NodeStressXY,
-        res_obj.NodeStressXZ,
-        res_obj.NodeStressYZ
-    )
-    for Sxx, Syy, Szz, Sxy, Sxz, Syz in iterator:
-        mstress.append(calculate_von_mises((Sxx, Syy, Szz, Sxy, Sxz, Syz)))
-    res_obj.vonMises = mstress
+    mstress = calculate_von_mises_array(get_stress_tensors(res_obj))
+    res_obj.vonMises = mstress.tolist()
     FreeCAD.Console.PrintLog("Added von Mises stress.\n")
     return res_obj
 
@@ -386,26 +398,11 @@ def add_principal_stress_std(res_obj):
     # TODO may be use only one container for principal stresses in result object
     # https://forum.freecadweb.org/viewtopic.php?f=18&t=33106&p=416006#p416006
     # but which one is better
-    prinstress1 = []
-    prinstress2 = []
-    prinstress3 = []
-    shearstress = []
-    iterator = zip(
-        res_obj.NodeStressXX,
-        res_obj.NodeStressYY,
-        res_obj.NodeStressZZ,
-        res_obj.NodeStressXY,
-        res_obj.NodeStressXZ,
-        res_obj.NodeStressYZ
-    )
-    for Sxx, Syy, Szz, Sxy, Sxz, Syz in iterator:
-        prin1, prin2, prin3, shear = calculate_principal_stress_std(
-            (Sxx, Syy, Szz, Sxy, Sxz, Syz)
-        )
-        prinstress1.append(prin1)
-        prinstress2.append(prin2)
-        prinstress3.append(prin3)
-        shearstress.append(shear)
+    prinstress = calculate_principal_stress_std_array(get_stress_tensors(res_obj))
+    prinstress1 = prinstress[:, 0].tolist()
+    prinstress2 = prinstress[:, 1].tolist()
+    prinstress3 = prinstress[:, 2].tolist()
+    shearstress = prinstress[:, 3].tolist()
     res_obj.PrincipalMax = prinstress1
     res_obj.PrincipalMed = prinstress2
     res_obj.PrincipalMin = prinstress3
@@ -711,6 +708,47 @@ def calculate_principal_stress_std(
     return (eigvals[0], eigvals[1], eigvals[2], maxshear)
 
 
+def calculate_von_mises_array(stress_tensors):
+    """Calculate Von mises stress of many stress tensors at once.
+    Gives the same values as calculate_von_mises for every row.
+
+    stress_tensors ... array of shape (n, 6), rows (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+    """
+    stress_tensors = np.asarray(stress_tensors, dtype=float).reshape((-1, 6))
+    if len(stress_tensors) == 0:
+        # no stress results, np.average does not accept empty rows
+        return np.zeros((0,))
+    normal = stress_tensors[:, :3]
+    shear = stress_tensors[:, 3:]
+    pressure = np.average(normal, axis=1)
+    # float_power squares like the ** 2 on the numpy scalars in calculate_von_mises
+    von_mises = np.sqrt(
+        1.5 * np.float_power(calculate_norm_array(normal - pressure[:, np.newaxis]), 2)
+        + 3.0 * np.float_power(calculate_norm_array(shear), 2)
+    )
+    return von_mises
+
+
+def calculate_principal_stress_std_array(stress_tensors):
+    """Calculate principal stresses and max shear of many stress tensors at once.
+    Gives the same values as calculate_principal_stress_std for every row.
+
+    stress_tensors ... array of shape (n, 6), rows (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+    returns an array of shape (n, 4), rows (prin1, prin2, prin3, maxshear)
+    rows with a NaN in the stress tensor are NaN
+    """
+    stress_tensors = np.asarray(stress_tensors, dtype=float).reshape((-1, 6))
+    principal = np.full((len(stress_tensors), 4), float("NaN"))
+    valid = ~np.isnan(stress_tensors).any(axis=1)
+    # rows of the symmetric tensors [[s11, s12, s31], [s12, s22, s23], [s31, s23, s33]]
+    sigma = stress_tensors[valid][:, [0, 3, 4, 3, 1, 5, 4, 5, 2]].reshape((-1, 3, 3))
+    if len(sigma):
+        eigvals = np.linalg.eigvalsh(sigma)[:, ::-1]
+        principal[valid, :3] = eigvals
+        principal[valid, 3] = (eigvals[:, 0] - eigvals[:, 2]) / 2.0
+    return principal
+
+
 def calculate_principal_stress_reinforced(stress_tensor):
     """Calculate principal stress vectors and values.
 
@@ -936,6 +974,22 @@ def calculate_mohr_coulomb(prin1, prin3, phi, fck):
 
 def calculate_disp_abs(displacements):
     # see https://forum.freecadweb.org/viewtopic.php?f=18&t=33106&start=100#p296657
-    return [np.linalg.norm(nd) for nd in displacements]
+    return calculate_norm_array(get_vector_array(displacements)).tolist()
+
+
+def get_vector_array(vectors):
+    """Returns a list of vectors as array of shape (n, 3)."""
+    values = np.fromiter(chain.from_iterable(vectors), dtype=float, count=3 * len(vectors))
+    return values.reshape((-1, 3))
+
+
+def calculate_norm_array(vectors):
+    """Calculate the lengths of the rows of a 2D array.
+
+    The rows are multiplied with matmul, which gives the same values
+    as np.linalg.norm for every single row.
+    """
+    squares = np.matmul(vectors[:, np.newaxis, :], vectors[:, :, np.newaxis])
+    return np.sqrt(squares.reshape((-1,)))
 
 ##  @}
@@ -150,6 +150,127 @@ class TestMeshCommon(unittest.TestCase):
             "Edges of Python created seg3 element are unexpected"
         )
 
+    # ********************************************************************************************
+    def test_mesh_bulk_python(
+        self
+    ):
+        bulk = Fem.FemMesh()
+        bulk.addNodes(
+            [(0, 0, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1)],
+            [1, 2, 3, 4]
+        )
+        bulk.addElements("Volume", [[1, 2, 3, 4]], [1])
+        bulk.addElements("Face", [[1, 2, 3], [1, 2, 4]], [2, 3])
+        bulk.addElements("Edge", [[1, 2], [2, 3]])
+
+        node_data = [bulk.NodeCount, bulk.Nodes]
+        element_data = [
+            bulk.VolumeCount,
+            bulk.getElementNodes(1),
+            bulk.FaceCount,
+            bulk.getElementNodes(2),
+            bulk.getElementNodes(3),
+            bulk.EdgeCount,
+            [bulk.getElementNodes(e) for e in bulk.Edges]
+        ]
+        expected_nodes = [
+            4, {
+                1: FreeCAD.Vector(0.0, 0.0, 0.0),
+                2: FreeCAD.Vector(1.0, 0.0, 0.0),
+                3: FreeCAD.Vector(0.0, 1.0, 0.0),
+                4: FreeCAD.Vector(0.0, 0.0, 1.0)
+            }
+        ]
+        expected_elements = [1, (1, 2, 3, 4), 2, (1, 2, 3), (1, 2, 4), 2, [(1, 2), (2, 3)]]
+        self.assertEqual(
+            node_data,
+            expected_nodes,
+            "Nodes of the bulk created mesh are unexpected"
+        )
+        self.assertEqual(
+            element_data,
+            expected_elements,
+            "Elements of the bulk created mesh are unexpected"
+        )
+        self.assertRaises(
+            ValueError,
+            bulk.addElements,
+            "Node",
+            [[1]]
+        )
+
+    # ********************************************************************************************
+    def test_mesh_solid_nodes_split(
+        self
+    ):
+        # mixed mesh, two hexa8 volumes and two quad4 shell faces on their top
+        # the shell faces share the nodes of one edge with the volumes
+        mixed = Fem.FemMesh()
+        node_id = 0
+        node_ids = {}
+        for z in range(2):
+            for y in range(2):
+                for x in range(5):
+                    node_id += 1
+                    node_ids[(x, y, z)] = node_id
+                    mixed.addNode(x, y, z, node_id)
+        for x in range(2):
+            mixed.addVolume([
+                node_ids[(x, 0, 0)], node_ids[(x + 1, 0, 0)],
+                node_ids[(x + 1, 1, 0)], node_ids[(x, 1, 0)],
+                node_ids[(x, 0, 1)], node_ids[(x + 1, 0, 1)],
+                node_ids[(x + 1, 1, 1)], node_ids[(x, 1, 1)]
+            ])
+        for x in range(2, 4):
+            mixed.addFace([
+                node_ids[(x, 0, 1)], node_ids[(x + 1, 0, 1)],
+                node_ids[(x + 1, 1, 1)], node_ids[(x, 1, 1)]
+            ])
+        mesh_obj = self.document.addObject("Fem::FemMeshObject", "Mesh")
+        mesh_obj.FemMesh = mixed
+
+        import ObjectsFem
+        from femmesh import meshsetsgetter
+        from femtools import membertools
+        analysis = ObjectsFem.makeAnalysis(self.document, "Analysis")
+        solver = ObjectsFem.makeSolverCalculixCcxTools(self.document)
+        getter = meshsetsgetter.MeshSetsGetter(
+            analysis,
+            solver,
+            mesh_obj,
+            membertools.AnalysisMember(analysis)
+        )
+
+        # all nodes on top, the nodes with x = 2 belong to volumes and shells
+        fixed_nodes = [node_ids[(x, y, 1)] for x in range(5) for y in range(2)]
+        nodes_solid, nodes_faceedge = getter.split_femnodes_solid(fixed_nodes)
+
+        # expected sets by the search over all volume elements
+        volumes_table = getter.get_femelement_volumes_table()
+        expected_solid = set()
+        expected_faceedge = set()
+        for n in fixed_nodes:
+            if any(n in volumes_table[ve] for ve in volumes_table):
+                expected_solid.add(n)
+            else:
+                expected_faceedge.add(n)
+
+        self.assertEqual(
+            nodes_solid,
+            expected_solid,
+            "Solid nodes of the mixed mesh are unexpected"
+        )
+        self.assertEqual(
+            nodes_faceedge,
+            expected_faceedge,
+            "Face and edge nodes of the mixed mesh are unexpected"
+        )
+        self.assertEqual(
+            nodes_solid,
+            {node_ids[(x, y, 1)] for x in range(3) for y in range(2)},
+            "Solid nodes of the mixed mesh are unexpected"
+        )
+
     # ********************************************************************************************
     def test_unv_save_load(
         self
@@ -514,6 +635,25 @@ class TestMeshEleTetra10(unittest.TestCase):
             file_extension
         )
 
+    # ********************************************************************************************
+    def test_tetra10_binary(
+        self
+    ):
+        # tetra10 element: reading from and writing to binary mesh file format
+
+        file_extension = "npz"
+        outfile = self.get_file_paths(file_extension)[0]
+
+        from femmesh import binarymesh
+        binarymesh.write_femmesh(self.femmesh, outfile)
+        femmesh_outfile = binarymesh.read_femmesh(outfile)
+
+        self.compare_mesh_files(
+            self.femmesh,
+            femmesh_outfile,
+            file_extension
+        )
+
     # ********************************************************************************************
     def test_tetra10_z88(
         self
@@ -533,6 +673,52 @@ class TestMeshEleTetra10(unittest.TestCase):
             file_extension
         )
 
+    # ********************************************************************************************
+    def test_tetra10_ele_table(
+        self
+    ):
+        # tetra10 element: node to element adjacency and element face search
+        from femmesh import meshtools
+
+        femelement_table = meshtools.get_femelement_table(self.femmesh)
+        femnodes_ele_table = meshtools.get_femnodes_ele_table(
+            self.femmesh.Nodes,
+            femelement_table
+        )
+        self.assertEqual(len(femnodes_ele_table), 10)
+        self.assertEqual(femnodes_ele_table[1], [[1, 1]])
+        self.assertEqual(femnodes_ele_table[4], [[1, 8]])
+        self.assertEqual(femnodes_ele_table[10], [[1, 512]])
+
+        # the nodes of the face in the plane z = 18 --> ccx face 1
+        face_nodes = [1, 2, 3, 5, 6, 7]
+        bit_pattern_dict = meshtools.get_bit_pattern_dict(
+            femelement_table,
+            femnodes_ele_table,
+            face_nodes
+        )
+        self.assertEqual(bit_pattern_dict, {1: [10, 119]})
+        self.assertEqual(
+            meshtools.get_ccxelement_faces_from_binary_search(bit_pattern_dict),
+            [[1, 1]]
+        )
+        self.assertEqual(
+            meshtools.get_femelements_by_femnodes_std(femelement_table, face_nodes),
+            []
+        )
+        self.assertEqual(
+            meshtools.get_femelements_by_femnodes_std(femelement_table, range(1, 11)),
+            [1]
+        )
+        self.assertEqual(
+            meshtools.get_femelements_by_femnodes_bin(
+                femelement_table,
+                femnodes_ele_table,
+                range(1, 11)
+            ),
+            [1]
+        )
+
 
 # ************************************************************************************************
 # ************************************************************************************************
@@ -577,14 +763,14 @@ class TestMeshGroups(unittest.TestCase):
         correct.
         """
 
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_elements
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_nodes
+        from femexamples.meshes import create_elements
+        from femexamples.meshes import create_nodes
 
         fm = Fem.FemMesh()
-        control = create_nodes(fm)
+        control = create_nodes(fm, "mesh_canticcx_tetra10")
         if not control:
             fcc_print("failed to create nodes")
-        control = create_elements(fm)
+        control = create_elements(fm, "mesh_canticcx_tetra10")
         if not control:
             fcc_print("failed to create elements")
 
@@ -639,14 +825,14 @@ class TestMeshGroups(unittest.TestCase):
         Adds a number of groups to FemMesh and deletes them
         afterwards. Checks whether GroupCount is OK
         """
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_elements
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_nodes
+        from femexamples.meshes import create_elements
+        from femexamples.meshes import create_nodes
 
         fm = Fem.FemMesh()
-        control = create_nodes(fm)
+        control = create_nodes(fm, "mesh_canticcx_tetra10")
         if not control:
             fcc_print("failed to create nodes")
-        control = create_elements(fm)
+        control = create_elements(fm, "mesh_canticcx_tetra10")
         if not control:
             fcc_print("failed to create elements")
 
@@ -673,14 +859,14 @@ class TestMeshGroups(unittest.TestCase):
         Add a node group, add elements to it. Verify that elements added
         and elements in getGroupElements are the same.
         """
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_elements
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_nodes
+        from femexamples.meshes import create_elements
+        from femexamples.meshes import create_nodes
 
         fm = Fem.FemMesh()
-        control = create_nodes(fm)
+        control = create_nodes(fm, "mesh_canticcx_tetra10")
         if not control:
             fcc_print("failed to create nodes")
-        control = create_elements(fm)
+        control = create_elements(fm, "mesh_canticcx_tetra10")
         if not control:
             fcc_print("failed to create elements")
 
@@ -286,6 +286,90 @@ class TestResult(unittest.TestCase):
             "Values of read npressure result data are unexpected"
         )
 
+    # ********************************************************************************************
+    def test_read_frd_steps(
+        self
+    ):
+        frd_file = join(
+            testtools.get_fem_test_home_dir(),
+            "calculix",
+            "thermomech_flow1D.frd"
+        )
+        from feminout.importCcxFrdResults import FrdReader
+        from feminout.importCcxFrdResults import read_frd_result as read_frd
+        frd = FrdReader(frd_file)
+        frd_content = read_frd(frd_file)
+
+        # the index knows all steps without reading their values
+        self.assertEqual(
+            [step["time"] for step in frd.steps],
+            [result_set["time"] for result_set in frd_content["Results"]],
+            "Times of the indexed steps are unexpected"
+        )
+
+        # a single step read from the index gives the values of the whole file read
+        result_set = frd.read_step(12)
+        for key in ("mflow", "npressure"):
+            node_numbers, values = result_set[key]
+            self.assertEqual(
+                dict(zip(node_numbers.tolist(), values.tolist())),
+                frd_content["Results"][12][key],
+                "Values of the read step {} data are unexpected".format(key)
+            )
+
+    # ********************************************************************************************
+    def test_read_frd_crlf_chunks(
+        self
+    ):
+        # CRLF copy of an frd file read in chunks much smaller than a line,
+        # the expected values are the ones written in the frd file
+        frd_file = join(
+            testtools.get_fem_test_home_dir(),
+            "calculix",
+            "box_static.frd"
+        )
+        crlf_file = join(testtools.get_fem_test_tmp_dir("result_frd_crlf"), "box_static.frd")
+        with open(frd_file, "rb") as f_in:
+            frd_data = f_in.read()
+        with open(crlf_file, "wb") as f_out:
+            f_out.write(frd_data.replace(b"\n", b"\r\n"))
+
+        from feminout import importCcxFrdResults
+        chunk_size = importCcxFrdResults.FRD_CHUNK_SIZE
+        importCcxFrdResults.FRD_CHUNK_SIZE = 97
+        try:
+            frd = importCcxFrdResults.FrdReader(crlf_file)
+            node_numbers, node_coords = frd.read_nodes()
+            result_set = frd.read_step(0)
+        finally:
+            importCcxFrdResults.FRD_CHUNK_SIZE = chunk_size
+
+        self.assertEqual(len(node_numbers), 280, "Number of read nodes is unexpected")
+        self.assertEqual(len(frd.steps), 1, "Number of read steps is unexpected")
+        self.assertEqual(result_set["time"], 1.0, "Time of the read step is unexpected")
+
+        # displacements of node 5 and 280
+        node_numbers, values = result_set["disp"]
+        disp = dict(zip(node_numbers.tolist(), values.tolist()))
+        self.assertEqual(len(disp), 280, "Number of read displacements is unexpected")
+        self.assertEqual(
+            [disp[5], disp[280]],
+            [
+                [-6.75227E-02, -7.58014E-03, -6.42607E-02],
+                [-5.32384E-03, 1.88752E-03, -6.50264E-03]
+            ],
+            "Read displacements are unexpected"
+        )
+
+        # stresses of node 1, the file order SYZ, SZX is swapped to SXZ, SYZ
+        node_numbers, values = result_set["stress"]
+        stress = dict(zip(node_numbers.tolist(), values.tolist()))
+        self.assertEqual(
+            stress[1],
+            [-2.62033E+03, -8.71861E+02, -8.00594E+02, -4.29349E+02, -5.42662E+02, -1.21884E+02],
+            "Read stresses are unexpected"
+        )
+
     # ********************************************************************************************
     def get_stress_values(
         self
@@ -349,6 +433,83 @@ class TestResult(unittest.TestCase):
             "Calculated principal stresses are not the expected values."
         )
 
+    # ********************************************************************************************
+    def test_stress_arrays(
+        self
+    ):
+        from femresult.resulttools import calculate_von_mises as vm
+        from femresult.resulttools import calculate_von_mises_array as vm_array
+        from femresult.resulttools import calculate_principal_stress_std as pr
+        from femresult.resulttools import calculate_principal_stress_std_array as pr_array
+        stress = self.get_stress_values()
+        stress_tensors = [
+            stress,
+            (1.0, 2.0, 3.0, 0.0, 0.0, 0.0),
+            (1.0, float("NaN"), 3.0, 0.0, 0.0, 0.0),
+            tuple(-2.5 * s for s in stress)
+        ]
+        # the values of all nodes at once are the same as the ones node by node
+        # up to rounding, the batched and the single node linear algebra
+        # may use different BLAS/LAPACK kernels
+        mises = vm_array(stress_tensors).tolist()
+        prin = [tuple(p) for p in pr_array(stress_tensors).tolist()]
+        for i in (0, 1, 3):
+            expected_mises = vm(stress_tensors[i])
+            self.assertAlmostEqual(
+                mises[i],
+                expected_mises,
+                delta=1e-9 * max(1.0, abs(expected_mises)),
+                msg="Calculated von Mises stresses of all nodes are not the expected values."
+            )
+            expected_prin = pr(stress_tensors[i])
+            self.assertEqual(len(prin[i]), len(expected_prin))
+            for value, expected in zip(prin[i], expected_prin):
+                self.assertAlmostEqual(
+                    value,
+                    expected,
+                    delta=1e-9 * max(1.0, abs(expected)),
+                    msg="Calculated principal stresses of all nodes are not the expected values."
+                )
+        self.assertTrue(
+            all(p != p for p in prin[2]),
+            "Calculated principal stresses of a NaN stress are not NaN."
+        )
+
+    # ********************************************************************************************
+    def test_stress_no_stress(
+        self
+    ):
+        # result objects without stress values, like thermal or Flow1D results
+        import ObjectsFem
+        from femresult import resulttools
+        res_obj = ObjectsFem.makeResultMechanical(self.document, "NoStressResult")
+        resulttools.add_von_mises(res_obj)
+        resulttools.add_principal_stress_std(res_obj)
+        self.assertEqual(res_obj.vonMises, [], "von Mises stresses without stress are not empty")
+        self.assertEqual(
+            [res_obj.PrincipalMax, res_obj.PrincipalMed, res_obj.PrincipalMin, res_obj.MaxShear],
+            [[], [], [], []],
+            "Principal stresses without stress are not empty"
+        )
+
+        # every step of the Flow1D frd file gets a result object
+        frd_file = join(
+            testtools.get_fem_test_home_dir(),
+            "calculix",
+            "thermomech_flow1D.frd"
+        )
+        from feminout.importCcxFrdResults import importFrd
+        FreeCAD.setActiveDocument(self.document.Name)
+        importFrd(frd_file, result_name_prefix="Flow1D_")
+        res_objs = [
+            obj for obj in self.document.Objects
+            if obj.isDerivedFrom("Fem::FemResultObject") and obj.Name.startswith("Flow1D_")
+        ]
+        self.assertEqual(len(res_objs), 13, "Number of imported Flow1D result objects")
+        for obj in res_objs:
+            self.assertEqual(obj.vonMises, [], "Imported Flow1D von Mises stresses are not empty")
+            self.assertTrue(obj.MassFlowRate, "Imported Flow1D mass flow rates are empty")
+
     # ********************************************************************************************
     def test_stress_principal_reinforced(
         self
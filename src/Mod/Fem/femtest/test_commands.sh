@@ -59,6 +59,8 @@ make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_material.TestMaterialUnits.tes
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_material.TestMaterialUnits.test_material_card_quantities
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshCommon.test_mesh_seg2_python
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshCommon.test_mesh_seg3_python
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshCommon.test_mesh_bulk_python
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshCommon.test_mesh_solid_nodes_split
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshCommon.test_unv_save_load
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshCommon.test_writeAbaqus_precision
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshEleTetra10.test_tetra10_create
@@ -66,7 +68,9 @@ make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshEleTetra10.test_t
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshEleTetra10.test_tetra10_unv
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshEleTetra10.test_tetra10_vkt
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshEleTetra10.test_tetra10_yml
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshEleTetra10.test_tetra10_binary
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshEleTetra10.test_tetra10_z88
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshEleTetra10.test_tetra10_ele_table
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshGroups.test_add_groups
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshGroups.test_delete_groups
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshGroups.test_add_group_elements
@@ -78,8 +82,12 @@ make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_object.TestObjectType.test_fem
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_open.TestObjectOpen.test_femobjects_open_head
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_open.TestObjectOpen.test_femobjects_open_de9b3fb438
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_result.TestResult.test_read_frd_massflow_networkpressure
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_result.TestResult.test_read_frd_steps
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_result.TestResult.test_read_frd_crlf_chunks
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_result.TestResult.test_stress_von_mises
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_result.TestResult.test_stress_principal_std
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_result.TestResult.test_stress_arrays
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_result.TestResult.test_stress_no_stress
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_result.TestResult.test_stress_principal_reinforced
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_result.TestResult.test_rho
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_result.TestResult.test_disp_abs
@@ -193,6 +201,16 @@ unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
     'femtest.app.test_mesh.TestMeshCommon.test_mesh_seg3_python'
 ))
 
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
+    'femtest.app.test_mesh.TestMeshCommon.test_mesh_bulk_python'
+))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
+    'femtest.app.test_mesh.TestMeshCommon.test_mesh_solid_nodes_split'
+))
+
 import unittest
 unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
     'femtest.app.test_mesh.TestMeshCommon.test_unv_save_load'
@@ -228,11 +246,21 @@ unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
     'femtest.app.test_mesh.TestMeshEleTetra10.test_tetra10_yml'
 ))
 
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
+    'femtest.app.test_mesh.TestMeshEleTetra10.test_tetra10_binary'
+))
+
 import unittest
 unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
     'femtest.app.test_mesh.TestMeshEleTetra10.test_tetra10_z88'
 ))
 
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
+    'femtest.app.test_mesh.TestMeshEleTetra10.test_tetra10_ele_table'
+))
+
 import unittest
 unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
     'femtest.app.test_mesh.TestMeshGroups.test_add_groups'
@@ -288,6 +316,16 @@ unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
     'femtest.app.test_result.TestResult.test_read_frd_massflow_networkpressure'
 ))
 
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
+    'femtest.app.test_result.TestResult.test_read_frd_steps'
+))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
+    'femtest.app.test_result.TestResult.test_read_frd_crlf_chunks'
+))
+
 import unittest
 unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
     'femtest.app.test_result.TestResult.test_stress_von_mises'
@@ -298,6 +336,16 @@ unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
     'femtest.app.test_result.TestResult.test_stress_principal_std'
 ))
 
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
+    'femtest.app.test_result.TestResult.test_stress_arrays'
+))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
+    'femtest.app.test_result.TestResult.test_stress_no_stress'
+))
+
 import unittest
 unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
     'femtest.app.test_result.TestResult.test_stress_principal_reinforced'